@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Compute Entity Network Metrics
+Offline centrality and community detection for the entity network
+
+Computes PageRank, betweenness (sampled above --betweenness-samples nodes),
+eigenvector centrality and Louvain communities for two graphs over the
+entity_network.json node set:
+- flight:       entity_network.json edges (flight co-occurrences)
+- coappearance: entities mentioned in the same document
+                (document_entity_index.json)
+
+Writes data/metadata/entity_network_metrics.json, which /api/network uses to
+rank, filter and colour nodes without per-request computation. Re-run after
+rebuilding entity_network.json (the API reports stale metrics).
+
+Usage:
+    python3 scripts/analysis/compute_network_metrics.py
+    python3 scripts/analysis/compute_network_metrics.py --betweenness-samples 200 --seed 7
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter
+from datetime import datetime
+from itertools import combinations
+from pathlib import Path
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+METADATA_DIR = PROJECT_ROOT / "data" / "metadata"
+NETWORK_PATH = METADATA_DIR / "entity_network.json"
+DOCUMENT_ENTITY_PATH = METADATA_DIR / "document_entity_index.json"
+METRICS_PATH = METADATA_DIR / "entity_network_metrics.json"
+
+sys.path.insert(0, str(PROJECT_ROOT / "server"))
+from services.graph_engine import GraphEngine
+from services.network_metrics import (
+    BETWEENNESS_SAMPLES,
+    METRICS_SCHEMA_VERSION,
+    compute_graph_metrics,
+    file_digest,
+)
+
+
+def name_key(name: str) -> str:
+    """Match "Last, First" and "First Last" spellings case-insensitively"""
+    if "," in name:
+        last, first = name.split(",", 1)
+        name = f"{first} {last}"
+    return " ".join(name.lower().split())
+
+
+def build_coappearance_graph(network: dict, document_entities: dict) -> GraphEngine:
+    """Document co-mention graph over the network's nodes (weight = shared documents)"""
+    nodes = network.get("nodes", [])
+    lookup = {}
+    for position, node in enumerate(nodes):
+        lookup.setdefault(name_key(node.get("name", node["id"])), position)
+
+    pair_counts = Counter()
+    for entity_names in document_entities.values():
+        members = sorted({lookup[key] for key in map(name_key, entity_names) if key in lookup})
+        pair_counts.update(combinations(members, 2))
+
+    pairs = sorted(pair_counts)
+    return GraphEngine(
+        [node["id"] for node in nodes],
+        [a for a, _ in pairs],
+        [b for _, b in pairs],
+        [pair_counts[pair] for pair in pairs],
+        names=[node.get("name", node["id"]) for node in nodes],
+    )
+
+
+def print_top(name: str, graph: GraphEngine, result: dict, limit: int = 5):
+    """Print the highest-ranked entities for each centrality"""
+    metrics = result["metrics"]
+    print(
+        f"\n{name.upper()} GRAPH: {graph.n_edges:,} edges, {result['communities']} "
+        f"communities (modularity {result['modularity']:.3f})"
+    )
+    print("-" * 70)
+    for metric in ("pagerank", "betweenness", "eigenvector"):
+        ranked = sorted(range(len(graph)), key=lambda n: -metrics[metric][n])[:limit]
+        top = ", ".join(f"{graph.node_ids[n]} ({metrics[metric][n]:.3f})" for n in ranked)
+        print(f"  {metric:<12} {top}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compute entity network metrics")
+    parser.add_argument("--network", type=Path, default=NETWORK_PATH)
+    parser.add_argument("--documents", type=Path, default=DOCUMENT_ENTITY_PATH)
+    parser.add_argument("--output", type=Path, default=METRICS_PATH)
+    parser.add_argument(
+        "--betweenness-samples",
+        type=int,
+        default=BETWEENNESS_SAMPLES,
+        help="Sampled sources for approximate betweenness (exact for smaller graphs)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Sampling/Louvain seed")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("ENTITY NETWORK METRICS")
+    print("=" * 70)
+
+    with open(args.network) as f:
+        network = json.load(f)
+
+    graphs = {"flight": GraphEngine.from_network(network)}
+    if args.documents.exists():
+        with open(args.documents) as f:
+            document_entities = json.load(f).get("document_entities", {})
+        graphs["coappearance"] = build_coappearance_graph(network, document_entities)
+        print(f"Loaded {len(document_entities):,} documents for the co-appearance graph")
+    else:
+        print(f"⚠️  {args.documents} not found; skipping the co-appearance graph")
+
+    results = {}
+    for name, graph in graphs.items():
+        start = time.perf_counter()
+        results[name] = compute_graph_metrics(graph, args.betweenness_samples, args.seed)
+        print(f"✓ {name}: {len(graph):,} nodes in {time.perf_counter() - start:.2f}s")
+        print_top(name, graph, results[name])
+
+    output = {
+        "schema_version": METRICS_SCHEMA_VERSION,
+        "generated": datetime.now().isoformat(),
+        "source_digest": file_digest(args.network),
+        "node_ids": graphs["flight"].node_ids,
+        "graphs": results,
+    }
+    temp_path = args.output.with_suffix(".json.tmp")
+    with open(temp_path, "w") as f:
+        json.dump(output, f)
+    os.replace(temp_path, args.output)
+    print(f"\n✓ Saved metrics: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Score OCR Quality
+Per-document OCR quality for the whole House Oversight OCR corpus
+
+Scores every document (packed corpus plus loose ocr_text/*.txt files not yet
+packed) with OCRQualityAssessor.assess_batch across a process pool and
+writes data/metadata/ocr_quality_scores.json (columnar, see
+server/services/ocr_quality_scores.py). /api/rag/search uses the scores to
+down-rank garbage OCR and build_vector_store.py stores them as
+`ocr_quality` metadata. Re-run after OCR changes.
+
+A word list can be compiled into a Bloom-filter lexicon (--compile-lexicon);
+workers then load the ~180KB filter instead of parsing the list.
+
+Usage:
+    python3 scripts/analysis/score_ocr_quality.py
+    python3 scripts/analysis/score_ocr_quality.py --compile-lexicon /usr/share/dict/words
+    python3 scripts/analysis/score_ocr_quality.py --workers 8 --batch-size 200
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Optional
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+LEXICON_PATH = PROJECT_ROOT / "data" / "metadata" / "ocr_lexicon.npz"
+
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+sys.path.insert(0, str(PROJECT_ROOT / "server"))
+from core.ocr_quality import BloomLexicon, OCRQualityAssessor
+from services.ocr_corpus import DEFAULT_CORPUS_DIR, DEFAULT_TEXT_DIR, get_ocr_corpus, read_ocr_text
+from services.ocr_quality_scores import DEFAULT_SCORES_PATH, SCORE_COLUMNS, SCORES_SCHEMA_VERSION
+
+
+# Per-worker state (set by the pool initializer)
+_assessor: Optional[OCRQualityAssessor] = None
+_text_dir = DEFAULT_TEXT_DIR
+_corpus_dir = DEFAULT_CORPUS_DIR
+
+
+def init_worker(lexicon_path: Optional[str], text_dir: Path, corpus_dir: Path):
+    global _assessor, _text_dir, _corpus_dir
+    _assessor = OCRQualityAssessor(Path(lexicon_path) if lexicon_path else None)
+    _text_dir, _corpus_dir = text_dir, corpus_dir
+
+
+def score_batch(doc_ids: list[str]) -> list[tuple[str, dict]]:
+    """Read and score one batch in a worker (documents without text are skipped)"""
+    texts = [read_ocr_text(doc_id, _text_dir, _corpus_dir) for doc_id in doc_ids]
+    found = [(doc_id, text) for doc_id, text in zip(doc_ids, texts) if text is not None]
+    metrics = _assessor.assess_batch([text for _, text in found])
+    return [(doc_id, result) for (doc_id, _), result in zip(found, metrics)]
+
+
+def list_documents(text_dir: Path, corpus_dir: Path) -> list[str]:
+    """Packed documents in storage order, then loose .txt files not yet packed"""
+    corpus = get_ocr_corpus(corpus_dir)
+    packed = corpus.doc_ids if corpus is not None else []
+    packed_ids = set(packed)
+    loose = sorted(path.stem for path in text_dir.glob("*.txt") if path.stem not in packed_ids)
+    return packed + loose
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score OCR quality per document")
+    parser.add_argument("--text-dir", type=Path, default=DEFAULT_TEXT_DIR)
+    parser.add_argument("--corpus-dir", type=Path, default=DEFAULT_CORPUS_DIR)
+    parser.add_argument("--output", type=Path, default=DEFAULT_SCORES_PATH)
+    parser.add_argument(
+        "--lexicon",
+        type=Path,
+        default=LEXICON_PATH,
+        help="Compiled lexicon or word list (built-in common words if missing)",
+    )
+    parser.add_argument(
+        "--compile-lexicon",
+        type=Path,
+        metavar="WORDLIST",
+        help="Compile this word list into --lexicon before scoring",
+    )
+    parser.add_argument("--workers", type=int, default=max(1, (os.cpu_count() or 1) - 1))
+    parser.add_argument("--batch-size", type=int, default=100, help="Documents per task")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("OCR QUALITY SCORING")
+    print("=" * 70)
+
+    if args.compile_lexicon:
+        with open(args.compile_lexicon, encoding="utf-8", errors="replace") as f:
+            lexicon = BloomLexicon.from_words(f)
+        args.lexicon.parent.mkdir(parents=True, exist_ok=True)
+        lexicon.save(args.lexicon)
+        print(f"✓ Compiled {len(lexicon):,} words → {args.lexicon}")
+        print(f"  {lexicon.bits.nbytes:,} bytes, {lexicon.num_hashes} hashes")
+
+    lexicon_path = str(args.lexicon) if args.lexicon.exists() else None
+    print(f"Lexicon: {lexicon_path or 'built-in common words'}")
+
+    doc_ids = list_documents(args.text_dir, args.corpus_dir)
+    if not doc_ids:
+        print(f"❌ No OCR text found in {args.corpus_dir} or {args.text_dir}")
+        sys.exit(1)
+    print(f"Scoring {len(doc_ids):,} documents with {args.workers} workers")
+
+    batches = [
+        doc_ids[start : start + args.batch_size]
+        for start in range(0, len(doc_ids), args.batch_size)
+    ]
+    columns = {name: [] for name in SCORE_COLUMNS}
+    scored_ids = []
+    start = time.perf_counter()
+    with Pool(
+        args.workers,
+        initializer=init_worker,
+        initargs=(lexicon_path, args.text_dir, args.corpus_dir),
+    ) as pool:
+        for done, results in enumerate(pool.imap(score_batch, batches), 1):
+            for doc_id, metrics in results:
+                scored_ids.append(doc_id)
+                for name in SCORE_COLUMNS:
+                    columns[name].append(round(metrics[f"{name}_score"], 4))
+            if done % 50 == 0 or done == len(batches):
+                rate = len(scored_ids) / (time.perf_counter() - start)
+                print(f"  {len(scored_ids):,}/{len(doc_ids):,} documents ({rate:,.0f} docs/s)")
+
+    output = {
+        "schema_version": SCORES_SCHEMA_VERSION,
+        "generated": datetime.now().isoformat(),
+        "lexicon": Path(lexicon_path).name if lexicon_path else "builtin",
+        "doc_ids": scored_ids,
+        **columns,
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = args.output.with_suffix(".json.tmp")
+    with open(temp_path, "w") as f:
+        json.dump(output, f)
+    os.replace(temp_path, args.output)
+
+    overall = columns["overall"]
+    low = sum(1 for score in overall if score < 0.7)
+    print(f"\n✓ Scored {len(scored_ids):,} documents in {time.perf_counter() - start:.1f}s")
+    print(f"  Low quality (<0.7): {low:,} ({low * 100 / max(len(overall), 1):.1f}%)")
+    print(f"✓ Saved scores: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
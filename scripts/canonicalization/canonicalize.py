@@ -11,22 +11,96 @@ Converts source documents to canonical format with:
 """
 
 import argparse
+import os
+import sqlite3
 import sys
 from datetime import datetime
+from multiprocessing import Pool
 from pathlib import Path
+from typing import Iterator, Optional
 
 import PyPDF2
 
 
-# Add core modules to path
-sys.path.insert(0, str(Path(__file__).parent))
+# Add core modules (scripts/core) to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.database import CanonicalDatabase
-from core.deduplicator import Deduplicator
+from core.deduplicator import Deduplicator, Document
 from core.hasher import DocumentHasher, generate_canonical_id
 from core.ocr_quality import OCRQualityAssessor
 
 
+DEFAULT_WORKERS = max(1, (os.cpu_count() or 1) - 1)
+
+# Documents written per database transaction
+DEFAULT_BATCH_SIZE = 500
+
+# Per-process extraction tools (created on first use in each pool worker)
+_tools: Optional[tuple[DocumentHasher, OCRQualityAssessor, Deduplicator]] = None
+
+
+def _get_tools() -> tuple[DocumentHasher, OCRQualityAssessor, Deduplicator]:
+    global _tools
+    if _tools is None:
+        _tools = (DocumentHasher(), OCRQualityAssessor(), Deduplicator())
+    return _tools
+
+
+def extract_pdf_text(pdf_file: Path) -> str:
+    """
+    Extract text from PDF file.
+
+    Uses PyPDF2 for basic extraction (pages joined once, not concatenated
+    page by page).
+    Future: Add OCR for scanned PDFs.
+    """
+    try:
+        with open(pdf_file, "rb") as f:
+            reader = PyPDF2.PdfReader(f)
+            return "\n".join(page.extract_text() for page in reader.pages).strip()
+    except Exception as e:
+        return f"[Error extracting text: {e}]"
+
+
+def extract_document(pdf_file: Path) -> dict:
+    """
+    Extraction stage: everything about one PDF that needs no database.
+
+    Runs in pool workers: text extraction, hashes, OCR quality, metadata,
+    redaction detection and the MinHash signature.
+
+    Returns:
+        {"file", "text", "hashes", "ocr_quality", "metadata", "has_redactions",
+         "file_size", "minhash"} or {"file", "error"}
+    """
+    try:
+        hasher, assessor, deduplicator = _get_tools()
+        text = extract_pdf_text(pdf_file)
+        hashes = hasher.hash_document(pdf_file, text)
+        candidate = Document(
+            id=str(pdf_file),
+            file_path=pdf_file,
+            file_hash=hashes["file_hash"],
+            content_hash=hashes.get("content_hash", ""),
+            fuzzy_hash=hashes.get("fuzzy_hash"),
+            text="" if text.startswith("[Error extracting text") else text,
+            document_type="other",
+        )
+        return {
+            "file": pdf_file,
+            "text": text,
+            "hashes": hashes,
+            "ocr_quality": assessor.assess(text)["overall_score"],
+            "metadata": Canonicalizer._extract_metadata(text, pdf_file),
+            "has_redactions": Canonicalizer._detect_redactions(text),
+            "file_size": pdf_file.stat().st_size,
+            "minhash": deduplicator.compute_signature(candidate),
+        }
+    except Exception as e:
+        return {"file": pdf_file, "error": str(e)}
+
+
 class Canonicalizer:
     """
     Main canonicalization engine.
@@ -43,22 +117,51 @@ class Canonicalizer:
     Rationale: Process one source at a time to manage memory.
     Each source is deduplicated against existing canonical collection.
 
-    Performance: ~1000 docs/minute on modern hardware
+    Design Decision: Parallel Extraction, Single Writer
+    Rationale: PDF parsing, hashing, OCR scoring and MinHash are CPU-bound
+    and independent per document, so they run in a process pool
+    (extract_document). Deduplication decisions depend on every earlier
+    document, so one writer consumes results in file order:
+    - Exact duplicates: in-memory content-hash index, preloaded with one query
+      (was: one SELECT per document)
+    - Rows (documents, sources, duplicate groups, error logs) are buffered
+      and written with executemany, one transaction per `batch_size`
+      documents (was: connect + commit per row)
+    - MinHash signatures are written immediately inside the open
+      transaction, so later documents in the batch see them as LSH candidates
+    - Markdown files and the in-memory indexes are updated only after the
+      batch commits; until then the batch's own additions are looked up in
+      `pending`, so a failed commit leaves no file or index entry behind
+      for rows that were rolled back
+
+    Trade-offs:
+    - A failed commit loses the current batch (re-run; completed batches are kept)
+    - Results waiting for the writer are held in memory
+
+    Performance: ~1000 docs/minute serially; extraction scales with workers
     """
 
-    def __init__(self, db_path: Path, canonical_dir: Path):
+    def __init__(
+        self,
+        db_path: Path,
+        canonical_dir: Path,
+        workers: int = DEFAULT_WORKERS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
         """
         Initialize canonicalizer.
 
         Args:
             db_path: Path to SQLite database
             canonical_dir: Root directory for canonical documents
+            workers: Extraction processes (1 = extract in this process)
+            batch_size: Documents written per database transaction
         """
         self.db = CanonicalDatabase(db_path)
         self.canonical_dir = canonical_dir
-        self.hasher = DocumentHasher()
         self.deduplicator = Deduplicator()
-        self.ocr_assessor = OCRQualityAssessor()
+        self.workers = workers
+        self.batch_size = batch_size
 
         # Ensure canonical directories exist
         for subdir in [
@@ -99,30 +202,71 @@ class Canonicalizer:
         self.db.log("canonicalize", source_name, "info", "Starting canonicalization")
 
         # Find all PDFs in source directory
-        pdf_files = list(source_dir.rglob("*.pdf"))
+        pdf_files = sorted(source_dir.rglob("*.pdf"))
         print(f"Found {len(pdf_files)} PDF files in {source_dir}")
 
-        for pdf_file in pdf_files:
-            try:
-                result = self._process_document(pdf_file, source_name, source_metadata)
-
-                stats["processed"] += 1
-
-                if result["is_duplicate"]:
-                    stats["duplicates_found"] += 1
-                    stats["sources_added"] += 1
-                else:
-                    stats["new_canonical"] += 1
-
-                # Progress
-                if stats["processed"] % 100 == 0:
-                    print(f"  Processed {stats['processed']}/{len(pdf_files)} documents...")
-
-            except Exception as e:
-                stats["errors"].append({"file": str(pdf_file), "error": str(e)})
-                self.db.log(
-                    "canonicalize", source_name, "error", f"Error processing {pdf_file}: {e}"
-                )
+        # In-memory state for duplicate checks (one query each instead of one per document)
+        content_index = self.db.load_content_index()
+        self.content_ids = {content_hash: ids[0] for content_hash, ids in content_index.items()}
+        self.canonical_quality = dict(content_index.values())
+        self.source_canonical_ids = self.db.get_source_canonical_ids(source_name)
+
+        results = self._extract_all(pdf_files)
+        while True:
+            batch = [result for _, result in zip(range(self.batch_size), results)]
+            if not batch:
+                break
+
+            pending = {
+                "documents": [],
+                "sources": [],
+                "duplicate_groups": [],
+                "logs": [],
+                "markdown": [],
+                "content_ids": {},
+                "canonical_quality": {},
+                "source_canonical_ids": set(),
+            }
+            with self.db.transaction():
+                for result in batch:
+                    pdf_file = result["file"]
+                    try:
+                        if "error" in result:
+                            raise RuntimeError(result["error"])
+                        outcome = self._write_document(
+                            result, source_name, source_metadata, pending
+                        )
+
+                        stats["processed"] += 1
+
+                        if outcome["is_duplicate"]:
+                            stats["duplicates_found"] += 1
+                            stats["sources_added"] += 1
+                        else:
+                            stats["new_canonical"] += 1
+
+                        # Progress
+                        if stats["processed"] % 100 == 0:
+                            print(f"  Processed {stats['processed']}/{len(pdf_files)} documents...")
+
+                    except Exception as e:
+                        stats["errors"].append({"file": str(pdf_file), "error": str(e)})
+                        pending["logs"].append(
+                            (
+                                "canonicalize",
+                                source_name,
+                                "error",
+                                f"Error processing {pdf_file}: {e}",
+                                None,
+                            )
+                        )
+
+                self.db.insert_canonical_documents(pending["documents"])
+                self.db.insert_sources(pending["sources"])
+                self.db.insert_duplicate_groups(pending["duplicate_groups"])
+                self.db.log_many(pending["logs"])
+
+            self._publish(pending)
 
         # Log completion
         self.db.log(
@@ -135,56 +279,115 @@ class Canonicalizer:
 
         return stats
 
-    def _process_document(self, pdf_file: Path, source_name: str, source_metadata: dict) -> dict:
+    def _extract_all(self, pdf_files: list[Path]) -> Iterator[dict]:
+        """Extraction results in file order (process pool unless workers == 1)"""
+        if self.workers <= 1 or len(pdf_files) <= 1:
+            yield from map(extract_document, pdf_files)
+            return
+
+        with Pool(min(self.workers, len(pdf_files))) as pool:
+            yield from pool.imap(extract_document, pdf_files, chunksize=4)
+
+    def _publish(self, pending: dict):
+        """After a batch commits: merge its index entries and write its markdown files"""
+        self.content_ids.update(pending["content_ids"])
+        self.canonical_quality.update(pending["canonical_quality"])
+        self.source_canonical_ids |= pending["source_canonical_ids"]
+        for doc_data, sources, text, metadata in pending["markdown"]:
+            self._generate_markdown(doc_data, sources, text, metadata)
+
+    def _write_document(
+        self, result: dict, source_name: str, source_metadata: dict, pending: dict
+    ) -> dict:
         """
-        Process a single document.
+        Writer stage for one extracted document.
 
         Returns:
             Dictionary with processing results
         """
-        # Extract text
-        text = self._extract_text_from_pdf(pdf_file)
-
-        # Generate hashes
-        hashes = self.hasher.hash_document(pdf_file, text)
+        hashes = result["hashes"]
 
         # Check if content already exists (duplicate detection)
-        existing = self.db.find_by_content_hash(hashes["content_hash"])
+        content_hash = hashes["content_hash"]
+        existing_id = pending["content_ids"].get(content_hash) or self.content_ids.get(
+            content_hash
+        )
 
-        if existing:
+        if existing_id:
             # Duplicate found - add as additional source
+            self._add_source_to_existing(existing_id, result, source_name, source_metadata, pending)
+
+            return {"is_duplicate": True, "canonical_id": existing_id}
+
+        # Near-duplicate check against stored MinHash signatures (OCR variants)
+        text = result["text"]
+        candidate = Document(
+            id=str(result["file"]),
+            file_path=result["file"],
+            file_hash=hashes["file_hash"],
+            content_hash=hashes["content_hash"],
+            fuzzy_hash=hashes.get("fuzzy_hash"),
+            text="" if text.startswith("[Error extracting text") else text,
+            document_type="other",
+            minhash=result["minhash"],
+        )
+        near_duplicates = self.deduplicator.find_stored_near_duplicates(self.db, candidate)
+
+        if near_duplicates:
+            canonical_id, similarity = near_duplicates[0]
             self._add_source_to_existing(
-                existing["canonical_id"], pdf_file, source_name, source_metadata, hashes, text
+                canonical_id, result, source_name, source_metadata, pending
+            )
+            pending["duplicate_groups"].append(
+                {
+                    "canonical_id": canonical_id,
+                    "duplicate_type": "fuzzy",
+                    "similarity_score": similarity,
+                    "detection_method": "minhash_lsh",
+                }
             )
 
-            return {"is_duplicate": True, "canonical_id": existing["canonical_id"]}
+            return {"is_duplicate": True, "canonical_id": canonical_id}
 
         # New document - create canonical version
         canonical_id = self._create_canonical_document(
-            pdf_file, source_name, source_metadata, hashes, text
+            result, source_name, source_metadata, pending
         )
+        self.deduplicator.store_signature(self.db, canonical_id, candidate)
 
         return {"is_duplicate": False, "canonical_id": canonical_id}
 
-    def _extract_text_from_pdf(self, pdf_file: Path) -> str:
-        """
-        Extract text from PDF file.
-
-        Uses PyPDF2 for basic extraction.
-        Future: Add OCR for scanned PDFs.
-        """
-        try:
-            with open(pdf_file, "rb") as f:
-                reader = PyPDF2.PdfReader(f)
-                text = ""
-                for page in reader.pages:
-                    text += page.extract_text() + "\n"
-                return text.strip()
-        except Exception as e:
-            return f"[Error extracting text: {e}]"
+    def _source_data(
+        self,
+        canonical_id: str,
+        result: dict,
+        source_name: str,
+        source_metadata: dict,
+        pending: dict,
+    ) -> dict:
+        if (
+            canonical_id in self.source_canonical_ids
+            or canonical_id in pending["source_canonical_ids"]
+        ):
+            # Same check the UNIQUE(canonical_id, source_name) constraint makes on insert
+            raise sqlite3.IntegrityError(
+                "UNIQUE constraint failed: document_sources.canonical_id, "
+                "document_sources.source_name"
+            )
+        return {
+            "canonical_id": canonical_id,
+            "source_name": source_name,
+            "source_url": source_metadata.get("url"),
+            "collection": source_metadata.get("collection"),
+            "download_date": datetime.now().isoformat()[:10],
+            "file_path": str(result["file"]),
+            "quality_score": result["ocr_quality"],
+            "file_size": result["file_size"],
+            "format": "pdf",
+        }
 
     def _create_canonical_document(
-        self, pdf_file: Path, source_name: str, source_metadata: dict, hashes: dict, text: str
+        self, result: dict, source_name: str, source_metadata: dict, pending: dict
     ) -> str:
         """
         Create new canonical document.
@@ -193,20 +396,21 @@ class Canonicalizer:
             Canonical ID
         """
         # Generate canonical ID
-        canonical_id = generate_canonical_id(hashes["content_hash"])
-
-        # Assess OCR quality
-        ocr_metrics = self.ocr_assessor.assess(text)
-        ocr_quality = ocr_metrics["overall_score"]
+        content_hash = result["hashes"]["content_hash"]
+        canonical_id = generate_canonical_id(content_hash)
+        if canonical_id in self.canonical_quality or canonical_id in pending["canonical_quality"]:
+            raise sqlite3.IntegrityError(
+                "UNIQUE constraint failed: canonical_documents.canonical_id"
+            )
 
-        # Extract metadata (basic implementation)
-        metadata = self._extract_metadata(text, pdf_file)
+        # OCR quality and metadata (computed during extraction)
+        ocr_quality = result["ocr_quality"]
+        metadata = result["metadata"]
 
-        # Insert into database
         doc_data = {
             "canonical_id": canonical_id,
-            "content_hash": hashes["content_hash"],
-            "file_hash": hashes["file_hash"],
+            "content_hash": content_hash,
+            "file_hash": result["hashes"]["file_hash"],
             "document_type": metadata.get("document_type", "other"),
             "title": metadata.get("title"),
             "date": metadata.get("date"),
@@ -214,77 +418,58 @@ class Canonicalizer:
             "to_persons": metadata.get("to_persons"),
             "subject": metadata.get("subject"),
             "ocr_quality": ocr_quality,
-            "has_redactions": self._detect_redactions(text),
+            "has_redactions": result["has_redactions"],
             "completeness": "complete",  # TODO: Implement detection
             "page_count": metadata.get("page_count", 1),
             "primary_source": source_name,
             "selection_reason": "Initial source",
         }
+        source_data = self._source_data(
+            canonical_id, result, source_name, source_metadata, pending
+        )
 
-        self.db.insert_canonical_document(doc_data)
-
-        # Add source
-        source_data = {
-            "canonical_id": canonical_id,
-            "source_name": source_name,
-            "source_url": source_metadata.get("url"),
-            "collection": source_metadata.get("collection"),
-            "download_date": datetime.now().isoformat()[:10],
-            "file_path": str(pdf_file),
-            "quality_score": ocr_quality,
-            "file_size": pdf_file.stat().st_size,
-            "format": "pdf",
-        }
-
-        self.db.insert_source(source_data)
-
-        # Generate markdown file
-        self._generate_markdown(canonical_id, text, metadata)
+        # Queue rows for the batch insert, and the markdown file for after it commits
+        pending["documents"].append(doc_data)
+        pending["sources"].append(source_data)
+        pending["markdown"].append((doc_data, [source_data], result["text"], metadata))
+        pending["content_ids"][content_hash] = canonical_id
+        pending["canonical_quality"][canonical_id] = ocr_quality
+        pending["source_canonical_ids"].add(canonical_id)
 
         return canonical_id
 
     def _add_source_to_existing(
         self,
         canonical_id: str,
-        pdf_file: Path,
+        result: dict,
         source_name: str,
         source_metadata: dict,
-        hashes: dict,
-        text: str,
+        pending: dict,
     ):
         """
         Add source to existing canonical document.
 
         Checks if this version is better quality and updates if so.
         """
-        # Assess OCR quality
-        ocr_metrics = self.ocr_assessor.assess(text)
-        ocr_quality = ocr_metrics["overall_score"]
+        ocr_quality = result["ocr_quality"]
 
         # Add as source
-        source_data = {
-            "canonical_id": canonical_id,
-            "source_name": source_name,
-            "source_url": source_metadata.get("url"),
-            "collection": source_metadata.get("collection"),
-            "download_date": datetime.now().isoformat()[:10],
-            "file_path": str(pdf_file),
-            "quality_score": ocr_quality,
-            "file_size": pdf_file.stat().st_size,
-            "format": "pdf",
-        }
-
-        self.db.insert_source(source_data)
+        pending["sources"].append(
+            self._source_data(canonical_id, result, source_name, source_metadata, pending)
+        )
+        pending["source_canonical_ids"].add(canonical_id)
 
         # Check if this version is better than current primary
-        canonical_doc = self.db.get_canonical_document(canonical_id)
-
-        if ocr_quality > canonical_doc.get("ocr_quality", 0):
+        current_quality = pending["canonical_quality"].get(
+            canonical_id, self.canonical_quality.get(canonical_id)
+        )
+        if ocr_quality > (current_quality or 0):
             # This version is better - update canonical
             # TODO: Implement update logic
             pass
 
-    def _extract_metadata(self, text: str, pdf_file: Path) -> dict:
+    @staticmethod
+    def _extract_metadata(text: str, pdf_file: Path) -> dict:
         """
         Extract metadata from document text.
 
@@ -318,7 +503,8 @@ class Canonicalizer:
 
         return metadata
 
-    def _detect_redactions(self, text: str) -> bool:
+    @staticmethod
+    def _detect_redactions(text: str) -> bool:
         """
         Detect if document contains redactions.
 
@@ -337,15 +523,15 @@ class Canonicalizer:
         text_upper = text.upper()
         return any(pattern in text_upper for pattern in redaction_patterns)
 
-    def _generate_markdown(self, canonical_id: str, text: str, metadata: dict):
+    def _generate_markdown(self, doc: dict, sources: list[dict], text: str, metadata: dict):
         """
         Generate markdown file with YAML frontmatter.
 
+        Uses the document and source rows being written (no database read-back).
+
         TODO: Implement full frontmatter generation
         """
-        # Get document data
-        doc = self.db.get_canonical_document(canonical_id)
-        sources = self.db.get_sources(canonical_id)
+        canonical_id = doc["canonical_id"]
 
         # Generate frontmatter
         frontmatter = self._generate_frontmatter(doc, sources, metadata)
@@ -426,6 +612,15 @@ def main():
     parser.add_argument(
         "--output", type=Path, default=Path("data/canonical"), help="Canonical output directory"
     )
+    parser.add_argument(
+        "--workers", type=int, default=DEFAULT_WORKERS, help="Extraction processes"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Documents written per database transaction",
+    )
 
     args = parser.parse_args()
 
@@ -433,7 +628,7 @@ def main():
     source_metadata = {"collection": args.collection, "url": args.url}
 
     # Run canonicalization
-    canonicalizer = Canonicalizer(args.db, args.output)
+    canonicalizer = Canonicalizer(args.db, args.output, args.workers, args.batch_size)
 
     print(f"Canonicalizing {args.source_name}...")
     stats = canonicalizer.canonicalize_source(args.source_dir, args.source_name, source_metadata)
@@ -4,6 +4,7 @@ Epstein Document Canonicalization System - Core Library
 This package provides core functionality for:
 - Document hashing (content-based and file-based)
 - Deduplication (exact, fuzzy, metadata, partial)
+- MinHash/LSH near-duplicate candidate generation
 - OCR quality assessment
 - Metadata extraction
 - Database operations
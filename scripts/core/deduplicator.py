@@ -3,15 +3,29 @@ Deduplication Engine
 
 Implements multi-strategy duplicate detection:
 1. Exact matching (file hash, content hash)
-2. Fuzzy matching (ssdeep, text similarity)
+2. Fuzzy matching (MinHash/LSH candidates, verified with ssdeep and text similarity)
 3. Metadata matching (for emails)
 4. Partial overlap detection
 """
 
+import zlib
 from dataclasses import dataclass
 from difflib import SequenceMatcher
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+
+from core.hasher import DocumentHasher
+from core.minhash import LSHIndex, MinHasher
+
+
+if TYPE_CHECKING:
+    from core.database import CanonicalDatabase
+
+
+# Normalized text kept with each stored signature to confirm candidates
+TEXT_SAMPLE_CHARS = 10000
 
 
 @dataclass
@@ -35,6 +49,9 @@ class Document:
     # Page hashes (for partial overlap)
     page_hashes: Optional[dict[int, str]] = None
 
+    # MinHash signature (computed lazily by Deduplicator.compute_signature)
+    minhash: Optional[np.ndarray] = None
+
 
 @dataclass
 class DuplicateGroup:
@@ -73,7 +90,7 @@ class Deduplicator:
 
     Performance:
     - Phase 1 (Exact): O(n) with hash map
-    - Phase 2 (Fuzzy): O(n²) comparisons (optimize with clustering)
+    - Phase 2 (Fuzzy): O(n) MinHash/LSH candidate generation + verification of candidates
     - Phase 3 (Metadata): O(n) with hash map
     - Phase 4 (Partial): O(n²) page comparisons
     """
@@ -84,6 +101,11 @@ class Deduplicator:
         metadata_threshold: float = 0.95,
         partial_overlap_min: float = 0.10,
         partial_overlap_max: float = 0.90,
+        minhash_threshold: float = 0.80,
+        candidate_threshold: float = 0.40,
+        num_perm: int = 128,
+        lsh_bands: int = 32,
+        shingle_size: int = 5,
     ):
         """
         Initialize deduplicator with thresholds.
@@ -93,11 +115,23 @@ class Deduplicator:
             metadata_threshold: Minimum similarity for metadata matching
             partial_overlap_min: Min overlap % to detect (avoid exact duplicates)
             partial_overlap_max: Max overlap % to detect (avoid exact duplicates)
+            minhash_threshold: Minimum estimated Jaccard similarity for a stored
+                signature to be confirmed against its stored fingerprint
+            candidate_threshold: Minimum estimated Jaccard similarity for an LSH
+                candidate pair to be verified with the exact text comparison
+            num_perm: MinHash signature length
+            lsh_bands: Number of LSH bands (num_perm must be divisible by it)
+            shingle_size: Character shingle length for MinHash
         """
         self.fuzzy_threshold = fuzzy_threshold
         self.metadata_threshold = metadata_threshold
         self.partial_overlap_min = partial_overlap_min
         self.partial_overlap_max = partial_overlap_max
+        self.minhash_threshold = minhash_threshold
+        self.candidate_threshold = candidate_threshold
+        self.lsh_bands = lsh_bands
+        self.minhasher = MinHasher(num_perm=num_perm, shingle_size=shingle_size)
+        self._lsh = LSHIndex(num_perm=num_perm, bands=lsh_bands)
 
     def deduplicate(self, documents: list[Document]) -> list[DuplicateGroup]:
         """
@@ -201,41 +235,190 @@ class Deduplicator:
         """
         Phase 2: Detect fuzzy duplicates using similarity matching.
 
-        Uses both fuzzy hashing (ssdeep) and text similarity (difflib).
-        Takes the maximum similarity score from both methods.
+        Candidate pairs come from MinHash signatures bucketed with banded LSH;
+        only candidates are verified with fuzzy hashing (ssdeep) and text
+        similarity (difflib), taking the maximum score from both methods.
 
-        Complexity: O(n²) - compares all pairs
-        Optimization Opportunity: Use LSH (locality-sensitive hashing) for O(n)
+        Complexity: O(n) signatures + O(c) verifications for c candidate pairs
+        (previously O(n²) verifications)
 
         Returns:
             List of DuplicateGroup objects with type='fuzzy'
         """
+        by_id = {}
+        lsh = LSHIndex(num_perm=self.minhasher.num_perm, bands=self.lsh_bands)
+
+        for doc in documents:
+            signature = self.compute_signature(doc)
+            if signature is None or doc.id in by_id:
+                continue
+            by_id[doc.id] = doc
+            lsh.insert(doc.id, signature)
+
+        # Verify candidates in input order so results are deterministic
+        position = {doc_id: i for i, doc_id in enumerate(by_id)}
+        candidates = sorted(
+            (tuple(sorted(pair, key=position.__getitem__)) for pair in lsh.candidate_pairs()),
+            key=lambda pair: (position[pair[0]], position[pair[1]]),
+        )
+
         groups = []
-        compared = set()
+        for id_a, id_b in candidates:
+            doc_a = by_id[id_a]
+            doc_b = by_id[id_b]
 
-        for i, doc_a in enumerate(documents):
-            for doc_b in documents[i + 1 :]:
-                pair = tuple(sorted([doc_a.id, doc_b.id]))
-                if pair in compared:
-                    continue
-                compared.add(pair)
+            # Cheap signature check before the expensive text comparison
+            if MinHasher.jaccard(doc_a.minhash, doc_b.minhash) < self.candidate_threshold:
+                continue
 
-                # Calculate similarity
-                similarity = self._calculate_similarity(doc_a, doc_b)
+            # Calculate similarity
+            similarity = self._calculate_similarity(doc_a, doc_b)
 
-                if similarity >= self.fuzzy_threshold:
-                    groups.append(
-                        DuplicateGroup(
-                            type="fuzzy",
-                            docs=[doc_a.id, doc_b.id],
-                            similarity=similarity,
-                            method="fuzzy_hash" if doc_a.fuzzy_hash else "text_diff",
-                            metadata={"score": similarity},
-                        )
+            if similarity >= self.fuzzy_threshold:
+                groups.append(
+                    DuplicateGroup(
+                        type="fuzzy",
+                        docs=[doc_a.id, doc_b.id],
+                        similarity=similarity,
+                        method="fuzzy_hash" if doc_a.fuzzy_hash else "text_diff",
+                        metadata={"score": similarity, "candidates": "minhash_lsh"},
                     )
+                )
 
         return groups
 
+    def compute_signature(self, doc: Document) -> Optional[np.ndarray]:
+        """
+        Compute (and cache on the document) its MinHash signature.
+
+        Returns:
+            Signature array, or None if the document has no text
+        """
+        if doc.minhash is None and doc.text:
+            doc.minhash = self.minhasher.signature(doc.text)
+        return doc.minhash
+
+    # ==================== Incremental (persisted signatures) ====================
+
+    def store_signature(self, db: "CanonicalDatabase", canonical_id: str, doc: Document) -> bool:
+        """
+        Persist a document's MinHash signature and LSH buckets.
+
+        Args:
+            db: Canonical database
+            canonical_id: ID the signature is stored under
+            doc: Document (signature computed if missing)
+
+        The document's fuzzy hash and a compressed prefix of its normalized
+        text are stored alongside, so later matches can be confirmed.
+
+        Returns:
+            True if a signature was stored (False for documents without text)
+        """
+        signature = self.compute_signature(doc)
+        if signature is None:
+            return False
+
+        sample = DocumentHasher.normalize_text(doc.text)[:TEXT_SAMPLE_CHARS]
+
+        db.upsert_minhash_signature(
+            canonical_id,
+            signature.tobytes(),
+            self._lsh.band_keys(signature),
+            num_perm=self.minhasher.num_perm,
+            shingle_size=self.minhasher.shingle_size,
+            seed=self.minhasher.seed,
+            fuzzy_hash=doc.fuzzy_hash,
+            text_sample=zlib.compress(sample.encode("utf-8")),
+        )
+        return True
+
+    def find_stored_near_duplicates(
+        self, db: "CanonicalDatabase", doc: Document
+    ) -> list[tuple[str, float]]:
+        """
+        Compare a new document against signatures already in the database.
+
+        Uses the persisted LSH buckets for candidate lookup and the estimated
+        Jaccard similarity of the two signatures as a cheap filter. With 128
+        permutations the estimate is only good to ~±0.09, so every remaining
+        candidate is confirmed against its stored fingerprint (ssdeep and
+        text sample, see _calculate_stored_similarity) with fuzzy_threshold.
+        Signatures built with different MinHash parameters, or stored without
+        a fingerprint, are ignored.
+
+        Args:
+            db: Canonical database with stored signatures
+            doc: Incoming document
+
+        Returns:
+            List of (canonical_id, confirmed_similarity), best match first
+        """
+        signature = self.compute_signature(doc)
+        if signature is None:
+            return []
+
+        candidate_ids = db.find_lsh_candidates(self._lsh.band_keys(signature))
+        if not candidate_ids:
+            return []
+
+        matches = []
+        sample = None
+        for canonical_id, stored in db.get_minhash_signatures(candidate_ids).items():
+            if (
+                stored["num_perm"] != self.minhasher.num_perm
+                or stored["shingle_size"] != self.minhasher.shingle_size
+                or stored["seed"] != self.minhasher.seed
+            ):
+                continue
+
+            if stored.get("text_sample") is None:
+                continue
+
+            other = np.frombuffer(stored["signature"], dtype=np.uint32)
+            if MinHasher.jaccard(signature, other) < self.minhash_threshold:
+                continue
+
+            if sample is None:
+                sample = DocumentHasher.normalize_text(doc.text)[:TEXT_SAMPLE_CHARS]
+            similarity = self._calculate_stored_similarity(doc, sample, stored)
+            if similarity >= self.fuzzy_threshold:
+                matches.append((canonical_id, similarity))
+
+        matches.sort(key=lambda match: (-match[1], match[0]))
+        return matches
+
+    @staticmethod
+    def _calculate_stored_similarity(doc: Document, sample: str, stored: dict) -> float:
+        """
+        Similarity between a document and a stored fingerprint.
+
+        Maximum of:
+        1. Fuzzy hash (ssdeep) if both sides have one and ssdeep is installed
+        2. Word-level difflib ratio of the normalized text samples
+
+        Words rather than characters: difflib's autojunk heuristic discards
+        every letter of long texts at the character level, and a misread
+        character changes one word either way.
+        """
+        scores = []
+
+        if doc.fuzzy_hash and stored.get("fuzzy_hash"):
+            try:
+                import ssdeep
+
+                hash_a = doc.fuzzy_hash.replace("ssdeep:", "")
+                hash_b = stored["fuzzy_hash"].replace("ssdeep:", "")
+                scores.append(ssdeep.compare(hash_a, hash_b) / 100.0)
+            except ImportError:
+                pass
+
+        stored_sample = zlib.decompress(stored["text_sample"]).decode("utf-8")
+        if sample and stored_sample:
+            scores.append(SequenceMatcher(None, sample.split(), stored_sample.split()).ratio())
+
+        return max(scores) if scores else 0.0
+
     def _calculate_similarity(self, doc_a: Document, doc_b: Document) -> float:
         """
         Calculate similarity between two documents.
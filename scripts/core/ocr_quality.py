@@ -6,11 +6,242 @@ Calculates quality scores for OCR'd documents using multiple metrics:
 2. Character corruption detection (mojibake)
 3. Line break consistency
 4. Whitespace normalization
+
+Large dictionaries can be compiled once into a Bloom filter (BloomLexicon,
+persisted as .npz) that loads in milliseconds and is shared by every
+assessor in a process; `assess_batch` scores many texts with one lexicon
+lookup per distinct word.
 """
 
+import hashlib
+import os
 import re
 import unicodedata
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
+from typing import Iterable, Optional, Union
+
+import numpy as np
+
+
+# Built-in common words (reduced set for performance)
+BUILTIN_WORDS = frozenset(
+    {
+        "the",
+        "be",
+        "to",
+        "of",
+        "and",
+        "a",
+        "in",
+        "that",
+        "have",
+        "i",
+        "it",
+        "for",
+        "not",
+        "on",
+        "with",
+        "he",
+        "as",
+        "you",
+        "do",
+        "at",
+        "this",
+        "but",
+        "his",
+        "by",
+        "from",
+        "they",
+        "we",
+        "say",
+        "her",
+        "she",
+        "or",
+        "an",
+        "will",
+        "my",
+        "one",
+        "all",
+        "would",
+        "there",
+        "their",
+        "email",
+        "subject",
+        "sent",
+        "date",
+        "cc",
+        "bcc",
+        "dear",
+        "sincerely",
+        "regards",
+        "thank",
+        "please",
+        "attached",
+        # Common legal terms
+        "court",
+        "judge",
+        "case",
+        "defendant",
+        "plaintiff",
+        "attorney",
+        "subpoena",
+        "deposition",
+        "motion",
+        "order",
+        "counsel",
+        # Common names in Epstein docs
+        "epstein",
+        "maxwell",
+        "giuffre",
+        "clinton",
+        "trump",
+        "andrew",
+    }
+)
+
+# Lowercase letter runs of 2+ characters between word boundaries
+# (same tokens as findall(r"\b[a-z]+\b") followed by the length filter)
+_WORD_PATTERN = re.compile(r"\b[a-z]{2,}\b")
+
+# Corruption penalty per ASCII code point: control characters except \n, \t, \r
+_ASCII_PENALTY = np.zeros(128, dtype=np.int64)
+_ASCII_PENALTY[[c for c in (*range(32), 127) if chr(c) not in "\n\t\r"]] = 3
+
+LEXICON_FORMAT_VERSION = 1
+
+
+class BloomLexicon:
+    """
+    Compiled, read-only word lexicon backed by a Bloom filter.
+
+    Design Decision: Bloom filter over a persisted bit array
+    Rationale: A 100k-word dictionary as a Python set costs ~10MB and a
+    line-by-line parse in every process that scores documents. The filter
+    is ~14.4 bits per word at a 0.1% false-positive rate (~180KB for 100k
+    words), loads with one np.load, and answers a whole batch of words with
+    vectorized probes.
+
+    Trade-offs:
+    - False positives: a garbage token is counted as a word with probability
+      `false_positive_rate` (never the reverse)
+    - Immutable: recompile to add words
+
+    Hashing: double hashing over one 128-bit BLAKE2b digest per word
+    (h1 + i * h2 mod num_bits for i < num_hashes); stable across processes,
+    unlike hash().
+    """
+
+    def __init__(self, bits: np.ndarray, num_bits: int, num_hashes: int, word_count: int):
+        self.bits = bits
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.word_count = word_count
+        self._steps = np.arange(num_hashes, dtype=np.uint64)
+
+    @classmethod
+    def from_words(cls, words: Iterable[str], false_positive_rate: float = 0.001) -> "BloomLexicon":
+        """Compile a lexicon from words (lowercased, blanks ignored)"""
+        unique = sorted({word.strip().lower() for word in words if word.strip()})
+        n = max(len(unique), 1)
+        num_bits = max(64, int(np.ceil(-n * np.log(false_positive_rate) / np.log(2) ** 2)))
+        num_hashes = max(1, int(round(num_bits / n * np.log(2))))
+        lexicon = cls(np.zeros((num_bits + 7) // 8, dtype=np.uint8), num_bits, num_hashes, 0)
+        if unique:
+            positions = lexicon._positions(unique).ravel()
+            masks = np.left_shift(np.uint8(1), (positions & np.uint64(7)).astype(np.uint8))
+            np.bitwise_or.at(lexicon.bits, positions >> np.uint64(3), masks)
+        lexicon.word_count = len(unique)
+        return lexicon
+
+    def _positions(self, words: list[str]) -> np.ndarray:
+        """Bit positions (len(words) × num_hashes)"""
+        digests = b"".join(
+            hashlib.blake2b(word.encode("utf-8"), digest_size=16).digest() for word in words
+        )
+        hashes = np.frombuffer(digests, dtype=np.uint64).reshape(-1, 2)
+        # uint64 arithmetic wraps; the modulus keeps positions in range
+        probes = hashes[:, :1] + self._steps * hashes[:, 1:]
+        return probes % np.uint64(self.num_bits)
+
+    def contains_many(self, words: list[str]) -> np.ndarray:
+        """Boolean membership per word"""
+        if not words:
+            return np.zeros(0, dtype=bool)
+        positions = self._positions(words)
+        bytes_ = self.bits[positions >> np.uint64(3)]
+        return ((bytes_ >> (positions & np.uint64(7)).astype(np.uint8)) & 1).all(axis=1)
+
+    def __contains__(self, word: str) -> bool:
+        return bool(self.contains_many([word])[0])
+
+    def __len__(self) -> int:
+        return self.word_count
+
+    def save(self, path: Path):
+        """Write the compiled lexicon (.npz, temp file + rename)"""
+        path = Path(path)
+        temp_path = path.with_name(path.name + ".tmp")
+        with open(temp_path, "wb") as f:
+            np.savez(
+                f,
+                bits=self.bits,
+                params=np.array(
+                    [LEXICON_FORMAT_VERSION, self.num_bits, self.num_hashes, self.word_count],
+                    dtype=np.int64,
+                ),
+            )
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "BloomLexicon":
+        with np.load(path) as data:
+            version, num_bits, num_hashes, word_count = (int(v) for v in data["params"])
+            if version != LEXICON_FORMAT_VERSION:
+                raise ValueError(f"Unsupported lexicon format in {path}")
+            return cls(data["bits"], num_bits, num_hashes, word_count)
+
+
+Lexicon = Union[frozenset, BloomLexicon]
+
+
+@lru_cache(maxsize=8)
+def load_lexicon(dictionary_path: Optional[str] = None) -> Lexicon:
+    """
+    Load a lexicon once per process.
+
+    Args:
+        dictionary_path: Compiled lexicon (.npz), word list (one word per
+            line), or None/missing for the built-in common words
+
+    Performance: word lists are O(n) to parse; compiled lexicons are one
+    array read. Assessors created with the same path share the result.
+    """
+    if dictionary_path is None or not Path(dictionary_path).exists():
+        return BUILTIN_WORDS
+    if dictionary_path.endswith(".npz"):
+        return BloomLexicon.load(Path(dictionary_path))
+    with open(dictionary_path) as f:
+        return frozenset(line.strip().lower() for line in f if line.strip())
+
+
+@lru_cache(maxsize=4096)
+def _char_penalty(code_point: int) -> int:
+    """Corruption penalty for one non-ASCII code point"""
+    char = chr(code_point)
+    # Replacement character (�)
+    if char == "\ufffd":
+        return 5  # Heavy penalty
+    category = unicodedata.category(char)
+    penalty = 0
+    # Control characters (except newline, tab - all ASCII)
+    if category.startswith("C"):
+        penalty += 3
+    # Unexpected unicode categories: private use, not assigned
+    if category in ("Co", "Cn"):
+        penalty += 2
+    return penalty
 
 
 class OCRQualityAssessor:
@@ -29,9 +260,11 @@ class OCRQualityAssessor:
     - Threshold: Quality score affects version selection
     - Dictionary: English-only vs. multi-language support
 
-    Optimization Opportunity:
-    - Cache dictionary lookups
-    - Use Bloom filter for word dictionary (faster membership testing)
+    Performance:
+    - Word matching: one regex pass, tokens counted with Counter, one lexicon
+      lookup per distinct word (per batch in assess_batch)
+    - Corruption: code points scored with numpy; only distinct non-ASCII
+      characters go through unicodedata
     """
 
     def __init__(self, dictionary_path: Optional[Path] = None):
@@ -39,95 +272,26 @@ class OCRQualityAssessor:
         Initialize OCR quality assessor.
 
         Args:
-            dictionary_path: Path to word dictionary file (one word per line)
+            dictionary_path: Compiled lexicon (.npz, see BloomLexicon) or word
+                           dictionary file (one word per line)
                            If None, uses built-in common words
         """
         self.dictionary = self._load_dictionary(dictionary_path)
 
-    def _load_dictionary(self, dictionary_path: Optional[Path]) -> set[str]:
+    def _load_dictionary(self, dictionary_path: Optional[Path]) -> Lexicon:
         """
-        Load word dictionary for lexical validation.
+        Load word dictionary for lexical validation (cached per process).
 
-        Performance: O(n) where n is dictionary size.
-        Memory: ~10MB for 100,000 words (English dictionary).
+        Performance: O(n) where n is dictionary size, once per path.
+        Memory: ~10MB for 100,000 words as a set, ~180KB compiled.
         """
-        if dictionary_path and dictionary_path.exists():
-            with open(dictionary_path) as f:
-                return {line.strip().lower() for line in f if line.strip()}
-
-        # Built-in common words (reduced set for performance)
-        return {
-            "the",
-            "be",
-            "to",
-            "of",
-            "and",
-            "a",
-            "in",
-            "that",
-            "have",
-            "i",
-            "it",
-            "for",
-            "not",
-            "on",
-            "with",
-            "he",
-            "as",
-            "you",
-            "do",
-            "at",
-            "this",
-            "but",
-            "his",
-            "by",
-            "from",
-            "they",
-            "we",
-            "say",
-            "her",
-            "she",
-            "or",
-            "an",
-            "will",
-            "my",
-            "one",
-            "all",
-            "would",
-            "there",
-            "their",
-            "email",
-            "subject",
-            "sent",
-            "date",
-            "cc",
-            "bcc",
-            "dear",
-            "sincerely",
-            "regards",
-            "thank",
-            "please",
-            "attached",
-            # Common legal terms
-            "court",
-            "judge",
-            "case",
-            "defendant",
-            "plaintiff",
-            "attorney",
-            "subpoena",
-            "deposition",
-            "motion",
-            "order",
-            "counsel",
-            # Common names in Epstein docs
-            "epstein",
-            "maxwell",
-            "giuffre",
-            "clinton",
-            "trump",
-            "andrew",
-        }
+        return load_lexicon(str(dictionary_path) if dictionary_path else None)
+
+    def _lookup(self, words: list[str]) -> np.ndarray:
+        """Dictionary membership for distinct words"""
+        if isinstance(self.dictionary, BloomLexicon):
+            return self.dictionary.contains_many(words)
+        return np.fromiter((word in self.dictionary for word in words), bool, len(words))
 
     def assess(self, text: str) -> dict[str, float]:
         """
@@ -150,20 +314,47 @@ class OCRQualityAssessor:
             quality = assessor.assess(ocr_text)
             print(f"Overall quality: {quality['overall_score']:.2f}")
         """
-        # Individual metrics
-        word_score = self._assess_word_quality(text)
-        corruption_score = self._assess_corruption(text)
-        line_score = self._assess_line_breaks(text)
+        return self.assess_batch([text])[0]
 
-        # Weighted combination
-        overall_score = word_score * 0.5 + corruption_score * 0.3 + line_score * 0.2
+    def assess_batch(self, texts: list[str]) -> list[dict[str, float]]:
+        """
+        Assess many texts (same metrics as assess, per text).
 
-        return {
-            "word_score": word_score,
-            "corruption_score": corruption_score,
-            "line_score": line_score,
-            "overall_score": overall_score,
-        }
+        The dictionary is consulted once per distinct word across the batch,
+        so repeated vocabulary (most of a corpus) is looked up once.
+        """
+        word_scores = self._word_scores(texts)
+        results = []
+        for text, word_score in zip(texts, word_scores):
+            # Individual metrics
+            corruption_score = self._assess_corruption(text)
+            line_score = self._assess_line_breaks(text)
+
+            # Weighted combination
+            overall_score = word_score * 0.5 + corruption_score * 0.3 + line_score * 0.2
+
+            results.append(
+                {
+                    "word_score": word_score,
+                    "corruption_score": corruption_score,
+                    "line_score": line_score,
+                    "overall_score": overall_score,
+                }
+            )
+        return results
+
+    def _word_scores(self, texts: list[str]) -> list[float]:
+        """Dictionary word ratio per text, with one lookup per distinct word in the batch"""
+        counts = [Counter(self._extract_words(text)) for text in texts]
+        vocabulary = list(set().union(*counts))
+        valid = dict(zip(vocabulary, self._lookup(vocabulary).tolist()))
+
+        scores = []
+        for counter in counts:
+            total = sum(counter.values())
+            valid_words = sum(count for word, count in counter.items() if valid[word])
+            scores.append(valid_words / total if total else 0.0)
+        return scores
 
     def _assess_word_quality(self, text: str) -> float:
         """
@@ -173,17 +364,9 @@ class OCRQualityAssessor:
         High score = most words are valid English words.
         Low score = lots of OCR garbage.
 
-        Performance: O(n * m) where n = num words, m = avg word length
-        Optimization: Use Bloom filter for O(n) average case
+        Performance: O(n) in the number of words, one lookup per distinct word
         """
-        words = self._extract_words(text)
-
-        if not words:
-            return 0.0
-
-        valid_words = sum(1 for word in words if self._is_valid_word(word))
-
-        return valid_words / len(words)
+        return self._word_scores([text])[0]
 
     def _extract_words(self, text: str) -> list:
         """
@@ -197,13 +380,8 @@ class OCRQualityAssessor:
         Returns:
             List of normalized words
         """
-        # Extract alphanumeric sequences
-        words = re.findall(r"\b[a-z]+\b", text.lower())
-
-        # Filter short words and numbers
-        words = [w for w in words if len(w) >= 2 and not w.isdigit()]
-
-        return words
+        # Letter runs only, so numbers and special characters never match
+        return _WORD_PATTERN.findall(text.lower())
 
     def _is_valid_word(self, word: str) -> bool:
         """
@@ -247,25 +425,18 @@ class OCRQualityAssessor:
         if not text:
             return 0.0
 
-        corruption_count = 0
-        total_chars = len(text)
-
-        for char in text:
-            # Replacement character (�)
-            if char == "\ufffd":
-                corruption_count += 5  # Heavy penalty
-
-            # Control characters (except newline, tab)
-            elif unicodedata.category(char).startswith("C") and char not in "\n\t\r":
-                corruption_count += 3
-
-            # Unexpected unicode categories
-            category = unicodedata.category(char)
-            if category in ("Co", "Cn"):  # Private use, not assigned
-                corruption_count += 2
+        codes = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+        is_ascii = codes < 128
+        corruption_count = int(_ASCII_PENALTY[codes[is_ascii]].sum())
+        if not is_ascii.all():
+            code_points, counts = np.unique(codes[~is_ascii], return_counts=True)
+            corruption_count += sum(
+                _char_penalty(int(code_point)) * int(count)
+                for code_point, count in zip(code_points, counts)
+            )
 
         # Calculate corruption rate
-        corruption_rate = corruption_count / total_chars if total_chars > 0 else 0
+        corruption_rate = corruption_count / len(text)
 
         # Convert to score (inverse of corruption rate)
         score = max(0.0, 1.0 - corruption_rate * 10)  # Scale up for sensitivity
@@ -2,21 +2,29 @@
 """
 OCR Processing Status Monitor
 Quick status check for ongoing OCR processing
+
+Reads the progress store written by ocr_house_oversight.py
+(ocr_progress.db, services/ocr_progress.py): counters and run metadata only,
+so the check takes the same time at any corpus size. A tree with only the
+legacy ocr_progress.json is imported into the database on first run.
 """
 
-import json
+import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 
 
-PROGRESS_FILE = Path(
-    "/Users/masa/Projects/Epstein/data/sources/house_oversight_nov2025/ocr_progress.json"
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "server"))
+from services.ocr_progress import STALL_SECONDS, OCRProgressStore
+
+
+PROGRESS_DB = Path(
+    "/Users/masa/Projects/Epstein/data/sources/house_oversight_nov2025/ocr_progress.db"
 )
 LOG_FILE = Path("/Users/masa/Projects/Epstein/logs/ocr_house_oversight.log")
 EMAIL_INDEX_FILE = Path(
     "/Users/masa/Projects/Epstein/data/sources/house_oversight_nov2025/email_candidates.jsonl"
 )
-TOTAL_FILES = 33572
 
 
 def format_timedelta(td):
@@ -43,27 +51,25 @@ def main():
     print("HOUSE OVERSIGHT OCR PROCESSING STATUS")
     print("=" * 70)
 
+    store = OCRProgressStore(PROGRESS_DB, legacy_path=PROGRESS_DB.with_suffix(".json"))
+    status = store.status()
+
     # Check if processing has started
-    if not PROGRESS_FILE.exists():
+    if not status["started"]:
         print("\nStatus: NOT STARTED")
         print("Run: python scripts/extraction/ocr_house_oversight.py")
         return
 
-    # Load progress
-    with open(PROGRESS_FILE) as f:
-        progress = json.load(f)
-
-    stats = progress.get("stats", {})
-    completed_count = len(progress.get("completed", []))
-    failed_count = len(progress.get("failed", []))
-    email_count = stats.get("emails_found", 0)
-
-    # Calculate progress
-    progress_pct = (completed_count / TOTAL_FILES) * 100 if TOTAL_FILES > 0 else 0
+    completed_count = status["completed"]
+    failed_count = status["failed"]
+    email_count = status["emails_found"]
+    total_files = status["total_files"]
+    progress_pct = status["progress"]
 
-    print(f"\nProgress: {completed_count:,} / {TOTAL_FILES:,} files ({progress_pct:.2f}%)")
+    print(f"\nProgress: {completed_count:,} / {total_files:,} files ({progress_pct:.2f}%)")
     print(f"Failed: {failed_count:,} files")
     print(f"Email candidates found: {email_count:,}")
+    print(f"Pages OCRed: {status['pages_ocred']:,}")
 
     # Show progress bar
     bar_width = 50
@@ -72,8 +78,8 @@ def main():
     print(f"\n[{bar}] {progress_pct:.1f}%")
 
     # Time estimates
-    start_time_str = stats.get("start_time")
-    last_update_str = stats.get("last_update")
+    start_time_str = status["start_time"]
+    last_update_str = status["last_update"]
 
     if start_time_str and completed_count > 0:
         start_time = datetime.fromisoformat(start_time_str)
@@ -83,7 +89,7 @@ def main():
 
         # Estimate remaining time
         rate = completed_count / elapsed.total_seconds() if elapsed.total_seconds() > 0 else 0
-        remaining_files = TOTAL_FILES - completed_count
+        remaining_files = total_files - completed_count
 
         if rate > 0:
             eta_seconds = remaining_files / rate
@@ -102,13 +108,14 @@ def main():
         time_since_update = datetime.now() - last_update
         print(f"\nLast update: {format_timedelta(time_since_update)} ago")
 
-        if time_since_update.total_seconds() > 300:  # 5 minutes
-            print("⚠️  WARNING: No updates in over 5 minutes. Process may be stalled.")
+        if status["stalled"]:
+            minutes = STALL_SECONDS // 60
+            print(f"⚠️  WARNING: No updates in over {minutes} minutes. Process may be stalled.")
 
     # Recent failures
     if failed_count > 0:
         print(f"\n⚠️  {failed_count} files failed to process")
-        recent_failures = progress.get("failed", [])[-5:]
+        recent_failures = store.recent_failures(5)
         print("\nRecent failures:")
         for failure in recent_failures:
             print(f"  - {failure.get('file', 'unknown')}: {failure.get('error', 'unknown error')}")
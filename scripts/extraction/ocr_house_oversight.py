@@ -1,14 +1,19 @@
 #!/usr/bin/env python3
 """
 House Oversight OCR Processing Script
-Processes 33,572 PDF pages with parallel OCR and email detection
+OCRs every page of the 33,572 House Oversight PDFs with email detection
 
 Features:
-- Parallel processing with configurable workers
-- Resume capability (tracks completed files)
-- Email detection and flagging
+- Page-granular parallel OCR: each page is one task on a shared process-pool
+  queue, so idle workers pick up pages of long documents
+- Per-page output and checkpoints (ocr_pages/<stem>/, see ocr_pages.py);
+  documents are reassembled into ocr_text/<stem>.txt when all pages are done
+- Resume capability: finished pages are never re-OCRed after a crash
+- Progress store (ocr_progress.db, services/ocr_progress.py): one row per
+  finished document plus counters, written as each document completes and
+  read in-process by the API and check_ocr_status.py
+- Email detection and flagging (on the reassembled document)
 - Progress tracking and logging
-- Error handling and retry logic
 - Estimated time remaining
 """
 
@@ -20,11 +25,12 @@ import time
 from datetime import datetime, timedelta
 from multiprocessing import Pool
 from pathlib import Path
+from typing import Optional
 
 
 try:
     import pytesseract
-    from pdf2image import convert_from_path
+    from pdf2image import convert_from_path, pdfinfo_from_path
     from PIL import Image
     from tqdm import tqdm
 except ImportError as e:
@@ -32,13 +38,22 @@ except ImportError as e:
     print("Please run: pip install pytesseract pdf2image pillow tqdm")
     sys.exit(1)
 
+from ocr_pages import PAGE_SEPARATOR, PageStore
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "server"))
+from services.ocr_progress import OCRProgressStore
+
 
 # Configuration
 SOURCE_DIR = Path("/Users/masa/Projects/Epstein/data/sources/house_oversight_nov2025/epstein-pdf")
 OUTPUT_DIR = Path("/Users/masa/Projects/Epstein/data/sources/house_oversight_nov2025/ocr_text")
-PROGRESS_FILE = Path(
-    "/Users/masa/Projects/Epstein/data/sources/house_oversight_nov2025/ocr_progress.json"
+PAGES_DIR = Path("/Users/masa/Projects/Epstein/data/sources/house_oversight_nov2025/ocr_pages")
+PROGRESS_DB = Path(
+    "/Users/masa/Projects/Epstein/data/sources/house_oversight_nov2025/ocr_progress.db"
 )
+# Previous progress format, imported once on --resume
+LEGACY_PROGRESS_FILE = PROGRESS_DB.with_suffix(".json")
 EMAIL_INDEX_FILE = Path(
     "/Users/masa/Projects/Epstein/data/sources/house_oversight_nov2025/email_candidates.jsonl"
 )
@@ -76,25 +91,15 @@ def setup_logging():
     return Logger(LOG_FILE)
 
 
-def load_progress() -> dict:
-    """Load processing progress from file"""
-    if PROGRESS_FILE.exists():
-        with open(PROGRESS_FILE) as f:
-            return json.load(f)
-    return {
-        "completed": [],
-        "failed": [],
-        "email_candidates": [],
-        "stats": {"total_processed": 0, "emails_found": 0, "start_time": None, "last_update": None},
-    }
-
-
-def save_progress(progress: dict):
-    """Save processing progress to file"""
-    PROGRESS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    progress["stats"]["last_update"] = datetime.now().isoformat()
-    with open(PROGRESS_FILE, "w") as f:
-        json.dump(progress, f, indent=2)
+def open_progress(resume: bool, total_files: int, logger) -> OCRProgressStore:
+    """Open the progress store (importing ocr_progress.json once when resuming)"""
+    store = OCRProgressStore(PROGRESS_DB)
+    store.start_run(total_files, fresh=not resume)
+    if resume and LEGACY_PROGRESS_FILE.exists() and not store.status()["completed"]:
+        with open(LEGACY_PROGRESS_FILE) as f:
+            imported = store.import_legacy_progress(json.load(f))
+        logger.log(f"Imported {imported} documents from {LEGACY_PROGRESS_FILE.name}")
+    return store
 
 
 def detect_email_content(text: str) -> dict:
@@ -139,24 +144,34 @@ def detect_email_content(text: str) -> dict:
     return indicators
 
 
-def process_single_pdf(args: tuple[Path, Path, str]) -> dict:
+def count_pages(pdf_path: Path) -> tuple[Path, Optional[int], Optional[str]]:
+    """Page count of a PDF (worker task)
+
+    Returns:
+        (pdf_path, page count or None, error or None)
     """
-    Process a single PDF file with OCR
+    try:
+        return pdf_path, int(pdfinfo_from_path(str(pdf_path))["Pages"]), None
+    except Exception as e:
+        return pdf_path, None, str(e)
+
+
+def ocr_page(args: tuple[Path, int, Path]) -> dict:
+    """
+    OCR one page and checkpoint it (worker task)
 
     Args:
-        args: Tuple of (pdf_path, output_dir, log_identifier)
+        args: Tuple of (pdf_path, 1-based page number, pages_dir)
 
     Returns:
-        Dict with processing results
+        Dict with page processing results
     """
-    pdf_path, output_dir, _log_id = args
+    pdf_path, page, pages_dir = args
 
     result = {
         "file": pdf_path.name,
+        "page": page,
         "success": False,
-        "is_email": False,
-        "email_confidence": 0.0,
-        "email_addresses": [],
         "text_length": 0,
         "error": None,
         "processing_time": 0.0,
@@ -165,78 +180,115 @@ def process_single_pdf(args: tuple[Path, Path, str]) -> dict:
     start_time = time.time()
 
     try:
-        # Convert PDF to image
-        images = convert_from_path(str(pdf_path), dpi=DPI, first_page=1, last_page=1)
+        images = convert_from_path(str(pdf_path), dpi=DPI, first_page=page, last_page=page)
 
         if not images:
-            result["error"] = "No images extracted from PDF"
+            result["error"] = f"No image extracted from page {page}"
             return result
 
-        # Perform OCR
         text = pytesseract.image_to_string(images[0], config=TESSERACT_CONFIG)
+        result["processing_time"] = time.time() - start_time
+        PageStore(pages_dir).save_page(
+            pdf_path.stem,
+            page,
+            text,
+            {"dpi": DPI, "ocr_time": round(result["processing_time"], 3)},
+        )
+        result["text_length"] = len(text)
+        result["success"] = True
 
-        if not text or len(text.strip()) < 10:
-            result["error"] = "Insufficient text extracted (possible blank page)"
-            result["success"] = True  # Still counts as processed
-            result["text_length"] = len(text.strip())
-            return result
+    except Exception as e:
+        result["error"] = str(e)
 
-        # Detect email content
-        email_detection = detect_email_content(text)
-        result["is_email"] = email_detection["confidence"] > 0.5
-        result["email_confidence"] = email_detection["confidence"]
-        result["email_addresses"] = email_detection["email_addresses"]
-        result["text_length"] = len(text)
+    finally:
+        result["processing_time"] = time.time() - start_time
 
-        # Save OCR text
-        output_file = output_dir / f"{pdf_path.stem}.txt"
-        output_file.parent.mkdir(parents=True, exist_ok=True)
+    return result
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(text)
 
-        # Save metadata
-        metadata = {
-            "source_pdf": pdf_path.name,
-            "ocr_date": datetime.now().isoformat(),
-            "text_length": len(text),
-            "is_email": result["is_email"],
-            "email_confidence": result["email_confidence"],
-            "email_addresses": result["email_addresses"],
-        }
+def assemble_document(store: PageStore, pdf_path: Path, output_dir: Path) -> dict:
+    """
+    Reassemble a fully OCRed document into output_dir/<stem>.txt and .json
 
-        metadata_file = output_dir / f"{pdf_path.stem}.json"
-        with open(metadata_file, "w", encoding="utf-8") as f:
-            json.dump(metadata, f, indent=2)
+    Returns:
+        Dict with document results (as recorded in the progress file)
+    """
+    result = {
+        "file": pdf_path.name,
+        "success": True,
+        "is_email": False,
+        "email_confidence": 0.0,
+        "email_addresses": [],
+        "text_length": 0,
+        "page_count": 0,
+        "error": None,
+    }
 
-        result["success"] = True
+    text, pages = store.assemble(pdf_path.stem)
+    result["page_count"] = len(pages)
+    result["text_length"] = len(text.replace(PAGE_SEPARATOR, "").strip())
 
-    except Exception as e:
-        result["error"] = str(e)
+    if result["text_length"] < 10:
+        # Still counts as processed
+        result["error"] = "Insufficient text extracted (possible blank document)"
+        store.mark_assembled(pdf_path.stem)
+        return result
 
-    finally:
-        result["processing_time"] = time.time() - start_time
+    # Detect email content
+    email_detection = detect_email_content(text)
+    result["is_email"] = email_detection["confidence"] > 0.5
+    result["email_confidence"] = email_detection["confidence"]
+    result["email_addresses"] = email_detection["email_addresses"]
+    result["text_length"] = len(text)
 
+    # Save OCR text (pages separated by form feeds)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    with open(output_dir / f"{pdf_path.stem}.txt", "w", encoding="utf-8") as f:
+        f.write(text)
+
+    # Save metadata
+    metadata = {
+        "source_pdf": pdf_path.name,
+        "ocr_date": datetime.now().isoformat(),
+        "text_length": len(text),
+        "page_count": len(pages),
+        "pages": [
+            {"page": page["page"], "text_length": page["text_length"]} for page in pages
+        ],
+        "is_email": result["is_email"],
+        "email_confidence": result["email_confidence"],
+        "email_addresses": result["email_addresses"],
+    }
+
+    with open(output_dir / f"{pdf_path.stem}.json", "w", encoding="utf-8") as f:
+        json.dump(metadata, f, indent=2)
+
+    store.mark_assembled(pdf_path.stem)
     return result
 
 
-def process_batch(pdf_files: list[Path], output_dir: Path, num_workers: int, logger) -> dict:
+def process_batch(
+    pdf_files: list[Path], output_dir: Path, pool: Pool, progress: OCRProgressStore, logger
+) -> dict:
     """
-    Process a batch of PDF files with parallel workers
+    OCR every pending page of a batch of PDFs and reassemble finished documents
+
+    Pages are scheduled document by document on the shared pool queue
+    (imap_unordered, one page per task): workers take the next page as soon
+    as they are free, so a 300-page PDF spreads across all workers instead of
+    pinning one, and documents complete roughly in batch order.
 
     Args:
         pdf_files: List of PDF file paths to process
-        output_dir: Output directory for OCR text
-        num_workers: Number of parallel workers
+        output_dir: Output directory for assembled OCR text
+        pool: Worker pool
+        progress: Progress store (each document is recorded as it finishes)
         logger: Logger instance
 
     Returns:
         Dict with batch processing results
     """
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    # Prepare arguments for parallel processing
-    args_list = [(pdf, output_dir, f"Worker-{i%num_workers}") for i, pdf in enumerate(pdf_files)]
+    store = PageStore(PAGES_DIR)
 
     results = {
         "completed": [],
@@ -248,52 +300,104 @@ def process_batch(pdf_files: list[Path], output_dir: Path, num_workers: int, log
             "failed": 0,
             "emails_found": 0,
             "total_text_chars": 0,
+            "pages_ocred": 0,
             "avg_processing_time": 0.0,
         },
     }
 
-    # Track all results for processing time calculation
-    all_results = []
-
-    # Process with progress bar
-    with Pool(num_workers) as pool:
-        with tqdm(total=len(pdf_files), desc="Processing PDFs", unit="file") as pbar:
-            for result in pool.imap_unordered(process_single_pdf, args_list):
-                all_results.append(result)
-                results["stats"]["total_processed"] += 1
-
-                if result["success"]:
-                    results["completed"].append(result["file"])
-                    results["stats"]["successful"] += 1
-                    results["stats"]["total_text_chars"] += result["text_length"]
-
-                    if result["is_email"]:
-                        results["email_candidates"].append(
-                            {
-                                "file": result["file"],
-                                "confidence": result["email_confidence"],
-                                "email_addresses": result["email_addresses"],
-                            }
-                        )
-                        results["stats"]["emails_found"] += 1
-                else:
-                    results["failed"].append({"file": result["file"], "error": result["error"]})
-                    results["stats"]["failed"] += 1
+    pages_done = {}
+
+    def record_document(result: dict):
+        progress.record_document(result, pages_ocred=pages_done.get(result["file"], 0))
+        results["stats"]["total_processed"] += 1
+        if result["success"]:
+            results["completed"].append(result["file"])
+            results["stats"]["successful"] += 1
+            results["stats"]["total_text_chars"] += result["text_length"]
 
-                pbar.update(1)
-                pbar.set_postfix(
+            if result["is_email"]:
+                results["email_candidates"].append(
                     {
-                        "emails": results["stats"]["emails_found"],
-                        "failed": results["stats"]["failed"],
+                        "file": result["file"],
+                        "confidence": result["email_confidence"],
+                        "email_addresses": result["email_addresses"],
                     }
                 )
+                results["stats"]["emails_found"] += 1
+        else:
+            results["failed"].append({"file": result["file"], "error": result["error"]})
+            results["stats"]["failed"] += 1
+
+    def finish_document(pdf_path: Path):
+        try:
+            record_document(assemble_document(store, pdf_path, output_dir))
+        except (OSError, ValueError) as e:
+            record_document({"file": pdf_path.name, "success": False, "error": str(e)})
+
+    # Plan: page counts for documents without a manifest
+    page_counts = {}
+    unplanned = []
+    for pdf in pdf_files:
+        manifest = store.load_manifest(pdf.stem)
+        if manifest:
+            page_counts[pdf] = manifest["page_count"]
+        else:
+            unplanned.append(pdf)
+    for pdf, page_count, error in pool.imap_unordered(count_pages, unplanned, chunksize=8):
+        if page_count is None:
+            record_document({"file": pdf.name, "success": False, "error": error})
+        else:
+            store.record_page_count(pdf.stem, pdf.name, page_count)
+            page_counts[pdf] = page_count
+
+    # Page tasks, document by document (checkpointed pages skipped)
+    tasks = []
+    remaining = {}
+    page_errors = {}
+    for pdf in pdf_files:
+        if pdf not in page_counts:
+            continue
+        pending = store.pending_pages(pdf.stem, page_counts[pdf])
+        remaining[pdf.name] = len(pending)
+        tasks.extend((pdf, page, PAGES_DIR) for page in pending)
+
+    by_name = {pdf.name: pdf for pdf in page_counts}
+    for name, count in remaining.items():
+        if count == 0:  # all pages done before a crash, not yet assembled
+            finish_document(by_name[name])
+
+    page_times = []
+    with tqdm(total=len(tasks), desc="OCR pages", unit="page") as pbar:
+        for result in pool.imap_unordered(ocr_page, tasks, chunksize=1):
+            name = result["file"]
+            remaining[name] -= 1
+            if result["success"]:
+                results["stats"]["pages_ocred"] += 1
+                pages_done[name] = pages_done.get(name, 0) + 1
+                page_times.append(result["processing_time"])
+            else:
+                page_errors.setdefault(name, []).append(f"page {result['page']}: {result['error']}")
+
+            if remaining[name] == 0:
+                if name in page_errors:
+                    # Checkpointed pages are kept; only the failed pages are retried on resume
+                    error = "; ".join(page_errors[name][:3])
+                    record_document({"file": name, "success": False, "error": error})
+                else:
+                    finish_document(by_name[name])
 
-    # Calculate average processing time
-    if results["stats"]["successful"] > 0:
-        results["stats"]["avg_processing_time"] = (
-            sum(r.get("processing_time", 0) for r in all_results if r["success"])
-            / results["stats"]["successful"]
-        )
+            pbar.update(1)
+            pbar.set_postfix(
+                {
+                    "docs": results["stats"]["successful"],
+                    "emails": results["stats"]["emails_found"],
+                    "failed": results["stats"]["failed"],
+                }
+            )
+
+    # Average OCR time per page
+    if page_times:
+        results["stats"]["avg_processing_time"] = sum(page_times) / len(page_times)
 
     return results
 
@@ -316,7 +420,11 @@ def main():
     parser = argparse.ArgumentParser(description="OCR processing for House Oversight PDFs")
     parser.add_argument("--workers", type=int, default=10, help="Number of parallel workers")
     parser.add_argument("--batch-size", type=int, default=1000, help="Batch size for processing")
-    parser.add_argument("--resume", action="store_true", help="Resume from previous progress")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume from previous progress (checkpointed pages in ocr_pages/ are always reused)",
+    )
     parser.add_argument("--test", type=int, help="Process only N files for testing")
     args = parser.parse_args()
 
@@ -326,31 +434,17 @@ def main():
     logger.log(f"Workers: {args.workers}, Batch Size: {args.batch_size}")
     logger.log("=" * 80)
 
-    # Load progress
-    progress = (
-        load_progress()
-        if args.resume
-        else {
-            "completed": [],
-            "failed": [],
-            "email_candidates": [],
-            "stats": {
-                "total_processed": 0,
-                "emails_found": 0,
-                "start_time": datetime.now().isoformat(),
-                "last_update": None,
-            },
-        }
-    )
-
     # Get all PDF files
     all_pdfs = sorted(SOURCE_DIR.glob("*.pdf"))
     total_files = len(all_pdfs)
 
     logger.log(f"Found {total_files} PDF files in source directory")
 
+    # Load progress
+    progress = open_progress(args.resume, total_files, logger)
+
     # Filter out already processed files
-    completed_set = set(progress["completed"])
+    completed_set = progress.completed_files()
     pending_pdfs = [pdf for pdf in all_pdfs if pdf.name not in completed_set]
 
     if args.test:
@@ -366,50 +460,45 @@ def main():
 
     # Process files
     start_time = datetime.now()
-    total_processed = len(completed_set)
+    run_processed = 0
 
     logger.log(f"Starting processing at {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
 
-    # Process in batches
-    for batch_num, i in enumerate(range(0, len(pending_pdfs), args.batch_size), 1):
-        batch_pdfs = pending_pdfs[i : i + args.batch_size]
-
-        logger.log(f"\n--- Batch {batch_num}: Processing {len(batch_pdfs)} files ---")
-
-        batch_results = process_batch(batch_pdfs, OUTPUT_DIR, args.workers, logger)
-
-        # Update global progress
-        progress["completed"].extend(batch_results["completed"])
-        progress["failed"].extend(batch_results["failed"])
-        progress["email_candidates"].extend(batch_results["email_candidates"])
-        progress["stats"]["total_processed"] += batch_results["stats"]["total_processed"]
-        progress["stats"]["emails_found"] += batch_results["stats"]["emails_found"]
-
-        total_processed += batch_results["stats"]["total_processed"]
-
-        # Save progress
-        save_progress(progress)
-
-        # Log batch results
-        logger.log(f"Batch {batch_num} complete:")
-        logger.log(f"  Processed: {batch_results['stats']['total_processed']}")
-        logger.log(f"  Successful: {batch_results['stats']['successful']}")
-        logger.log(f"  Failed: {batch_results['stats']['failed']}")
-        logger.log(f"  Emails found: {batch_results['stats']['emails_found']}")
-
-        # Estimate completion time
-        eta = estimate_completion_time(total_files, total_processed, start_time)
-        logger.log(
-            f"  Progress: {total_processed}/{total_files} ({total_processed*100/total_files:.1f}%)"
-        )
-        logger.log(f"  Estimated time remaining: {eta}")
-
-        # Save email candidates to JSONL
-        if batch_results["email_candidates"]:
-            EMAIL_INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
-            with open(EMAIL_INDEX_FILE, "a") as f:
-                for candidate in batch_results["email_candidates"]:
-                    f.write(json.dumps(candidate) + "\n")
+    # Process in batches (one pool for the whole run)
+    with Pool(args.workers) as pool:
+        for batch_num, i in enumerate(range(0, len(pending_pdfs), args.batch_size), 1):
+            batch_pdfs = pending_pdfs[i : i + args.batch_size]
+
+            logger.log(f"\n--- Batch {batch_num}: Processing {len(batch_pdfs)} files ---")
+
+            batch_results = process_batch(batch_pdfs, OUTPUT_DIR, pool, progress, logger)
+            run_processed += batch_results["stats"]["total_processed"]
+
+            # Log batch results
+            logger.log(f"Batch {batch_num} complete:")
+            logger.log(f"  Processed: {batch_results['stats']['total_processed']}")
+            logger.log(f"  Successful: {batch_results['stats']['successful']}")
+            logger.log(f"  Failed: {batch_results['stats']['failed']}")
+            logger.log(f"  Emails found: {batch_results['stats']['emails_found']}")
+            logger.log(f"  Pages OCRed: {batch_results['stats']['pages_ocred']}")
+            logger.log(
+                f"  Avg OCR time per page: {batch_results['stats']['avg_processing_time']:.2f}s"
+            )
+
+            # Estimate completion time (from this run's rate)
+            eta = estimate_completion_time(len(pending_pdfs), run_processed, start_time)
+            status = progress.status()
+            logger.log(
+                f"  Progress: {status['completed']}/{total_files} ({status['progress']:.1f}%)"
+            )
+            logger.log(f"  Estimated time remaining: {eta}")
+
+            # Save email candidates to JSONL
+            if batch_results["email_candidates"]:
+                EMAIL_INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
+                with open(EMAIL_INDEX_FILE, "a") as f:
+                    for candidate in batch_results["email_candidates"]:
+                        f.write(json.dumps(candidate) + "\n")
 
     # Final summary
     end_time = datetime.now()
@@ -418,15 +507,18 @@ def main():
     logger.log("\n" + "=" * 80)
     logger.log("OCR Processing Complete!")
     logger.log("=" * 80)
-    logger.log(f"Total files processed: {progress['stats']['total_processed']}")
-    logger.log(f"Total emails found: {progress['stats']['emails_found']}")
+    status = progress.status()
+    logger.log(f"Total files completed: {status['completed']} ({status['failed']} failed)")
+    logger.log(f"Total emails found: {status['emails_found']}")
+    logger.log(f"Files processed this run: {run_processed}")
     logger.log(f"Total processing time: {duration}")
     logger.log(
-        f"Average time per file: {duration.total_seconds() / max(progress['stats']['total_processed'], 1):.2f} seconds"
+        f"Average time per file: {duration.total_seconds() / max(run_processed, 1):.2f} seconds"
     )
     logger.log(f"\nOutput directory: {OUTPUT_DIR}")
+    logger.log(f"Page directory: {PAGES_DIR}")
     logger.log(f"Email candidates index: {EMAIL_INDEX_FILE}")
-    logger.log(f"Progress file: {PROGRESS_FILE}")
+    logger.log(f"Progress database: {PROGRESS_DB}")
     logger.log("=" * 80)
 
 
@@ -0,0 +1,174 @@
+"""
+OCR Page Store - Per-page OCR output, checkpoints and document reassembly
+
+Design Decision: The page file is the checkpoint
+Rationale: ocr_house_oversight.py rasterized only page 1 of every PDF and
+recorded finished documents in a JSON list rewritten after every batch, so
+multi-page documents were never fully indexed and a crash lost the whole
+batch in flight. OCR now runs per page, and every page is written on its own
+by the worker that produced it:
+
+    ocr_pages/<stem>/manifest.json    {"source_pdf", "page_count", "assembled"}
+    ocr_pages/<stem>/p0001.txt        page text
+    ocr_pages/<stem>/p0001.json       page metadata (written last: the checkpoint)
+
+A page is done when its .json exists (temp file + rename, so a crash leaves
+either no checkpoint or a complete one). Resuming lists each document
+directory once; nothing is re-read or rewritten per page elsewhere. When a
+document's pages are all done, its text is reassembled into the existing
+ocr_text/<stem>.txt / <stem>.json layout (pages separated by form feeds),
+which downstream consumers already read.
+
+Trade-offs:
+- Page text is stored twice (page files and the assembled document) so pages
+  can be re-OCRed and reassembled individually
+- One directory per document: ~2 extra inodes per page
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+
+# Separator between pages in assembled documents (Tesseract's own page break)
+PAGE_SEPARATOR = "\f"
+
+
+def write_atomic(path: Path, content: str):
+    """Write text via temp file + rename (readers never see partial files)"""
+    temp_path = path.with_name(path.name + ".tmp")
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(temp_path, path)
+
+
+class PageStore:
+    """
+    Page-granular OCR output for a set of documents.
+
+    Usage:
+        store = PageStore(PAGES_DIR)
+        store.record_page_count("HOUSE_OVERSIGHT_010477", "HOUSE_OVERSIGHT_010477.pdf", 12)
+        for page in store.pending_pages("HOUSE_OVERSIGHT_010477"):
+            store.save_page("HOUSE_OVERSIGHT_010477", page, text, {"ocr_time": 1.2})
+        if store.is_complete("HOUSE_OVERSIGHT_010477"):
+            text, pages = store.assemble("HOUSE_OVERSIGHT_010477")
+    """
+
+    def __init__(self, pages_dir: Path):
+        self.pages_dir = Path(pages_dir)
+
+    # ==================== Paths ====================
+
+    def document_dir(self, stem: str) -> Path:
+        return self.pages_dir / stem
+
+    def page_text_path(self, stem: str, page: int) -> Path:
+        return self.document_dir(stem) / f"p{page:04d}.txt"
+
+    def page_metadata_path(self, stem: str, page: int) -> Path:
+        return self.document_dir(stem) / f"p{page:04d}.json"
+
+    # ==================== Manifest ====================
+
+    def load_manifest(self, stem: str) -> Optional[dict]:
+        """Document manifest (None if the document has not been planned)"""
+        path = self.document_dir(stem) / "manifest.json"
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save_manifest(self, stem: str, manifest: dict):
+        self.document_dir(stem).mkdir(parents=True, exist_ok=True)
+        write_atomic(self.document_dir(stem) / "manifest.json", json.dumps(manifest))
+
+    def record_page_count(self, stem: str, source_pdf: str, page_count: int) -> dict:
+        """Create the manifest once the page count is known (kept if it already matches)"""
+        manifest = self.load_manifest(stem)
+        if manifest and manifest.get("page_count") == page_count:
+            return manifest
+        manifest = {"source_pdf": source_pdf, "page_count": page_count, "assembled": False}
+        self.save_manifest(stem, manifest)
+        return manifest
+
+    # ==================== Pages ====================
+
+    def done_pages(self, stem: str) -> set[int]:
+        """Pages with a checkpoint (one directory listing)"""
+        try:
+            names = os.listdir(self.document_dir(stem))
+        except FileNotFoundError:
+            return set()
+        return {
+            int(name[1:5])
+            for name in names
+            if name.startswith("p") and name.endswith(".json") and name[1:5].isdigit()
+        }
+
+    def pending_pages(self, stem: str, page_count: Optional[int] = None) -> list[int]:
+        """1-based page numbers still to OCR (all pages if unplanned and no count given)"""
+        if page_count is None:
+            manifest = self.load_manifest(stem)
+            if manifest is None:
+                return []
+            page_count = manifest["page_count"]
+        done = self.done_pages(stem)
+        return [page for page in range(1, page_count + 1) if page not in done]
+
+    def is_complete(self, stem: str) -> bool:
+        manifest = self.load_manifest(stem)
+        return manifest is not None and not self.pending_pages(stem, manifest["page_count"])
+
+    def save_page(self, stem: str, page: int, text: str, metadata: dict) -> dict:
+        """Write page text, then its metadata checkpoint"""
+        self.document_dir(stem).mkdir(parents=True, exist_ok=True)
+        write_atomic(self.page_text_path(stem, page), text)
+        record = {
+            "page": page,
+            "text_length": len(text),
+            "ocr_date": datetime.now().isoformat(),
+            **metadata,
+        }
+        write_atomic(self.page_metadata_path(stem, page), json.dumps(record))
+        return record
+
+    def load_page(self, stem: str, page: int) -> tuple[str, dict]:
+        with open(self.page_text_path(stem, page), encoding="utf-8") as f:
+            text = f.read()
+        with open(self.page_metadata_path(stem, page)) as f:
+            return text, json.load(f)
+
+    # ==================== Reassembly ====================
+
+    def assemble(self, stem: str) -> tuple[str, list[dict]]:
+        """
+        Document text from its pages, in page order.
+
+        Returns:
+            (text with PAGE_SEPARATOR between pages, page metadata list)
+
+        Raises:
+            ValueError: If the document is unplanned or has pending pages
+        """
+        manifest = self.load_manifest(stem)
+        if manifest is None:
+            raise ValueError(f"{stem}: no page manifest")
+        pending = self.pending_pages(stem, manifest["page_count"])
+        if pending:
+            raise ValueError(f"{stem}: {len(pending)} pages not yet OCRed")
+
+        texts, pages = [], []
+        for page in range(1, manifest["page_count"] + 1):
+            text, metadata = self.load_page(stem, page)
+            texts.append(text.rstrip(PAGE_SEPARATOR))
+            pages.append(metadata)
+        return PAGE_SEPARATOR.join(texts), pages
+
+    def mark_assembled(self, stem: str):
+        manifest = self.load_manifest(stem) or {}
+        manifest["assembled"] = True
+        self.save_manifest(stem, manifest)
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Pack OCR Corpus
+Convert ocr_text/ (<stem>.txt + <stem>.json per PDF) into the packed corpus
+
+Writes data/sources/house_oversight_nov2025/ocr_corpus/ (shard-<gen>-NNNN.bin +
+index.json, see server/services/ocr_corpus.py). The API, the similarity
+service, build_vector_store.py and link_entities_to_docs.py read the packed
+corpus when it exists and fall back to the loose files for documents it does
+not contain. Re-run after an OCR run adds or changes documents; the loose
+files are left in place.
+
+Usage:
+    python3 scripts/extraction/pack_ocr_corpus.py
+    python3 scripts/extraction/pack_ocr_corpus.py --compression zlib
+    python3 scripts/extraction/pack_ocr_corpus.py --verify
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+sys.path.insert(0, str(PROJECT_ROOT / "server"))
+from services.ocr_corpus import (
+    COMPRESSIONS,
+    DEFAULT_CORPUS_DIR,
+    DEFAULT_SHARD_BYTES,
+    DEFAULT_TEXT_DIR,
+    OCRCorpus,
+    pack_directory,
+)
+
+
+def verify(text_dir: Path, corpus_dir: Path) -> int:
+    """Compare every packed document with its loose .txt file; returns the mismatch count"""
+    corpus = OCRCorpus(corpus_dir)
+    mismatches = 0
+    for doc_id, text in corpus.iter_texts():
+        with open(text_dir / f"{doc_id}.txt", encoding="utf-8", errors="replace") as f:
+            if f.read() != text:
+                mismatches += 1
+                print(f"⚠️  Mismatch: {doc_id}")
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack OCR text files into a corpus")
+    parser.add_argument("--text-dir", type=Path, default=DEFAULT_TEXT_DIR)
+    parser.add_argument("--output", type=Path, default=DEFAULT_CORPUS_DIR)
+    parser.add_argument("--compression", choices=COMPRESSIONS, default="none")
+    parser.add_argument(
+        "--shard-mb",
+        type=int,
+        default=DEFAULT_SHARD_BYTES // (1024 * 1024),
+        help="Start a new shard after this many MB",
+    )
+    parser.add_argument(
+        "--verify", action="store_true", help="Compare the packed corpus with the loose files"
+    )
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("PACK OCR CORPUS")
+    print("=" * 70)
+
+    if not args.text_dir.exists():
+        print(f"❌ {args.text_dir} not found")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    count = pack_directory(
+        args.text_dir, args.output, args.compression, args.shard_mb * 1024 * 1024
+    )
+    size = sum(path.stat().st_size for path in args.output.glob("shard-*.bin"))
+    print(f"✓ Packed {count:,} documents in {time.perf_counter() - start:.1f}s")
+    print(f"  {size / (1024 * 1024):.1f} MB ({args.compression}) → {args.output}")
+
+    if args.verify:
+        mismatches = verify(args.text_dir, args.output)
+        if mismatches:
+            print(f"❌ {mismatches} documents differ")
+            sys.exit(1)
+        print("✓ Verified against the loose files")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Document Embedding Matrix Builder
+Epstein Document Archive - RAG System
+
+Embeds every document in all_documents_index.json in batches and writes a
+persisted, memory-mapped embedding matrix that the server loads at startup
+for /api/documents/{doc_id}/similar.
+
+Design Decision: Offline batch build instead of per-request encoding
+Rationale: The similarity endpoint used to encode documents one at a time on
+every cold query. Encoding the corpus once in large batches is ~50x faster
+per document, and queries become a single matrix-vector product.
+
+Uses the same text selection as DocumentSimilarityService (first 3000 chars of
+OCR text, then markdown, summary, filename) so matrix and fallback agree.
+
+Output (data/vector_store/document_embeddings/):
+- embeddings-<gen>.npy: L2-normalized rows (float32 default, --dtype float16 to halve size)
+- ids.json: row → document ID mapping, the matrix file name and build metadata
+  (replaced last, so the API never pairs a new matrix with old IDs)
+
+Performance:
+- ~200-400 documents/second on CPU (batch size 256)
+- ~50MB (float32) / ~25MB (float16) for 33K documents
+
+Usage:
+    python3 scripts/rag/build_document_embeddings.py
+    python3 scripts/rag/build_document_embeddings.py --dtype float16 --batch-size 512
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from sentence_transformers import SentenceTransformer
+from tqdm import tqdm
+
+
+# Project paths
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DOC_INDEX_PATH = PROJECT_ROOT / "data/metadata/all_documents_index.json"
+
+sys.path.insert(0, str(PROJECT_ROOT / "server"))
+from services.document_similarity import load_document_text
+from services.embedding_matrix import DEFAULT_MATRIX_DIR, EmbeddingMatrixWriter
+
+
+MODEL_NAME = "all-MiniLM-L6-v2"
+
+
+def load_documents(index_path: Path) -> list[dict]:
+    """Load documents with IDs from the unified document index."""
+    with open(index_path) as f:
+        documents = json.load(f).get("documents", [])
+
+    seen = set()
+    unique_docs = []
+    for doc in documents:
+        doc_id = doc.get("id")
+        if doc_id and doc_id not in seen:
+            seen.add(doc_id)
+            unique_docs.append(doc)
+    return unique_docs
+
+
+def build_matrix(
+    index_path: Path,
+    output_dir: Path,
+    batch_size: int = 256,
+    dtype: str = "float32",
+):
+    """Embed all documents in batches and publish the matrix."""
+    print("=" * 70)
+    print("DOCUMENT EMBEDDING MATRIX BUILDER")
+    print("=" * 70)
+
+    documents = load_documents(index_path)
+    print(f"📄 Documents in index: {len(documents)}")
+
+    print(f"Loading model: {MODEL_NAME}")
+    model = SentenceTransformer(MODEL_NAME)
+    dim = model.get_sentence_embedding_dimension()
+
+    writer = EmbeddingMatrixWriter(
+        output_dir, count=len(documents), dim=dim, dtype=dtype, model_name=MODEL_NAME
+    )
+
+    ids: list[str] = []
+    batch_ids: list[str] = []
+    batch_texts: list[str] = []
+    start_time = time.time()
+
+    def flush():
+        if not batch_texts:
+            return
+        embeddings = model.encode(
+            batch_texts, batch_size=batch_size, show_progress_bar=False, convert_to_numpy=True
+        )
+        writer.write(len(ids), embeddings)
+        ids.extend(batch_ids)
+        batch_ids.clear()
+        batch_texts.clear()
+
+    for doc in tqdm(documents, desc="Embedding documents"):
+        text = load_document_text(doc)
+        if not text:
+            continue
+        batch_ids.append(doc["id"])
+        batch_texts.append(text)
+        if len(batch_texts) >= batch_size:
+            flush()
+    flush()
+
+    writer.close(ids)
+
+    elapsed = time.time() - start_time
+    print("\n" + "=" * 70)
+    print("✅ EMBEDDING MATRIX BUILD COMPLETE")
+    print("=" * 70)
+    print(f"Documents embedded: {len(ids)}")
+    print(f"Dimensions: {dim} ({dtype})")
+    print(f"Time elapsed: {elapsed:.1f}s ({len(ids) / max(elapsed, 1e-9):.1f} docs/second)")
+    print(f"Output: {output_dir}")
+    print("=" * 70)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build precomputed document embedding matrix for similarity search"
+    )
+    parser.add_argument("--index", type=Path, default=DOC_INDEX_PATH, help="Document index path")
+    parser.add_argument("--output", type=Path, default=DEFAULT_MATRIX_DIR, help="Output directory")
+    parser.add_argument("--batch-size", type=int, default=256, help="Encoding batch size")
+    parser.add_argument(
+        "--dtype", choices=["float32", "float16"], default="float32", help="Storage dtype"
+    )
+
+    args = parser.parse_args()
+
+    build_matrix(args.index, args.output, batch_size=args.batch_size, dtype=args.dtype)
+
+
+if __name__ == "__main__":
+    main()
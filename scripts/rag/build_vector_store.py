@@ -6,21 +6,58 @@ Epstein Document Archive - RAG System
 Embeds all 33,562 OCR documents into ChromaDB for semantic search.
 Uses sentence-transformers (all-MiniLM-L6-v2) for efficient embeddings.
 
+Design Decision: Three-stage pipeline
+Rationale: Reading files, encoding and writing to ChromaDB used to run one
+after another on a single thread, so the CPU-bound encoder sat idle during
+disk reads and collection writes. The stages now overlap:
+1. Reader threads prefetch and parse batches (file I/O, date and entity
+   extraction) into a bounded queue
+2. The main thread encodes each batch on a multi-process embedding pool
+3. A writer thread streams batches into the collection and appends their
+   IDs to the checkpoint log
+
+Failure handling: a stage thread that raises records its exception and sets a
+shared stop event. Queue puts/gets poll that event, so the other stages stop
+instead of blocking on a full or empty queue, and the exception is re-raised
+in the main thread. Batches already written stay checkpointed (resumable).
+
+Checkpointing: data/vector_store/embedding_progress.txt is append-only (one
+document ID per line, written after the batch is in the collection), instead
+of rewriting the full processed-files JSON after every batch. The legacy
+embedding_progress.json is still read on resume.
+
+Chunk mode (--chunks): documents are split into overlapping windows of the
+model's own tokens (200 tokens, 40 overlap) so nothing past the model's
+256-token limit is dropped. Chunk vectors go to the separate
+`epstein_document_chunks` collection with parent_doc_id, chunk_index and
+char_start/char_end metadata, which /api/rag/search?mode=passage uses to
+return the matched passage instead of the start of the file.
+
+Entity detection: one Aho–Corasick pass (substring semantics, same as the
+previous per-entity `in` scan) instead of one scan per entity name.
+
 Performance:
-- ~5-10 documents/second
-- ~5-6 hours for complete dataset
+- Throughput report (docs/second, per-stage busy time) printed at the end
+- Encoding dominates; scales with --workers up to the number of physical cores
 - ~2GB storage for embeddings
 
 Usage:
     python3 scripts/rag/build_vector_store.py
-    python3 scripts/rag/build_vector_store.py --batch-size 50
-    python3 scripts/rag/build_vector_store.py --resume
+    python3 scripts/rag/build_vector_store.py --batch-size 256 --workers 4
+    python3 scripts/rag/build_vector_store.py --no-resume
+    python3 scripts/rag/build_vector_store.py --chunks
 """
 
 import argparse
+import copy
 import json
+import os
+import queue
 import re
-from datetime import datetime
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -31,21 +68,130 @@ from tqdm import tqdm
 
 
 # Project paths
-PROJECT_ROOT = Path("/Users/masa/Projects/Epstein")
+PROJECT_ROOT = Path(__file__).parent.parent.parent
 OCR_TEXT_DIR = PROJECT_ROOT / "data/sources/house_oversight_nov2025/ocr_text"
 VECTOR_STORE_DIR = PROJECT_ROOT / "data/vector_store/chroma"
 ENTITY_INDEX_PATH = PROJECT_ROOT / "data/md/entities/ENTITIES_INDEX.json"
-PROGRESS_FILE = PROJECT_ROOT / "data/vector_store/embedding_progress.json"
+PROGRESS_LOG = PROJECT_ROOT / "data/vector_store/embedding_progress.txt"
+LEGACY_PROGRESS_FILE = PROJECT_ROOT / "data/vector_store/embedding_progress.json"
+CHUNK_PROGRESS_LOG = PROJECT_ROOT / "data/vector_store/chunk_embedding_progress.txt"
+
+sys.path.insert(0, str(PROJECT_ROOT / "server"))
+from services.ocr_corpus import get_ocr_corpus, read_ocr_text
+from services.ocr_quality_scores import get_ocr_quality_scores
+from services.passage_retrieval import CHUNK_COLLECTION_NAME
+from services.vector_filters import filter_metadata
+from utils.aho_corasick import AhoCorasickMatcher
+from utils.text_chunker import chunk_text, model_token_offsets
+
 
 # Collection name
 COLLECTION_NAME = "epstein_documents"
 
+# Chunk windows (model tokens, excluding CLS/SEP; all-MiniLM-L6-v2 reads 256)
+CHUNK_WINDOW = 200
+CHUNK_OVERLAP = 40
+
+DEFAULT_WORKERS = max(1, (os.cpu_count() or 1) // 2)
+
+# Upper bound on entries per collection.add (the client's own limit, if lower,
+# wins); in --chunks mode one document batch expands to thousands of chunks
+MAX_ADD_BATCH = 5000
+
+# End-of-stream marker for pipeline queues
+_DONE = object()
+
+# How often a stage blocked on a queue checks whether another stage failed
+STAGE_POLL_SECONDS = 0.5
+
+
+class ProgressLog:
+    """
+    Append-only checkpoint of processed document IDs.
+
+    One ID per line; each batch is appended and flushed once it has been
+    written to the collection, so an interrupted run loses at most the
+    batches still in flight.
+    """
+
+    def __init__(self, path: Path = PROGRESS_LOG, legacy_path: Optional[Path] = None):
+        self.path = path
+        self.legacy_path = legacy_path
+        self._file = None
+
+    def load(self) -> set:
+        """Read all processed IDs (including the legacy JSON progress file)."""
+        processed = set()
+
+        if self.legacy_path and self.legacy_path.exists():
+            with open(self.legacy_path) as f:
+                processed.update(json.load(f).get("processed_files", []))
+
+        if self.path.exists():
+            with open(self.path, encoding="utf-8") as f:
+                processed.update(line.strip() for line in f if line.strip())
+
+        return processed
+
+    def reset(self):
+        """Discard all checkpoints."""
+        for path in (self.path, self.legacy_path):
+            if path and path.exists():
+                path.unlink()
+
+    def append(self, doc_ids: list[str]):
+        """Append processed IDs and flush."""
+        if not doc_ids:
+            return
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write("".join(f"{doc_id}\n" for doc_id in doc_ids))
+        self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
 
 class VectorStoreBuilder:
-    def __init__(self, batch_size: int = 100, resume: bool = True):
-        """Initialize the vector store builder."""
+    def __init__(
+        self,
+        batch_size: int = 256,
+        resume: bool = True,
+        workers: int = DEFAULT_WORKERS,
+        readers: int = 4,
+        prefetch: int = 4,
+        chunks: bool = False,
+        chunk_window: int = CHUNK_WINDOW,
+        chunk_overlap: int = CHUNK_OVERLAP,
+    ):
+        """
+        Initialize the vector store builder.
+
+        Args:
+            batch_size: Documents per pipeline batch (collection.add calls of at
+                    most max_add_batch entries each)
+            resume: Skip documents listed in the checkpoint log
+            workers: Embedding processes (1 = encode in this process)
+            readers: Reader threads for file I/O and metadata extraction
+            prefetch: Batches read ahead of the encoder
+            chunks: Embed overlapping token windows into the chunk collection
+                    instead of whole documents into the document collection
+            chunk_window: Tokens per chunk
+            chunk_overlap: Tokens shared by consecutive chunks
+        """
         self.batch_size = batch_size
         self.resume = resume
+        self.workers = workers
+        self.readers = readers
+        self.prefetch = prefetch
+        self.chunks = chunks
+        self.chunk_window = chunk_window
+        self.chunk_overlap = chunk_overlap
+        self.collection_name = CHUNK_COLLECTION_NAME if chunks else COLLECTION_NAME
+        self._tokenizers = threading.local()
 
         # Create vector store directory
         VECTOR_STORE_DIR.mkdir(parents=True, exist_ok=True)
@@ -58,16 +204,20 @@ class VectorStoreBuilder:
         )
 
         # Get or create collection
+        description = "Epstein Document Archive - OCR Text Embeddings"
+        if chunks:
+            description = "Epstein Document Archive - OCR Passage Embeddings"
         try:
-            self.collection = self.client.get_collection(name=COLLECTION_NAME)
-            print(f"✅ Found existing collection: {COLLECTION_NAME}")
-            print(f"   Current documents: {self.collection.count()}")
+            self.collection = self.client.get_collection(name=self.collection_name)
+            print(f"✅ Found existing collection: {self.collection_name}")
+            print(f"   Current entries: {self.collection.count()}")
         except:
             self.collection = self.client.create_collection(
-                name=COLLECTION_NAME,
-                metadata={"description": "Epstein Document Archive - OCR Text Embeddings"},
+                name=self.collection_name,
+                metadata={"description": description},
             )
-            print(f"✅ Created new collection: {COLLECTION_NAME}")
+            print(f"✅ Created new collection: {self.collection_name}")
+        self.max_add_batch = self._max_add_batch()
 
         # Initialize embedding model
         print("\nLoading sentence-transformers model...")
@@ -77,10 +227,31 @@ class VectorStoreBuilder:
 
         # Load entity index for entity detection
         self.entity_index = self._load_entity_index()
+        self.entity_matcher = self._build_entity_matcher()
+
+        # Per-document OCR quality (scripts/analysis/score_ocr_quality.py), stored as metadata
+        self.quality_scores = get_ocr_quality_scores()
+        if self.quality_scores:
+            print(f"✅ OCR quality scores for {len(self.quality_scores)} documents")
 
         # Load progress
+        if chunks:
+            self.progress = ProgressLog(CHUNK_PROGRESS_LOG)
+        else:
+            self.progress = ProgressLog(PROGRESS_LOG, legacy_path=LEGACY_PROGRESS_FILE)
         self.processed_files = self._load_progress()
 
+        self.stats = {
+            "read_seconds": 0.0,
+            "encode_seconds": 0.0,
+            "write_seconds": 0.0,
+            "embedded": 0,
+            "chunks": 0,
+            "skipped": 0,
+            "failed": 0,
+        }
+        self._stats_lock = threading.Lock()
+
     def _load_entity_index(self) -> dict:
         """Load entity index for entity mention detection."""
         if ENTITY_INDEX_PATH.exists():
@@ -90,29 +261,39 @@ class VectorStoreBuilder:
                 return data
         return {"entities": []}
 
+    def _build_entity_matcher(self) -> AhoCorasickMatcher:
+        """
+        Build one automaton for all entity names.
+
+        Patterns: the full name, plus the last name for "LastName, FirstName"
+        entries (if longer than 3 characters). Payload is the entity name.
+        """
+        matcher = AhoCorasickMatcher()
+        for entity in self.entity_index.get("entities", []):
+            name = entity.get("name", "")
+            if not name:
+                continue
+
+            matcher.add(name, name)
+
+            if "," in name:
+                last_name = name.split(",")[0].strip()
+                if len(last_name) > 3:
+                    matcher.add(last_name, name)
+
+        matcher.build()
+        return matcher
+
     def _load_progress(self) -> set:
         """Load previously processed files for resume capability."""
-        if self.resume and PROGRESS_FILE.exists():
-            with open(PROGRESS_FILE) as f:
-                progress = json.load(f)
-                processed = set(progress.get("processed_files", []))
-                print(f"✅ Resume enabled: {len(processed)} files already processed")
-                return processed
-        return set()
-
-    def _save_progress(self, processed_files: set):
-        """Save progress for resume capability."""
-        PROGRESS_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with open(PROGRESS_FILE, "w") as f:
-            json.dump(
-                {
-                    "processed_files": list(processed_files),
-                    "last_updated": datetime.now().isoformat(),
-                    "total_processed": len(processed_files),
-                },
-                f,
-                indent=2,
-            )
+        if not self.resume:
+            self.progress.reset()
+            return set()
+
+        processed = self.progress.load()
+        if processed:
+            print(f"✅ Resume enabled: {len(processed)} files already processed")
+        return processed
 
     def _extract_date(self, text: str) -> Optional[str]:
         """Extract date from document text (basic pattern matching)."""
@@ -126,44 +307,41 @@ class VectorStoreBuilder:
         for pattern in patterns:
             match = re.search(pattern, text, re.IGNORECASE)
             if match:
-                return match.group(1)
+                return match.group(0)
 
         return None
 
     def _detect_entity_mentions(self, text: str) -> list[str]:
-        """Detect entity mentions in document text."""
-        mentioned_entities = []
-        text_lower = text.lower()
+        """
+        Detect entity mentions in document text.
 
-        for entity in self.entity_index.get("entities", []):
-            name = entity.get("name", "")
-            if not name:
-                continue
-
-            # Check for entity name (case-insensitive)
-            if name.lower() in text_lower:
-                mentioned_entities.append(name)
-                continue
-
-            # Check variations (last name only for "LastName, FirstName" format)
-            if "," in name:
-                last_name = name.split(",")[0].strip()
-                if len(last_name) > 3 and last_name.lower() in text_lower:
-                    mentioned_entities.append(name)
-
-        return list(set(mentioned_entities))  # Remove duplicates
+        Case-insensitive substring matching (no word boundaries), in one pass
+        over the text regardless of the number of entities.
+        """
+        return list(self.entity_matcher.find_substring_payloads(text))
 
     def _get_document_files(self) -> list[Path]:
-        """Get all .txt files from OCR directory."""
-        txt_files = sorted(OCR_TEXT_DIR.glob("*.txt"))
-        print(f"\n📄 Found {len(txt_files)} text files")
+        """
+        Get all OCR text documents (as ocr_text/<doc_id>.txt paths).
+
+        Documents in the packed corpus (scripts/extraction/pack_ocr_corpus.py)
+        come first, in storage order, so reads stream through the shards;
+        loose .txt files not yet packed follow.
+        """
+        corpus = get_ocr_corpus()
+        packed = corpus.doc_ids if corpus is not None else []
+        packed_ids = set(packed)
+        loose = sorted(path for path in OCR_TEXT_DIR.glob("*.txt") if path.stem not in packed_ids)
+        txt_files = [OCR_TEXT_DIR / f"{doc_id}.txt" for doc_id in packed] + loose
+        print(f"\n📄 Found {len(txt_files)} text files ({len(packed)} packed)")
         return txt_files
 
     def _read_document(self, file_path: Path) -> Optional[dict]:
         """Read document and extract metadata."""
         try:
-            with open(file_path, encoding="utf-8") as f:
-                text = f.read()
+            text = read_ocr_text(file_path.stem, text_dir=file_path.parent)
+            if text is None:
+                return None
 
             # Skip empty documents
             if len(text.strip()) < 50:
@@ -185,7 +363,12 @@ class VectorStoreBuilder:
                 "file_size": len(text),
                 "date_extracted": date if date else "",
                 "entity_mentions": ", ".join(entities) if entities else "",
+                # Normalized date/date_epoch and entity_ids for filter pushdown
+                **filter_metadata(date, entities),
             }
+            quality = self.quality_scores.get(doc_id) if self.quality_scores else None
+            if quality is not None:
+                metadata["ocr_quality"] = quality
 
             return {"id": doc_id, "text": text, "metadata": metadata}
 
@@ -193,7 +376,145 @@ class VectorStoreBuilder:
             print(f"⚠️  Error reading {file_path.name}: {e}")
             return None
 
-    def build_vector_store(self):
+    def _chunk_document(self, doc: dict) -> list[dict]:
+        """
+        Split a document into chunk records with parent ID and offsets.
+
+        Each reader thread tokenizes with its own tokenizer copy (fast
+        tokenizers are not safe to share across threads).
+        """
+        offsets = getattr(self._tokenizers, "offsets", None)
+        if offsets is None:
+            offsets = model_token_offsets(copy.deepcopy(self.model.tokenizer))
+            self._tokenizers.offsets = offsets
+
+        records = []
+        for chunk in chunk_text(
+            doc["text"], window=self.chunk_window, overlap=self.chunk_overlap, tokenize=offsets
+        ):
+            metadata = dict(doc["metadata"])
+            metadata.update(
+                {
+                    "parent_doc_id": doc["id"],
+                    "chunk_index": chunk.index,
+                    "char_start": chunk.start,
+                    "char_end": chunk.end,
+                }
+            )
+            records.append(
+                {"id": f"{doc['id']}#c{chunk.index}", "text": chunk.text, "metadata": metadata}
+            )
+        return records
+
+    def _timed_read(self, file_path: Path) -> Optional[dict]:
+        start = time.perf_counter()
+        try:
+            doc = self._read_document(file_path)
+            if doc and self.chunks:
+                doc["records"] = self._chunk_document(doc)
+            return doc
+        finally:
+            with self._stats_lock:
+                self.stats["read_seconds"] += time.perf_counter() - start
+
+    # ==================== Pipeline stages ====================
+
+    def _fail(self, error: BaseException):
+        """Record a stage thread's exception and stop the other stages."""
+        if self._stage_error is None:
+            self._stage_error = error
+        self._stop.set()
+
+    def _check_stop(self):
+        """Raise the failed stage's exception once the pipeline is stopped."""
+        if self._stop.is_set():
+            raise self._stage_error or RuntimeError("Vector store pipeline stopped")
+
+    def _put(self, stage_queue: queue.Queue, item):
+        """Blocking put that gives up when another stage has failed."""
+        while True:
+            try:
+                stage_queue.put(item, timeout=STAGE_POLL_SECONDS)
+                return
+            except queue.Full:
+                self._check_stop()
+
+    def _get(self, stage_queue: queue.Queue):
+        """Blocking get that gives up when another stage has failed."""
+        while True:
+            try:
+                return stage_queue.get(timeout=STAGE_POLL_SECONDS)
+            except queue.Empty:
+                self._check_stop()
+
+    def _read_stage(self, files: list[Path], out_queue: queue.Queue):
+        """Stage 1: read batches with a thread pool, bounded by the queue size."""
+        try:
+            with ThreadPoolExecutor(max_workers=self.readers) as pool:
+                for start in range(0, len(files), self.batch_size):
+                    chunk = files[start : start + self.batch_size]
+                    docs = list(pool.map(self._timed_read, chunk))
+                    self._put(out_queue, (chunk, docs))
+            self._put(out_queue, _DONE)
+        except BaseException as e:
+            self._fail(e)
+
+    def _encode(self, texts: list[str], pool: Optional[dict]):
+        """Stage 2: encode a batch (multi-process pool if available)."""
+        start = time.perf_counter()
+        try:
+            if pool is not None:
+                return self.model.encode_multi_process(texts, pool, batch_size=32)
+            return self.model.encode(texts, show_progress_bar=False, convert_to_numpy=True)
+        finally:
+            self.stats["encode_seconds"] += time.perf_counter() - start
+
+    def _write_stage(self, in_queue: queue.Queue, pbar: tqdm):
+        """Stage 3: stream batches into the collection and checkpoint them."""
+        try:
+            self._write_batches(in_queue, pbar)
+        except BaseException as e:
+            self._fail(e)
+
+    def _write_batches(self, in_queue: queue.Queue, pbar: tqdm):
+        while True:
+            item = self._get(in_queue)
+            if item is _DONE:
+                return
+
+            docs, records, embeddings, skipped_ids = item
+            start = time.perf_counter()
+            written = set(self._process_batch(records, embeddings)) if records else set()
+
+            # A document is done once all of its records are in the collection
+            failed_docs = {
+                record.get("parent", record["id"])
+                for record in records
+                if record["id"] not in written
+            }
+            done = [doc["id"] for doc in docs if doc["id"] not in failed_docs]
+            self.progress.append(done + skipped_ids)
+            self.stats["write_seconds"] += time.perf_counter() - start
+
+            self.stats["embedded"] += len(done)
+            self.stats["chunks"] += len(written) if self.chunks else 0
+            self.stats["failed"] += len(docs) - len(done)
+            self.stats["skipped"] += len(skipped_ids)
+            pbar.update(len(docs) + len(skipped_ids))
+
+    def _to_records(self, docs: list[dict]) -> list[dict]:
+        """Collection entries for a batch: one per document, or one per chunk."""
+        if not self.chunks:
+            return docs
+
+        records = []
+        for doc in docs:
+            for record in doc.get("records", []):
+                record["parent"] = doc["id"]
+                records.append(record)
+        return records
+
+    def build_vector_store(self) -> dict:
         """Build the complete vector store."""
         print("\n" + "=" * 70)
         print("CHROMADB VECTOR STORE BUILDER")
@@ -208,112 +529,187 @@ class VectorStoreBuilder:
         if not files_to_process:
             print("\n✅ All documents already processed!")
             print(f"Total documents in collection: {self.collection.count()}")
-            return
+            return self.stats
 
         print(f"📊 Files to process: {len(files_to_process)}")
         print(f"   Already processed: {len(self.processed_files)}")
         print(f"   Batch size: {self.batch_size}")
+        print(f"   Embedding workers: {self.workers}, reader threads: {self.readers}")
+        if self.chunks:
+            print(f"   Chunks: {self.chunk_window} tokens, {self.chunk_overlap} overlap")
+
+        read_queue: queue.Queue = queue.Queue(maxsize=self.prefetch)
+        write_queue: queue.Queue = queue.Queue(maxsize=2)
+        self._stop = threading.Event()
+        self._stage_error: Optional[BaseException] = None
 
-        # Process in batches
-        batch_docs = []
-        batch_ids = []
-        batch_metadatas = []
-
-        start_time = datetime.now()
-
-        with tqdm(total=len(files_to_process), desc="Embedding documents") as pbar:
-            for file_path in files_to_process:
-                # Read document
-                doc = self._read_document(file_path)
-                if not doc:
-                    self.processed_files.add(file_path.stem)
-                    pbar.update(1)
-                    continue
-
-                # Add to batch
-                batch_docs.append(doc["text"])
-                batch_ids.append(doc["id"])
-                batch_metadatas.append(doc["metadata"])
-
-                # Process batch when full
-                if len(batch_docs) >= self.batch_size:
-                    self._process_batch(batch_docs, batch_ids, batch_metadatas)
-
-                    # Mark as processed
-                    for doc_id in batch_ids:
-                        self.processed_files.add(doc_id)
-
-                    # Save progress
-                    self._save_progress(self.processed_files)
-
-                    # Clear batch
-                    batch_docs = []
-                    batch_ids = []
-                    batch_metadatas = []
-
-                    pbar.update(self.batch_size)
-
-        # Process remaining documents
-        if batch_docs:
-            self._process_batch(batch_docs, batch_ids, batch_metadatas)
-            for doc_id in batch_ids:
-                self.processed_files.add(doc_id)
-            self._save_progress(self.processed_files)
-
-        # Final statistics
-        elapsed = datetime.now() - start_time
+        pool = None
+        if self.workers > 1:
+            pool = self.model.start_multi_process_pool(target_devices=["cpu"] * self.workers)
+
+        start_time = time.perf_counter()
+
+        try:
+            with tqdm(total=len(files_to_process), desc="Embedding documents") as pbar:
+                reader = threading.Thread(
+                    target=self._read_stage, args=(files_to_process, read_queue), daemon=True
+                )
+                writer = threading.Thread(
+                    target=self._write_stage, args=(write_queue, pbar), daemon=True
+                )
+                reader.start()
+                writer.start()
+
+                try:
+                    while (item := self._get(read_queue)) is not _DONE:
+                        files, docs = item
+                        valid_docs = [doc for doc in docs if doc]
+                        skipped_ids = [f.stem for f, doc in zip(files, docs) if not doc]
+
+                        records = self._to_records(valid_docs)
+
+                        embeddings = None
+                        if records:
+                            embeddings = self._encode([r["text"] for r in records], pool)
+
+                        self._put(write_queue, (valid_docs, records, embeddings, skipped_ids))
+
+                    self._put(write_queue, _DONE)
+                    writer.join()
+                    self._check_stop()
+                except BaseException:
+                    # Stop the reader and writer; the first failure is re-raised
+                    self._stop.set()
+                    raise
+        finally:
+            if pool is not None:
+                self.model.stop_multi_process_pool(pool)
+            self.progress.close()
+
+        elapsed = time.perf_counter() - start_time
+        self._print_report(len(files_to_process), elapsed)
+
+        return self.stats
+
+    def _print_report(self, file_count: int, elapsed: float):
+        """Print final statistics and throughput."""
         total_docs = self.collection.count()
+        throughput = file_count / max(elapsed, 1e-9)
+        self.stats["elapsed_seconds"] = elapsed
+        self.stats["docs_per_second"] = throughput
 
         print("\n" + "=" * 70)
         print("✅ VECTOR STORE BUILD COMPLETE")
         print("=" * 70)
-        print(f"Total documents embedded: {total_docs}")
-        print(f"Time elapsed: {elapsed}")
-        print(f"Average speed: {len(files_to_process) / elapsed.total_seconds():.2f} docs/second")
+        print(f"Total entries in {self.collection_name}: {total_docs}")
+        print(
+            f"This run: {self.stats['embedded']} embedded, {self.stats['skipped']} skipped, "
+            f"{self.stats['failed']} failed"
+            + (f" ({self.stats['chunks']} chunks)" if self.chunks else "")
+        )
+        print(f"Time elapsed: {elapsed:.1f}s")
+        print(f"Throughput: {throughput:.2f} docs/second")
+        print(
+            f"Stage busy time: read {self.stats['read_seconds']:.1f}s "
+            f"(across {self.readers} threads), encode {self.stats['encode_seconds']:.1f}s, "
+            f"write {self.stats['write_seconds']:.1f}s"
+        )
+        print(f"Checkpoint log: {self.progress.path}")
         print(f"Storage location: {VECTOR_STORE_DIR}")
         print("=" * 70)
 
-    def _process_batch(self, documents: list[str], ids: list[str], metadatas: list[dict]):
-        """Process a batch of documents and add to ChromaDB."""
+    def _max_add_batch(self) -> int:
+        """Entries per collection.add: the client's max batch size, capped at MAX_ADD_BATCH"""
+        try:
+            limit = self.client.get_max_batch_size()
+        except AttributeError:  # older chromadb clients
+            limit = getattr(self.client, "max_batch_size", None) or MAX_ADD_BATCH
+        return max(1, min(limit, MAX_ADD_BATCH))
+
+    def _process_batch(self, docs: list[dict], embeddings) -> list[str]:
+        """
+        Add an encoded batch (documents or chunks) to ChromaDB.
+
+        Entries are added in slices of max_add_batch, so a chunk batch never
+        exceeds the client's batch limit (which would force the slow
+        one-by-one fallback for the whole batch).
+
+        Returns:
+            IDs of entries that were written
+        """
+        written = []
+        for start in range(0, len(docs), self.max_add_batch):
+            end = start + self.max_add_batch
+            written.extend(self._add_slice(docs[start:end], embeddings[start:end]))
+        return written
+
+    def _add_slice(self, docs: list[dict], embeddings) -> list[str]:
+        """One collection.add, falling back to per-entry adds if it fails"""
+        ids = [doc["id"] for doc in docs]
         try:
-            # Generate embeddings
-            embeddings = self.model.encode(
-                documents, show_progress_bar=False, convert_to_numpy=True
-            )
-
-            # Add to collection
             self.collection.add(
-                embeddings=embeddings.tolist(), documents=documents, ids=ids, metadatas=metadatas
+                embeddings=embeddings.tolist(),
+                documents=[doc["text"] for doc in docs],
+                ids=ids,
+                metadatas=[doc["metadata"] for doc in docs],
             )
+            return ids
 
         except Exception as e:
             print(f"\n⚠️  Error processing batch: {e}")
-            # Try processing one by one
-            for doc, doc_id, metadata in zip(documents, ids, metadatas):
+            # Try adding one by one (embeddings are already computed)
+            written = []
+            for doc, embedding in zip(docs, embeddings):
                 try:
-                    embedding = self.model.encode([doc], show_progress_bar=False)
                     self.collection.add(
-                        embeddings=embedding.tolist(),
-                        documents=[doc],
-                        ids=[doc_id],
-                        metadatas=[metadata],
+                        embeddings=[embedding.tolist()],
+                        documents=[doc["text"]],
+                        ids=[doc["id"]],
+                        metadatas=[doc["metadata"]],
                     )
+                    written.append(doc["id"])
                 except Exception as e2:
-                    print(f"⚠️  Failed to process {doc_id}: {e2}")
+                    print(f"⚠️  Failed to process {doc['id']}: {e2}")
+            return written
 
 
 def main():
     parser = argparse.ArgumentParser(
         description="Build ChromaDB vector store for Epstein documents"
     )
-    parser.add_argument("--batch-size", type=int, default=100, help="Batch size for processing")
+    parser.add_argument("--batch-size", type=int, default=256, help="Batch size for processing")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Embedding processes (default: {DEFAULT_WORKERS}, 1 disables the pool)",
+    )
+    parser.add_argument("--readers", type=int, default=4, help="Reader threads (default: 4)")
+    parser.add_argument(
+        "--prefetch", type=int, default=4, help="Batches to read ahead (default: 4)"
+    )
+    parser.add_argument(
+        "--chunks",
+        action="store_true",
+        help=f"Embed {CHUNK_WINDOW}-token overlapping chunks into '{CHUNK_COLLECTION_NAME}'",
+    )
+    parser.add_argument(
+        "--resume", action="store_true", help="Resume from checkpoint (default behavior)"
+    )
     parser.add_argument(
         "--no-resume", action="store_true", help="Start from scratch (ignore progress)"
     )
 
     args = parser.parse_args()
 
-    builder = VectorStoreBuilder(batch_size=args.batch_size, resume=not args.no_resume)
+    builder = VectorStoreBuilder(
+        batch_size=args.batch_size,
+        resume=not args.no_resume,
+        workers=args.workers,
+        readers=args.readers,
+        prefetch=args.prefetch,
+        chunks=args.chunks,
+    )
 
     builder.build_vector_store()
 
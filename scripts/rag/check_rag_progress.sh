@@ -3,7 +3,7 @@
 # Usage: bash scripts/rag/check_rag_progress.sh
 
 LOG_FILE="/tmp/rag_build.log"
-PROGRESS_FILE="/Users/masa/Projects/Epstein/data/vector_store/embedding_progress.json"
+PROGRESS_FILE="$(cd "$(dirname "$0")/../.." && pwd)/data/vector_store/embedding_progress.txt"
 
 echo "========================================"
 echo "RAG Vector Store Build Progress"
@@ -27,13 +27,8 @@ echo ""
 # Show progress file stats if exists
 if [ -f "$PROGRESS_FILE" ]; then
     echo "Progress File Stats:"
-    python3 -c "
-import json
-with open('$PROGRESS_FILE', 'r') as f:
-    data = json.load(f)
-    print(f\"  Documents processed: {data.get('total_processed', 0):,}")
-    print(f\"  Last updated: {data.get('last_updated', 'N/A')}\")
-"
+    echo "  Documents processed: $(wc -l < "$PROGRESS_FILE" | tr -d ' ')"
+    echo "  Last updated: $(date -r "$PROGRESS_FILE")"
     echo ""
 fi
 
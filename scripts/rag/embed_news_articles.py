@@ -25,6 +25,7 @@ Usage:
 
 import argparse
 import json
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -43,6 +44,9 @@ PROGRESS_FILE = PROJECT_ROOT / "data/vector_store/news_embedding_progress.json"
 
 COLLECTION_NAME = "epstein_documents"
 
+sys.path.insert(0, str(PROJECT_ROOT / "server"))
+from services.vector_filters import filter_metadata
+
 
 class NewsArticleEmbedder:
     """
@@ -245,6 +249,8 @@ class NewsArticleEmbedder:
             # Processing metadata
             "scraped_at": article.get("scraped_at", ""),
             "embedded_at": datetime.now().isoformat(),
+            # Normalized date/date_epoch and entity_ids for filter pushdown
+            **filter_metadata(article.get("published_date", ""), entities),
         }
 
         return metadata
@@ -14,11 +14,13 @@ Usage:
 
 import argparse
 import json
+import sys
 from collections import defaultdict
 from pathlib import Path
 from typing import Optional
 
 import chromadb
+import numpy as np
 from chromadb.config import Settings
 from sentence_transformers import SentenceTransformer
 
@@ -28,9 +30,13 @@ PROJECT_ROOT = Path("/Users/masa/Projects/Epstein")
 VECTOR_STORE_DIR = PROJECT_ROOT / "data/vector_store/chroma"
 ENTITY_DOC_INDEX_PATH = PROJECT_ROOT / "data/metadata/entity_document_index.json"
 ENTITY_NETWORK_PATH = PROJECT_ROOT / "data/metadata/entity_network.json"
+DATE_TABLE_PATH = PROJECT_ROOT / "data/vector_store/document_dates.json"
 
 COLLECTION_NAME = "epstein_documents"
 
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "server"))
+from services.document_fetch import fetch_documents, get_document_date_table
+
 
 class KnowledgeGraphRAG:
     def __init__(self):
@@ -61,6 +67,17 @@ class KnowledgeGraphRAG:
         # Build adjacency list for graph traversal
         self.adjacency_list = self._build_adjacency_list()
 
+        # Date side-table (loaded on first temporal query)
+        self._date_table = None
+
+    @property
+    def date_table(self):
+        """Columnar (id, date) projection of the collection metadata."""
+        if self._date_table is None:
+            self._date_table = get_document_date_table(self.collection, DATE_TABLE_PATH)
+            print(f"✅ Date side-table loaded: {len(self._date_table)} documents")
+        return self._date_table
+
     def _build_adjacency_list(self) -> dict[str, list[tuple[str, int]]]:
         """Build adjacency list from entity network for graph traversal."""
         adj_list = defaultdict(list)
@@ -163,35 +180,26 @@ class KnowledgeGraphRAG:
         self, doc_ids: list[str], query: str, limit: int
     ) -> list[dict]:
         """Rank documents by semantic similarity to query."""
-        # Generate query embedding
-        query_embedding = self.model.encode([query])[0]
-
-        # Get documents from ChromaDB
-        results = []
-        for doc_id in doc_ids:
-            doc = self.collection.get(ids=[doc_id])
-            if doc["ids"]:
-                # Calculate similarity
-                doc_text = doc["documents"][0]
-                doc_embedding = self.model.encode([doc_text])[0]
-
-                # Cosine similarity
-                similarity = float(
-                    sum(a * b for a, b in zip(query_embedding, doc_embedding))
-                    / (
-                        sum(a**2 for a in query_embedding) ** 0.5
-                        * sum(b**2 for b in doc_embedding) ** 0.5
-                    )
-                )
-
-                results.append(
-                    {
-                        "id": doc_id,
-                        "similarity": similarity,
-                        "text": doc_text,
-                        "metadata": doc["metadatas"][0],
-                    }
-                )
+        # Get documents from ChromaDB (batched gets)
+        documents = fetch_documents(self.collection, doc_ids)
+        if not documents:
+            return []
+
+        # Encode query and documents in one batch, cosine similarity as a matrix product
+        texts = [doc["text"] for doc in documents.values()]
+        embeddings = self.model.encode([query, *texts])
+        embeddings = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+        similarities = embeddings[1:] @ embeddings[0]
+
+        results = [
+            {
+                "id": doc_id,
+                "similarity": float(similarity),
+                "text": doc["text"],
+                "metadata": doc["metadata"],
+            }
+            for (doc_id, doc), similarity in zip(documents.items(), similarities)
+        ]
 
         # Sort by similarity
         results.sort(key=lambda x: x["similarity"], reverse=True)
@@ -202,32 +210,30 @@ class KnowledgeGraphRAG:
     ) -> list[dict]:
         """Rank documents by total entity mention count."""
         doc_scores = defaultdict(int)
+        candidates = set(doc_ids)
 
         # Calculate total mentions for each document
         for entity in entities:
             entity_data = entity_to_docs.get(entity, {})
             for doc in entity_data.get("documents", []):
-                if doc["doc_id"] in doc_ids:
+                if doc["doc_id"] in candidates:
                     doc_scores[doc["doc_id"]] += doc["mentions"]
 
         # Get top documents
         top_docs = sorted(doc_scores.items(), key=lambda x: x[1], reverse=True)[:limit]
 
-        # Retrieve from ChromaDB
-        results = []
-        for doc_id, score in top_docs:
-            doc = self.collection.get(ids=[doc_id])
-            if doc["ids"]:
-                results.append(
-                    {
-                        "id": doc_id,
-                        "mention_score": score,
-                        "text": doc["documents"][0],
-                        "metadata": doc["metadatas"][0],
-                    }
-                )
-
-        return results
+        # Retrieve from ChromaDB (one batched get)
+        documents = fetch_documents(self.collection, [doc_id for doc_id, _ in top_docs])
+        return [
+            {
+                "id": doc_id,
+                "mention_score": score,
+                "text": documents[doc_id]["text"],
+                "metadata": documents[doc_id]["metadata"],
+            }
+            for doc_id, score in top_docs
+            if doc_id in documents
+        ]
 
     def temporal_entity_query(
         self,
@@ -239,6 +245,10 @@ class KnowledgeGraphRAG:
         """
         Find documents mentioning entity within a date range.
 
+        Dates come from the columnar side-table, so only the returned page of
+        documents is fetched from ChromaDB. Undated documents are excluded; a
+        bare year bound covers the whole year.
+
         Args:
             entity: Entity name
             start_date: Start date (YYYY-MM-DD or YYYY)
@@ -246,7 +256,7 @@ class KnowledgeGraphRAG:
             limit: Maximum results
 
         Returns:
-            List of documents within date range
+            List of documents within date range, oldest first
         """
         print(f"\n📅 Temporal query: {entity} ({start_date} to {end_date})")
 
@@ -256,42 +266,26 @@ class KnowledgeGraphRAG:
             print(f"❌ Entity not found: {entity}")
             return []
 
-        entity_data = entity_to_docs[entity]
-        results = []
-
-        for doc_info in entity_data["documents"]:
-            doc_id = doc_info["doc_id"]
-
-            # Get document metadata
-            doc = self.collection.get(ids=[doc_id])
-            if not doc["ids"]:
-                continue
-
-            metadata = doc["metadatas"][0]
-            doc_date = metadata.get("date_extracted")
-
-            # Filter by date range
-            if doc_date:
-                if start_date and doc_date < start_date:
-                    continue
-                if end_date and doc_date > end_date:
-                    continue
-
-                results.append(
-                    {
-                        "id": doc_id,
-                        "date": doc_date,
-                        "mentions": doc_info["mentions"],
-                        "text": doc["documents"][0],
-                        "metadata": metadata,
-                    }
-                )
-
-        # Sort by date
-        results.sort(key=lambda x: x["date"] or "")
-        print(f"✅ Found {len(results)} documents in date range")
-
-        return results[:limit]
+        mentions = {doc["doc_id"]: doc["mentions"] for doc in entity_to_docs[entity]["documents"]}
+
+        # Filter and sort by date without touching document text
+        in_range = self.date_table.select(mentions, start_date, end_date)
+        print(f"✅ Found {len(in_range)} documents in date range")
+
+        # Fetch only the returned page (one batched get)
+        page = in_range[:limit]
+        documents = fetch_documents(self.collection, [doc_id for doc_id, _ in page])
+        return [
+            {
+                "id": doc_id,
+                "date": doc_date,
+                "mentions": mentions[doc_id],
+                "text": documents[doc_id]["text"],
+                "metadata": documents[doc_id]["metadata"],
+            }
+            for doc_id, doc_date in page
+            if doc_id in documents
+        ]
 
     def graph_enhanced_search(
         self,
@@ -421,7 +415,10 @@ def main():
         if args.date_range:
             start_date, end_date = args.date_range
 
-        results = kg_rag.temporal_entity_query(args.temporal, start_date, end_date, args.limit)
+        try:
+            results = kg_rag.temporal_entity_query(args.temporal, start_date, end_date, args.limit)
+        except ValueError as e:
+            parser.error(str(e))
 
     elif args.query:
         # Hybrid search
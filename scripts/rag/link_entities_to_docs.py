@@ -16,6 +16,7 @@ Usage:
 import argparse
 import json
 import re
+import sys
 from collections import defaultdict
 from pathlib import Path
 
@@ -28,6 +29,10 @@ OCR_TEXT_DIR = PROJECT_ROOT / "data/sources/house_oversight_nov2025/ocr_text"
 ENTITY_INDEX_PATH = PROJECT_ROOT / "data/md/entities/ENTITIES_INDEX.json"
 OUTPUT_PATH = PROJECT_ROOT / "data/metadata/entity_document_index.json"
 ENTITY_NETWORK_PATH = PROJECT_ROOT / "data/metadata/entity_network.json"
+OCR_CORPUS_DIR = PROJECT_ROOT / "data/sources/house_oversight_nov2025/ocr_corpus"
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "server"))
+from services.ocr_corpus import get_ocr_corpus, read_ocr_text
 
 
 class EntityDocumentLinker:
@@ -112,9 +117,13 @@ class EntityDocumentLinker:
         return mentions
 
     def _get_document_files(self) -> list[Path]:
-        """Get all .txt files from OCR directory."""
-        txt_files = sorted(OCR_TEXT_DIR.glob("*.txt"))
-        print(f"📄 Found {len(txt_files)} text files")
+        """Get all OCR text documents (packed corpus first, then loose .txt files)."""
+        corpus = get_ocr_corpus(OCR_CORPUS_DIR)
+        packed = corpus.doc_ids if corpus is not None else []
+        packed_ids = set(packed)
+        loose = sorted(path for path in OCR_TEXT_DIR.glob("*.txt") if path.stem not in packed_ids)
+        txt_files = [OCR_TEXT_DIR / f"{doc_id}.txt" for doc_id in packed] + loose
+        print(f"📄 Found {len(txt_files)} text files ({len(packed)} packed)")
         return txt_files
 
     def link_entities_to_documents(self):
@@ -141,11 +150,12 @@ class EntityDocumentLinker:
             for file_path in all_files:
                 try:
                     # Read document
-                    with open(file_path, encoding="utf-8") as f:
-                        text = f.read()
+                    text = read_ocr_text(
+                        file_path.stem, text_dir=OCR_TEXT_DIR, corpus_dir=OCR_CORPUS_DIR
+                    )
 
                     # Skip empty documents
-                    if len(text.strip()) < 50:
+                    if text is None or len(text.strip()) < 50:
                         pbar.update(1)
                         continue
 
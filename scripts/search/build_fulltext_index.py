@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Document Full-Text Index Builder
+Epstein Document Archive - Search
+
+Builds or incrementally updates the SQLite FTS5 index over every catalog
+document's OCR text (data/sources/house_oversight_nov2025/ocr_text) or
+markdown file. The server uses it for `q` in /api/documents and
+DocumentService.search_documents.
+
+Incremental: only documents whose text file path, mtime or size changed are
+re-read; classification/source changes update metadata only; documents no
+longer in the catalog are removed. Re-running after a new OCR batch is cheap.
+
+Output: data/metadata/document_fts.db (WAL mode; the server can keep reading
+while a build runs)
+
+Usage:
+    python3 scripts/search/build_fulltext_index.py
+    python3 scripts/search/build_fulltext_index.py --rebuild
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+
+# Project paths
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DOC_INDEX_PATH = PROJECT_ROOT / "data/metadata/all_documents_index.json"
+
+sys.path.insert(0, str(PROJECT_ROOT / "server"))
+from services.document_catalog import DocumentCatalog
+from services.fulltext_index import DEFAULT_FTS_PATH, FullTextIndex
+
+
+def build_index(index_path: Path, db_path: Path, rebuild: bool = False) -> dict:
+    """Sync the FTS index with the document catalog."""
+    print("=" * 70)
+    print("DOCUMENT FULL-TEXT INDEX BUILDER")
+    print("=" * 70)
+
+    if rebuild and db_path.exists():
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+        print(f"🗑️  Removed existing index: {db_path}")
+
+    catalog = DocumentCatalog(index_path)
+    if not catalog.available:
+        print(f"❌ Document index not found: {index_path}")
+        sys.exit(1)
+
+    # Same visibility rules as /api/documents (metadata JSON and placeholders excluded)
+    documents = catalog.filter_documents()
+    print(f"📄 Documents in catalog: {len(documents):,}")
+
+    def progress(processed: int):
+        print(f"   {processed:,}/{len(documents):,} documents", end="\r", flush=True)
+
+    start = time.time()
+    stats = FullTextIndex(db_path).sync(documents, project_root=PROJECT_ROOT, progress=progress)
+    elapsed = time.time() - start
+
+    print()
+    print(f"✅ Index: {db_path}")
+    for key, value in stats.items():
+        print(f"   {key:>17}: {value:,}")
+    print(f"   {'elapsed':>17}: {elapsed:.1f}s")
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the document full-text (FTS5) index")
+    parser.add_argument("--index", type=Path, default=DOC_INDEX_PATH, help="all_documents_index.json")
+    parser.add_argument("--db", type=Path, default=DEFAULT_FTS_PATH, help="FTS database path")
+    parser.add_argument("--rebuild", action="store_true", help="Drop the index and rebuild")
+    args = parser.parse_args()
+
+    build_index(args.index, args.db, rebuild=args.rebuild)
+
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,7 @@ from services.document_service import DocumentService
 # Import services
 from services.entity_service import EntityService
 from services.flight_service import FlightService
+from services.fulltext_index import FullTextQueryError
 from services.network_service import NetworkService
 
 
@@ -236,15 +237,18 @@ async def search_documents(
     if not document_service:
         raise HTTPException(status_code=500, detail="Document service not initialized")
 
-    return document_service.search_documents(
-        q=q,
-        entity=entity,
-        doc_type=doc_type,
-        source=source,
-        classification=classification,
-        limit=limit,
-        offset=offset,
-    )
+    try:
+        return document_service.search_documents(
+            q=q,
+            entity=entity,
+            doc_type=doc_type,
+            source=source,
+            classification=classification,
+            limit=limit,
+            offset=offset,
+        )
+    except FullTextQueryError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.get("/documents/{doc_id}")
@@ -319,15 +323,18 @@ async def get_network_graph(
 async def find_path(
     entity_a: str = Query(..., description="First entity name"),
     entity_b: str = Query(..., description="Second entity name"),
+    k: int = Query(1, ge=1, le=10, description="Number of shortest paths"),
+    max_hops: Optional[int] = Query(None, ge=1, le=10, description="Maximum path length"),
 ):
     """Find shortest path between two entities
 
-    Uses BFS algorithm to find shortest path.
+    Uses bidirectional BFS on the resident graph; k > 1 adds the next-shortest
+    loopless paths as "alternatives".
     """
     if not network_service:
         raise HTTPException(status_code=500, detail="Network service not initialized")
 
-    return network_service.find_shortest_path(entity_a, entity_b)
+    return network_service.find_shortest_path(entity_a, entity_b, k=k, max_hops=max_hops)
 
 
 @router.get("/network/subgraph/{entity_name}")
@@ -389,7 +396,10 @@ async def unified_search(
 
     # Search documents
     if not type or type == "documents":
-        doc_results = document_service.search_documents(q=q, limit=limit)
+        try:
+            doc_results = document_service.search_documents(q=q, limit=limit)
+        except FullTextQueryError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         results["results"]["documents"] = doc_results["documents"]
 
     # Search flights (by passenger name)
@@ -25,7 +25,6 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, JSONResponse
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from fastapi.staticfiles import StaticFiles
-from openai import OpenAI
 from pydantic import BaseModel
 from sse_starlette.sse import EventSourceResponse
 
@@ -47,8 +46,18 @@ SERVER_DIR = Path(__file__).parent
 sys.path.insert(0, str(SERVER_DIR))
 from services.audit_logger import AuditLogger, LoginEvent
 from services.file_watcher import FileWatcherService
+from services.document_catalog import get_document_catalog
+from services.fulltext_index import FullTextQueryError, get_fulltext_index, search_catalog
+from services.llm_gateway import close_llm_gateway, get_llm_gateway
+from services.summary_store import SingleFlight, extract_pdf_text, get_summary_store
 from services.document_similarity import get_similarity_service
 from services.entity_similarity import get_entity_similarity_service
+from services.entity_posting_index import EntityPostingIndex
+from services.graph_engine import GraphEngine
+from services.network_lod import NetworkLOD
+from services.network_metrics import METRIC_NAMES, NetworkMetrics, file_digest
+from services.ocr_corpus import read_ocr_metadata, read_ocr_text
+from services.ocr_progress import get_ocr_progress_store
 from entity_detector import get_entity_detector
 
 # Database imports
@@ -65,6 +74,8 @@ METADATA_DIR = DATA_DIR / "metadata"
 TRANSFORMED_DIR = DATA_DIR / "transformed"
 MD_DIR = DATA_DIR / "md"
 LOGS_DIR = PROJECT_ROOT / "logs"
+DOCUMENT_INDEX_PATH = METADATA_DIR / "all_documents_index.json"
+DOCUMENT_FTS_PATH = METADATA_DIR / "document_fts.db"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -74,23 +85,10 @@ logging.basicConfig(level=logging.INFO)
 AUDIT_DB_PATH = DATA_DIR / "logs" / "audit.db"
 audit_logger = AuditLogger(AUDIT_DB_PATH)
 
-# Initialize OpenRouter client
-openrouter_client = None
+# OpenRouter model (requests go through the shared async LLM gateway)
 openrouter_model = os.getenv("OPENROUTER_MODEL", "openai/gpt-4o")
 
 
-def get_openrouter_client():
-    """Initialize OpenRouter client (lazy loading)"""
-    global openrouter_client
-    if openrouter_client is None:
-        api_key = os.getenv("OPENROUTER_API_KEY")
-        if not api_key:
-            raise ValueError("OPENROUTER_API_KEY not set in .env.local")
-
-        openrouter_client = OpenAI(base_url="https://openrouter.ai/api/v1", api_key=api_key)
-    return openrouter_client
-
-
 app = FastAPI(
     title="Epstein Document Archive API",
     description="Search and explore the Epstein document archive",
@@ -294,10 +292,15 @@ app.add_middleware(
 entity_stats = {}  # ID -> Entity dict
 entity_bios = {}  # ID/Name -> Biography dict
 network_data = {}
+network_metrics: Optional[NetworkMetrics] = None  # Precomputed centrality/communities
+network_graph = GraphEngine([], [], [], [])  # CSR view of network_data
+network_version = ""  # Content digest of entity_network.json (stable node ints)
+network_lod_views: dict[tuple[str, str], NetworkLOD] = {}  # (rank_by, metrics_graph) -> views
 semantic_index = {}
 classifications = {}
 timeline_data = {}
 document_entity_index = {}  # Document ID -> List of entity names
+document_entity_postings = EntityPostingIndex()  # Entity -> sorted document ints
 
 # Reverse mappings for backward compatibility
 name_to_id = {}  # Name/variation -> ID
@@ -352,30 +355,18 @@ def calculate_entity_connections(entity_name: str) -> int:
     """
     Calculate connection count for an entity based on co-occurrences in documents.
     Returns the number of unique entities mentioned in the same documents.
-    """
-    if not document_entity_index:
-        return 0
-
-    # Normalize entity name for matching (lowercase for comparison)
-    entity_name_lower = entity_name.lower().strip()
-
-    # Find all documents mentioning this entity
-    co_mentioned_entities = set()
-
-    for doc_id, entities_in_doc in document_entity_index.items():
-        # Check if this entity appears in the document (case-insensitive)
-        entities_lower = [e.lower().strip() for e in entities_in_doc]
-        if entity_name_lower in entities_lower:
-            # Add all other entities from this document
-            co_mentioned_entities.update(e for e in entities_in_doc if e.lower().strip() != entity_name_lower)
 
-    return len(co_mentioned_entities)
+    Performance: walks only the entity's posting list (built once in load_data)
+    instead of scanning every document in document_entity_index.
+    """
+    return document_entity_postings.connection_count(entity_name)
 
 
 def load_data():
     """Load all JSON data into memory with error handling"""
     global entity_stats, entity_bios, network_data, semantic_index, classifications, timeline_data
-    global name_to_id, id_to_name, guid_to_id, document_entity_index
+    global network_metrics, network_graph, network_version
+    global name_to_id, id_to_name, guid_to_id, document_entity_index, document_entity_postings
 
     print("Loading data...")
 
@@ -458,6 +449,9 @@ def load_data():
         print(f"  ✗ Document-entity index not found: {doc_entity_path}")
         document_entity_index = {}
 
+    document_entity_postings = EntityPostingIndex.from_document_entities(document_entity_index)
+    print(f"  ✓ Built entity posting lists: {len(document_entity_postings)} entities")
+
     # Network
     network_path = METADATA_DIR / "entity_network.json"
     if network_path.exists():
@@ -472,6 +466,19 @@ def load_data():
         print(f"  ✗ Network file not found: {network_path}")
         network_data = {}
 
+    # Network metrics (scripts/analysis/compute_network_metrics.py)
+    network_graph = GraphEngine.from_network(network_data)
+    network_version = file_digest(network_path)[:12] if network_path.exists() else ""
+    network_lod_views.clear()
+
+    metrics_path = METADATA_DIR / "entity_network_metrics.json"
+    network_metrics = NetworkMetrics.load(metrics_path, network_path)
+    if network_metrics:
+        stale = " (stale: re-run compute_network_metrics.py)" if network_metrics.stale else ""
+        print(f"  ✓ Loaded network metrics{stale}")
+    else:
+        print(f"  ⚠️  Network metrics not found: {metrics_path}")
+
     # Semantic index
     semantic_path = METADATA_DIR / "semantic_index.json"
     if semantic_path.exists():
@@ -713,73 +720,40 @@ def detect_entity_type(entity_name: str) -> str:
 def get_ocr_status():
     """Get current OCR processing status
 
-    Design Decision: Safe Number Parsing
-    Rationale: OCR status script outputs formatted numbers with commas (e.g., "33,572")
-    which Python's int() cannot parse directly. We need to strip commas before conversion.
+    Design Decision: In-process read of the OCR progress store
+    Rationale: This used to run scripts/extraction/check_ocr_status.py in a
+    subprocess on every request and scrape its printed numbers. The OCR run
+    now keeps counters in ocr_progress.db (services/ocr_progress.py), so the
+    status is two small SQLite reads.
 
     Error Handling: Return safe fallback values rather than failing the entire API call.
     """
     try:
-        result = subprocess.run(
-            ["python3", str(PROJECT_ROOT / "scripts/extraction/check_ocr_status.py")],
-            check=False,
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-
-        output = result.stdout
-
-        # Parse output
-        status = {
-            "active": "Progress:" in output,
-            "progress": 0,
-            "processed": 0,
-            "total": 0,
-            "emails_found": 0,
-            "failed": 0,
-        }
-
-        def safe_int(value: str) -> int:
-            """Parse integer safely, removing commas and whitespace"""
-            try:
-                return int(value.replace(",", "").strip())
-            except (ValueError, AttributeError):
-                return 0
-
-        def safe_float(value: str) -> float:
-            """Parse float safely, removing percent signs and parentheses"""
-            try:
-                cleaned = value.replace("%", "").replace("(", "").replace(")", "").strip()
-                return float(cleaned)
-            except (ValueError, AttributeError):
-                return 0.0
-
-        for line in output.split("\n"):
-            if "Progress:" in line:
-                # Example: "Progress: 15,100 / 33,572 (45.0%)"
-                parts = line.split()
-                if len(parts) >= 6:
-                    status["processed"] = safe_int(parts[1])
-                    status["total"] = safe_int(parts[3])
-                    status["progress"] = safe_float(parts[4])
-            elif "Email candidates found:" in line:
-                status["emails_found"] = safe_int(line.split(":")[1])
-            elif "Failed:" in line:
-                status["failed"] = safe_int(line.split(":")[1].split()[0])
-
-        return status
-    except subprocess.TimeoutExpired:
-        return {"active": False, "error": "OCR status check timeout"}
+        status = get_ocr_progress_store().status()
     except Exception as e:
         return {"active": False, "error": str(e)}
 
+    return {
+        "active": status["started"],
+        "progress": status["progress"],
+        "processed": status["completed"],
+        "total": status["total_files"],
+        "emails_found": status["emails_found"],
+        "failed": status["failed"],
+        "pages_ocred": status["pages_ocred"],
+        "last_update": status["last_update"],
+        "stalled": status["stalled"],
+    }
+
 
 @app.on_event("startup")
 async def startup_event():
     """Load data on startup"""
     load_data()
 
+    # Memory-map the precomputed corpus embedding matrix for /similar
+    get_similarity_service().load_embedding_matrix()
+
 
 @app.get("/health")
 async def health_check():
@@ -1433,18 +1407,9 @@ async def get_ingestion_status(username: str = Depends(get_current_user)):
         status_text = "idle"
 
     # Get last updated timestamp
-    progress_path = METADATA_DIR.parent / "sources/house_oversight_nov2025/ocr_progress.json"
-    last_updated = None
+    last_updated = ocr_status.get("last_update")
     current_source = "House Oversight Committee Nov 2025"
 
-    if progress_path.exists():
-        try:
-            with open(progress_path) as f:
-                progress_data = json.load(f)
-                last_updated = progress_data.get("last_updated")
-        except Exception:
-            pass
-
     # Get download stats from log file
     download_stats = {"total": 0, "completed": 0, "failed": 0, "status": "idle"}
     download_log_path = Path("/tmp/courtlistener_download.log")
@@ -2537,11 +2502,66 @@ async def batch_resolve_names(
     }
 
 
+def check_network_metrics_params(rank_by: str, metrics_graph: str, needs_metrics: bool):
+    """Validate rank_by / metrics_graph (HTTP 400) and metrics availability (HTTP 503)"""
+    if rank_by != "connection_count" and rank_by not in METRIC_NAMES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"rank_by must be one of: connection_count, {', '.join(METRIC_NAMES)}",
+        )
+    if (needs_metrics or rank_by != "connection_count") and network_metrics is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Network metrics not computed (run scripts/analysis/compute_network_metrics.py)",
+        )
+    if network_metrics and metrics_graph not in network_metrics.graphs:
+        raise HTTPException(
+            status_code=400,
+            detail=f"metrics_graph must be one of: {', '.join(network_metrics.graphs)}",
+        )
+
+
+def get_network_lod(rank_by: str, metrics_graph: str) -> NetworkLOD:
+    """Level-of-detail views for one ranking, built once per network load"""
+    key = (rank_by, metrics_graph)
+    if key not in network_lod_views:
+        node_ids = network_graph.node_ids
+        communities = scores = None
+        if network_metrics:
+            communities = [network_metrics.score(n, "community", metrics_graph) for n in node_ids]
+        if rank_by != "connection_count":
+            scores = [network_metrics.score(n, rank_by, metrics_graph) for n in node_ids]
+        nodes = network_data.get("nodes", [])
+        hidden = [
+            i for i, node in enumerate(nodes) if entity_filter.is_generic(node.get("name", ""))
+        ]
+        network_lod_views[key] = NetworkLOD(network_graph, nodes, communities, scores, hidden)
+    return network_lod_views[key]
+
+
+def network_lod_metadata(rank_by: str, metrics_graph: str, top_k: int) -> dict:
+    return {
+        "graph_version": network_version,
+        "graph_nodes": len(network_graph),
+        "graph_edges": network_graph.n_edges,
+        "rank_by": rank_by,
+        "top_k": top_k,
+        "metrics": (
+            {**network_metrics.summary(), "graph": metrics_graph}
+            if network_metrics
+            else {"available": False}
+        ),
+    }
+
+
 @app.get("/api/network")
 async def get_network(
     min_connections: int = Query(0),
     max_nodes: int = Query(500, le=1000),
     deduplicate: bool = Query(False),  # FIXED: Disabled until deduplication works with snake_case IDs
+    rank_by: str = Query("connection_count"),
+    metrics_graph: str = Query("flight"),
+    community: Optional[int] = Query(None, ge=0),
     username: str = Depends(get_current_user),
 ):
     """Get network graph data with optional deduplication
@@ -2550,14 +2570,27 @@ async def get_network(
         min_connections: Minimum connections to include node (default: 0)
         max_nodes: Maximum nodes to return (default: 500, max: 1000)
         deduplicate: Apply name disambiguation to merge duplicates (default: True)
+        rank_by: connection_count (default) or a precomputed metric
+            (degree, weighted_degree, pagerank, betweenness, eigenvector)
+        metrics_graph: Metric source graph: flight (default) or coappearance
+        community: Only nodes in this community of metrics_graph (0 = largest)
 
     Returns:
-        Network graph with nodes, edges, and metadata
+        Network graph with nodes, edges, and metadata. When metrics are
+        available each node carries "metrics" and "community" for
+        metrics_graph (for ranking and colouring client-side).
 
     Design Decision: Filter Generic Entities
     Rationale: Exclude non-disambiguatable entities (Male, Female, Nanny (1))
     from network graph. These placeholders create misleading connections.
+
+    Design Decision: Precomputed metrics only
+    Rationale: Centrality and communities come from
+    entity_network_metrics.json (scripts/analysis/compute_network_metrics.py);
+    the request only looks values up by node ID.
     """
+    check_network_metrics_params(rank_by, metrics_graph, community is not None)
+
     # Get disambiguator
     disambiguator = get_disambiguator()
 
@@ -2587,8 +2620,25 @@ async def get_network(
     # Filter by minimum connections
     nodes = [n for n in nodes if n.get("connection_count", 0) >= min_connections]
 
-    # Sort by connections and limit
-    nodes.sort(key=lambda n: n.get("connection_count", 0), reverse=True)
+    # Attach precomputed metrics (copies: network_data nodes are shared)
+    if network_metrics:
+        annotated = []
+        for node in nodes:
+            values = network_metrics.node_metrics(node["id"], metrics_graph)
+            node = dict(node)
+            node["community"] = values.pop("community") if values else None
+            node["metrics"] = values
+            annotated.append(node)
+        nodes = annotated
+
+    if community is not None:
+        nodes = [n for n in nodes if n["community"] == community]
+
+    # Sort by connections (or the requested metric) and limit
+    if rank_by == "connection_count":
+        nodes.sort(key=lambda n: n.get("connection_count", 0), reverse=True)
+    else:
+        nodes.sort(key=lambda n: (n["metrics"] or {}).get(rank_by, 0), reverse=True)
     nodes = nodes[:max_nodes]
 
     # Get node IDs for edge filtering (after deduplication, these are canonical IDs)
@@ -2624,10 +2674,135 @@ async def get_network(
             "deduplicated": deduplicate,
             "total_nodes": len(nodes),
             "total_edges": len(edges),
+            "rank_by": rank_by,
+            "metrics": (
+                {**network_metrics.summary(), "graph": metrics_graph}
+                if network_metrics
+                else {"available": False}
+            ),
         },
     }
 
 
+@app.get("/api/network/lod")
+async def get_network_lod_view(
+    level: str = Query("overview"),
+    community: Optional[int] = Query(None, ge=0),
+    max_nodes: int = Query(200, ge=1, le=1000),
+    top_k: int = Query(5, ge=0),
+    min_weight: float = Query(0, ge=0),
+    rank_by: str = Query("connection_count"),
+    metrics_graph: str = Query("flight"),
+    username: str = Depends(get_current_user),
+):
+    """Level-of-detail network view in the compact columnar payload
+
+    Query Parameters:
+        level: overview (one super-node per community, for low zoom) or
+            community (members of `community`, for zooming into one cluster)
+        community: Community number (required for level=community)
+        max_nodes: Members returned for level=community (default: 200)
+        top_k: Edges kept per node by weight (default: 5, 0 = all)
+        min_weight: Minimum edge weight (level=community)
+        rank_by / metrics_graph: As for /api/network
+
+    Returns:
+        {"level", "nodes": {"index": [...], "id": [...], ...},
+         "edges": {"source": [...], "target": [...], "weight": [...]},
+         "communities" (overview only), "metadata"}
+        Node ints are stable for metadata.graph_version (see
+        /api/network/expand).
+
+    Design Decision: Server-side level of detail
+    Rationale: services/network_lod.py; large neighbourhoods are collapsed or
+    pruned before they reach the graph view.
+    """
+    if level not in ("overview", "community"):
+        raise HTTPException(status_code=400, detail="level must be one of: overview, community")
+    check_network_metrics_params(rank_by, metrics_graph, level == "overview")
+    if level == "community" and community is None:
+        raise HTTPException(status_code=400, detail="level=community requires community")
+
+    lod = get_network_lod(rank_by, metrics_graph)
+    if level == "overview":
+        view = lod.overview(top_k)
+    else:
+        view = lod.community(community, max_nodes, top_k, min_weight)
+    return {
+        "level": level,
+        **view,
+        "metadata": network_lod_metadata(rank_by, metrics_graph, top_k),
+    }
+
+
+class NetworkExpandRequest(BaseModel):
+    entities: list[str] = []  # Node IDs or names to expand from
+    seeds: list[int] = []  # Node ints to expand from (e.g. the current viewport)
+    known: list[int] = []  # Node ints already on the client (not re-sent)
+    hops: int = 1
+    max_nodes: int = 100
+    top_k: int = 5
+    min_weight: float = 0
+    rank_by: str = "connection_count"
+    metrics_graph: str = "flight"
+    graph_version: Optional[str] = None  # Version the client's node ints belong to
+
+
+@app.post("/api/network/expand")
+async def expand_network(request: NetworkExpandRequest, username: str = Depends(get_current_user)):
+    """Neighbourhood / viewport expansion in the compact columnar payload
+
+    Returns the seeds and nodes within `hops` of them that are not in `known`
+    (nearest first, then by rank_by), with the top-k edges connecting them to each
+    other and to the client's existing nodes.
+
+    Returns:
+        {"level": "expand", "nodes": {..., "hops": [...]}, "edges": {...},
+         "not_found": [unresolved entities], "metadata"}
+
+    Raises:
+        HTTPException 409: graph_version differs from the loaded network
+            (the client's node ints are stale; reload the overview)
+    """
+    if request.graph_version and request.graph_version != network_version:
+        raise HTTPException(
+            status_code=409, detail="Network changed; reload the graph (graph_version mismatch)"
+        )
+    if not 1 <= request.hops <= 3:
+        raise HTTPException(status_code=400, detail="hops must be between 1 and 3")
+    if not 1 <= request.max_nodes <= 1000 or request.top_k < 0:
+        raise HTTPException(status_code=400, detail="max_nodes must be 1-1000, top_k >= 0")
+    n_nodes = len(network_graph)
+    if any(not 0 <= n < n_nodes for n in request.seeds + request.known):
+        raise HTTPException(status_code=400, detail="Unknown node int in seeds/known")
+    check_network_metrics_params(request.rank_by, request.metrics_graph, False)
+
+    seeds = list(request.seeds)
+    not_found = []
+    for entity in request.entities:
+        node = network_graph.index.get(entity, network_graph.name_index.get(entity))
+        if node is None:
+            not_found.append(entity)
+        else:
+            seeds.append(node)
+
+    lod = get_network_lod(request.rank_by, request.metrics_graph)
+    view = lod.expand(
+        seeds,
+        request.known,
+        request.hops,
+        request.max_nodes,
+        request.top_k,
+        request.min_weight,
+    )
+    return {
+        "level": "expand",
+        **view,
+        "not_found": not_found,
+        "metadata": network_lod_metadata(request.rank_by, request.metrics_graph, request.top_k),
+    }
+
+
 @app.get("/api/search")
 async def search(
     q: str = Query(..., min_length=1),
@@ -3526,73 +3701,52 @@ async def search_documents(
 ):
     """Search documents with filters.
 
+    `q` is a full-text query over OCR/markdown text (SQLite FTS5, BM25 ranked):
+    words, "exact phrases", AND/OR/NOT and prefix* are supported. Without a
+    built index (scripts/search/build_fulltext_index.py) it falls back to
+    filename/path substring matching.
+
     Returns:
         - documents: Array of matching documents with snippets
         - total: Total matching documents
         - filters: Available filter options (facets)
+        - text_facets: Classification/source counts of the text matches
     """
     try:
-        # Load document index
-        doc_index_path = METADATA_DIR / "all_documents_index.json"
-        if not doc_index_path.exists():
+        catalog = get_document_catalog(DOCUMENT_INDEX_PATH)
+        if not catalog.available:
             return {"documents": [], "total": 0, "error": "Document index not found"}
 
-        with open(doc_index_path) as f:
-            doc_data = json.load(f)
-
-        documents = doc_data.get("documents", [])
-
-        # Filter documents
-        filtered_docs = documents
-
-        # ALWAYS filter out JSON metadata files and unavailable content
-        filtered_docs = [
-            doc
-            for doc in filtered_docs
-            if not (
-                # Exclude JSON files from data/metadata/ directory
-                (
-                    doc.get("path", "").startswith("data/metadata/")
-                    and doc.get("filename", "").endswith(".json")
-                )
-                or
-                # Exclude documents with unavailable content
-                doc.get("content") == "Content not available for this document."
+        facets = catalog.facets
+        fulltext = get_fulltext_index(DOCUMENT_FTS_PATH)
+        if q and fulltext.available:
+            result = search_catalog(
+                catalog,
+                fulltext,
+                q,
+                entity=entity,
+                classification=doc_type,
+                source=source,
+                limit=limit,
+                offset=offset,
             )
-        ]
-
-        # Filter by entity
-        if entity:
-            entity_lower = entity.lower()
-            filtered_docs = [
-                doc
-                for doc in filtered_docs
-                if any(entity_lower in e.lower() for e in doc.get("entities_mentioned", []))
-            ]
-
-        # Filter by document type
-        if doc_type:
-            filtered_docs = [
-                doc
-                for doc in filtered_docs
-                if doc.get("classification", "").lower() == doc_type.lower()
-            ]
-
-        # Filter by source
-        if source:
-            filtered_docs = [
-                doc for doc in filtered_docs if source.lower() in doc.get("source", "").lower()
-            ]
+            return {
+                "documents": result["documents"],
+                "total": result["total"],
+                "limit": limit,
+                "offset": offset,
+                "filters": {"types": facets["classifications"], "sources": facets["sources"]},
+                "text_facets": result["text_facets"],
+            }
 
-        # Full-text search in filename and path
-        if q:
-            q_lower = q.lower()
-            filtered_docs = [
-                doc
-                for doc in filtered_docs
-                if q_lower in doc.get("filename", "").lower()
-                or q_lower in doc.get("path", "").lower()
-            ]
+        # Filter via catalog secondary indexes (metadata JSON files and
+        # unavailable content are always excluded). doc_type matches classification.
+        filtered_docs = catalog.filter_documents(
+            q=q,
+            entity=entity,
+            classification=doc_type,
+            source=source,
+        )
 
         # Get total before pagination
         total = len(filtered_docs)
@@ -3600,18 +3754,16 @@ async def search_documents(
         # Paginate
         paginated_docs = filtered_docs[offset : offset + limit]
 
-        # Generate facets for filtering
-        all_types = {doc.get("classification", "unknown") for doc in documents}
-        all_sources = {doc.get("source", "unknown") for doc in documents}
-
         return {
             "documents": paginated_docs,
             "total": total,
             "limit": limit,
             "offset": offset,
-            "filters": {"types": sorted(all_types), "sources": sorted(all_sources)},
+            "filters": {"types": facets["classifications"], "sources": facets["sources"]},
         }
 
+    except FullTextQueryError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error searching documents: {e}")
         return {"documents": [], "total": 0, "error": str(e)}
@@ -3626,18 +3778,12 @@ async def get_document(doc_id: str, username: str = Depends(get_current_user)):
         - content: Document text content (if available)
     """
     try:
-        # Load document index
-        doc_index_path = METADATA_DIR / "all_documents_index.json"
-        if not doc_index_path.exists():
+        catalog = get_document_catalog(DOCUMENT_INDEX_PATH)
+        if not catalog.available:
             raise HTTPException(status_code=404, detail="Document index not found")
 
-        with open(doc_index_path) as f:
-            doc_data = json.load(f)
-
-        documents = doc_data.get("documents", [])
-
-        # Find document by ID
-        document = next((doc for doc in documents if doc.get("id") == doc_id), None)
+        # O(1) lookup in the resident document catalog
+        document = catalog.get(doc_id)
 
         if not document:
             raise HTTPException(status_code=404, detail=f"Document {doc_id} not found")
@@ -3701,18 +3847,12 @@ async def get_document_summary(doc_id: str, username: str = Depends(get_current_
     - Entity detection failures are logged but don't fail request
     """
     try:
-        # Load document index
-        doc_index_path = METADATA_DIR / "all_documents_index.json"
-        if not doc_index_path.exists():
+        catalog = get_document_catalog(DOCUMENT_INDEX_PATH)
+        if not catalog.available:
             raise HTTPException(status_code=404, detail="Document index not found")
 
-        with open(doc_index_path) as f:
-            doc_data = json.load(f)
-
-        documents = doc_data.get("documents", [])
-
-        # Find document by ID
-        document = next((doc for doc in documents if doc.get("id") == doc_id), None)
+        # O(1) lookup in the resident document catalog
+        document = catalog.get(doc_id)
 
         if not document:
             raise HTTPException(status_code=404, detail=f"Document {doc_id} not found")
@@ -3730,20 +3870,22 @@ async def get_document_summary(doc_id: str, username: str = Depends(get_current_
             "metadata": document,
         }
 
-        # Check for OCR text file
-        # OCR files are in data/sources/house_oversight_nov2025/ocr_text/
-        # Pattern: {filename without extension}.txt
+        # Check for OCR text
+        # Packed corpus (ocr_corpus/) when built, else
+        # data/sources/house_oversight_nov2025/ocr_text/
+        # Pattern: {filename without extension}
         filename = document.get("filename", "")
         if filename:
-            # Remove .pdf extension and add .txt
+            # Remove .pdf extension
             base_name = filename.rsplit(".", 1)[0]
-            ocr_text_path = Path("data/sources/house_oversight_nov2025/ocr_text") / f"{base_name}.txt"
+            try:
+                full_text = read_ocr_text(base_name)
+            except Exception as e:
+                logger.warning(f"Could not read OCR text for {doc_id}: {e}")
+                full_text = None
 
-            if ocr_text_path.exists():
+            if full_text is not None:
                 try:
-                    with open(ocr_text_path, "r", encoding="utf-8") as f:
-                        full_text = f.read()
-
                     summary["has_ocr_text"] = True
                     summary["full_text_length"] = len(full_text)
                     # Provide first 3000 characters as preview
@@ -3768,18 +3910,16 @@ async def get_document_summary(doc_id: str, username: str = Depends(get_current_
                         logger.warning(f"Entity detection failed for {doc_id}: {e}")
                         # Continue without entity detection - not critical
 
-                    # Try to load OCR metadata JSON if available
-                    ocr_json_path = ocr_text_path.with_suffix(".json")
-                    if ocr_json_path.exists():
-                        try:
-                            with open(ocr_json_path, "r") as f:
-                                ocr_metadata = json.load(f)
-                                summary["ocr_metadata"] = ocr_metadata
-                        except Exception as e:
-                            logger.warning(f"Could not load OCR metadata for {doc_id}: {e}")
+                    # Try to load OCR metadata if available
+                    try:
+                        ocr_metadata = read_ocr_metadata(base_name)
+                        if ocr_metadata is not None:
+                            summary["ocr_metadata"] = ocr_metadata
+                    except Exception as e:
+                        logger.warning(f"Could not load OCR metadata for {doc_id}: {e}")
 
                 except Exception as e:
-                    logger.warning(f"Could not read OCR text for {doc_id}: {e}")
+                    logger.warning(f"Could not process OCR text for {doc_id}: {e}")
 
         return summary
 
@@ -3859,13 +3999,11 @@ async def get_document_rag_summary(
             # Truncate to reasonable length for summarization (4000 chars)
             content_for_summary = doc_text[:4000]
 
-            # Generate summary using Grok API
+            # Generate summary (async LLM gateway; doesn't block the event loop)
             try:
-                client = get_openrouter_client()
-
-                response = client.chat.completions.create(
-                    model=openrouter_model,
-                    messages=[
+                summary_text = await get_llm_gateway().complete(
+                    openrouter_model,
+                    [
                         {
                             "role": "system",
                             "content": "You are a legal document analyzer. Generate concise, factual summaries of court documents and legal filings. Focus on key facts, parties involved, and main allegations or findings. Be objective and precise."
@@ -3879,8 +4017,6 @@ async def get_document_rag_summary(
                     temperature=0.3,  # Low temperature for factual summaries
                 )
 
-                summary_text = response.choices[0].message.content.strip()
-
                 return {
                     "document_id": doc_id,
                     "summary": summary_text,
@@ -3916,6 +4052,150 @@ async def get_document_rag_summary(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Summaries are cached in their own SQLite store; concurrent requests for the
+# same uncached document share one extraction + LLM call
+MASTER_INDEX_PATH = METADATA_DIR / "master_document_index.json"
+SUMMARY_DB_PATH = METADATA_DIR / "document_summaries.db"
+_summary_flight = SingleFlight()
+_summary_store_migrated = False
+
+
+def get_ai_summary_store():
+    """Summary store, importing summaries cached in the master index on first use
+
+    The import is marked done only once it has run, so a failed import - or a
+    master index that does not exist yet - is retried on the next request
+    (re-importing is harmless: existing rows win).
+    """
+    global _summary_store_migrated
+    store = get_summary_store(SUMMARY_DB_PATH)
+    if not _summary_store_migrated:
+        catalog = get_document_catalog(MASTER_INDEX_PATH, id_field="hash")
+        if catalog.available:
+            store.import_documents(catalog.documents)
+            _summary_store_migrated = True
+    return store
+
+
+def _summary_response(document_id: str, document: dict, record: dict, from_cache: bool) -> dict:
+    return {
+        "document_id": document_id,
+        "summary": record["summary"],
+        "summary_generated_at": record["generated_at"],
+        "summary_model": record["model"],
+        "word_count": record["word_count"],
+        "from_cache": from_cache,
+        "text_source": record["text_source"],  # "pdf_extraction" or "ocr"
+        "document_metadata": {
+            "canonical_path": document.get("canonical_path", ""),
+            "size": document.get("size", 0),
+            "source_count": document.get("source_count", 0)
+        }
+    }
+
+
+def _read_summary_source_text(
+    document_id: str, pdf_path: Path, canonical_path: str
+) -> tuple[str, str]:
+    """Extract text from the PDF, falling back to OCR text (blocking; run in a thread)"""
+    try:
+        logger.info(f"Extracting text from {pdf_path}")
+        extracted_text = extract_pdf_text(pdf_path)
+        logger.info(f"Extracted {len(extracted_text)} characters from PDF")
+        return extracted_text, "pdf_extraction"
+    except Exception as pdf_error:
+        logger.warning(f"PDF extraction failed: {pdf_error}. Trying OCR text fallback...")
+
+    # Try to find OCR text file (for house_oversight_nov2025 documents)
+    filename = canonical_path.split("/")[-1]
+    base_name = filename.rsplit(".", 1)[0] if "." in filename else filename
+
+    # Packed OCR corpus first (falls back to data/sources/house_oversight_nov2025/ocr_text/)
+    try:
+        extracted_text = read_ocr_text(base_name)
+        if extracted_text and extracted_text.strip():
+            logger.info(f"Using OCR text for {base_name} ({len(extracted_text)} chars)")
+            return extracted_text, "ocr"
+    except Exception as ocr_error:
+        logger.warning(f"Failed to read OCR text for {base_name}: {ocr_error}")
+
+    # OCR text stored next to the PDF
+    ocr_paths = [pdf_path.parent / "ocr_text" / f"{base_name}.txt"]
+
+    for ocr_path in ocr_paths:
+        if ocr_path.exists():
+            try:
+                with open(ocr_path, "r", encoding="utf-8") as f:
+                    extracted_text = f.read()
+                if extracted_text.strip():
+                    logger.info(f"Using OCR text from {ocr_path} ({len(extracted_text)} chars)")
+                    return extracted_text, "ocr"
+            except Exception as ocr_error:
+                logger.warning(f"Failed to read OCR file {ocr_path}: {ocr_error}")
+
+    logger.error(f"No extractable text found for {document_id}")
+    raise HTTPException(
+        status_code=422,
+        detail="This document appears to be a scanned PDF with no OCR text available. Cannot generate summary."
+    )
+
+
+async def _request_document_summary(model: str, content_for_summary: str) -> str:
+    """LLM call for one document summary"""
+    return await get_llm_gateway().complete(
+        model,
+        [
+            {
+                "role": "system",
+                "content": "You are a document analyzer specializing in legal and investigative documents. Generate clear, factual summaries that help readers understand the document's content quickly."
+            },
+            {
+                "role": "user",
+                "content": f"""Summarize this document in 200-300 words. Include:
+1. Document type (court filing, deposition, letter, etc.)
+2. Main topics and subject matter
+3. Key entities/people mentioned
+4. Date range or time period (if mentioned)
+5. Key findings or important details
+
+Document text:
+{content_for_summary}"""
+            }
+        ],
+        max_tokens=500,
+        temperature=0.3,  # Low temperature for consistency
+    )
+
+
+async def _generate_document_summary(
+    document_id: str, pdf_path: Path, canonical_path: str, model: str
+) -> dict:
+    """Extract text, summarize and store (one call per document across concurrent requests)"""
+    store = get_ai_summary_store()
+
+    # PDF parsing is CPU-bound; keep it off the event loop
+    extracted_text, text_source = await asyncio.to_thread(
+        _read_summary_source_text, document_id, pdf_path, canonical_path
+    )
+
+    # Truncate to reasonable length for summarization (8000 chars)
+    content_for_summary = extracted_text[:8000]
+
+    try:
+        logger.info(f"Generating summary with {model}")
+        summary_text = await _request_document_summary(model, content_for_summary)
+    except Exception as e:
+        logger.error(f"Grok API failed for {document_id}: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail=f"AI summary generation failed: {str(e)}"
+        )
+
+    record = await asyncio.to_thread(store.put, document_id, model, summary_text, text_source)
+    logger.info(f"Generated and cached summary for {document_id}: {record['word_count']} words")
+    return record
+
+
 @app.get("/api/documents/{document_id}/ai-summary")
 async def get_document_ai_summary(
     document_id: str,
@@ -3924,27 +4204,28 @@ async def get_document_ai_summary(
     """
     Generate on-demand AI summary from PDF document with caching.
 
-    Design Decision: Direct PDF extraction + Grok summarization with persistent caching
+    Design Decision: Direct PDF extraction + LLM summarization with a persistent summary store
     Rationale:
     - Large PDFs (>5MB) fail to render in browser
     - Users need quick understanding without downloading full file
     - Extract text directly from PDF files (not relying on OCR or RAG)
-    - Cache summaries in master_document_index.json to avoid regeneration
-    - Use Grok for fast, accurate summarization (x-ai/grok-4.1-fast:free)
+    - Cache summaries in document_summaries.db (SQLite, keyed by document hash
+      and model) instead of rewriting master_document_index.json per summary
+    - Concurrent requests for the same uncached document share one LLM call
 
     Process:
-    1. Look up document by hash in master_document_index.json
-    2. Check if summary already cached in document metadata
+    1. Look up document by hash in the master index (shared catalog, O(1))
+    2. Check the summary store
     3. If cached: return immediately (no API call)
-    4. If not cached:
-       a. Extract text from PDF file using pypdf
-       b. Generate summary using Grok API
-       c. Cache summary in master_document_index.json
+    4. If not cached (single-flight per document and model):
+       a. Extract text from PDF file using pypdf (worker thread)
+       b. Generate summary via OpenRouter (async LLM gateway)
+       c. Store summary in document_summaries.db
        d. Return generated summary
 
     Performance:
-    - Cached: <50ms (file read only)
-    - Uncached: 2-5s (PDF extraction ~500ms, Grok API ~2-4s)
+    - Cached: ~1ms (indexed SQLite lookup)
+    - Uncached: 2-5s (PDF extraction ~500ms, LLM API ~2-4s)
 
     Returns:
         {
@@ -3964,53 +4245,34 @@ async def get_document_ai_summary(
     Error Handling:
     - 404 if document_id not found in master_document_index.json
     - 404 if PDF file doesn't exist at canonical_path
-    - 500 if PDF extraction fails
-    - 503 if Grok API fails (doesn't cache failed attempts)
+    - 422 if neither PDF text nor OCR text is available
+    - 503 if the LLM API fails (doesn't cache failed attempts)
     """
     try:
-        # Load master document index
-        master_index_path = METADATA_DIR / "master_document_index.json"
-        if not master_index_path.exists():
+        catalog = get_document_catalog(MASTER_INDEX_PATH, id_field="hash")
+        if not catalog.available:
             raise HTTPException(
                 status_code=404,
                 detail="Master document index not found"
             )
 
-        # Read index
-        with open(master_index_path, "r", encoding="utf-8") as f:
-            index_data = json.load(f)
-
-        documents = index_data.get("documents", [])
-
         # Find document by hash (document_id is the hash)
-        document = next(
-            (doc for doc in documents if doc.get("hash") == document_id),
-            None
-        )
-
+        document = catalog.get(document_id)
         if not document:
             raise HTTPException(
                 status_code=404,
                 detail=f"Document with hash {document_id} not found"
             )
 
+        # Use configured model or default to gpt-4o-mini for summaries
+        model = os.getenv("OPENROUTER_MODEL", "openai/gpt-4o-mini")
+
         # Check if summary already exists (cached)
-        if "summary" in document and document.get("summary"):
+        store = get_ai_summary_store()
+        cached = store.get(document_id, model)
+        if cached:
             logger.info(f"Returning cached summary for {document_id}")
-            return {
-                "document_id": document_id,
-                "summary": document["summary"],
-                "summary_generated_at": document.get("summary_generated_at", "unknown"),
-                "summary_model": document.get("summary_model", "unknown"),
-                "word_count": document.get("summary_word_count", len(document["summary"].split())),
-                "from_cache": True,
-                "text_source": document.get("summary_text_source", "unknown"),
-                "document_metadata": {
-                    "canonical_path": document.get("canonical_path", ""),
-                    "size": document.get("size", 0),
-                    "source_count": document.get("source_count", 0)
-                }
-            }
+            return _summary_response(document_id, document, cached, from_cache=True)
 
         # Summary not cached - need to generate
         canonical_path = document.get("canonical_path")
@@ -4027,145 +4289,11 @@ async def get_document_ai_summary(
                 detail=f"PDF file not found at {canonical_path}"
             )
 
-        # Extract text from PDF - try direct extraction first, fall back to OCR
-        extracted_text = ""
-        text_source = "pdf_extraction"
-
-        try:
-            from pypdf import PdfReader
-
-            logger.info(f"Extracting text from {pdf_path}")
-            reader = PdfReader(str(pdf_path))
-
-            # Extract text from all pages (limit to first 50 pages for performance)
-            max_pages = min(len(reader.pages), 50)
-
-            for page_num in range(max_pages):
-                try:
-                    page_text = reader.pages[page_num].extract_text()
-                    extracted_text += page_text + "\n"
-                except Exception as e:
-                    logger.warning(f"Failed to extract page {page_num}: {e}")
-                    continue
-
-            if extracted_text.strip():
-                logger.info(f"Extracted {len(extracted_text)} characters from PDF")
-            else:
-                raise ValueError("No text could be extracted from PDF")
-
-        except Exception as pdf_error:
-            logger.warning(f"PDF extraction failed: {pdf_error}. Trying OCR text fallback...")
-
-            # Try to find OCR text file (for house_oversight_nov2025 documents)
-            filename = canonical_path.split("/")[-1]
-            base_name = filename.rsplit(".", 1)[0] if "." in filename else filename
-
-            # Check common OCR locations
-            ocr_paths = [
-                PROJECT_ROOT / "data" / "sources" / "house_oversight_nov2025" / "ocr_text" / f"{base_name}.txt",
-                pdf_path.parent / "ocr_text" / f"{base_name}.txt",
-            ]
-
-            ocr_found = False
-            for ocr_path in ocr_paths:
-                if ocr_path.exists():
-                    try:
-                        with open(ocr_path, "r", encoding="utf-8") as f:
-                            extracted_text = f.read()
-                        if extracted_text.strip():
-                            logger.info(f"Using OCR text from {ocr_path} ({len(extracted_text)} chars)")
-                            text_source = "ocr"
-                            ocr_found = True
-                            break
-                    except Exception as ocr_error:
-                        logger.warning(f"Failed to read OCR file {ocr_path}: {ocr_error}")
-
-            if not ocr_found:
-                logger.error(f"No extractable text found for {document_id}")
-                raise HTTPException(
-                    status_code=422,
-                    detail="This document appears to be a scanned PDF with no OCR text available. Cannot generate summary."
-                )
-
-        # Truncate to reasonable length for summarization (8000 chars)
-        content_for_summary = extracted_text[:8000]
-
-        # Generate summary using Grok API
-        try:
-            client = get_openrouter_client()
-
-            # Use configured model or default to gpt-4o-mini for summaries
-            model = os.getenv("OPENROUTER_MODEL", "openai/gpt-4o-mini")
-
-            logger.info(f"Generating summary with {model}")
-
-            response = client.chat.completions.create(
-                model=model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a document analyzer specializing in legal and investigative documents. Generate clear, factual summaries that help readers understand the document's content quickly."
-                    },
-                    {
-                        "role": "user",
-                        "content": f"""Summarize this document in 200-300 words. Include:
-1. Document type (court filing, deposition, letter, etc.)
-2. Main topics and subject matter
-3. Key entities/people mentioned
-4. Date range or time period (if mentioned)
-5. Key findings or important details
-
-Document text:
-{content_for_summary}"""
-                    }
-                ],
-                max_tokens=500,
-                temperature=0.3,  # Low temperature for consistency
-            )
-
-            summary_text = response.choices[0].message.content.strip()
-            word_count = len(summary_text.split())
-            generated_at = datetime.now().isoformat()
-
-            logger.info(f"Generated summary: {word_count} words")
-
-            # Cache summary in document metadata
-            document["summary"] = summary_text
-            document["summary_generated_at"] = generated_at
-            document["summary_model"] = model
-            document["summary_word_count"] = word_count
-            document["summary_text_source"] = text_source
-
-            # Write back to master_document_index.json
-            try:
-                with open(master_index_path, "w", encoding="utf-8") as f:
-                    json.dump(index_data, f, indent=2, ensure_ascii=False)
-                logger.info(f"Cached summary for {document_id} in master_document_index.json")
-            except Exception as e:
-                logger.error(f"Failed to cache summary: {e}")
-                # Don't fail the request - still return the summary
-
-            return {
-                "document_id": document_id,
-                "summary": summary_text,
-                "summary_generated_at": generated_at,
-                "summary_model": model,
-                "word_count": word_count,
-                "from_cache": False,
-                "text_source": text_source,  # "pdf_extraction" or "ocr"
-                "document_metadata": {
-                    "canonical_path": canonical_path,
-                    "size": document.get("size", 0),
-                    "source_count": document.get("source_count", 0)
-                }
-            }
-
-        except Exception as e:
-            logger.error(f"Grok API failed for {document_id}: {e}")
-            raise HTTPException(
-                status_code=503,
-                detail=f"AI summary generation failed: {str(e)}"
-            )
+        record = await _summary_flight.do(
+            (document_id, model),
+            lambda: _generate_document_summary(document_id, pdf_path, canonical_path, model),
+        )
+        return _summary_response(document_id, document, record, from_cache=False)
 
     except HTTPException:
         raise
@@ -4197,9 +4325,9 @@ async def get_similar_documents(
     4. Return top N most similar documents above threshold
 
     Performance:
-    - First request: ~500ms (model loading + embedding generation)
-    - Cached requests: ~200ms (embeddings cached in memory)
-    - Embedding cache: LRU with 1000 document limit
+    - Precomputed matrix (scripts/rag/build_document_embeddings.py): a few ms
+      per query (one vectorized matvec + argpartition top-k)
+    - Fallback without matrix: per-document encoding, LRU cache of 1000 embeddings
 
     Args:
         doc_id: Source document ID to find similar documents for
@@ -4244,18 +4372,12 @@ async def get_similar_documents(
     start_time = time.time()
 
     try:
-        # Load document index
-        doc_index_path = METADATA_DIR / "all_documents_index.json"
-        if not doc_index_path.exists():
+        catalog = get_document_catalog(DOCUMENT_INDEX_PATH)
+        if not catalog.available:
             raise HTTPException(status_code=404, detail="Document index not found")
 
-        with open(doc_index_path) as f:
-            doc_data = json.load(f)
-
-        documents = doc_data.get("documents", [])
-
-        # Find source document
-        source_doc = next((doc for doc in documents if doc.get("id") == doc_id), None)
+        # O(1) lookup in the resident document catalog
+        source_doc = catalog.get(doc_id)
         if not source_doc:
             raise HTTPException(status_code=404, detail=f"Document {doc_id} not found")
 
@@ -4265,7 +4387,8 @@ async def get_similar_documents(
         # Find similar documents
         similar_docs = similarity_service.find_similar_documents(
             doc_id=doc_id,
-            all_documents=documents,
+            all_documents=catalog.documents,
+            get_document=catalog.get,
             limit=limit,
             similarity_threshold=similarity_threshold
         )
@@ -4333,15 +4456,12 @@ async def head_download_document(doc_id: str, username: str = Depends(get_curren
     Returns same status codes as GET endpoint for consistency.
     """
     try:
-        doc_index_path = METADATA_DIR / "all_documents_index.json"
-        if not doc_index_path.exists():
+        catalog = get_document_catalog(DOCUMENT_INDEX_PATH)
+        if not catalog.available:
             raise HTTPException(status_code=404, detail="Document index not found")
 
-        with open(doc_index_path) as f:
-            doc_data = json.load(f)
-
-        documents = doc_data.get("documents", [])
-        document = next((doc for doc in documents if doc.get("id") == doc_id), None)
+        # O(1) lookup in the resident document catalog
+        document = catalog.get(doc_id)
 
         if not document:
             raise HTTPException(status_code=404, detail=f"Document {doc_id} not found")
@@ -4410,18 +4530,12 @@ async def download_document(doc_id: str, username: str = Depends(get_current_use
     - Memory: Minimal server memory usage (streaming, not loading into RAM)
     """
     try:
-        # Load document index
-        doc_index_path = METADATA_DIR / "all_documents_index.json"
-        if not doc_index_path.exists():
+        catalog = get_document_catalog(DOCUMENT_INDEX_PATH)
+        if not catalog.available:
             raise HTTPException(status_code=404, detail="Document index not found")
 
-        with open(doc_index_path) as f:
-            doc_data = json.load(f)
-
-        documents = doc_data.get("documents", [])
-
-        # Find document by ID
-        document = next((doc for doc in documents if doc.get("id") == doc_id), None)
+        # O(1) lookup in the resident document catalog
+        document = catalog.get(doc_id)
 
         if not document:
             raise HTTPException(status_code=404, detail=f"Document {doc_id} not found")
@@ -4512,15 +4626,12 @@ async def head_view_document(doc_id: str, username: str = Depends(get_current_us
     - 500: Server error reading document metadata
     """
     try:
-        doc_index_path = METADATA_DIR / "all_documents_index.json"
-        if not doc_index_path.exists():
+        catalog = get_document_catalog(DOCUMENT_INDEX_PATH)
+        if not catalog.available:
             raise HTTPException(status_code=404, detail="Document index not found")
 
-        with open(doc_index_path) as f:
-            doc_data = json.load(f)
-
-        documents = doc_data.get("documents", [])
-        document = next((doc for doc in documents if doc.get("id") == doc_id), None)
+        # O(1) lookup in the resident document catalog
+        document = catalog.get(doc_id)
 
         if not document:
             raise HTTPException(status_code=404, detail=f"Document {doc_id} not found")
@@ -4582,16 +4693,12 @@ async def view_document(doc_id: str, username: str = Depends(get_current_user)):
     - Download button can use /download for saving file
     """
     try:
-        # Load document index (same as download endpoint)
-        doc_index_path = METADATA_DIR / "all_documents_index.json"
-        if not doc_index_path.exists():
+        catalog = get_document_catalog(DOCUMENT_INDEX_PATH)
+        if not catalog.available:
             raise HTTPException(status_code=404, detail="Document index not found")
 
-        with open(doc_index_path) as f:
-            doc_data = json.load(f)
-
-        documents = doc_data.get("documents", [])
-        document = next((doc for doc in documents if doc.get("id") == doc_id), None)
+        # O(1) lookup in the resident document catalog
+        document = catalog.get(doc_id)
 
         if not document:
             raise HTTPException(status_code=404, detail=f"Document {doc_id} not found")
@@ -4826,6 +4933,15 @@ async def shutdown_event():
     # Close enrichment service
     await enrichment_service.close()
 
+    # Write pending search analytics
+    if search_available:
+        from routes.search import close_search_analytics
+
+        close_search_analytics()
+
+    # Close pooled LLM connections
+    await close_llm_gateway()
+
 
 # ============================================================================
 # API v2 Routes - API-First Architecture
@@ -4920,7 +5036,13 @@ if flights_available:
 
 # Register Enhanced Chat routes
 if chat_enhanced_available:
+    from services.site_snapshot import get_site_snapshot_provider
+
     app.include_router(chat_enhanced_router)
+    # Rebuild the chatbot's site snapshot as soon as a source file changes
+    file_watcher_service.get_event_handler().add_listener(
+        get_site_snapshot_provider().invalidate
+    )
     logger.info("Enhanced Chat routes registered at /api/chat")
 
 # Register News routes
@@ -5,38 +5,28 @@ Intelligent chatbot with complete site awareness and navigation assistance
 """
 
 import json
+import logging
 import os
-from pathlib import Path
 
 from fastapi import APIRouter, Depends
-from openai import OpenAI
 from pydantic import BaseModel
+from services.llm_gateway import get_llm_gateway
+from services.site_snapshot import get_site_snapshot_provider
+from sse_starlette.sse import EventSourceResponse
 
 
+logger = logging.getLogger(__name__)
+
 # Initialize router
 router = APIRouter(prefix="/api/chat", tags=["chat"])
 
-# Paths
-PROJECT_ROOT = Path(__file__).parent.parent.parent
-DATA_DIR = PROJECT_ROOT / "data"
-MD_DIR = DATA_DIR / "md"
-METADATA_DIR = DATA_DIR / "metadata"
-
-# OpenRouter client (lazy loaded)
-openrouter_client = None
+# OpenRouter model (requests go through the shared async LLM gateway)
 openrouter_model = os.getenv("OPENROUTER_MODEL", "openai/gpt-4o")
 
-
-def get_openrouter_client():
-    """Initialize OpenRouter client (lazy loading)"""
-    global openrouter_client
-    if openrouter_client is None:
-        api_key = os.getenv("OPENROUTER_API_KEY")
-        if not api_key:
-            raise ValueError("OPENROUTER_API_KEY not set in .env.local")
-
-        openrouter_client = OpenAI(base_url="https://openrouter.ai/api/v1", api_key=api_key)
-    return openrouter_client
+# Chat completion settings
+CHAT_TEMPERATURE = 0.7
+CHAT_MAX_TOKENS = 800
+CHAT_TIMEOUT = 30.0
 
 
 # Import get_current_user at runtime to avoid circular imports
@@ -72,80 +62,6 @@ class ChatResponse(BaseModel):
     model: str = ""
 
 
-# Data loaders (cached)
-_entity_stats = None
-_network_data = None
-_classifications = None
-
-
-def load_entity_stats() -> dict:
-    """Load entity statistics (cached)"""
-    global _entity_stats
-    if _entity_stats is None:
-        stats_path = METADATA_DIR / "entity_statistics.json"
-        if stats_path.exists():
-            with open(stats_path) as f:
-                data = json.load(f)
-                _entity_stats = data.get("statistics", {})
-        else:
-            _entity_stats = {}
-    return _entity_stats
-
-
-def load_network_data() -> dict:
-    """Load network data (cached)"""
-    global _network_data
-    if _network_data is None:
-        network_path = METADATA_DIR / "entity_network.json"
-        if network_path.exists():
-            with open(network_path) as f:
-                _network_data = json.load(f)
-        else:
-            _network_data = {"nodes": [], "edges": []}
-    return _network_data
-
-
-def load_classifications() -> dict:
-    """Load document classifications (cached)"""
-    global _classifications
-    if _classifications is None:
-        class_path = METADATA_DIR / "document_classifications.json"
-        if class_path.exists():
-            with open(class_path) as f:
-                data = json.load(f)
-                _classifications = data.get("results", {})
-        else:
-            _classifications = {}
-    return _classifications
-
-
-def get_total_documents() -> int:
-    """Get total document count from unified index"""
-    total = len(load_classifications())
-    unified_index_path = METADATA_DIR / "all_documents_index.json"
-    if unified_index_path.exists():
-        try:
-            with open(unified_index_path) as f:
-                unified_data = json.load(f)
-                total = unified_data.get("total_documents", total)
-        except Exception:
-            pass
-    return total
-
-
-def get_total_flights() -> int:
-    """Get total flight count"""
-    flight_data_path = MD_DIR / "entities/flight_logs_by_flight.json"
-    if flight_data_path.exists():
-        try:
-            with open(flight_data_path) as f:
-                flight_data = json.load(f)
-                return len(flight_data.get("flights", []))
-        except Exception:
-            pass
-    return 0
-
-
 def detect_intent(query: str) -> str:
     """Detect user intent from query"""
     query_lower = query.lower()
@@ -181,53 +97,18 @@ def detect_intent(query: str) -> str:
 
 
 def detect_entities(query: str) -> list[dict]:
-    """Detect entities mentioned in query"""
-    entity_stats = load_entity_stats()
-    query_lower = query.lower()
-    detected = []
-
-    for entity_name, entity_data in entity_stats.items():
-        if entity_name.lower() in query_lower:
-            detected.append(
-                {
-                    "name": entity_name,
-                    "documents": entity_data.get("total_documents", 0),
-                    "connections": entity_data.get("connection_count", 0),
-                    "flights": entity_data.get("flight_count", 0),
-                    "is_billionaire": entity_data.get("is_billionaire", False),
-                }
-            )
-
-    return detected
+    """Detect entities mentioned in query (indexed matcher from the site snapshot)"""
+    return get_site_snapshot_provider().get().detect_entities(query)
 
 
 def build_site_capabilities() -> dict:
-    """Build comprehensive site capabilities context"""
-    entity_stats = load_entity_stats()
-    network_data = load_network_data()
+    """
+    Site capabilities context from the precomputed snapshot.
 
-    return {
-        "entities": {
-            "total": len(entity_stats),
-            "with_bios": sum(1 for e in entity_stats.values() if e.get("biography")),
-            "billionaires": sum(1 for e in entity_stats.values() if e.get("is_billionaire")),
-            "in_black_book": sum(1 for e in entity_stats.values() if e.get("in_black_book")),
-        },
-        "flights": {"total": get_total_flights(), "searchable": get_total_flights() > 0},
-        "documents": {"total": get_total_documents(), "searchable": True},
-        "network": {
-            "nodes": len(network_data.get("nodes", [])),
-            "edges": len(network_data.get("edges", [])),
-            "available": len(network_data.get("nodes", [])) > 0,
-        },
-        "features": [
-            "Search entities by name",
-            "Filter flight logs by passenger/date/route",
-            "Browse documents by type and source",
-            "Explore network connections",
-            "View timeline of events",
-        ],
-    }
+    The snapshot is rebuilt only when its source files change, so this no
+    longer parses the document/flight indexes on every message.
+    """
+    return get_site_snapshot_provider().get().capabilities
 
 
 def generate_navigation(intent: str, detected_entities: list[dict]) -> list[NavigationAction]:
@@ -384,6 +265,52 @@ def generate_fallback_response(intent: str, capabilities: dict, entities: list[d
     return fallback_responses.get(intent, fallback_responses["general"])
 
 
+def prepare_chat(request: ChatRequest) -> dict:
+    """Intent, entities, navigation, suggestions and LLM messages for a chat request"""
+    query = request.message
+
+    # Site context and entity detection from one snapshot version
+    snapshot = get_site_snapshot_provider().get()
+    capabilities = snapshot.capabilities
+
+    # Detect intent and entities
+    intent = detect_intent(query)
+    detected_entities = snapshot.detect_entities(query)
+
+    # Build system prompt and message history (last 5 messages)
+    system_prompt = build_system_prompt(capabilities, intent, detected_entities)
+    messages = [{"role": "system", "content": system_prompt}]
+    for msg in request.conversation_history[-5:]:
+        messages.append({"role": msg.role, "content": msg.content})
+    messages.append({"role": "user", "content": query})
+
+    return {
+        "capabilities": capabilities,
+        "intent": intent,
+        "detected_entities": detected_entities,
+        "navigation_actions": generate_navigation(intent, detected_entities),
+        "suggestions": generate_suggestions(intent, detected_entities),
+        "messages": messages,
+        "snapshot_version": snapshot.version,
+    }
+
+
+def chat_context(chat: dict) -> dict:
+    """Response context block (detected entities, intent, site stats)"""
+    capabilities = chat["capabilities"]
+    return {
+        "detected_entities": chat["detected_entities"],
+        "intent": chat["intent"],
+        "site_stats": {
+            "entities": capabilities["entities"]["total"],
+            "flights": capabilities["flights"]["total"],
+            "documents": capabilities["documents"]["total"],
+            "connections": capabilities["network"]["edges"],
+        },
+        "snapshot_version": chat["snapshot_version"],
+    }
+
+
 @router.post("/enhanced", response_model=ChatResponse)
 async def chat_enhanced(request: ChatRequest, username: str = Depends(get_auth_dependency())):
     """
@@ -397,6 +324,10 @@ async def chat_enhanced(request: ChatRequest, username: str = Depends(get_auth_d
     - Conversation history support
     - Graceful fallbacks when LLM unavailable
 
+    The completion runs through the async LLM gateway (pooled connections,
+    per-model concurrency limit, 30s deadline), so it never blocks the
+    event loop. See /api/chat/enhanced/stream for token streaming.
+
     Returns enriched response with:
     - AI-generated answer
     - Suggested follow-up questions
@@ -404,77 +335,41 @@ async def chat_enhanced(request: ChatRequest, username: str = Depends(get_auth_d
     - Detected context (entities, intent, stats)
     """
     try:
-        query = request.message
-        conversation_history = request.conversation_history
-
-        # Build site context
-        capabilities = build_site_capabilities()
-
-        # Detect intent and entities
-        intent = detect_intent(query)
-        detected_entities = detect_entities(query)
-
-        # Generate navigation and suggestions
-        navigation_actions = generate_navigation(intent, detected_entities)
-        follow_up_suggestions = generate_suggestions(intent, detected_entities)
-
-        # Build system prompt
-        system_prompt = build_system_prompt(capabilities, intent, detected_entities)
+        chat = prepare_chat(request)
 
         # Call LLM
         try:
-            client = get_openrouter_client()
-
-            # Build message history
-            messages = [{"role": "system", "content": system_prompt}]
-
-            # Add conversation history (last 5 messages)
-            for msg in conversation_history[-5:]:
-                messages.append({"role": msg.role, "content": msg.content})
-
-            # Add current message
-            messages.append({"role": "user", "content": query})
-
-            completion = client.chat.completions.create(
-                model=openrouter_model,
-                messages=messages,
-                temperature=0.7,
-                max_tokens=800,
-                timeout=30.0,
+            ai_response = await get_llm_gateway().complete(
+                openrouter_model,
+                chat["messages"],
+                max_tokens=CHAT_MAX_TOKENS,
+                temperature=CHAT_TEMPERATURE,
+                timeout=CHAT_TIMEOUT,
             )
 
-            ai_response = completion.choices[0].message.content.strip()
-
             return ChatResponse(
                 response=ai_response,
-                suggestions=follow_up_suggestions,
-                navigation={"quick_actions": navigation_actions},
-                context={
-                    "detected_entities": detected_entities,
-                    "intent": intent,
-                    "site_stats": {
-                        "entities": capabilities["entities"]["total"],
-                        "flights": capabilities["flights"]["total"],
-                        "documents": capabilities["documents"]["total"],
-                        "connections": capabilities["network"]["edges"],
-                    },
-                },
+                suggestions=chat["suggestions"],
+                navigation={"quick_actions": chat["navigation_actions"]},
+                context=chat_context(chat),
                 model=openrouter_model,
             )
 
         except Exception as api_error:
             # Fallback response if LLM fails
-            print(f"OpenRouter API error: {api_error}")
+            logger.error(f"OpenRouter API error: {api_error}")
 
-            fallback_response = generate_fallback_response(intent, capabilities, detected_entities)
+            fallback_response = generate_fallback_response(
+                chat["intent"], chat["capabilities"], chat["detected_entities"]
+            )
 
             return ChatResponse(
                 response=fallback_response,
-                suggestions=follow_up_suggestions,
-                navigation={"quick_actions": navigation_actions},
+                suggestions=chat["suggestions"],
+                navigation={"quick_actions": chat["navigation_actions"]},
                 context={
-                    "detected_entities": detected_entities,
-                    "intent": intent,
+                    "detected_entities": chat["detected_entities"],
+                    "intent": chat["intent"],
                     "error": "AI service temporarily unavailable - showing contextual response",
                 },
                 model="fallback",
@@ -491,6 +386,69 @@ async def chat_enhanced(request: ChatRequest, username: str = Depends(get_auth_d
         )
 
 
+@router.post("/enhanced/stream")
+async def chat_enhanced_stream(
+    request: ChatRequest, username: str = Depends(get_auth_dependency())
+):
+    """
+    Enhanced chat with the answer streamed token by token (server-sent events)
+
+    Events:
+    - meta:  {"suggestions", "navigation", "context", "model"} (sent first)
+    - token: {"text": delta} (repeated)
+    - done:  {"model": model or "fallback"}
+    - error: {"message"} followed by the contextual fallback answer as one
+             token event, if the LLM fails before streaming anything
+
+    Usage (browser, POST body as for /enhanced):
+        fetch('/api/chat/enhanced/stream', {method: 'POST', body, headers})
+        then read response.body and split on blank lines
+    """
+    chat = prepare_chat(request)
+
+    async def event_generator():
+        yield {
+            "event": "meta",
+            "data": json.dumps(
+                {
+                    "suggestions": chat["suggestions"],
+                    "navigation": {"quick_actions": chat["navigation_actions"]},
+                    "context": chat_context(chat),
+                    "model": openrouter_model,
+                }
+            ),
+        }
+
+        streamed = False
+        model = openrouter_model
+        try:
+            async for delta in get_llm_gateway().stream(
+                openrouter_model,
+                chat["messages"],
+                max_tokens=CHAT_MAX_TOKENS,
+                temperature=CHAT_TEMPERATURE,
+                timeout=CHAT_TIMEOUT,
+            ):
+                streamed = True
+                yield {"event": "token", "data": json.dumps({"text": delta})}
+        except Exception as api_error:
+            logger.error(f"OpenRouter API error: {api_error}")
+            yield {
+                "event": "error",
+                "data": json.dumps({"message": "AI service temporarily unavailable"}),
+            }
+            if not streamed:
+                model = "fallback"
+                fallback_response = generate_fallback_response(
+                    chat["intent"], chat["capabilities"], chat["detected_entities"]
+                )
+                yield {"event": "token", "data": json.dumps({"text": fallback_response})}
+
+        yield {"event": "done", "data": json.dumps({"model": model})}
+
+    return EventSourceResponse(event_generator())
+
+
 @router.get("/welcome")
 async def get_welcome_message():
     """
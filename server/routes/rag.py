@@ -6,6 +6,7 @@ Epstein Document Archive - Vector Search & RAG Endpoints
 Provides semantic search, entity-based retrieval, and knowledge graph integration.
 """
 
+import asyncio
 import json
 from pathlib import Path
 from typing import Optional
@@ -14,7 +15,29 @@ import chromadb
 from chromadb.config import Settings
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
-from sentence_transformers import SentenceTransformer
+from services.document_fetch import fetch_documents
+from services.embedding_service import get_embedding_service
+from services.entity_posting_index import EntityPostingIndex
+from services.ocr_quality_scores import (
+    DEFAULT_QUALITY_WEIGHT,
+    get_ocr_quality_scores,
+    quality_adjusted,
+)
+from services.passage_retrieval import (
+    AGGREGATION_MODES,
+    CHUNK_COLLECTION_NAME,
+    aggregate_chunk_hits,
+    chunk_query_size,
+    filter_hits,
+)
+from services.vector_filters import (
+    legacy_date_match,
+    legacy_entity_match,
+    parse_date_bound,
+    query_filtered,
+    supports_pushdown,
+    where_clauses,
+)
 
 
 # Project paths
@@ -31,8 +54,9 @@ router = APIRouter(prefix="/api/rag", tags=["RAG"])
 # Global instances (lazy loaded)
 _chroma_client = None
 _collection = None
-_embedding_model = None
+_chunk_collection = None
 _entity_doc_index = None
+_entity_postings = None
 _entity_network = None
 
 
@@ -55,14 +79,26 @@ def get_chroma_collection():
     return _collection
 
 
-def get_embedding_model():
-    """Get embedding model (lazy loading)."""
-    global _embedding_model
+def get_chunk_collection():
+    """Get chunk-level collection for passage retrieval (lazy loading)."""
+    global _chunk_collection
+
+    if _chunk_collection is None:
+        get_chroma_collection()
+        try:
+            _chunk_collection = _chroma_client.get_collection(name=CHUNK_COLLECTION_NAME)
+        except:
+            raise HTTPException(
+                status_code=503,
+                detail="Chunk index not initialized. Run build_vector_store.py --chunks first.",
+            )
 
-    if _embedding_model is None:
-        _embedding_model = SentenceTransformer("all-MiniLM-L6-v2")
+    return _chunk_collection
 
-    return _embedding_model
+
+def get_embedding_model():
+    """Get embedding model (shared by all routers and services)."""
+    return get_embedding_service().model
 
 
 def get_entity_doc_index():
@@ -79,6 +115,17 @@ def get_entity_doc_index():
     return _entity_doc_index
 
 
+def get_entity_postings() -> EntityPostingIndex:
+    """Get entity posting lists built from the entity-document index (lazy loading)."""
+    global _entity_postings
+
+    if _entity_postings is None:
+        entity_to_docs = get_entity_doc_index().get("entity_to_documents", {})
+        _entity_postings = EntityPostingIndex.from_entity_documents(entity_to_docs)
+
+    return _entity_postings
+
+
 def get_entity_network():
     """Get entity network (lazy loading)."""
     global _entity_network
@@ -94,11 +141,21 @@ def get_entity_network():
 
 
 # Pydantic models
+class PassageSpan(BaseModel):
+    chunk_index: int
+    char_start: int
+    char_end: int
+    similarity: float
+
+
 class SearchResult(BaseModel):
     id: str
     similarity: float
     text_excerpt: str
     metadata: dict
+    passage: Optional[PassageSpan] = None
+    matched_chunks: Optional[int] = None
+    score: Optional[float] = None
 
 
 class EntityDocumentResult(BaseModel):
@@ -144,11 +201,26 @@ async def semantic_search(
     doc_type: Optional[str] = Query(
         None, description="Filter by document type (news_article, court_doc, etc.)"
     ),
+    mode: str = Query(
+        "document",
+        enum=["document", "passage"],
+        description="document: whole-document vectors; passage: chunk vectors grouped per document",
+    ),
+    aggregate: str = Query(
+        "max", enum=list(AGGREGATION_MODES), description="Chunk score aggregation in passage mode"
+    ),
+    quality_weight: float = Query(
+        DEFAULT_QUALITY_WEIGHT,
+        ge=0.0,
+        le=1.0,
+        description="Share of the ranking score taken by OCR quality (0 = similarity only)",
+    ),
 ):
     """
     Perform semantic search across all documents.
 
-    Returns documents ranked by similarity to the query.
+    Returns documents ranked by similarity to the query, down-ranked by OCR
+    quality when scores exist (scripts/analysis/score_ocr_quality.py).
     Optionally filter by entity mentions or document type.
 
     Args:
@@ -156,46 +228,75 @@ async def semantic_search(
         limit: Maximum results to return
         entity_filter: Filter to documents mentioning this entity
         doc_type: Filter by document type (e.g., "news_article")
+        mode: "passage" searches the chunk index and returns each document's
+              best-matching passage (with offsets) as the excerpt
+        aggregate: "max" (best chunk) or "sum" (all matched chunks) per document
+        quality_weight: Ranking score = similarity * (1 - w + w * ocr_quality);
+              `score` holds it and `metadata.ocr_quality` the document's quality
     """
     import time
 
     start_time = time.time()
 
-    try:
-        # Get collection and model
-        collection = get_chroma_collection()
-        model = get_embedding_model()
+    if mode not in ("document", "passage") or aggregate not in AGGREGATION_MODES:
+        raise HTTPException(status_code=400, detail="Invalid mode or aggregate")
 
-        # Generate query embedding
-        query_embedding = model.encode([query])[0]
+    try:
+        # Generate query embedding (cached, encoded off the event loop)
+        query_embedding = await get_embedding_service().embed_query(query)
 
         # Build where filter
         where_filter = {}
         if doc_type:
             where_filter["doc_type"] = doc_type
 
-        # Search with optional filter
-        results = collection.query(
-            query_embeddings=[query_embedding.tolist()],
-            n_results=limit * 2,  # Get extra for filtering
-            where=where_filter if where_filter else None,
+        # Over-fetch so documents down-ranked for OCR quality can be replaced
+        quality_scores = get_ocr_quality_scores() if quality_weight else None
+        candidates = limit * 2 if quality_scores else limit
+
+        if mode == "passage":
+            formatted_results = await asyncio.to_thread(
+                _passage_search,
+                query_embedding,
+                candidates,
+                where_filter,
+                entity_filter,
+                aggregate,
+            )
+            formatted_results = _rank_by_quality(
+                formatted_results, quality_scores, quality_weight, limit
+            )
+            return SearchResponse(
+                query=query,
+                results=formatted_results,
+                total_results=len(formatted_results),
+                search_time_ms=(time.time() - start_time) * 1000,
+            )
+
+        collection = get_chroma_collection()
+
+        # Entity filter: pushed into ChromaDB (entity_ids) when the store has
+        # filter metadata, otherwise checked per hit with re-queries
+        pushdown = bool(entity_filter) and await asyncio.to_thread(supports_pushdown, collection)
+        accept = None
+        if entity_filter and not pushdown:
+
+            def accept(_doc_id, _similarity, _text, metadata):
+                return entity_filter in metadata.get("entity_mentions", "")
+
+        # Re-query loop is blocking ChromaDB I/O; keep it off the event loop
+        hits = await asyncio.to_thread(
+            query_filtered,
+            collection,
+            query_embedding.tolist(),
+            candidates,
+            where=where_clauses(where_filter, entity=entity_filter if pushdown else None),
+            accept=accept,
         )
 
         # Format results
         formatted_results = []
-        for i in range(len(results["ids"][0])):
-            doc_id = results["ids"][0][i]
-            distance = results["distances"][0][i]
-            similarity = 1 - distance
-            text = results["documents"][0][i]
-            metadata = results["metadatas"][0][i]
-
-            # Apply entity filter
-            if entity_filter:
-                entity_mentions = metadata.get("entity_mentions", "")
-                if entity_filter not in entity_mentions:
-                    continue
-
+        for doc_id, similarity, text, metadata in hits:
             # Create excerpt (first 300 chars)
             excerpt = text[:300] + "..." if len(text) > 300 else text
 
@@ -204,9 +305,9 @@ async def semantic_search(
                     id=doc_id, similarity=float(similarity), text_excerpt=excerpt, metadata=metadata
                 )
             )
-
-            if len(formatted_results) >= limit:
-                break
+        formatted_results = _rank_by_quality(
+            formatted_results, quality_scores, quality_weight, limit
+        )
 
         search_time = (time.time() - start_time) * 1000
 
@@ -217,10 +318,65 @@ async def semantic_search(
             search_time_ms=search_time,
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _rank_by_quality(
+    results: list[SearchResult], quality_scores, weight: float, limit: int
+) -> list[SearchResult]:
+    """Order results by OCR-quality-adjusted similarity and keep the top `limit`."""
+    if quality_scores is None:
+        return results[:limit]
+
+    for result in results:
+        quality = quality_scores.get(result.id)
+        if quality is not None:
+            result.metadata = {**result.metadata, "ocr_quality": quality}
+        result.score = quality_adjusted(result.similarity, quality, weight)
+    return sorted(results, key=lambda result: result.score, reverse=True)[:limit]
+
+
+def _passage_search(
+    query_embedding, limit: int, where_filter: dict, entity_filter: Optional[str], aggregate: str
+) -> list[SearchResult]:
+    """Query the chunk index and return one result per document with its best passage."""
+    chunk_collection = get_chunk_collection()
+
+    results = chunk_collection.query(
+        query_embeddings=[query_embedding.tolist()],
+        n_results=chunk_query_size(limit * 2 if entity_filter else limit),
+        where=where_filter if where_filter else None,
+    )
+
+    hits = aggregate_chunk_hits(
+        results["ids"][0],
+        results["distances"][0],
+        results["documents"][0],
+        results["metadatas"][0],
+        mode=aggregate,
+    )
+
+    return [
+        SearchResult(
+            id=hit.doc_id,
+            similarity=hit.score,
+            text_excerpt=hit.passage.text,
+            metadata=hit.metadata,
+            passage=PassageSpan(
+                chunk_index=hit.passage.chunk_index,
+                char_start=hit.passage.char_start,
+                char_end=hit.passage.char_end,
+                similarity=hit.passage.similarity,
+            ),
+            matched_chunks=hit.matched_chunks,
+        )
+        for hit in filter_hits(hits, entity_filter)[:limit]
+    ]
+
+
 @router.get("/entity/{entity_name}", response_model=EntitySearchResponse)
 async def get_entity_documents(
     entity_name: str,
@@ -352,10 +508,8 @@ async def get_similar_documents(
 
         # Use document text as query
         doc_text = source_doc["documents"][0]
-        model = get_embedding_model()
-
-        # Generate embedding
-        query_embedding = model.encode([doc_text])[0]
+        # Generate embedding (encoded off the event loop)
+        query_embedding = (await get_embedding_service().embed_texts([doc_text]))[0]
 
         # Search for similar documents
         results = collection.query(
@@ -467,32 +621,29 @@ async def multi_entity_search(
         entity_index = get_entity_doc_index()
         entity_to_docs = entity_index.get("entity_to_documents", {})
 
-        # Get document sets for each entity
-        doc_sets = []
         for entity in entity_list:
-            if entity in entity_to_docs:
-                doc_ids = {doc["doc_id"] for doc in entity_to_docs[entity]["documents"]}
-                doc_sets.append(doc_ids)
-            else:
+            if entity not in entity_to_docs:
                 raise HTTPException(status_code=404, detail=f"Entity not found: {entity}")
 
-        # Find intersection
-        common_docs = set.intersection(*doc_sets)
+        # Intersect sorted posting lists (smallest first)
+        postings = get_entity_postings()
+        common_postings = postings.intersect_postings(entity_list)
+        common_docs = postings.to_doc_ids(common_postings[:limit])
 
-        # Get document details from ChromaDB
-        collection = get_chroma_collection()
+        # Get document details from ChromaDB (one batched get)
+        documents = fetch_documents(get_chroma_collection(), common_docs)
         results = []
 
-        for doc_id in list(common_docs)[:limit]:
-            doc_result = collection.get(ids=[doc_id])
-            if doc_result["ids"]:
-                text = doc_result["documents"][0]
-                metadata = doc_result["metadatas"][0]
-                excerpt = text[:300] + "..." if len(text) > 300 else text
-
-                results.append({"id": doc_id, "text_excerpt": excerpt, "metadata": metadata})
+        for doc_id, doc in documents.items():
+            text = doc["text"]
+            excerpt = text[:300] + "..." if len(text) > 300 else text
+            results.append({"id": doc_id, "text_excerpt": excerpt, "metadata": doc["metadata"]})
 
-        return {"entities": entity_list, "documents": results, "total_results": len(common_docs)}
+        return {
+            "entities": entity_list,
+            "documents": results,
+            "total_results": int(len(common_postings)),
+        }
 
     except HTTPException:
         raise
@@ -530,82 +681,71 @@ async def search_news_articles(
     Returns:
         Search results with news article metadata
 
-    Design Decision: Date Filtering Strategy
-    Rationale: ChromaDB metadata filtering for dates would require standardized
-    YYYY-MM-DD format in all article metadata. Since articles may have varying
-    date formats, we apply date filtering post-query on the Python side.
+    Design Decision: Date and entity filters pushed into ChromaDB
+    Rationale: Filtering a fixed `limit * 2` candidate list in Python returned
+    short (often empty) pages for selective date ranges or entities.
+    embed_news_articles.py now stores date_epoch and entity_ids, and the
+    filters become `$gte`/`$lte` and `$contains` clauses of the vector query.
 
-    Performance: O(n) filter after vector search. For timeline view (typical
-    date ranges: 1-10 years), this adds <10ms overhead on result sets of 100-200
-    articles. Acceptable for user-facing queries.
+    Stores embedded before filter metadata existed fall back to the previous
+    Python checks, re-querying with more candidates until the page is full
+    (see services/vector_filters.py).
 
     Trade-offs:
-    - Simplicity: Works with any date format in metadata
-    - Flexibility: Easy to adjust date comparison logic
-    - Performance: Slightly slower than DB-level filtering but negligible for
-      typical result set sizes (<1000 articles)
-
-    Future Enhancement: If article count exceeds 10,000 and date filtering
-    becomes a bottleneck, migrate to standardized date field in ChromaDB
-    metadata and use $gte/$lte operators.
+    - Entity filter matches a full entity name (case-insensitive) when pushed
+      down, a substring of entity_mentions otherwise
+    - Articles without a parseable published_date never match a date filter
+      (pushdown) instead of always matching (fallback)
     """
     import time
 
     start_time = time.time()
 
     try:
-        collection = get_chroma_collection()
-        model = get_embedding_model()
-
-        # Generate query embedding
-        query_embedding = model.encode([query])[0]
+        try:
+            start_date = parse_date_bound(start_date)
+            end_date = parse_date_bound(end_date)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
-        # Build where filter for news articles
-        where_filter = {"doc_type": "news_article"}
+        collection = get_chroma_collection()
+        # Generate query embedding (cached, encoded off the event loop)
+        query_embedding = await get_embedding_service().embed_query(query)
 
-        # Add publication filter if specified
+        # Publication and credibility filters
+        extra = []
         if publication:
-            where_filter["publication"] = {"$eq": publication}
-
-        # Add credibility filter if specified
+            extra.append({"publication": {"$eq": publication}})
         if min_credibility is not None:
-            where_filter["credibility_score"] = {"$gte": min_credibility}
+            extra.append({"credibility_score": {"$gte": min_credibility}})
+
+        # Date and entity filters: pushed down when the store has filter metadata
+        pushdown = await asyncio.to_thread(supports_pushdown, collection)
+        where_filter = where_clauses(
+            {"doc_type": "news_article"},
+            date_start=start_date if pushdown else None,
+            date_end=end_date if pushdown else None,
+            entity=entity if pushdown else None,
+            extra=extra,
+        )
 
-        # Search with filters
-        results = collection.query(
-            query_embeddings=[query_embedding.tolist()],
-            n_results=limit * 2,  # Get extra for entity filtering
+        def accept(_doc_id, _similarity, _text, metadata):
+            return legacy_entity_match(metadata, entity) and legacy_date_match(
+                metadata, start_date, end_date, "published_date"
+            )
+
+        hits = await asyncio.to_thread(
+            query_filtered,
+            collection,
+            query_embedding.tolist(),
+            limit,
             where=where_filter,
+            accept=None if pushdown else accept,
         )
 
         # Format results
         formatted_results = []
-        for i in range(len(results["ids"][0])):
-            doc_id = results["ids"][0][i]
-            distance = results["distances"][0][i]
-            similarity = 1 - distance
-            text = results["documents"][0][i]
-            metadata = results["metadatas"][0][i]
-
-            # Apply entity filter if specified
-            if entity:
-                entity_mentions = metadata.get("entity_mentions", "")
-                if entity.lower() not in entity_mentions.lower():
-                    continue
-
-            # Apply date range filter if specified
-            if start_date or end_date:
-                published_date = metadata.get("published_date", "")
-                if published_date:
-                    # Extract date part (YYYY-MM-DD) from datetime string
-                    article_date = published_date.split("T")[0]
-
-                    # Skip if outside date range
-                    if start_date and article_date < start_date:
-                        continue
-                    if end_date and article_date > end_date:
-                        continue
-
+        for doc_id, similarity, text, metadata in hits:
             # Create excerpt
             excerpt = text[:300] + "..." if len(text) > 300 else text
 
@@ -615,9 +755,6 @@ async def search_news_articles(
                 )
             )
 
-            if len(formatted_results) >= limit:
-                break
-
         search_time = (time.time() - start_time) * 1000
 
         return SearchResponse(
@@ -627,6 +764,8 @@ async def search_news_articles(
             search_time_ms=search_time,
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -649,7 +788,6 @@ async def find_similar_articles(
     """
     try:
         collection = get_chroma_collection()
-        model = get_embedding_model()
 
         # Normalize article ID format
         if not article_id.startswith("news:"):
@@ -670,7 +808,7 @@ async def find_similar_articles(
 
         # Use article text as query
         doc_text = source_doc["documents"][0]
-        query_embedding = model.encode([doc_text])[0]
+        query_embedding = (await get_embedding_service().embed_texts([doc_text]))[0]
 
         # Search for similar news articles only
         results = collection.query(
@@ -7,9 +7,10 @@ Provides comprehensive search across entities, flights, documents, and news arti
 with advanced features like fuzzy matching, boolean operators, and faceted filtering.
 """
 
+import asyncio
 import json
+import logging
 import time
-from datetime import datetime
 from difflib import SequenceMatcher
 from pathlib import Path
 from typing import Any, Optional
@@ -18,7 +19,29 @@ import chromadb
 from chromadb.config import Settings
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
-from sentence_transformers import SentenceTransformer
+from services.autocomplete_index import (
+    AutocompleteIndex,
+    set_popular_query,
+    sync_entities,
+)
+from services.document_catalog import get_document_catalog
+from services.embedding_service import get_embedding_service
+from services.fulltext_index import get_fulltext_index
+from services.hybrid_search import (
+    BooleanPostFilter,
+    SearchResultCache,
+    decode_cursor,
+    encode_cursor,
+    reciprocal_rank_fusion,
+)
+from services.search_analytics import SearchAnalytics
+from services.vector_filters import (
+    legacy_date_match,
+    parse_date_bound,
+    query_filtered,
+    supports_pushdown,
+    where_clauses,
+)
 
 
 # Project paths
@@ -26,18 +49,31 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 VECTOR_STORE_DIR = PROJECT_ROOT / "data/vector_store/chroma"
 ENTITY_INDEX_PATH = PROJECT_ROOT / "data/md/entities/ENTITIES_INDEX.json"
 SEARCH_ANALYTICS_PATH = PROJECT_ROOT / "data/metadata/search_analytics.json"
+DOCUMENT_INDEX_PATH = PROJECT_ROOT / "data/metadata/all_documents_index.json"
+DOCUMENT_FTS_PATH = PROJECT_ROOT / "data/metadata/document_fts.db"
 
 COLLECTION_NAME = "epstein_documents"
 
+# Rank fusion: retriever weights and candidates taken from each retriever
+RETRIEVER_WEIGHTS = {"entities": 1.0, "bm25": 1.0, "dense": 1.0, "news": 1.0}
+LEXICAL_CANDIDATES = 100
+DENSE_CANDIDATES = 50
+NEWS_CANDIDATES = 30
+
+logger = logging.getLogger(__name__)
+
 # Initialize router
 router = APIRouter(prefix="/api/search", tags=["Search"])
 
 # Global instances (lazy loaded)
 _chroma_client = None
 _collection = None
-_embedding_model = None
 _entity_index = None
+_entity_index_mtime = None
 _search_analytics = None
+_autocomplete_index = None
+_autocomplete_entities = None
+_result_cache = SearchResultCache()
 
 
 def get_chroma_collection():
@@ -60,58 +96,78 @@ def get_chroma_collection():
 
 
 def get_embedding_model():
-    """Get embedding model (lazy loading)."""
-    global _embedding_model
-
-    if _embedding_model is None:
-        _embedding_model = SentenceTransformer("all-MiniLM-L6-v2")
-
-    return _embedding_model
+    """Get embedding model (shared by all routers and services)."""
+    return get_embedding_service().model
 
 
 def get_entity_index():
-    """Get entity index (lazy loading)."""
-    global _entity_index
+    """Get entity index (lazy loading, reloaded when the file changes)."""
+    global _entity_index, _entity_index_mtime
 
-    if _entity_index is None:
-        if ENTITY_INDEX_PATH.exists():
+    try:
+        mtime = ENTITY_INDEX_PATH.stat().st_mtime
+    except OSError:
+        mtime = None
+
+    if _entity_index is None or mtime != _entity_index_mtime:
+        if mtime is not None:
             with open(ENTITY_INDEX_PATH) as f:
                 _entity_index = json.load(f)
         else:
             _entity_index = {"entities": []}
+        _entity_index_mtime = mtime
 
     return _entity_index
 
 
-def load_search_analytics():
-    """Get or initialize search analytics (lazy loading)."""
+def get_autocomplete_index() -> AutocompleteIndex:
+    """Get autocomplete index (built once, then updated incrementally).
+
+    Popular queries arrive through a search analytics listener; entity names
+    and aliases are re-synced only when ENTITIES_INDEX.json is reloaded.
+    """
+    global _autocomplete_index, _autocomplete_entities
+
+    if _autocomplete_index is None:
+        index = AutocompleteIndex()
+        get_search_analytics_store().add_listener(
+            lambda counts: [set_popular_query(index, q, c) for q, c in counts.items()]
+        )
+        _autocomplete_index = index
+
+    entity_index = get_entity_index()
+    if entity_index is not _autocomplete_entities:
+        sync_entities(_autocomplete_index, entity_index.get("entities", []))
+        _autocomplete_entities = entity_index
+
+    return _autocomplete_index
+
+
+def get_search_analytics_store() -> SearchAnalytics:
+    """Get search analytics aggregator (lazy loading, flushes in background)."""
     global _search_analytics
 
     if _search_analytics is None:
-        if SEARCH_ANALYTICS_PATH.exists():
-            with open(SEARCH_ANALYTICS_PATH) as f:
-                _search_analytics = json.load(f)
-        else:
-            _search_analytics = {
-                "total_searches": 0,
-                "popular_queries": {},
-                "recent_searches": [],
-                "last_updated": datetime.utcnow().isoformat(),
-            }
+        _search_analytics = SearchAnalytics(SEARCH_ANALYTICS_PATH)
 
     return _search_analytics
 
 
+def load_search_analytics():
+    """Get current search analytics (total, popular, recent, last_updated)."""
+    return get_search_analytics_store().snapshot()
+
+
 def save_search_analytics():
-    """Save search analytics to disk."""
-    global _search_analytics
+    """Write pending search analytics to disk now."""
+    if _search_analytics is not None:
+        _search_analytics.flush()
 
-    if _search_analytics:
-        SEARCH_ANALYTICS_PATH.parent.mkdir(parents=True, exist_ok=True)
-        _search_analytics["last_updated"] = datetime.utcnow().isoformat()
 
-        with open(SEARCH_ANALYTICS_PATH, "w") as f:
-            json.dump(_search_analytics, f, indent=2)
+def close_search_analytics():
+    """Stop the analytics flusher and write pending events (server shutdown)."""
+    if _search_analytics is not None:
+        _search_analytics.close()
 
 
 def fuzzy_match(query: str, target: str, threshold: float = 0.6) -> float:
@@ -149,7 +205,8 @@ def parse_boolean_query(query: str) -> dict[str, list[str]]:
     """
     Parse boolean operators from query string.
 
-    Supports AND, OR, NOT operators:
+    Supports AND, OR, NOT operators (uppercase only, as in FTS5; a lowercase
+    "not" is an ordinary word):
     - "term1 AND term2" - both must be present
     - "term1 OR term2" - either must be present
     - "term1 NOT term2" - first present, second absent
@@ -170,11 +227,14 @@ def parse_boolean_query(query: str) -> dict[str, list[str]]:
     while i < len(terms):
         term = terms[i]
 
-        if term.upper() == "AND":
+        if term == "AND":
             current_mode = "must"
-        elif term.upper() == "OR":
+        elif term == "OR":
+            # "a OR b": the left operand is optional too
+            if current_mode == "must" and i > 0 and result["must"][-1:] == [terms[i - 1].lower()]:
+                result["should"].append(result["must"].pop())
             current_mode = "should"
-        elif term.upper() == "NOT":
+        elif term == "NOT":
             if i + 1 < len(terms):
                 result["must_not"].append(terms[i + 1].lower())
                 i += 1
@@ -210,6 +270,8 @@ class SearchResult(BaseModel):
     similarity: float
     metadata: dict[str, Any]
     highlights: Optional[list[str]] = None
+    score: Optional[float] = None  # fused (reciprocal rank fusion) score
+    retrievers: Optional[dict[str, int]] = None  # retriever -> rank that found it
 
 
 class UnifiedSearchResponse(BaseModel):
@@ -221,6 +283,7 @@ class UnifiedSearchResponse(BaseModel):
     results: list[SearchResult]
     facets: dict[str, dict[str, int]]
     suggestions: list[str]
+    next_cursor: Optional[str] = None
 
 
 class SearchSuggestion(BaseModel):
@@ -240,6 +303,9 @@ async def unified_search(
     query: str = Query(..., description="Search query with optional boolean operators"),
     limit: int = Query(20, ge=1, le=100, description="Maximum results"),
     offset: int = Query(0, ge=0, description="Pagination offset"),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from a previous response (pages the same result set)"
+    ),
     fields: Optional[str] = Query(
         "all",
         description="Comma-separated fields to search: all, entities, documents, flights, news",
@@ -255,112 +321,190 @@ async def unified_search(
     Unified multi-field search across all data sources.
 
     Features:
-    - Multi-field search (entities, documents, flights, news)
-    - Fuzzy matching for typo tolerance
-    - Boolean operators (AND, OR, NOT)
-    - Date range filtering
+    - Hybrid retrieval: BM25 full-text and vector search run concurrently
+      and are fused with reciprocal rank fusion (with entities and news)
+    - Fuzzy matching for typos
+    - Boolean operators (AND, OR, NOT) enforced as post-filters
+    - Stable cursor pagination (pages are served from the fused result set)
     - Faceted results for filtering UI
     - Search suggestions
 
     Args:
         query: Search query (supports AND, OR, NOT operators)
         limit: Maximum results to return
-        offset: Pagination offset
+        offset: Pagination offset (first page)
+        cursor: next_cursor of a previous response; other parameters except
+            limit are ignored
         fields: Which fields to search (all, entities, documents, flights, news)
         fuzzy: Enable fuzzy matching
-        min_similarity: Minimum similarity threshold
+        min_similarity: Minimum similarity threshold (entity and vector hits)
         doc_type: Filter by document type
         source: Filter by source
         date_start: Start date for filtering
         date_end: End date for filtering
 
     Returns:
-        Unified search results with facets and suggestions
+        Unified search results with facets, suggestions and next_cursor
     """
     start_time = time.time()
 
     try:
-        # Track search analytics
-        analytics = load_search_analytics()
-        analytics["total_searches"] += 1
-        analytics["popular_queries"][query] = analytics["popular_queries"].get(query, 0) + 1
-        analytics["recent_searches"].insert(
-            0, {"query": query, "timestamp": datetime.utcnow().isoformat(), "fields": fields}
-        )
-        analytics["recent_searches"] = analytics["recent_searches"][:100]  # Keep last 100
-        save_search_analytics()
+        if cursor:
+            try:
+                search_id, cursor_offset = decode_cursor(cursor)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            cached = _result_cache.get(search_id)
+            if cached is None:
+                raise HTTPException(
+                    status_code=410, detail="Search cursor expired; run the search again"
+                )
+            return build_page(cached, search_id, cursor_offset, limit, start_time)
+
+        try:
+            date_start = parse_date_bound(date_start)
+            date_end = parse_date_bound(date_end)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        # Track search analytics (queued; written by the background flusher)
+        analytics_store = get_search_analytics_store()
+        analytics_store.record(query, fields)
 
         # Parse boolean query
         boolean_terms = parse_boolean_query(query)
+        post_filter = BooleanPostFilter.from_query(query, boolean_terms)
 
         # Determine which fields to search
         search_fields = fields.split(",") if fields != "all" else ["entities", "documents", "news"]
 
-        all_results = []
-        facets = {"types": {}, "sources": {}, "doc_types": {}, "entity_types": {}}
-
-        # Search entities
+        # Retrievers run concurrently; each returns its own ranked list
+        retrievers = {}
         if "entities" in search_fields or "all" in search_fields:
-            entity_results = await search_entities(query, boolean_terms, fuzzy, min_similarity)
-            all_results.extend(entity_results)
-
-            for result in entity_results:
-                facets["types"]["entity"] = facets["types"].get("entity", 0) + 1
-
-        # Search documents (via vector store)
+            retrievers["entities"] = search_entities(
+                query, boolean_terms, fuzzy, min_similarity, post_filter
+            )
         if "documents" in search_fields or "all" in search_fields:
-            doc_results = await search_documents(
-                query, boolean_terms, min_similarity, doc_type, source, date_start, date_end
+            retrievers["bm25"] = search_documents_lexical(
+                query, doc_type, source, date_start, date_end, post_filter
+            )
+            retrievers["dense"] = search_documents(
+                query,
+                boolean_terms,
+                min_similarity,
+                doc_type,
+                source,
+                date_start,
+                date_end,
+                post_filter,
             )
-            all_results.extend(doc_results)
-
-            for result in doc_results:
-                facets["types"]["document"] = facets["types"].get("document", 0) + 1
-                result_doc_type = result.metadata.get("doc_type", "unknown")
-                facets["doc_types"][result_doc_type] = (
-                    facets["doc_types"].get(result_doc_type, 0) + 1
-                )
-                result_source = result.metadata.get("source", "unknown")
-                facets["sources"][result_source] = facets["sources"].get(result_source, 0) + 1
-
-        # Search news articles
         if "news" in search_fields or "all" in search_fields:
-            news_results = await search_news(
-                query, boolean_terms, min_similarity, date_start, date_end
+            retrievers["news"] = search_news(
+                query, boolean_terms, min_similarity, date_start, date_end, post_filter
             )
-            all_results.extend(news_results)
-
-            for result in news_results:
-                facets["types"]["news"] = facets["types"].get("news", 0) + 1
 
-        # Sort by similarity
-        all_results.sort(key=lambda x: x.similarity, reverse=True)
+        outcomes = await asyncio.gather(*retrievers.values(), return_exceptions=True)
+        ranked_lists: dict[str, list[SearchResult]] = {}
+        for name, outcome in zip(retrievers, outcomes):
+            if isinstance(outcome, BaseException):
+                # One unavailable retriever (e.g. vector store not built) shouldn't fail the search
+                logger.warning("Search retriever %s failed: %s", name, outcome)
+                outcome = []
+            ranked_lists[name] = outcome
 
-        # Apply pagination
-        paginated_results = all_results[offset : offset + limit]
+        all_results = fuse_results(ranked_lists)
+        facets = compute_facets(all_results)
 
         # Generate suggestions based on query
+        analytics = {"popular_queries": dict(analytics_store.top_queries(20))}
         suggestions = generate_suggestions(query, analytics)
 
-        search_time = (time.time() - start_time) * 1000
-
-        return UnifiedSearchResponse(
-            query=query,
-            total_results=len(all_results),
-            search_time_ms=search_time,
-            results=paginated_results,
-            facets=facets,
-            suggestions=suggestions[:5],
-        )
+        result_set = {
+            "query": query,
+            "results": all_results,
+            "facets": facets,
+            "suggestions": suggestions[:5],
+        }
+        search_id = _result_cache.put(result_set)
+        return build_page(result_set, search_id, offset, limit, start_time)
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def fuse_results(ranked_lists: dict[str, list[SearchResult]]) -> list[SearchResult]:
+    """
+    Merge retriever lists with reciprocal rank fusion.
+
+    A document found by both BM25 and the vector index appears once: the
+    vector hit (ChromaDB metadata) is kept and gains the BM25 snippet as its
+    highlight. News hits win over plain document hits for the same ID.
+    """
+    by_id: dict[str, SearchResult] = {}
+    for name in ("bm25", "entities", "dense", "news"):
+        for result in ranked_lists.get(name, []):
+            existing = by_id.get(result.id)
+            if existing is not None and existing.highlights and not result.highlights:
+                result = result.model_copy(update={"highlights": existing.highlights})
+            by_id[result.id] = result
+
+    fused = reciprocal_rank_fusion(
+        {name: [result.id for result in results] for name, results in ranked_lists.items()},
+        weights=RETRIEVER_WEIGHTS,
+    )
+    return [
+        by_id[result_id].model_copy(update={"score": round(score, 6), "retrievers": ranks})
+        for result_id, score, ranks in fused
+    ]
+
+
+def compute_facets(results: list[SearchResult]) -> dict[str, dict[str, int]]:
+    """Type, doc_type and source counts over the fused result set."""
+    facets = {"types": {}, "sources": {}, "doc_types": {}, "entity_types": {}}
+    for result in results:
+        facets["types"][result.type] = facets["types"].get(result.type, 0) + 1
+        if result.type == "document":
+            result_doc_type = result.metadata.get("doc_type", "unknown")
+            facets["doc_types"][result_doc_type] = facets["doc_types"].get(result_doc_type, 0) + 1
+            result_source = result.metadata.get("source", "unknown")
+            facets["sources"][result_source] = facets["sources"].get(result_source, 0) + 1
+    return facets
+
+
+def build_page(
+    result_set: dict, search_id: str, offset: int, limit: int, start_time: float
+) -> UnifiedSearchResponse:
+    """Slice one page out of a cached fused result set."""
+    results = result_set["results"]
+    next_offset = offset + limit
+    return UnifiedSearchResponse(
+        query=result_set["query"],
+        total_results=len(results),
+        search_time_ms=(time.time() - start_time) * 1000,
+        results=results[offset:next_offset],
+        facets=result_set["facets"],
+        suggestions=result_set["suggestions"],
+        next_cursor=encode_cursor(search_id, next_offset) if next_offset < len(results) else None,
+    )
+
+
 async def search_entities(
-    query: str, boolean_terms: dict[str, list[str]], fuzzy: bool, min_similarity: float
+    query: str,
+    boolean_terms: dict[str, list[str]],
+    fuzzy: bool,
+    min_similarity: float,
+    post_filter: Optional[BooleanPostFilter] = None,
+) -> list[SearchResult]:
+    """Search entities with fuzzy matching (best match first)."""
+    return await asyncio.to_thread(match_entities, query, fuzzy, min_similarity, post_filter)
+
+
+def match_entities(
+    query: str, fuzzy: bool, min_similarity: float, post_filter: Optional[BooleanPostFilter]
 ) -> list[SearchResult]:
-    """Search entities with fuzzy matching."""
+    """Score every entity against the query (CPU-bound; runs in a worker thread)."""
     entity_index = get_entity_index()
     entities = entity_index.get("entities", [])
 
@@ -392,23 +536,126 @@ async def search_entities(
         # Take best score
         best_score = max(name_score, max_alias_score, bio_score)
 
-        if best_score >= min_similarity:
-            results.append(
-                SearchResult(
-                    id=f"entity:{name}",
-                    type="entity",
-                    title=name,
-                    description=biography[:200] + "..." if len(biography) > 200 else biography,
-                    similarity=best_score,
-                    metadata={
-                        "aliases": aliases,
-                        "categories": entity.get("categories", []),
-                        "sources": entity.get("sources", []),
-                    },
-                    highlights=[name, *aliases[:3]],
-                )
+        if best_score < min_similarity:
+            continue
+        if post_filter and not post_filter.matches(" ".join([name, *aliases, biography])):
+            continue
+
+        results.append(
+            SearchResult(
+                id=f"entity:{name}",
+                type="entity",
+                title=name,
+                description=biography[:200] + "..." if len(biography) > 200 else biography,
+                similarity=best_score,
+                metadata={
+                    "aliases": aliases,
+                    "categories": entity.get("categories", []),
+                    "sources": entity.get("sources", []),
+                },
+                highlights=[name, *aliases[:3]],
             )
+        )
+
+    results.sort(key=lambda x: x.similarity, reverse=True)
+    return results
+
+
+async def search_documents_lexical(
+    query: str,
+    doc_type: Optional[str],
+    source: Optional[str],
+    date_start: Optional[str] = None,
+    date_end: Optional[str] = None,
+    post_filter: Optional[BooleanPostFilter] = None,
+) -> list[SearchResult]:
+    """BM25 full-text search over OCR/markdown text (best match first)."""
+    return await asyncio.to_thread(
+        match_documents_lexical, query, doc_type, source, date_start, date_end, post_filter
+    )
+
+
+def match_documents_lexical(
+    query: str,
+    doc_type: Optional[str],
+    source: Optional[str],
+    date_start: Optional[str] = None,
+    date_end: Optional[str] = None,
+    post_filter: Optional[BooleanPostFilter] = None,
+) -> list[SearchResult]:
+    """
+    Rank documents with the FTS5 index.
+
+    Results are keyed by OCR file stem (the ChromaDB document ID) when the
+    document has OCR text, so fusion merges them with vector hits for the
+    same file. Returns [] when the index hasn't been built.
+
+    The boolean post-filter is applied to BM25 hits too (on the indexed
+    text), like every other retriever: the FTS translation is not trusted to
+    have kept every operator.
+    """
+    index = get_fulltext_index(DOCUMENT_FTS_PATH)
+    if not index.available:
+        return []
+    catalog = get_document_catalog(DOCUMENT_INDEX_PATH)
+
+    allowed = None
+    if doc_type or source:
+        allowed = {
+            doc.get("id") for doc in catalog.filter_documents(doc_type=doc_type, source=source)
+        }
+
+    boolean_filter = post_filter if post_filter is not None and post_filter.active else None
+
+    # Filtered searches rank everything; the filter decides what survives
+    filtered = allowed is not None or date_start or date_end or boolean_filter is not None
+    ranked = index.rank_with_paths(query, limit=None if filtered else LEXICAL_CANDIDATES)
+    hits = []
+    for start in range(0, len(ranked), LEXICAL_CANDIDATES):
+        page = []
+        for doc_id, score, text_path in ranked[start : start + LEXICAL_CANDIDATES]:
+            if allowed is not None and doc_id not in allowed:
+                continue
+            if (date_start or date_end) and not legacy_date_match(
+                catalog.get(doc_id) or {}, date_start, date_end, "date"
+            ):
+                continue
+            page.append((doc_id, score, text_path))
+
+        if boolean_filter is not None:
+            texts = index.texts([doc_id for doc_id, _, _ in page])
+            page = [hit for hit in page if boolean_filter.matches(texts.get(hit[0], ""))]
+
+        hits.extend(page[: LEXICAL_CANDIDATES - len(hits)])
+        if len(hits) >= LEXICAL_CANDIDATES:
+            break
+    if not hits:
+        return []
+
+    snippets = index.snippets(query, [doc_id for doc_id, _, _ in hits])
+    best_score = hits[0][1] or 1.0
 
+    results = []
+    for doc_id, score, text_path in hits:
+        doc = catalog.get(doc_id) or {}
+        snippet = snippets.get(doc_id, "")
+        results.append(
+            SearchResult(
+                id=Path(text_path).stem if text_path else doc_id,
+                type="document",
+                title=doc.get("filename", "Unknown Document"),
+                description=snippet.replace("<mark>", "").replace("</mark>", ""),
+                similarity=round(max(0.0, min(1.0, score / best_score)), 4),
+                metadata={
+                    "document_id": doc_id,
+                    "filename": doc.get("filename"),
+                    "source": doc.get("source", "unknown"),
+                    "doc_type": doc.get("doc_type") or doc.get("classification", "unknown"),
+                    "bm25": round(score, 4),
+                },
+                highlights=[snippet] if snippet else None,
+            )
+        )
     return results
 
 
@@ -420,52 +667,57 @@ async def search_documents(
     source: Optional[str],
     date_start: Optional[str],
     date_end: Optional[str],
+    post_filter: Optional[BooleanPostFilter] = None,
 ) -> list[SearchResult]:
-    """Search documents via vector store."""
+    """Search documents via vector store (best match first)."""
     collection = get_chroma_collection()
-    model = get_embedding_model()
-
-    # Generate query embedding
-    query_embedding = model.encode([query])[0]
-
-    # Build where filter
-    where_filter = {}
-    if doc_type:
-        where_filter["doc_type"] = doc_type
-    if source:
-        where_filter["source"] = source
-
-    # Search
-    results = collection.query(
-        query_embeddings=[query_embedding.tolist()],
-        n_results=50,
-        where=where_filter if where_filter else None,
+    # Generate query embedding (cached, encoded off the event loop)
+    query_embedding = await get_embedding_service().embed_query(query)
+
+    # Metadata filters; the date range is pushed down when the store has
+    # date_epoch metadata and checked per hit otherwise
+    pushdown = bool(date_start or date_end) and await asyncio.to_thread(
+        supports_pushdown, collection
+    )
+    where_filter = where_clauses(
+        {"doc_type": doc_type, "source": source},
+        date_start=date_start if pushdown else None,
+        date_end=date_end if pushdown else None,
+    )
+
+    def accept(_doc_id, _similarity, text, metadata):
+        if not pushdown and not legacy_date_match(metadata, date_start, date_end, "date_extracted"):
+            return False
+        return post_filter is None or post_filter.matches(text)
+
+    # Re-queries with more candidates while post-filters leave the list short
+    hits = await asyncio.to_thread(
+        query_filtered,
+        collection,
+        query_embedding.tolist(),
+        DENSE_CANDIDATES,
+        where=where_filter,
+        accept=accept,
+        min_similarity=min_similarity,
     )
 
     search_results = []
 
-    for i in range(len(results["ids"][0])):
-        doc_id = results["ids"][0][i]
-        distance = results["distances"][0][i]
-        similarity = 1 - distance
-        text = results["documents"][0][i]
-        metadata = results["metadatas"][0][i]
-
-        if similarity >= min_similarity:
-            # Create excerpt with context
-            excerpt = text[:300] + "..." if len(text) > 300 else text
-
-            search_results.append(
-                SearchResult(
-                    id=doc_id,
-                    type="document",
-                    title=metadata.get("filename", "Unknown Document"),
-                    description=excerpt,
-                    similarity=float(similarity),
-                    metadata=metadata,
-                    highlights=None,
-                )
+    for doc_id, similarity, text, metadata in hits:
+        # Create excerpt with context
+        excerpt = text[:300] + "..." if len(text) > 300 else text
+
+        search_results.append(
+            SearchResult(
+                id=doc_id,
+                type="document",
+                title=metadata.get("filename", "Unknown Document"),
+                description=excerpt,
+                similarity=float(similarity),
+                metadata=metadata,
+                highlights=None,
             )
+        )
 
     return search_results
 
@@ -476,45 +728,54 @@ async def search_news(
     min_similarity: float,
     date_start: Optional[str],
     date_end: Optional[str],
+    post_filter: Optional[BooleanPostFilter] = None,
 ) -> list[SearchResult]:
-    """Search news articles."""
+    """Search news articles (best match first)."""
     collection = get_chroma_collection()
-    model = get_embedding_model()
+    # Generate query embedding (cached, encoded off the event loop)
+    query_embedding = await get_embedding_service().embed_query(query)
 
-    # Generate query embedding
-    query_embedding = model.encode([query])[0]
-
-    # Build where filter for news articles
-    where_filter = {"doc_type": "news_article"}
+    # News articles, with the date range pushed down when supported
+    pushdown = bool(date_start or date_end) and await asyncio.to_thread(
+        supports_pushdown, collection
+    )
+    where_filter = where_clauses(
+        {"doc_type": "news_article"},
+        date_start=date_start if pushdown else None,
+        date_end=date_end if pushdown else None,
+    )
 
-    # Search
-    results = collection.query(
-        query_embeddings=[query_embedding.tolist()], n_results=30, where=where_filter
+    def accept(_doc_id, _similarity, text, metadata):
+        if not pushdown and not legacy_date_match(metadata, date_start, date_end, "published_date"):
+            return False
+        return post_filter is None or post_filter.matches(text)
+
+    hits = await asyncio.to_thread(
+        query_filtered,
+        collection,
+        query_embedding.tolist(),
+        NEWS_CANDIDATES,
+        where=where_filter,
+        accept=accept,
+        min_similarity=min_similarity,
     )
 
     search_results = []
 
-    for i in range(len(results["ids"][0])):
-        doc_id = results["ids"][0][i]
-        distance = results["distances"][0][i]
-        similarity = 1 - distance
-        text = results["documents"][0][i]
-        metadata = results["metadatas"][0][i]
-
-        if similarity >= min_similarity:
-            excerpt = text[:300] + "..." if len(text) > 300 else text
-
-            search_results.append(
-                SearchResult(
-                    id=doc_id,
-                    type="news",
-                    title=metadata.get("title", "News Article"),
-                    description=excerpt,
-                    similarity=float(similarity),
-                    metadata=metadata,
-                    highlights=None,
-                )
+    for doc_id, similarity, text, metadata in hits:
+        excerpt = text[:300] + "..." if len(text) > 300 else text
+
+        search_results.append(
+            SearchResult(
+                id=doc_id,
+                type="news",
+                title=metadata.get("title", "News Article"),
+                description=excerpt,
+                similarity=float(similarity),
+                metadata=metadata,
+                highlights=None,
             )
+        )
 
     return search_results
 
@@ -558,7 +819,9 @@ async def get_search_suggestions(
     Provides real-time suggestions based on:
     - Entity names and aliases
     - Popular search queries
-    - Document titles
+    - Trigram fuzzy matches when substring matches don't fill the list
+
+    Served from a prebuilt n-gram index (see services/autocomplete_index.py).
 
     Args:
         query: Partial search query (minimum 2 characters)
@@ -568,64 +831,11 @@ async def get_search_suggestions(
         List of search suggestions with type and score
     """
     try:
-        suggestions = []
-        query_lower = query.lower()
-
-        # Search entities
-        entity_index = get_entity_index()
-        entities = entity_index.get("entities", [])
-
-        for entity in entities:
-            name = entity.get("name", "")
-            aliases = entity.get("aliases", [])
-
-            # Check name
-            if query_lower in name.lower():
-                score = fuzzy_match(query, name, 0.5)
-                if score > 0:
-                    suggestions.append(
-                        SearchSuggestion(
-                            text=name,
-                            type="entity",
-                            score=score,
-                            metadata={"categories": entity.get("categories", [])},
-                        )
-                    )
-
-            # Check aliases
-            for alias in aliases:
-                if query_lower in alias.lower():
-                    score = fuzzy_match(query, alias, 0.5)
-                    if score > 0:
-                        suggestions.append(
-                            SearchSuggestion(
-                                text=f"{alias} ({name})",
-                                type="entity_alias",
-                                score=score,
-                                metadata={"canonical_name": name},
-                            )
-                        )
-
-        # Get popular queries
-        analytics = load_search_analytics()
-        popular = analytics.get("popular_queries", {})
-
-        for pop_query, count in popular.items():
-            if query_lower in pop_query.lower():
-                score = fuzzy_match(query, pop_query, 0.5)
-                if score > 0:
-                    suggestions.append(
-                        SearchSuggestion(
-                            text=pop_query,
-                            type="popular_query",
-                            score=score * 0.8,  # Slightly lower priority
-                            metadata={"search_count": count},
-                        )
-                    )
-
-        # Sort by score and limit
-        suggestions.sort(key=lambda x: x.score, reverse=True)
-        return suggestions[:limit]
+        hits = get_autocomplete_index().search(query, limit=limit)
+        return [
+            SearchSuggestion(text=hit.text, type=hit.type, score=hit.score, metadata=hit.metadata)
+            for hit in hits
+        ]
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -682,13 +892,7 @@ async def clear_search_history():
         Confirmation message
     """
     try:
-        global _search_analytics
-
-        analytics = load_search_analytics()
-        analytics["recent_searches"] = []
-        analytics["last_updated"] = datetime.utcnow().isoformat()
-
-        save_search_analytics()
+        get_search_analytics_store().clear_recent()
 
         return {"status": "success", "message": "Search history cleared"}
 
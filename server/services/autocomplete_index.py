@@ -0,0 +1,327 @@
+"""
+Autocomplete Index - N-gram postings for search-as-you-type suggestions
+
+Design Decision: Bigram/trigram postings + tiered, popularity-weighted ranking
+Rationale: /api/search/suggestions scanned every entity, alias and popular
+query on each keystroke and ran difflib on each substring hit. Every
+suggestion is now indexed once by its character bigrams and trigrams:
+- 2-character queries read one bigram posting set (exact substring answer)
+- Longer queries intersect their trigram postings (smallest first) and
+  verify the few survivors with `in`
+- When substring matches don't fill the page, the share of the query's
+  trigrams found in an entry gives typo-tolerant matches ("Ghisline" ->
+  "Maxwell, Ghislaine"); containment rather than Dice, so long names are not
+  penalized for their length
+
+Ranking (score, then popularity weight, then text):
+- exact 1.0 > prefix 0.95 > word prefix 0.92 > substring 0.9 > fuzzy (<0.85)
+- Scores are multiplied by the entry's boost (popular queries: 0.8, as before)
+- Weight: entity flights + sources, popular query search count
+
+Updates are incremental: `add`/`remove`/`set_weight` touch only the entry's
+own n-grams, so a new popular query or a changed entity file does not
+rebuild the index.
+
+Performance (1,690 entities/aliases + popular queries):
+- Lookup: tens of microseconds; worst case is a common bigram
+- Memory: ~2 n-grams per character of each entry
+"""
+
+import heapq
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Optional
+
+
+TIER_EXACT = 1.0
+TIER_PREFIX = 0.95
+TIER_WORD_PREFIX = 0.92
+TIER_SUBSTRING = 0.9
+FUZZY_CEILING = 0.85
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase and collapse whitespace"""
+    return " ".join(text.lower().split())
+
+
+def ngrams(text: str, n: int) -> set[str]:
+    """Character n-grams of text (the text itself if shorter than n)"""
+    if len(text) <= n:
+        return {text} if text else set()
+    return {text[i : i + n] for i in range(len(text) - n + 1)}
+
+
+@dataclass
+class AutocompleteEntry:
+    """One suggestion: matched on `match_text`, displayed as `text`"""
+
+    key: tuple[str, str]
+    text: str
+    type: str
+    match_text: str
+    weight: float = 0.0
+    boost: float = 1.0
+    metadata: dict = field(default_factory=dict)
+    grams: frozenset = frozenset()
+
+
+@dataclass
+class AutocompleteHit:
+    """Ranked suggestion"""
+
+    text: str
+    type: str
+    score: float
+    metadata: dict
+
+
+class AutocompleteIndex:
+    """Incrementally maintained n-gram index over suggestion strings"""
+
+    def __init__(self):
+        self._entries: dict[int, AutocompleteEntry] = {}
+        self._ids: dict[tuple[str, str], int] = {}
+        self._postings: dict[str, set[int]] = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: tuple[str, str]) -> bool:
+        return key in self._ids
+
+    def keys(self, entry_type: Optional[str] = None) -> set[tuple[str, str]]:
+        """Keys of all entries (optionally of one type)"""
+        with self._lock:
+            return {key for key in self._ids if entry_type is None or key[0] == entry_type}
+
+    # ==================== Updates ====================
+
+    def add(
+        self,
+        text: str,
+        entry_type: str,
+        match_text: Optional[str] = None,
+        weight: float = 0.0,
+        boost: float = 1.0,
+        metadata: Optional[dict] = None,
+    ) -> None:
+        """Add or replace the entry keyed by (entry_type, text)"""
+        match = normalize_text(match_text if match_text is not None else text)
+        if not match:
+            return
+
+        key = (entry_type, text)
+        entry = AutocompleteEntry(
+            key=key,
+            text=text,
+            type=entry_type,
+            match_text=match,
+            weight=weight,
+            boost=boost,
+            metadata=metadata or {},
+            grams=frozenset(ngrams(match, 2) | ngrams(match, 3)),
+        )
+
+        with self._lock:
+            if key in self._ids:
+                self._remove_locked(key)
+            entry_id = self._next_id
+            self._next_id += 1
+            self._entries[entry_id] = entry
+            self._ids[key] = entry_id
+            for gram in entry.grams:
+                self._postings.setdefault(gram, set()).add(entry_id)
+
+    def remove(self, entry_type: str, text: str) -> bool:
+        """Remove an entry; returns False if it was not indexed"""
+        with self._lock:
+            return self._remove_locked((entry_type, text))
+
+    def _remove_locked(self, key: tuple[str, str]) -> bool:
+        entry_id = self._ids.pop(key, None)
+        if entry_id is None:
+            return False
+        entry = self._entries.pop(entry_id)
+        for gram in entry.grams:
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(entry_id)
+                if not posting:
+                    del self._postings[gram]
+        return True
+
+    def set_weight(
+        self, entry_type: str, text: str, weight: float, metadata: Optional[dict] = None
+    ) -> bool:
+        """Update popularity (and metadata) without re-indexing
+
+        Returns:
+            False if the entry is not indexed
+        """
+        with self._lock:
+            entry_id = self._ids.get((entry_type, text))
+            if entry_id is None:
+                return False
+            self._entries[entry_id].weight = weight
+            if metadata is not None:
+                self._entries[entry_id].metadata = metadata
+            return True
+
+    # ==================== Lookup ====================
+
+    def search(
+        self, query: str, limit: int = 10, fuzzy_threshold: float = 0.6
+    ) -> list[AutocompleteHit]:
+        """Top suggestions for a partial query
+
+        Args:
+            query: Text typed so far (at least 2 characters after normalizing)
+            limit: Maximum suggestions
+            fuzzy_threshold: Minimum share of query trigrams for typo matches
+
+        Returns:
+            Suggestions ordered by score, popularity weight, then text
+        """
+        q = normalize_text(query)
+        if len(q) < 2 or limit <= 0:
+            return []
+
+        with self._lock:
+            scored: dict[int, float] = {}
+
+            for entry_id in self._substring_candidates(q):
+                entry = self._entries[entry_id]
+                tier = self._tier(q, entry.match_text)
+                if tier:
+                    scored[entry_id] = tier * entry.boost
+
+            if len(scored) < limit and len(q) >= 3:
+                for entry_id, overlap in self._fuzzy_candidates(q, fuzzy_threshold):
+                    if entry_id not in scored:
+                        scored[entry_id] = overlap * FUZZY_CEILING * self._entries[entry_id].boost
+
+            best = heapq.nsmallest(
+                limit,
+                scored.items(),
+                key=lambda item: (
+                    -item[1],
+                    -self._entries[item[0]].weight,
+                    self._entries[item[0]].text,
+                ),
+            )
+            return [
+                AutocompleteHit(
+                    text=self._entries[entry_id].text,
+                    type=self._entries[entry_id].type,
+                    score=round(score, 4),
+                    metadata=self._entries[entry_id].metadata,
+                )
+                for entry_id, score in best
+            ]
+
+    def _substring_candidates(self, q: str) -> Iterable[int]:
+        if len(q) == 2:
+            return self._postings.get(q, ())
+
+        postings = []
+        for gram in ngrams(q, 3):
+            posting = self._postings.get(gram)
+            if not posting:
+                return ()
+            postings.append(posting)
+        postings.sort(key=len)
+
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+            if not candidates:
+                break
+        return candidates
+
+    @staticmethod
+    def _tier(q: str, text: str) -> float:
+        if text == q:
+            return TIER_EXACT
+        if text.startswith(q):
+            return TIER_PREFIX
+        if q not in text:
+            return 0.0
+        if f" {q}" in text:
+            return TIER_WORD_PREFIX
+        return TIER_SUBSTRING
+
+    def _fuzzy_candidates(self, q: str, threshold: float) -> Iterable[tuple[int, float]]:
+        grams = ngrams(q, 3)
+        shared: dict[int, int] = {}
+        for gram in grams:
+            for entry_id in self._postings.get(gram, ()):
+                shared[entry_id] = shared.get(entry_id, 0) + 1
+
+        for entry_id, count in shared.items():
+            overlap = count / len(grams)
+            if overlap >= threshold:
+                yield entry_id, overlap
+
+
+# ==================== Search Suggestion Sources ====================
+
+
+def entity_entries(entities: list[dict[str, Any]]) -> dict[tuple[str, str], dict[str, Any]]:
+    """Autocomplete entries (by key) for entity names and aliases"""
+    entries = {}
+    for entity in entities:
+        name = entity.get("name", "")
+        if not name:
+            continue
+        weight = float(entity.get("flights", 0) or 0) + len(entity.get("sources", []) or [])
+        entries[("entity", name)] = {
+            "text": name,
+            "entry_type": "entity",
+            "weight": weight,
+            "metadata": {"categories": entity.get("categories", [])},
+        }
+        for alias in entity.get("aliases", []) or []:
+            display = f"{alias} ({name})"
+            entries[("entity_alias", display)] = {
+                "text": display,
+                "entry_type": "entity_alias",
+                "match_text": alias,
+                "weight": weight,
+                "metadata": {"canonical_name": name},
+            }
+    return entries
+
+
+def sync_entities(index: AutocompleteIndex, entities: list[dict[str, Any]]) -> int:
+    """Bring entity/alias entries in line with the entity list
+
+    New entries are indexed and stale ones removed; entries that stay get
+    their weight and metadata (categories, canonical name) refreshed in place.
+
+    Returns:
+        Number of entries added or removed
+    """
+    wanted = entity_entries(entities)
+    current = index.keys("entity") | index.keys("entity_alias")
+
+    changed = 0
+    for entry_type, text in current - wanted.keys():
+        index.remove(entry_type, text)
+        changed += 1
+    for key, entry in wanted.items():
+        if key in current:
+            index.set_weight(key[0], key[1], entry["weight"], entry["metadata"])
+        else:
+            index.add(**entry)
+            changed += 1
+    return changed
+
+
+def set_popular_query(index: AutocompleteIndex, query: str, count: int) -> None:
+    """Add a popular query or update its search count"""
+    metadata = {"search_count": count}
+    if not index.set_weight("popular_query", query, count, metadata):
+        index.add(query, "popular_query", weight=count, boost=0.8, metadata=metadata)
@@ -0,0 +1,402 @@
+"""
+Document Catalog - Process-resident, indexed view of all_documents_index.json
+
+Design Decision: One shared catalog instead of per-request JSON parsing
+Rationale: Every document endpoint used to json.load() the full document index
+and then scan it linearly for a single ID. The catalog parses the file once,
+keeps it resident, and exposes O(1) ID lookups plus secondary indexes so the
+common filters (classification, source, type, entity) never touch every document.
+
+Indexes:
+- ID → document (same validation rules as the original DocumentService index)
+- classification / type / source / entity → sorted document positions
+- Precomputed "visible" set (metadata JSON files and empty placeholders excluded)
+- Precomputed facets
+
+Freshness: The index file's mtime is checked on access (at most once per
+`check_interval` seconds). When it changes, the catalog is rebuilt under a lock
+and swapped in atomically, so readers never see a half-built index.
+
+Trade-offs:
+- Memory: Documents stay resident (~tens of MB for 38K docs) vs. re-parsing
+- Substring filters (entity, source) scan the key vocabulary, not the documents,
+  which is orders of magnitude smaller
+
+Performance:
+- get(): O(1)
+- filter_documents(): O(matches) for exact filters, O(vocabulary + matches) for
+  substring filters
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, Optional
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_PATH = (
+    Path(__file__).parent.parent.parent / "data" / "metadata" / "all_documents_index.json"
+)
+
+UNAVAILABLE_CONTENT = "Content not available for this document."
+
+
+def _is_hidden(doc: dict) -> bool:
+    """Check whether a document is excluded from listings
+
+    Hidden documents are JSON metadata files under data/metadata/ and
+    documents whose content is the unavailable placeholder.
+    """
+    return (
+        doc.get("path", "").startswith("data/metadata/") and doc.get("filename", "").endswith(".json")
+    ) or doc.get("content") == UNAVAILABLE_CONTENT
+
+
+class _CatalogSnapshot:
+    """Immutable set of indexes built from one version of the index file"""
+
+    def __init__(self, documents: list[dict], mtime: float, id_field: str = "id"):
+        self.documents = documents
+        self.mtime = mtime
+        self.id_field = id_field
+        self.by_id: dict[str, dict] = {}
+        self.by_classification: dict[str, list[int]] = {}
+        self.by_type: dict[str, list[int]] = {}
+        self.by_source: dict[str, list[int]] = {}
+        self.by_entity: dict[str, list[int]] = {}
+        self.visible: list[int] = []
+
+        self._build_document_index()
+        self._build_secondary_indexes()
+
+        self.facets = {
+            "types": sorted({doc.get("type", "unknown") for doc in documents}),
+            "classifications": sorted(
+                {doc.get("classification", "unknown") for doc in documents}
+            ),
+            "sources": sorted({doc.get("source", "unknown") for doc in documents}),
+        }
+
+    def _build_document_index(self):
+        """Build document ID index for O(1) lookups
+
+        Validates:
+        - Warns about duplicate IDs (keeps last occurrence)
+        - Skips documents with missing/null IDs (logs warning)
+        """
+        duplicate_ids = []
+        skipped_count = 0
+
+        for doc in self.documents:
+            doc_id = doc.get(self.id_field)
+
+            # Skip documents without valid IDs
+            if not doc_id:
+                skipped_count += 1
+                continue
+
+            # Track duplicates (should not happen, but validate anyway)
+            if doc_id in self.by_id:
+                duplicate_ids.append(doc_id)
+
+            self.by_id[doc_id] = doc
+
+        if skipped_count > 0:
+            logger.warning(
+                f"Skipped {skipped_count} documents with missing/null IDs during index build"
+            )
+
+        if duplicate_ids:
+            logger.warning(
+                f"Found {len(duplicate_ids)} duplicate document IDs: {duplicate_ids[:10]}..."
+            )
+
+    def _build_secondary_indexes(self):
+        """Build position lists keyed by lowercased field values
+
+        Positions are appended in document order, so every posting list is
+        already sorted and filter results keep the original index ordering.
+        """
+        for position, doc in enumerate(self.documents):
+            if not _is_hidden(doc):
+                self.visible.append(position)
+
+            classification = (doc.get("classification") or "").lower()
+            self.by_classification.setdefault(classification, []).append(position)
+
+            doc_type = (doc.get("type") or "").lower()
+            self.by_type.setdefault(doc_type, []).append(position)
+
+            source = (doc.get("source") or "").lower()
+            self.by_source.setdefault(source, []).append(position)
+
+            seen = set()
+            for entity in doc.get("entities_mentioned") or []:
+                key = entity.lower()
+                if key not in seen:
+                    seen.add(key)
+                    self.by_entity.setdefault(key, []).append(position)
+
+
+class DocumentCatalog:
+    """Shared document catalog with O(1) ID lookup and secondary indexes
+
+    Usage:
+        catalog = get_document_catalog()
+        doc = catalog.get("DOJ-OGR-00000001")
+        page = catalog.filter_documents(classification="email")[:20]
+
+    Thread Safety: Reloads are serialized with a lock; readers always work
+    against a complete snapshot.
+    """
+
+    def __init__(
+        self,
+        index_path: Path = DEFAULT_INDEX_PATH,
+        check_interval: float = 1.0,
+        id_field: str = "id",
+    ):
+        """Initialize catalog (index is loaded lazily on first access)
+
+        Args:
+            index_path: Path to all_documents_index.json
+            check_interval: Minimum seconds between mtime checks
+            id_field: Document key used by get() (master_document_index.json
+                is keyed by "hash")
+        """
+        self.index_path = Path(index_path)
+        self.check_interval = check_interval
+        self.id_field = id_field
+        self._snapshot: Optional[_CatalogSnapshot] = None
+        self._last_check = 0.0
+        self._stale = False
+        self._lock = threading.Lock()
+        self.reload_count = 0
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def _current_mtime(self) -> Optional[float]:
+        try:
+            return os.stat(self.index_path).st_mtime
+        except OSError:
+            return None
+
+    def _load(self, mtime: float) -> _CatalogSnapshot:
+        start = time.perf_counter()
+        with open(self.index_path) as f:
+            data = json.load(f)
+        snapshot = _CatalogSnapshot(data.get("documents", []), mtime, self.id_field)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        logger.info(
+            f"Document catalog loaded: {len(snapshot.by_id)} documents indexed "
+            f"in {elapsed_ms:.0f}ms"
+        )
+        return snapshot
+
+    def _ensure_fresh(self) -> Optional[_CatalogSnapshot]:
+        """Return current snapshot, reloading if the index file changed"""
+        now = time.monotonic()
+        snapshot = self._snapshot
+        if snapshot is not None and now - self._last_check < self.check_interval:
+            return snapshot
+
+        mtime = self._current_mtime()
+        self._last_check = now
+
+        if mtime is None:
+            # Index file removed - keep serving the last good snapshot if any
+            return snapshot
+
+        if snapshot is not None and snapshot.mtime == mtime and not self._stale:
+            return snapshot
+
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is None or snapshot.mtime != mtime or self._stale:
+                try:
+                    self._snapshot = self._load(mtime)
+                    self._stale = False
+                    self.reload_count += 1
+                except (OSError, ValueError) as e:
+                    logger.error(f"Failed to load document catalog {self.index_path}: {e}")
+            return self._snapshot
+
+    def reload(self):
+        """Force a reload on the next access (e.g. from the file watcher)"""
+        with self._lock:
+            self._stale = True
+            self._last_check = 0.0
+
+    @property
+    def available(self) -> bool:
+        """Whether a document index has been loaded"""
+        return self._ensure_fresh() is not None
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    @property
+    def documents(self) -> list[dict]:
+        """All documents in index order"""
+        snapshot = self._ensure_fresh()
+        return snapshot.documents if snapshot else []
+
+    @property
+    def facets(self) -> dict:
+        """Available filter values: types, classifications, sources"""
+        snapshot = self._ensure_fresh()
+        if not snapshot:
+            return {"types": [], "classifications": [], "sources": []}
+        return snapshot.facets
+
+    def __len__(self) -> int:
+        snapshot = self._ensure_fresh()
+        return len(snapshot.by_id) if snapshot else 0
+
+    def get(self, doc_id: str) -> Optional[dict]:
+        """Get document metadata by ID in O(1)
+
+        Note: The returned dict is shared; copy it before mutating.
+        """
+        snapshot = self._ensure_fresh()
+        if not snapshot:
+            return None
+        return snapshot.by_id.get(doc_id)
+
+    def by_classification(self, classification: str) -> list[dict]:
+        """All documents with the given classification (case-insensitive)"""
+        return self._exact("by_classification", classification)
+
+    def by_source(self, source: str) -> list[dict]:
+        """All documents from the given source (case-insensitive)"""
+        return self._exact("by_source", source)
+
+    def by_entity(self, entity_name: str) -> list[dict]:
+        """All documents whose entities_mentioned contains entity_name (case-insensitive)"""
+        return self._exact("by_entity", entity_name)
+
+    def filter_documents(
+        self,
+        q: Optional[str] = None,
+        entity: Optional[str] = None,
+        classification: Optional[str] = None,
+        doc_type: Optional[str] = None,
+        source: Optional[str] = None,
+        include_hidden: bool = False,
+    ) -> list[dict]:
+        """Filter documents using the secondary indexes
+
+        Matching semantics mirror the original endpoint filters:
+        - entity: substring of any entities_mentioned entry
+        - classification / doc_type: exact (case-insensitive) match
+        - source: substring of source
+        - q: substring of filename or path
+
+        Args:
+            q: Filename/path substring
+            entity: Entity name substring
+            classification: Classification value
+            doc_type: Document type value (the "type" field)
+            source: Source substring
+            include_hidden: Include metadata JSON files and unavailable documents
+
+        Returns:
+            Matching documents in original index order
+        """
+        snapshot = self._ensure_fresh()
+        if not snapshot:
+            return []
+
+        candidates: Optional[set[int]] = None
+
+        def narrow(positions: Iterable[int]):
+            nonlocal candidates
+            positions = positions if isinstance(positions, set) else set(positions)
+            candidates = positions if candidates is None else candidates & positions
+
+        if classification:
+            narrow(snapshot.by_classification.get(classification.lower(), ()))
+        if doc_type:
+            narrow(snapshot.by_type.get(doc_type.lower(), ()))
+        if source:
+            narrow(self._substring(snapshot.by_source, source.lower()))
+        if entity:
+            narrow(self._substring(snapshot.by_entity, entity.lower()))
+        if not include_hidden:
+            narrow(snapshot.visible)
+
+        if candidates is None:
+            results = snapshot.documents
+        else:
+            results = [snapshot.documents[p] for p in sorted(candidates)]
+
+        if q:
+            q_lower = q.lower()
+            results = [
+                doc
+                for doc in results
+                if q_lower in doc.get("filename", "").lower()
+                or q_lower in doc.get("path", "").lower()
+            ]
+
+        return results
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _exact(self, index_name: str, value: str) -> list[dict]:
+        """Documents in one posting list, resolved against the same snapshot
+
+        Positions are only meaningful for the snapshot they came from, so the
+        lookup and the position -> document step must not straddle a reload.
+        """
+        snapshot = self._ensure_fresh()
+        if not snapshot:
+            return []
+        positions = getattr(snapshot, index_name).get(value.lower(), [])
+        return [snapshot.documents[p] for p in positions]
+
+    @staticmethod
+    def _substring(index: dict[str, list[int]], needle: str) -> set[int]:
+        """Union the posting lists of every key containing needle"""
+        positions: set[int] = set()
+        for key, postings in index.items():
+            if needle in key:
+                positions.update(postings)
+        return positions
+
+
+# Catalog instances keyed by resolved index path and ID field
+_catalogs: dict[tuple[Path, str], DocumentCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_document_catalog(
+    index_path: Optional[Path] = None, id_field: str = "id"
+) -> DocumentCatalog:
+    """
+    Get shared DocumentCatalog for an index file.
+
+    Args:
+        index_path: Path to all_documents_index.json (default: data/metadata)
+        id_field: Document key for get()
+
+    Returns:
+        Process-wide DocumentCatalog instance for that path and ID field
+    """
+    key = (Path(index_path or DEFAULT_INDEX_PATH).resolve(), id_field)
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            catalog = DocumentCatalog(key[0], id_field=id_field)
+            _catalogs[key] = catalog
+    return catalog
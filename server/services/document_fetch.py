@@ -0,0 +1,253 @@
+"""
+Document Fetch - Batched ChromaDB gets and a columnar date side-table
+
+Design Decision: One `get` per batch of ids, dates answered without the store
+Rationale: `/api/rag/multi-entity` and KnowledgeGraphRAG
+(`temporal_entity_query`, `get_documents_connecting_entities`) called
+`collection.get(ids=[doc_id])` once per document - an N+1 pattern that costs
+thousands of SQLite round-trips (each returning the full document text) for
+heavily-mentioned entities. Temporal queries fetched every document of an
+entity just to read `date_extracted` from its metadata.
+
+- `fetch_documents`: de-duplicated ids, one `get` per `batch_size` ids,
+  results keyed by id (ChromaDB does not guarantee result order)
+- `DocumentDateTable`: parallel columns (id, ISO date, epoch day) projected
+  from collection metadata once and persisted next to the vector store;
+  date-range selection runs over the integer column and only the selected
+  page of documents is fetched afterwards
+
+Staleness: the table records the collection's document count and is rebuilt
+when the count changes. In-place metadata edits that keep the count need
+`refresh=True` (or deleting the side-table file).
+
+Performance (2,000 ids, local store):
+- Per-id gets: ~2,000 round-trips; batched: 8 round-trips of 256 ids
+- Temporal filter: one pass over an int array instead of fetching each document
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from array import array
+from pathlib import Path
+from typing import Iterable, Optional, Sequence
+
+from services.vector_filters import date_to_epoch, normalize_date, parse_date_bound
+
+
+logger = logging.getLogger(__name__)
+
+# ids per collection.get (keeps SQLite's bound-parameter limit comfortably away)
+FETCH_BATCH_SIZE = 256
+
+# Metadata page size when projecting the date column
+SCAN_PAGE_SIZE = 5000
+
+# Metadata fields tried (in order) when a record has no normalized date
+DATE_FIELDS = ("date_extracted", "published_date")
+
+# Epoch value for undated documents
+UNDATED = -(2**62)
+
+YEAR_ONLY = re.compile(r"^\s*(\d{4})\s*$")
+
+
+def fetch_documents(
+    collection,
+    ids: Iterable[str],
+    include: Sequence[str] = ("documents", "metadatas"),
+    batch_size: int = FETCH_BATCH_SIZE,
+) -> dict[str, dict]:
+    """
+    Fetch documents by id in batches.
+
+    Args:
+        collection: ChromaDB collection
+        ids: Document ids (duplicates are fetched once)
+        include: ChromaDB include fields ("documents", "metadatas", "embeddings")
+        batch_size: ids per `collection.get`
+
+    Returns:
+        {id: {"text": ..., "metadata": ..., "embedding": ...}} for ids found in
+        the collection (keys present per `include`), in request order
+    """
+    unique_ids = list(dict.fromkeys(ids))
+    found: dict[str, dict] = {}
+
+    for start in range(0, len(unique_ids), batch_size):
+        batch = unique_ids[start : start + batch_size]
+        result = collection.get(ids=batch, include=list(include))
+        columns = {
+            "text": result.get("documents"),
+            "metadata": result.get("metadatas"),
+            "embedding": result.get("embeddings"),
+        }
+        for row, doc_id in enumerate(result["ids"]):
+            found[doc_id] = {
+                key: values[row] for key, values in columns.items() if values is not None
+            }
+
+    return {doc_id: found[doc_id] for doc_id in unique_ids if doc_id in found}
+
+
+def parse_range_bound(value: Optional[str], end: bool = False) -> Optional[str]:
+    """
+    Date range bound as an ISO date; a bare year covers the whole year.
+
+    Raises:
+        ValueError: If the value is not a recognizable date
+    """
+    if value:
+        match = YEAR_ONLY.match(value)
+        if match:
+            return f"{match.group(1)}-12-31" if end else f"{match.group(1)}-01-01"
+    return parse_date_bound(value)
+
+
+class DocumentDateTable:
+    """
+    Columnar date projection of a collection's metadata.
+
+    Usage:
+        table = get_document_date_table(collection, path)
+        for doc_id, iso_date in table.select(entity_doc_ids, "1995", "2000"):
+            ...
+    """
+
+    def __init__(self, ids: list[str], dates: list[str], epochs: Iterable[int], source_count: int):
+        self.ids = ids
+        self.dates = dates
+        self.epochs = array("q", epochs)
+        self.source_count = source_count
+        self.row = {doc_id: position for position, doc_id in enumerate(ids)}
+
+    @staticmethod
+    def _record_date(metadata: Optional[dict]) -> Optional[str]:
+        metadata = metadata or {}
+        if metadata.get("date"):
+            return normalize_date(metadata["date"])
+        for field in DATE_FIELDS:
+            iso_date = normalize_date(metadata.get(field))
+            if iso_date:
+                return iso_date
+        return None
+
+    @classmethod
+    def build(cls, collection, page_size: int = SCAN_PAGE_SIZE) -> "DocumentDateTable":
+        """Project (id, date) from all collection metadata, page by page"""
+        source_count = collection.count()
+        ids, dates, epochs = [], [], []
+
+        for offset in range(0, source_count, page_size):
+            page = collection.get(include=["metadatas"], limit=page_size, offset=offset)
+            for doc_id, metadata in zip(page["ids"], page["metadatas"]):
+                iso_date = cls._record_date(metadata)
+                ids.append(doc_id)
+                dates.append(iso_date or "")
+                epochs.append(date_to_epoch(iso_date) if iso_date else UNDATED)
+
+        logger.info(f"Date side-table built: {len(ids)} documents")
+        return cls(ids, dates, epochs, source_count)
+
+    @classmethod
+    def load(cls, path: Path) -> "DocumentDateTable":
+        with open(path) as f:
+            data = json.load(f)
+        columns = data["columns"]
+        return cls(columns["id"], columns["date"], columns["date_epoch"], data["source_count"])
+
+    def save(self, path: Path) -> None:
+        """Write atomically (temp file + rename)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(temp_path, "w") as f:
+            json.dump(
+                {
+                    "source_count": self.source_count,
+                    "columns": {
+                        "id": self.ids,
+                        "date": self.dates,
+                        "date_epoch": self.epochs.tolist(),
+                    },
+                },
+                f,
+            )
+        os.replace(temp_path, path)
+
+    def select(
+        self,
+        doc_ids: Iterable[str],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> list[tuple[str, str]]:
+        """
+        Dated documents within an inclusive range, oldest first.
+
+        Args:
+            doc_ids: Candidate document ids (unknown ids are skipped)
+            start_date: Lower bound (ISO date, free-form date or bare year)
+            end_date: Upper bound (same formats)
+
+        Returns:
+            [(doc_id, iso_date)] sorted by date (ties keep candidate order);
+            undated documents are excluded
+
+        Raises:
+            ValueError: If a bound is not a recognizable date
+        """
+        start = parse_range_bound(start_date)
+        end = parse_range_bound(end_date, end=True)
+        low = date_to_epoch(start) if start else UNDATED + 1
+        high = date_to_epoch(end) if end else 2**62
+
+        epochs, row = self.epochs, self.row
+        selected = []
+        for doc_id in doc_ids:
+            position = row.get(doc_id)
+            if position is not None and low <= epochs[position] <= high:
+                selected.append((epochs[position], doc_id, position))
+
+        selected.sort(key=lambda item: item[0])
+        return [(doc_id, self.dates[position]) for _, doc_id, position in selected]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+# Tables keyed by resolved side-table path
+_tables: dict[Path, DocumentDateTable] = {}
+_tables_lock = threading.Lock()
+
+
+def get_document_date_table(collection, path: Path, refresh: bool = False) -> DocumentDateTable:
+    """
+    Get the date side-table for a collection, building or rebuilding it as needed.
+
+    Args:
+        collection: ChromaDB collection the table projects
+        path: Side-table file (e.g. data/vector_store/document_dates.json)
+        refresh: Rebuild even if the document count is unchanged
+
+    Returns:
+        Process-wide DocumentDateTable for that path
+    """
+    path = Path(path).resolve()
+    count = collection.count()
+
+    with _tables_lock:
+        table = _tables.get(path)
+        if table is None and path.exists() and not refresh:
+            try:
+                table = DocumentDateTable.load(path)
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Ignoring unreadable date side-table {path}: {e}")
+
+        if refresh or table is None or table.source_count != count:
+            table = DocumentDateTable.build(collection)
+            table.save(path)
+
+        _tables[path] = table
+    return table
@@ -16,6 +16,9 @@ import json
 from pathlib import Path
 from typing import Optional
 
+from .document_catalog import DocumentCatalog, get_document_catalog
+from .fulltext_index import FullTextIndex, get_fulltext_index, search_catalog
+
 
 class DocumentService:
     """Service for document data operations"""
@@ -30,24 +33,28 @@ class DocumentService:
         self.metadata_dir = data_path / "metadata"
         self.md_dir = data_path / "md"
 
+        # Shared, mtime-reloaded document catalog (ID index + secondary indexes)
+        self.catalog: DocumentCatalog = get_document_catalog(
+            self.metadata_dir / "all_documents_index.json"
+        )
+
+        # FTS5 index over OCR/markdown text (built by build_fulltext_index.py)
+        self.fulltext: FullTextIndex = get_fulltext_index(self.metadata_dir / "document_fts.db")
+
         # Data caches
-        self.documents: list[dict] = []
         self.classifications: dict = {}
         self.semantic_index: dict = {}
-        self._document_index: dict[str, dict] = {}  # ID → document mapping for O(1) lookups
 
         # Load data
         self.load_data()
 
-    def load_data(self):
-        """Load document index and classifications"""
-        # Load unified document index
-        doc_index_path = self.metadata_dir / "all_documents_index.json"
-        if doc_index_path.exists():
-            with open(doc_index_path) as f:
-                doc_data = json.load(f)
-                self.documents = doc_data.get("documents", [])
+    @property
+    def documents(self) -> list[dict]:
+        """All documents from the shared catalog"""
+        return self.catalog.documents
 
+    def load_data(self):
+        """Load classifications and semantic index (documents come from the catalog)"""
         # Load classifications
         class_path = self.metadata_dir / "document_classifications.json"
         if class_path.exists():
@@ -62,44 +69,6 @@ class DocumentService:
                 data = json.load(f)
                 self.semantic_index = data.get("entity_to_documents", {})
 
-        # Build ID index for O(1) lookups
-        self._build_document_index()
-
-    def _build_document_index(self):
-        """Build document ID index for O(1) lookups
-
-        Validates:
-        - Warns about duplicate IDs (keeps last occurrence)
-        - Skips documents with missing/null IDs (logs warning)
-        """
-        self._document_index = {}
-        duplicate_ids = []
-        skipped_count = 0
-
-        for doc in self.documents:
-            doc_id = doc.get("id")
-
-            # Skip documents without valid IDs
-            if not doc_id:
-                skipped_count += 1
-                continue
-
-            # Track duplicates (should not happen, but validate anyway)
-            if doc_id in self._document_index:
-                duplicate_ids.append(doc_id)
-
-            self._document_index[doc_id] = doc
-
-        # Log warnings for data quality issues
-        if skipped_count > 0:
-            print(f"WARNING: Skipped {skipped_count} documents with missing/null IDs during index build")
-
-        if duplicate_ids:
-            print(f"WARNING: Found {len(duplicate_ids)} duplicate document IDs: {duplicate_ids[:10]}...")
-
-        # Log success
-        print(f"Built document ID index: {len(self._document_index)} documents indexed")
-
     def search_documents(
         self,
         q: Optional[str] = None,
@@ -113,7 +82,8 @@ class DocumentService:
         """Search documents with multiple filters
 
         Args:
-            q: Full-text search query (searches filename and path)
+            q: Full-text search query (BM25 over OCR/markdown text when the
+               FTS index is built; filename and path substrings otherwise)
             entity: Filter by entity mention
             doc_type: Filter by document type (email, pdf)
             source: Filter by source collection
@@ -125,70 +95,39 @@ class DocumentService:
             {
                 "documents": List of matching documents,
                 "total": Total matching count,
-                "facets": Available filter options
+                "facets": Available filter options,
+                "text_facets": Classification/source counts of text matches
+                               (full-text queries only)
             }
         """
-        filtered_docs = self.documents.copy()
-
-        # ALWAYS filter out JSON metadata files and unavailable content
-        filtered_docs = [
-            doc
-            for doc in filtered_docs
-            if not (
-                # Exclude JSON files from data/metadata/ directory
-                (
-                    doc.get("path", "").startswith("data/metadata/")
-                    and doc.get("filename", "").endswith(".json")
-                )
-                or
-                # Exclude documents with unavailable content
-                doc.get("content") == "Content not available for this document."
+        if q and self.fulltext.available:
+            result = search_catalog(
+                self.catalog,
+                self.fulltext,
+                q,
+                entity=entity,
+                classification=classification,
+                doc_type=doc_type,
+                source=source,
+                limit=limit,
+                offset=offset,
             )
-        ]
-
-        # Full-text search in filename and path
-        if q:
-            q_lower = q.lower()
-            filtered_docs = [
-                doc
-                for doc in filtered_docs
-                if q_lower in doc.get("filename", "").lower()
-                or q_lower in doc.get("path", "").lower()
-            ]
-
-        # Filter by entity mention
-        if entity:
-            entity_lower = entity.lower()
-            filtered_docs = [
-                doc
-                for doc in filtered_docs
-                if any(entity_lower in e.lower() for e in doc.get("entities_mentioned", []))
-            ]
-
-        # Filter by document type (email, pdf)
-        if doc_type:
-            filtered_docs = [
-                doc for doc in filtered_docs if doc.get("type", "").lower() == doc_type.lower()
-            ]
-
-        # Filter by classification
-        if classification:
-            filtered_docs = [
-                doc
-                for doc in filtered_docs
-                if doc.get("classification", "").lower() == classification.lower()
-            ]
-
-        # Filter by source
-        if source:
-            filtered_docs = [
-                doc for doc in filtered_docs if source.lower() in doc.get("source", "").lower()
-            ]
+            return {
+                "documents": result["documents"],
+                "total": result["total"],
+                "offset": offset,
+                "limit": limit,
+                "facets": self.catalog.facets,
+                "text_facets": result["text_facets"],
+            }
 
-        # Get facets for filtering
-        all_types = {doc.get("type", "unknown") for doc in self.documents}
-        all_classifications = {doc.get("classification", "unknown") for doc in self.documents}
-        all_sources = {doc.get("source", "unknown") for doc in self.documents}
+        filtered_docs = self.catalog.filter_documents(
+            q=q,
+            entity=entity,
+            doc_type=doc_type,
+            classification=classification,
+            source=source,
+        )
 
         # Paginate
         total = len(filtered_docs)
@@ -199,11 +138,7 @@ class DocumentService:
             "total": total,
             "offset": offset,
             "limit": limit,
-            "facets": {
-                "types": sorted(all_types),
-                "classifications": sorted(all_classifications),
-                "sources": sorted(all_sources),
-            },
+            "facets": self.catalog.facets,
         }
 
     def get_document_by_id(self, doc_id: str) -> Optional[dict]:
@@ -218,12 +153,15 @@ class DocumentService:
         Performance:
             O(1) hash lookup via document index (previously O(n) linear search)
         """
-        # O(1) index lookup (replaces O(n) linear search)
-        document = self._document_index.get(doc_id)
+        # O(1) catalog lookup (replaces O(n) linear search)
+        document = self.catalog.get(doc_id)
 
         if not document:
             return None
 
+        # Copy so loaded content never leaks into the shared catalog
+        document = dict(document)
+
         # Try to load content from markdown file
         content = None
         doc_path = document.get("path", "")
@@ -255,13 +193,23 @@ class DocumentService:
         # Get document paths from semantic index
         doc_paths = self.semantic_index.get(entity_name, [])
 
-        # Find matching documents
+        # Exact entity matches come straight from the catalog's entity index
         matching_docs = [
             doc
-            for doc in self.documents
-            if doc.get("path") in doc_paths or entity_name in doc.get("entities_mentioned", [])
+            for doc in self.catalog.by_entity(entity_name)
+            if entity_name in doc.get("entities_mentioned", [])
         ]
 
+        # Semantic index paths need a path match (kept in index order)
+        if doc_paths:
+            doc_paths = set(doc_paths)
+            matching_ids = {id(doc) for doc in matching_docs}
+            matching_docs = [
+                doc
+                for doc in self.documents
+                if id(doc) in matching_ids or doc.get("path") in doc_paths
+            ]
+
         return {"entity": entity_name, "documents": matching_docs, "total": len(matching_docs)}
 
     def get_statistics(self) -> dict:
@@ -19,24 +19,83 @@ Alternatives Considered:
 2. FAISS: Rejected due to additional dependencies
 3. Direct MCP integration: MCP vector search is for code, not documents
 
+Precomputed Matrix (preferred path):
+- scripts/rag/build_document_embeddings.py embeds the whole corpus offline in
+  batches into a memory-mapped matrix (see embedding_matrix.py)
+- When the source document has a row in the matrix, similarity is one
+  vectorized matrix-vector product + argpartition top-k (milliseconds)
+- A source document missing from the matrix (added after the last build)
+  encodes only its own text and queries the matrix with it
+- The per-document encode loop below is kept only for when no matrix has
+  been built
+
 Performance:
-- Time Complexity: O(n) for similarity comparison, O(1) for cached embeddings
-- Space Complexity: O(k) where k = cached documents (max 1000)
-- Expected Performance: <200ms for similarity search with 33K documents
+- Matrix path: O(N·D) BLAS matvec, ~a few ms for 33K documents
+  (+ one encode when the source has no row)
+- No matrix: O(n) model.encode calls, LRU-cached (max 1000 embeddings)
 """
 
-import json
 import logging
 from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 
+from .embedding_matrix import DEFAULT_MATRIX_DIR, EmbeddingMatrix
+from .embedding_service import get_embedding_service
+from .ocr_corpus import read_ocr_text
+
 
 logger = logging.getLogger(__name__)
 
 
+def load_document_text(document: dict) -> Optional[str]:
+    """
+    Load the text used to embed a document (OCR, markdown, summary or filename).
+
+    Shared by the similarity service and the offline matrix builder so both
+    embed exactly the same text.
+
+    Args:
+        document: Document metadata dict
+
+    Returns:
+        Document text content or None if unavailable
+    """
+    # Try OCR text first
+    filename = document.get("filename", "")
+    if filename:
+        base_name = filename.rsplit(".", 1)[0]
+        try:
+            # Packed corpus when available, loose ocr_text/<base_name>.txt otherwise
+            text = read_ocr_text(base_name)
+            if text is not None:
+                # Use first 3000 chars for embedding (performance optimization)
+                return text[:3000]
+        except Exception as e:
+            logger.warning(f"Could not read OCR text for {document.get('id')}: {e}")
+
+    # Try markdown content
+    doc_path = document.get("path", "")
+    if doc_path:
+        md_path = Path(doc_path)
+        if md_path.exists() and md_path.suffix == ".md":
+            try:
+                with open(md_path, "r", encoding="utf-8") as f:
+                    text = f.read()
+                return text[:3000]
+            except Exception as e:
+                logger.warning(f"Could not read markdown for {document.get('id')}: {e}")
+
+    # Fallback to summary or filename
+    summary = document.get("summary", "")
+    if summary:
+        return summary
+
+    return filename
+
+
 class DocumentSimilarityService:
     """
     Service for finding semantically similar documents using embeddings.
@@ -45,16 +104,49 @@ class DocumentSimilarityService:
     for document matching. Implements LRU cache for embedding storage.
     """
 
-    def __init__(self, cache_size: int = 1000):
+    def __init__(self, cache_size: int = 1000, matrix_dir: Path = DEFAULT_MATRIX_DIR):
         """
         Initialize similarity service.
 
         Args:
             cache_size: Maximum number of embeddings to cache in memory
+            matrix_dir: Directory of the precomputed corpus embedding matrix
         """
         self.cache_size = cache_size
         self.embedding_cache: OrderedDict[str, np.ndarray] = OrderedDict()
         self.model = None
+        self.matrix_dir = Path(matrix_dir)
+        self.embedding_matrix: Optional[EmbeddingMatrix] = None
+        self._matrix_checked = False
+
+    def load_embedding_matrix(self) -> bool:
+        """
+        Load (or reload) the precomputed corpus embedding matrix.
+
+        Called at server startup; safe to call again after a rebuild.
+
+        Returns:
+            True if a matrix is available
+        """
+        self._matrix_checked = True
+        try:
+            self.embedding_matrix = EmbeddingMatrix.load(self.matrix_dir)
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to load embedding matrix from {self.matrix_dir}: {e}")
+            self.embedding_matrix = None
+
+        if self.embedding_matrix is None:
+            logger.warning(
+                "No precomputed embedding matrix found - similarity falls back to "
+                "per-document encoding. Build it with scripts/rag/build_document_embeddings.py"
+            )
+        return self.embedding_matrix is not None
+
+    def _get_embedding_matrix(self) -> Optional[EmbeddingMatrix]:
+        """Lazily load the embedding matrix on first use"""
+        if not self._matrix_checked:
+            self.load_embedding_matrix()
+        return self.embedding_matrix
 
     def _get_model(self):
         """
@@ -65,9 +157,8 @@ class DocumentSimilarityService:
         """
         if self.model is None:
             try:
-                from sentence_transformers import SentenceTransformer
-                # Use same model as MCP vector search for consistency
-                self.model = SentenceTransformer('sentence-transformers/all-MiniLM-L6-v2')
+                # Shared with the search routers (same model as MCP vector search)
+                self.model = get_embedding_service().model
                 logger.info("Loaded sentence-transformers model: all-MiniLM-L6-v2")
             except ImportError:
                 logger.error("sentence-transformers not installed. Install with: pip install sentence-transformers")
@@ -91,9 +182,9 @@ class DocumentSimilarityService:
             self.embedding_cache.move_to_end(doc_id)
             return self.embedding_cache[doc_id]
 
-        # Generate embedding
-        model = self._get_model()
-        embedding = model.encode(text, convert_to_numpy=True)
+        # Generate embedding (through the shared service, which serializes encodes)
+        self._get_model()
+        embedding = get_embedding_service().encode([text])[0]
 
         # Add to cache
         self.embedding_cache[doc_id] = embedding
@@ -133,39 +224,7 @@ class DocumentSimilarityService:
         Returns:
             Document text content or None if unavailable
         """
-        # Try OCR text first
-        filename = document.get("filename", "")
-        if filename:
-            base_name = filename.rsplit(".", 1)[0]
-            ocr_text_path = Path("data/sources/house_oversight_nov2025/ocr_text") / f"{base_name}.txt"
-
-            if ocr_text_path.exists():
-                try:
-                    with open(ocr_text_path, "r", encoding="utf-8") as f:
-                        text = f.read()
-                    # Use first 3000 chars for embedding (performance optimization)
-                    return text[:3000]
-                except Exception as e:
-                    logger.warning(f"Could not read OCR text for {document.get('id')}: {e}")
-
-        # Try markdown content
-        doc_path = document.get("path", "")
-        if doc_path:
-            md_path = Path(doc_path)
-            if md_path.exists() and md_path.suffix == ".md":
-                try:
-                    with open(md_path, "r", encoding="utf-8") as f:
-                        text = f.read()
-                    return text[:3000]
-                except Exception as e:
-                    logger.warning(f"Could not read markdown for {document.get('id')}: {e}")
-
-        # Fallback to summary or filename
-        summary = document.get("summary", "")
-        if summary:
-            return summary
-
-        return filename
+        return load_document_text(document)
 
     def find_similar_documents(
         self,
@@ -173,7 +232,8 @@ class DocumentSimilarityService:
         all_documents: List[dict],
         limit: int = 5,
         similarity_threshold: float = 0.7,
-        use_cache: bool = True
+        use_cache: bool = True,
+        get_document: Optional[Callable[[str], Optional[dict]]] = None,
     ) -> List[dict]:
         """
         Find documents similar to the given document.
@@ -184,13 +244,17 @@ class DocumentSimilarityService:
             limit: Maximum number of results
             similarity_threshold: Minimum similarity score (0.0-1.0)
             use_cache: Use cache for performance (default: True)
+            get_document: Optional O(1) ID → metadata lookup (e.g. DocumentCatalog.get);
+                built from all_documents when omitted
 
         Returns:
             List of similar documents with similarity scores, sorted by score descending
 
         Performance:
             - Cached: <1ms for repeated queries
-            - Uncached: ~200ms for 33K documents
+            - Precomputed matrix: a few ms (one matvec + argpartition)
+            - Source without a matrix row: one encode + the matrix query
+            - No matrix: one encode per uncached document
             - Cache TTL: 10 minutes
 
         Example:
@@ -217,12 +281,100 @@ class DocumentSimilarityService:
                     return cached_result
             except ImportError:
                 logger.warning("Cache module not available for similarity search")
+
+        if get_document is None:
+            documents_by_id = {doc.get("id"): doc for doc in all_documents if doc.get("id")}
+            get_document = documents_by_id.get
+
         # Find source document
-        source_doc = next((doc for doc in all_documents if doc.get("id") == doc_id), None)
+        source_doc = get_document(doc_id)
         if not source_doc:
             logger.error(f"Source document {doc_id} not found")
             return []
 
+        matrix = self._get_embedding_matrix()
+        if matrix is not None:
+            similarities = self._similar_from_matrix(
+                matrix, source_doc, doc_id, get_document, limit, similarity_threshold
+            )
+        else:
+            similarities = self._similar_by_encoding(
+                source_doc, doc_id, all_documents, limit, similarity_threshold
+            )
+
+        results = [self._format_result(doc, score) for doc, score in similarities]
+
+        logger.info(f"Found {len(results)} similar documents for {doc_id}")
+
+        # Cache results (if enabled)
+        if use_cache:
+            try:
+                cache.set(cache_key, results)
+            except:
+                pass  # Silently fail if caching fails
+
+        return results
+
+    def _similar_from_matrix(
+        self,
+        matrix: EmbeddingMatrix,
+        source_doc: dict,
+        doc_id: str,
+        get_document: Callable[[str], Optional[dict]],
+        limit: int,
+        similarity_threshold: float,
+    ) -> List[Tuple[dict, float]]:
+        """
+        Vectorized similarity against the precomputed corpus matrix.
+
+        A source document without a row (added after the last build) is
+        encoded on its own; the rest of the corpus still comes from the matrix.
+
+        Over-fetches a few candidates so rows without catalog metadata can be
+        dropped without returning fewer than `limit` results.
+        """
+        source_row = matrix.id_to_row.get(doc_id)
+        if source_row is not None:
+            query = matrix.vector(doc_id)
+            exclude_rows = [source_row]
+        else:
+            source_text = self._load_document_text(source_doc)
+            if not source_text:
+                logger.warning(f"No text content available for {doc_id}")
+                return []
+            query = self._get_embedding(source_text, doc_id)
+            exclude_rows = None
+
+        rows, scores = matrix.top_k(
+            query,
+            k=limit * 2 + 1,
+            exclude_rows=exclude_rows,
+            min_score=similarity_threshold,
+        )
+
+        similarities: List[Tuple[dict, float]] = []
+        for row, score in zip(rows.tolist(), scores.tolist()):
+            doc = get_document(matrix.ids[row])
+            if doc is None:
+                continue
+            similarities.append((doc, float(score)))
+            if len(similarities) >= limit:
+                break
+        return similarities
+
+    def _similar_by_encoding(
+        self,
+        source_doc: dict,
+        doc_id: str,
+        all_documents: List[dict],
+        limit: int,
+        similarity_threshold: float,
+    ) -> List[Tuple[dict, float]]:
+        """
+        Fallback similarity: encode documents one by one (LRU-cached).
+
+        Used only when no precomputed matrix has been built.
+        """
         # Load source document text
         source_text = self._load_document_text(source_doc)
         if not source_text:
@@ -257,36 +409,24 @@ class DocumentSimilarityService:
         similarities.sort(key=lambda x: x[1], reverse=True)
 
         # Take top N results
-        top_results = similarities[:limit]
-
-        # Format results
-        results = []
-        for doc, score in top_results:
-            doc_text = self._load_document_text(doc)
-            preview = doc_text[:200] if doc_text else ""
-
-            results.append({
-                "document_id": doc.get("id"),
-                "title": doc.get("filename", "Untitled"),
-                "similarity_score": round(score, 3),
-                "preview": preview,
-                "entities": doc.get("entities_mentioned", []),
-                "doc_type": doc.get("doc_type", "unknown"),
-                "file_size": doc.get("file_size", 0),
-                "date": doc.get("date_extracted"),
-                "classification": doc.get("classification"),
-            })
-
-        logger.info(f"Found {len(results)} similar documents for {doc_id}")
-
-        # Cache results (if enabled)
-        if use_cache:
-            try:
-                cache.set(cache_key, results)
-            except:
-                pass  # Silently fail if caching fails
-
-        return results
+        return similarities[:limit]
+
+    def _format_result(self, doc: dict, score: float) -> dict:
+        """Format a similar document for the API response."""
+        doc_text = self._load_document_text(doc)
+        preview = doc_text[:200] if doc_text else ""
+
+        return {
+            "document_id": doc.get("id"),
+            "title": doc.get("filename", "Untitled"),
+            "similarity_score": round(score, 3),
+            "preview": preview,
+            "entities": doc.get("entities_mentioned", []),
+            "doc_type": doc.get("doc_type", "unknown"),
+            "file_size": doc.get("file_size", 0),
+            "date": doc.get("date_extracted"),
+            "classification": doc.get("classification"),
+        }
 
     def clear_cache(self):
         """Clear embedding cache."""
@@ -0,0 +1,258 @@
+"""
+Embedding Matrix - Persisted, memory-mapped corpus embeddings
+
+Design Decision: One precomputed (N × D) matrix instead of per-request encoding
+Rationale: Document similarity used to read OCR text and call model.encode()
+for every document in the corpus, one at a time, on every cold query. With the
+matrix built offline (scripts/rag/build_document_embeddings.py), a similarity
+query is a single matrix-vector product plus an argpartition top-k.
+
+On-disk layout (data/vector_store/document_embeddings/):
+- embeddings-<gen>.npy: L2-normalized float32 or float16 rows (np.save format)
+- ids.json: {"ids": [...], "embeddings": "embeddings-<gen>.npy", "model": ...,
+  "dim": ..., "dtype": ..., "created_at": ...}
+
+Row i of the referenced matrix belongs to ids[i]. ids.json is the manifest:
+each build writes its matrix under a new name (`<gen>` is unique per build)
+and publishes it by atomically replacing ids.json, so a reader or a crash
+can never pair a new matrix with old IDs. Older matrices are removed after
+the swap (open memory maps stay valid). Manifests without an "embeddings"
+entry (older builds) refer to embeddings.npy, and a matrix whose row count
+differs from len(ids) is refused.
+
+Trade-offs:
+- float32 files are memory-mapped directly (zero-copy, shared page cache)
+- float16 files halve disk size but are upcast to float32 once at load, since
+  numpy has no BLAS path for float16 matmul
+- Rebuild required when the corpus changes (no incremental update)
+
+Performance:
+- 33K × 384 float32 = ~50MB; one query ≈ a few ms
+- Top-k: O(N) argpartition + O(k log k) sort
+"""
+
+import json
+import logging
+import os
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MATRIX_DIR = (
+    Path(__file__).parent.parent.parent / "data" / "vector_store" / "document_embeddings"
+)
+EMBEDDINGS_FILE = "embeddings.npy"  # pre-manifest builds
+EMBEDDINGS_PATTERN = "embeddings-*.npy"
+IDS_FILE = "ids.json"
+
+
+class EmbeddingMatrix:
+    """Read-only corpus embedding matrix keyed by document ID
+
+    Usage:
+        matrix = EmbeddingMatrix.load(DEFAULT_MATRIX_DIR)
+        rows, scores = matrix.top_k(matrix.vector("DOJ-OGR-00000001"), k=5)
+    """
+
+    def __init__(self, ids: list[str], vectors: np.ndarray, meta: Optional[dict] = None):
+        """
+        Args:
+            ids: Document ID for each row
+            vectors: (N × D) L2-normalized embeddings
+            meta: Build metadata (model, dtype, created_at)
+        """
+        if len(ids) != vectors.shape[0]:
+            raise ValueError(f"ID count {len(ids)} does not match matrix rows {vectors.shape[0]}")
+
+        self.ids = ids
+        self.vectors = vectors
+        self.meta = meta or {}
+        self.id_to_row: dict[str, int] = {doc_id: row for row, doc_id in enumerate(ids)}
+
+    @classmethod
+    def load(cls, directory: Path = DEFAULT_MATRIX_DIR) -> Optional["EmbeddingMatrix"]:
+        """Load a persisted matrix, memory-mapping float32 data
+
+        Returns:
+            EmbeddingMatrix or None if the files do not exist
+
+        Raises:
+            ValueError: If the matrix row count does not match the manifest IDs
+        """
+        directory = Path(directory)
+        ids_path = directory / IDS_FILE
+
+        # A rebuild may publish a new manifest and remove the matrix the one
+        # just read refers to; re-read the manifest once in that case
+        for attempt in range(2):
+            try:
+                with open(ids_path) as f:
+                    meta = json.load(f)
+            except FileNotFoundError:
+                return None
+            embeddings_path = directory / meta.get("embeddings", EMBEDDINGS_FILE)
+            try:
+                vectors = np.load(embeddings_path, mmap_mode="r")
+                break
+            except FileNotFoundError:
+                if attempt:
+                    return None
+        ids = meta.pop("ids", [])
+
+        if vectors.dtype != np.float32:
+            vectors = np.asarray(vectors, dtype=np.float32)
+
+        matrix = cls(ids, vectors, meta)
+        logger.info(
+            f"Loaded embedding matrix: {len(ids)} documents × {vectors.shape[1]} dims "
+            f"({meta.get('dtype', vectors.dtype)}) from {directory}"
+        )
+        return matrix
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self.id_to_row
+
+    @property
+    def dim(self) -> int:
+        return int(self.vectors.shape[1])
+
+    def vector(self, doc_id: str) -> Optional[np.ndarray]:
+        """Get a document's embedding (float32 copy) or None"""
+        row = self.id_to_row.get(doc_id)
+        if row is None:
+            return None
+        return np.array(self.vectors[row], dtype=np.float32)
+
+    def top_k(
+        self,
+        query: np.ndarray,
+        k: int,
+        exclude_rows: Optional[list[int]] = None,
+        min_score: Optional[float] = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Find the k rows most similar to query (cosine similarity)
+
+        Args:
+            query: Query embedding (normalized internally)
+            k: Number of results
+            exclude_rows: Rows to drop (e.g. the source document)
+            min_score: Minimum cosine similarity
+
+        Returns:
+            (rows, scores) sorted by score descending
+        """
+        query = np.asarray(query, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm == 0 or len(self.ids) == 0 or k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        scores = np.asarray(self.vectors @ (query / norm), dtype=np.float32)
+
+        if exclude_rows:
+            scores[exclude_rows] = -np.inf
+
+        n = scores.shape[0]
+        if k < n:
+            candidates = np.argpartition(-scores, k - 1)[:k]
+        else:
+            candidates = np.arange(n)
+
+        order = np.argsort(-scores[candidates], kind="stable")
+        rows = candidates[order]
+        top_scores = scores[rows]
+
+        keep = np.isfinite(top_scores)
+        if min_score is not None:
+            keep &= top_scores >= min_score
+
+        return rows[keep], top_scores[keep]
+
+
+class EmbeddingMatrixWriter:
+    """Streaming writer used by the offline builder
+
+    Rows are written into a preallocated .npy memmap under a name unique to
+    this build; close() publishes it by atomically replacing ids.json (which
+    names the matrix), so a server never loads a half-written matrix or pairs
+    a matrix with another build's IDs.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        count: int,
+        dim: int,
+        dtype: str = "float32",
+        model_name: str = "all-MiniLM-L6-v2",
+    ):
+        if dtype not in ("float32", "float16"):
+            raise ValueError(f"Unsupported dtype: {dtype}")
+
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.dtype = dtype
+        self.model_name = model_name
+        self.dim = dim
+        self.embeddings_name = f"embeddings-{uuid.uuid4().hex[:12]}.npy"
+        self._tmp_path = self.directory / f"{self.embeddings_name}.tmp"
+        self._array = np.lib.format.open_memmap(
+            self._tmp_path, mode="w+", dtype=np.dtype(dtype), shape=(count, dim)
+        )
+
+    def write(self, start_row: int, vectors: np.ndarray):
+        """Write L2-normalized vectors starting at start_row"""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        self._array[start_row : start_row + len(vectors)] = vectors / norms
+
+    def close(self, ids: list[str]):
+        """Flush rows and publish the matrix with one atomic manifest swap
+
+        Rows beyond len(ids) (documents skipped during the build) are trimmed.
+        Matrices of earlier builds are removed once the new manifest is in place.
+        """
+        embeddings_path = self.directory / self.embeddings_name
+        rows = len(ids)
+        self._array.flush()
+
+        if rows == self._array.shape[0]:
+            del self._array
+            os.replace(self._tmp_path, embeddings_path)
+        else:
+            trimmed_path = self.directory / f"{self.embeddings_name}.trim.tmp"
+            with open(trimmed_path, "wb") as f:
+                np.save(f, np.asarray(self._array[:rows]))
+            del self._array
+            self._tmp_path.unlink()
+            os.replace(trimmed_path, embeddings_path)
+
+        ids_path = self.directory / IDS_FILE
+        tmp_ids = self.directory / f"{IDS_FILE}.tmp"
+        with open(tmp_ids, "w") as f:
+            json.dump(
+                {
+                    "ids": ids,
+                    "embeddings": self.embeddings_name,
+                    "model": self.model_name,
+                    "dim": self.dim,
+                    "dtype": self.dtype,
+                    "created_at": datetime.now().isoformat(),
+                },
+                f,
+            )
+        os.replace(tmp_ids, ids_path)
+
+        stale = [*self.directory.glob(EMBEDDINGS_PATTERN), self.directory / EMBEDDINGS_FILE]
+        for path in stale:
+            if path.name != self.embeddings_name:
+                path.unlink(missing_ok=True)
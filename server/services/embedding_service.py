@@ -0,0 +1,251 @@
+"""
+Embedding Service - One shared sentence-transformer for the whole process
+
+Design Decision: Process-wide singleton with a query-embedding LRU
+Rationale: rag.py, search.py, EntitySimilarityService and
+DocumentSimilarityService each loaded their own copy of all-MiniLM-L6-v2
+(~90 MB of weights and a cold-start each), and every request re-encoded its
+query synchronously inside an `async def` route, blocking the event loop for
+the whole forward pass. unified_search encoded the same query twice (documents
+and news).
+
+This service:
+- Loads the model once, lazily, behind a lock
+- Caches query embeddings in a bounded LRU keyed by normalized text
+  (lowercased, whitespace collapsed - the model's tokenizer is uncased, so
+  normalized variants produce identical vectors)
+- Micro-batches concurrent async query encodes: requests arriving within a
+  short window are encoded in one `model.encode` call, and identical
+  in-flight queries share one future
+- Runs async encodes on a single encoding thread, never on the event loop
+- Serializes every `model.encode` call (async batches, sync callers such as
+  EntitySimilarity and DocumentSimilarity) behind one lock: the model's fast
+  tokenizer is not thread-safe ("Already borrowed" under concurrent use)
+
+Trade-offs:
+- A lone query waits up to `batch_window_ms` (default 5 ms) for companions
+- Encodes never overlap; throughput comes from batching, and torch already
+  spreads one forward pass across cores
+- Cached arrays are shared and read-only; callers needing to mutate must copy
+- Document texts (similar-document lookups) bypass the cache - they are long
+  and rarely repeated
+
+Usage:
+    service = get_embedding_service()
+    vector = await service.embed_query("flight logs 2002")   # async routes
+    vector = service.encode_query("flight logs 2002")        # sync code
+"""
+
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+import numpy as np
+
+
+MODEL_NAME = "all-MiniLM-L6-v2"
+
+
+def normalize_query(text: str) -> str:
+    """Cache key for a query: lowercased with whitespace collapsed"""
+    return " ".join(text.lower().split())
+
+
+class EmbeddingService:
+    """Shared embedding model with query cache and micro-batching"""
+
+    def __init__(
+        self,
+        model_name: str = MODEL_NAME,
+        cache_size: int = 2048,
+        max_batch_size: int = 64,
+        batch_window_ms: float = 5.0,
+        model_factory: Optional[Callable[[str], object]] = None,
+    ):
+        """Initialize service (the model is loaded on first use)
+
+        Args:
+            model_name: Sentence-transformers model name
+            cache_size: Maximum cached query embeddings
+            max_batch_size: Maximum queries per micro-batch
+            batch_window_ms: How long the first query of a batch waits
+            model_factory: Builds the model from its name
+                           (default: sentence_transformers.SentenceTransformer)
+        """
+        self.model_name = model_name
+        self.cache_size = cache_size
+        self.max_batch_size = max_batch_size
+        self.batch_window = batch_window_ms / 1000.0
+        self._model_factory = model_factory
+
+        self._model = None
+        self._model_lock = threading.Lock()
+
+        self._cache: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        self._encode_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="embed")
+
+        # Micro-batch state (event loop thread only)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: OrderedDict[str, asyncio.Future] = OrderedDict()
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+        self.stats = {"hits": 0, "misses": 0, "batches": 0, "encoded": 0}
+
+    # ==================== Model ====================
+
+    @property
+    def model(self):
+        """The shared model (loaded on first access)"""
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:
+                    factory = self._model_factory
+                    if factory is None:
+                        from sentence_transformers import SentenceTransformer
+
+                        factory = SentenceTransformer
+                    self._model = factory(self.model_name)
+        return self._model
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        """Encode texts without caching (blocking)
+
+        The only place the model encodes; callers in any thread are serialized.
+
+        Returns:
+            float32 array of shape (len(texts), dim)
+        """
+        model = self.model
+        with self._encode_lock:
+            embeddings = model.encode(list(texts), convert_to_numpy=True)
+        return np.asarray(embeddings, dtype=np.float32)
+
+    # ==================== Query Cache ====================
+
+    def _cache_get(self, key: str) -> Optional[np.ndarray]:
+        with self._cache_lock:
+            vector = self._cache.get(key)
+            if vector is None:
+                self.stats["misses"] += 1
+                return None
+            self._cache.move_to_end(key)
+            self.stats["hits"] += 1
+            return vector
+
+    def _cache_put(self, key: str, vector: np.ndarray) -> np.ndarray:
+        vector.setflags(write=False)
+        with self._cache_lock:
+            self._cache[key] = vector
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return vector
+
+    def _encode_keys(self, keys: list[str]) -> list[np.ndarray]:
+        """Encode normalized queries and cache them (runs in the pool)"""
+        embeddings = self.encode(keys)
+        with self._cache_lock:
+            self.stats["batches"] += 1
+            self.stats["encoded"] += len(keys)
+        return [self._cache_put(key, embeddings[i].copy()) for i, key in enumerate(keys)]
+
+    def encode_query(self, text: str) -> np.ndarray:
+        """Embedding for a query, from cache when possible (blocking)"""
+        key = normalize_query(text)
+        vector = self._cache_get(key)
+        if vector is not None:
+            return vector
+        return self._encode_keys([key])[0]
+
+    def cache_info(self) -> dict:
+        """Cache size and hit/miss counters"""
+        with self._cache_lock:
+            return {**self.stats, "size": len(self._cache), "capacity": self.cache_size}
+
+    def clear_cache(self) -> None:
+        with self._cache_lock:
+            self._cache.clear()
+
+    # ==================== Async (Event Loop) ====================
+
+    async def embed_query(self, text: str) -> np.ndarray:
+        """Embedding for a query without blocking the event loop
+
+        Cache hits return immediately; misses join the current micro-batch.
+        """
+        key = normalize_query(text)
+        vector = self._cache_get(key)
+        if vector is not None:
+            return vector
+
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Futures belong to one loop; start fresh on a new one
+            self._loop = loop
+            self._pending = OrderedDict()
+            self._flush_handle = None
+
+        future = self._pending.get(key)
+        if future is None:
+            future = loop.create_future()
+            self._pending[key] = future
+            if len(self._pending) >= self.max_batch_size:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = loop.call_later(self.batch_window, self._flush)
+
+        return await asyncio.shield(future)
+
+    async def embed_texts(self, texts: list[str]) -> np.ndarray:
+        """Encode texts (uncached) on the encoding pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.encode, list(texts))
+
+    def _flush(self) -> None:
+        """Send pending queries to the pool as one batch"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+
+        batch = self._pending
+        self._pending = OrderedDict()
+        keys = list(batch)
+
+        task = self._loop.run_in_executor(self._executor, self._encode_keys, keys)
+
+        def resolve(done: asyncio.Future) -> None:
+            error = done.exception()
+            for i, key in enumerate(keys):
+                future = batch[key]
+                if future.done():
+                    continue
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(done.result()[i])
+
+        task.add_done_callback(resolve)
+
+
+# Global service instance
+_embedding_service: Optional[EmbeddingService] = None
+_service_lock = threading.Lock()
+
+
+def get_embedding_service() -> EmbeddingService:
+    """Get the process-wide embedding service"""
+    global _embedding_service
+
+    if _embedding_service is None:
+        with _service_lock:
+            if _embedding_service is None:
+                _embedding_service = EmbeddingService()
+
+    return _embedding_service
@@ -27,6 +27,8 @@ try:
 except ImportError:
     SentenceTransformer = None
 
+from .embedding_service import get_embedding_service
+
 
 logger = logging.getLogger(__name__)
 
@@ -77,9 +79,10 @@ class EntitySimilarityService:
             traceback.print_exc()
             raise
 
-        # Initialize embedding model
+        # Shared embedding model (one copy per process, see embedding_service)
         try:
-            self.model = SentenceTransformer("all-MiniLM-L6-v2")
+            self.embeddings = get_embedding_service()
+            self.model = self.embeddings.model
             logger.info("✓ Sentence transformer model loaded")
         except Exception as e:
             logger.error(f"Failed to load embedding model: {e}")
@@ -216,7 +219,7 @@ class EntitySimilarityService:
         """
         try:
             # Generate embedding for query text
-            query_embedding = self.model.encode(query_text).tolist()
+            query_embedding = self.embeddings.encode_query(query_text).tolist()
 
             # Build where clause
             where_clause = {"doc_type": "entity_biography"}
@@ -9,6 +9,7 @@ import logging
 import os
 import time
 from pathlib import Path
+from typing import Callable
 
 from watchdog.events import FileSystemEventHandler
 from watchdog.observers import Observer
@@ -25,6 +26,7 @@ class DataFileWatcher(FileSystemEventHandler):
     - Debouncing: Groups rapid changes into single event (1 second window)
     - Event mapping: Maps filenames to semantic event types
     - Client management: Maintains list of connected SSE queues
+    - Listeners: In-process callbacks (cache invalidation) run on every event
     """
 
     # Map filenames to event types
@@ -37,6 +39,10 @@ class DataFileWatcher(FileSystemEventHandler):
         "victims_index.json": "victims_updated",
         "entity_name_mappings.json": "entity_mappings_updated",
         "entity_filter_list.json": "entity_filter_updated",
+        "entity_statistics.json": "entity_stats_updated",
+        "document_classifications.json": "documents_updated",
+        "all_documents_index.json": "documents_updated",
+        "flight_logs_by_flight.json": "flights_updated",
     }
 
     def __init__(self, enable_hot_reload: bool = True):
@@ -52,6 +58,7 @@ class DataFileWatcher(FileSystemEventHandler):
         self.debounce_timers: dict[str, float] = {}
         self.debounce_delay = 1.0  # 1 second debounce
         self.pending_events: set[str] = set()
+        self.listeners: list[Callable[[str, str], None]] = []
 
         logger.info(f"File watcher initialized (enabled: {self.enabled})")
 
@@ -100,6 +107,12 @@ class DataFileWatcher(FileSystemEventHandler):
             event_type: Type of event (e.g., "entity_network_updated")
             filename: Name of file that changed
         """
+        for listener in list(self.listeners):
+            try:
+                listener(event_type, filename)
+            except Exception as e:
+                logger.error(f"File change listener failed for {filename}: {e}")
+
         if not self.clients:
             logger.debug(f"No clients connected, skipping broadcast of {event_type}")
             return
@@ -149,6 +162,17 @@ class DataFileWatcher(FileSystemEventHandler):
             self.clients.remove(queue)
             logger.info(f"Client disconnected (remaining: {len(self.clients)})")
 
+    def add_listener(self, callback: Callable[[str, str], None]):
+        """
+        Register an in-process callback for file change events
+
+        Called from the watchdog thread, with or without SSE clients connected.
+
+        Args:
+            callback: Function taking (event_type, filename)
+        """
+        self.listeners.append(callback)
+
     def get_client_count(self) -> int:
         """Get number of connected clients"""
         return len(self.clients)
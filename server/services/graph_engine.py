@@ -0,0 +1,350 @@
+"""
+Graph Engine - Resident CSR adjacency for entity network queries
+
+Design Decision: Build the graph once, query integer arrays
+Rationale: NetworkService rebuilt an adjacency dict from every edge on each
+`find_shortest_path` call and resolved path nodes with a linear `next(...)`
+per hop; `get_entity_subgraph` scanned the full edge list for every node it
+dequeued (O(V·E) per request). The engine interns node IDs to integers and
+stores the undirected graph in compressed sparse row (CSR) form once, when
+entity_network.json is loaded.
+
+Structure:
+- node_ids: int → node ID; index: node ID → int; name_index: name → int
+- indptr / indices / weights: CSR rows (each undirected edge stored in both
+  directions); within a row, neighbours are ordered by descending weight,
+  so traversals prefer the strongest tie among equally short options
+- edge_of: CSR slot → position in the source edge list (edge dicts are
+  returned unchanged)
+- degree / weighted_degree: precomputed per node
+
+Queries:
+- bfs(source, max_hops, min_weight): hop distances (k-hop neighbourhoods)
+- shortest_path: bidirectional BFS, expanding the smaller frontier
+- k_shortest_paths: Yen's algorithm over hop count (ties: heavier total
+  weight first), each spur path found with the bidirectional search
+- induced_edges: edges among a node set, in source order
+
+Trade-offs:
+- Unweighted (hop-count) paths; `min_weight` excludes weak edges instead of
+  turning weights into distances
+- Immutable: rebuilt when the network file is reloaded
+- Traversals iterate Python lists mirrored from the numpy arrays (numpy
+  scalar indexing is slower than list indexing in tight loops)
+
+Performance (255 nodes / 1,482 edges, see
+tests/verification/benchmark_graph_engine.py):
+- Shortest path: ~0.01 ms vs ~0.4 ms (adjacency rebuilt per call)
+- 2-hop subgraph: ~0.1 ms vs ~12 ms (edge scan per dequeued node)
+- 5,000-node synthetic graph: ~135× (paths) and ~800× (subgraphs) faster
+"""
+
+import heapq
+from typing import Iterable, Optional
+
+import numpy as np
+
+
+class GraphEngine:
+    """Undirected weighted graph in CSR form
+
+    Usage:
+        graph = GraphEngine.from_network(network_data)
+        path = graph.shortest_path(graph.index["jeffrey_epstein"], graph.index["glenn_dubin"])
+        [graph.node_ids[n] for n in path]
+    """
+
+    def __init__(
+        self,
+        node_ids: list[str],
+        sources: Iterable[int],
+        targets: Iterable[int],
+        weights: Iterable[float],
+        names: Optional[list[str]] = None,
+        edge_positions: Optional[Iterable[int]] = None,
+    ):
+        """Build CSR arrays from an edge list of node ints
+
+        Args:
+            node_ids: Node ID per node int
+            sources / targets / weights: One entry per undirected edge
+            names: Display name per node int (defaults to node_ids)
+            edge_positions: Index of each edge in the caller's edge list
+                (defaults to 0..n-1)
+        """
+        self.node_ids = list(node_ids)
+        self.index = {node_id: n for n, node_id in enumerate(self.node_ids)}
+        self.name_index: dict[str, int] = {}
+        for n, name in enumerate(names or self.node_ids):
+            self.name_index.setdefault(name, n)
+
+        n_nodes = len(self.node_ids)
+        src = np.asarray(list(sources), dtype=np.int64)
+        dst = np.asarray(list(targets), dtype=np.int64)
+        wgt = np.asarray(list(weights), dtype=np.float64)
+        if edge_positions is None:
+            positions = np.arange(len(src), dtype=np.int64)
+        else:
+            positions = np.asarray(list(edge_positions), dtype=np.int64)
+        self.n_edges = len(src)
+
+        # Both directions of each edge, sorted by (row, -weight, source order)
+        rows = np.concatenate([src, dst])
+        cols = np.concatenate([dst, src])
+        slot_weights = np.concatenate([wgt, wgt])
+        slot_edges = np.concatenate([positions, positions])
+        order = np.lexsort((slot_edges, -slot_weights, rows))
+
+        self.indices = cols[order].astype(np.int32)
+        self.weights = slot_weights[order]
+        self.edge_of = slot_edges[order].astype(np.int32)
+        self.indptr = np.zeros(n_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n_nodes), out=self.indptr[1:])
+
+        self.degree = np.diff(self.indptr)
+        self.weighted_degree = np.bincount(rows, weights=slot_weights, minlength=n_nodes)
+
+        # List mirrors for traversal loops
+        self._indptr = self.indptr.tolist()
+        self._indices = self.indices.tolist()
+        self._weights = self.weights.tolist()
+        self._edge_of = self.edge_of.tolist()
+
+    @classmethod
+    def from_network(cls, network_data: dict) -> "GraphEngine":
+        """Build from entity_network.json data ({"nodes": [...], "edges": [...]})
+
+        Edges whose endpoints are not nodes, and self-loops, are skipped.
+        """
+        nodes = network_data.get("nodes", [])
+        node_ids = [node["id"] for node in nodes]
+        index = {node_id: n for n, node_id in enumerate(node_ids)}
+
+        positions, sources, targets, weights = [], [], [], []
+        for position, edge in enumerate(network_data.get("edges", [])):
+            source = index.get(edge.get("source"))
+            target = index.get(edge.get("target"))
+            if source is None or target is None or source == target:
+                continue
+            positions.append(position)
+            sources.append(source)
+            targets.append(target)
+            weights.append(edge.get("weight", 1))
+
+        return cls(
+            node_ids,
+            sources,
+            targets,
+            weights,
+            names=[node.get("name", node["id"]) for node in nodes],
+            edge_positions=positions,
+        )
+
+    def __len__(self) -> int:
+        return len(self.node_ids)
+
+    # ==================== Traversal ====================
+
+    def neighbors(self, node: int, min_weight: float = 0) -> list[int]:
+        """Neighbour ints, strongest first"""
+        start, end = self._indptr[node], self._indptr[node + 1]
+        return [
+            self._indices[slot] for slot in range(start, end) if self._weights[slot] >= min_weight
+        ]
+
+    def bfs(
+        self, source: int, max_hops: Optional[int] = None, min_weight: float = 0
+    ) -> dict[int, int]:
+        """Hop distance from source to every node reachable within max_hops
+
+        Returns:
+            {node int: hops}, in discovery order (source first)
+        """
+        indptr, indices, weights = self._indptr, self._indices, self._weights
+        distances = {source: 0}
+        frontier = [source]
+        hops = 0
+        while frontier and (max_hops is None or hops < max_hops):
+            hops += 1
+            next_frontier = []
+            for node in frontier:
+                for slot in range(indptr[node], indptr[node + 1]):
+                    neighbor = indices[slot]
+                    if neighbor not in distances and weights[slot] >= min_weight:
+                        distances[neighbor] = hops
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+        return distances
+
+    def shortest_path(
+        self,
+        source: int,
+        target: int,
+        max_hops: Optional[int] = None,
+        min_weight: float = 0,
+        banned_nodes: frozenset = frozenset(),
+        banned_edges: frozenset = frozenset(),
+    ) -> Optional[list[int]]:
+        """Fewest-hop path via bidirectional BFS
+
+        Args:
+            source / target: Node ints
+            max_hops: Maximum path length (None: unbounded)
+            min_weight: Ignore edges lighter than this
+            banned_nodes: Node ints the path may not pass through
+            banned_edges: (low int, high int) pairs the path may not use
+
+        Returns:
+            Node ints from source to target, or None if no path
+        """
+        if source == target:
+            return [source]
+        if source in banned_nodes or target in banned_nodes:
+            return None
+
+        indptr, indices, weights = self._indptr, self._indices, self._weights
+        parents = ({source: None}, {target: None})  # forward, backward
+        frontiers = ([source], [target])
+        hops = 0
+
+        while frontiers[0] and frontiers[1]:
+            if max_hops is not None and hops >= max_hops:
+                return None
+            hops += 1
+
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            own, other = parents[side], parents[1 - side]
+            next_frontier = []
+            meetings = []
+            for node in frontiers[side]:
+                for slot in range(indptr[node], indptr[node + 1]):
+                    neighbor = indices[slot]
+                    if neighbor in own or weights[slot] < min_weight:
+                        continue
+                    if neighbor in banned_nodes:
+                        continue
+                    if banned_edges and (min(node, neighbor), max(node, neighbor)) in banned_edges:
+                        continue
+                    own[neighbor] = node
+                    next_frontier.append(neighbor)
+                    if neighbor in other:
+                        meetings.append(neighbor)
+            frontiers = (
+                (next_frontier, frontiers[1]) if side == 0 else (frontiers[0], next_frontier)
+            )
+
+            if meetings:
+                # Meeting nodes differ in depth on the other side; take the shortest
+                best = min(meetings, key=lambda m: self._depth(other, m))
+                return self._join(parents, best)
+
+        return None
+
+    @staticmethod
+    def _depth(parents: dict, node: int) -> int:
+        depth = 0
+        while parents[node] is not None:
+            node = parents[node]
+            depth += 1
+        return depth
+
+    @staticmethod
+    def _join(parents: tuple, meeting: int) -> list[int]:
+        forward, backward = parents
+        path = []
+        node = meeting
+        while node is not None:
+            path.append(node)
+            node = forward[node]
+        path.reverse()
+        node = backward[meeting]
+        while node is not None:
+            path.append(node)
+            node = backward[node]
+        return path
+
+    def k_shortest_paths(
+        self,
+        source: int,
+        target: int,
+        k: int,
+        max_hops: Optional[int] = None,
+        min_weight: float = 0,
+    ) -> list[list[int]]:
+        """Up to k loopless paths in order of hop count (Yen's algorithm)
+
+        Equal-length candidates are ordered by total edge weight, heaviest first.
+        """
+        first = self.shortest_path(source, target, max_hops, min_weight)
+        if first is None:
+            return []
+
+        paths = [first]
+        candidates: list[tuple[int, float, list[int]]] = []
+        seen = {tuple(first)}
+
+        while len(paths) < k:
+            previous = paths[-1]
+            for spur_index in range(len(previous) - 1):
+                root = previous[: spur_index + 1]
+                banned_edges = {
+                    self._edge_key(path[spur_index], path[spur_index + 1])
+                    for path in paths
+                    if len(path) > spur_index + 1 and path[: spur_index + 1] == root
+                }
+                spur_hops = None if max_hops is None else max_hops - spur_index
+                spur = self.shortest_path(
+                    root[-1],
+                    target,
+                    spur_hops,
+                    min_weight,
+                    banned_nodes=frozenset(root[:-1]),
+                    banned_edges=frozenset(banned_edges),
+                )
+                if spur is None:
+                    continue
+                candidate = root[:-1] + spur
+                if tuple(candidate) not in seen:
+                    seen.add(tuple(candidate))
+                    heapq.heappush(
+                        candidates, (len(candidate), -self.path_weight(candidate), candidate)
+                    )
+            if not candidates:
+                break
+            paths.append(heapq.heappop(candidates)[2])
+
+        return paths
+
+    # ==================== Edges ====================
+
+    @staticmethod
+    def _edge_key(a: int, b: int) -> tuple[int, int]:
+        return (a, b) if a < b else (b, a)
+
+    def edge_slot(self, a: int, b: int) -> Optional[int]:
+        """CSR slot of edge a→b (None if not adjacent)"""
+        for slot in range(self._indptr[a], self._indptr[a + 1]):
+            if self._indices[slot] == b:
+                return slot
+        return None
+
+    def path_edges(self, path: list[int]) -> list[int]:
+        """Source edge positions along a path"""
+        return [self._edge_of[self.edge_slot(a, b)] for a, b in zip(path, path[1:])]
+
+    def path_weight(self, path: list[int]) -> float:
+        """Total edge weight along a path"""
+        return sum(self._weights[self.edge_slot(a, b)] for a, b in zip(path, path[1:]))
+
+    def induced_edges(self, nodes: Iterable[int], min_weight: float = 0) -> list[int]:
+        """Source edge positions with both endpoints in `nodes`, in source order"""
+        members = set(nodes)
+        indptr, indices, weights = self._indptr, self._indices, self._weights
+        positions = []
+        for node in members:
+            for slot in range(indptr[node], indptr[node + 1]):
+                neighbor = indices[slot]
+                if node < neighbor and neighbor in members and weights[slot] >= min_weight:
+                    positions.append(self._edge_of[slot])
+        positions.sort()
+        return positions
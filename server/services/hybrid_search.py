@@ -0,0 +1,190 @@
+"""
+Hybrid Search - Rank fusion, boolean post-filters and result cursors
+
+Design Decision: Reciprocal rank fusion over independent retrievers
+Rationale: unified_search concatenated fuzzy entity scores, ChromaDB cosine
+similarities and news similarities and sorted them as if they shared a scale
+(a 0.6 fuzzy name match outranked a 0.58 cosine hit regardless of how good
+either was within its own list). Each retriever now contributes only its
+ranking:
+
+    score(d) = Σ_r  w_r / (k + rank_r(d))        (rank starts at 1, k = 60)
+
+so a document found by both BM25 (exact words) and the vector index
+(meaning) rises above one found by either alone, and no retriever's score
+distribution dominates.
+
+Boolean post-filters: explicit AND / OR / NOT queries are enforced on the
+text of every retriever's hits (BM25, dense, entity and news) before fusion.
+Only uppercase operators count, as in FTS5: "flights that did not include
+clinton" is a plain query. Plain queries are not filtered at all - the
+dense retriever is meant to find documents that don't contain the words.
+
+Cursors: the fused list is kept in a small TTL cache under a random search
+ID. Later pages are slices of that list (`cursor = "<search_id>.<offset>"`),
+so paging never re-runs retrieval and results can't shift between pages.
+
+Trade-offs:
+- RRF discards score magnitudes (a near-perfect match and a marginal one at
+  the same rank count the same)
+- Cursors live in process memory: they expire after `ttl` seconds and don't
+  survive restarts or cross workers
+"""
+
+import re
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+
+RRF_K = 60
+
+BOOLEAN_OPERATOR = re.compile(r"(?:^|\s)(AND|OR|NOT)(?:\s|$)")
+
+
+def reciprocal_rank_fusion(
+    rankings: dict[str, list[str]],
+    weights: Optional[dict[str, float]] = None,
+    k: int = RRF_K,
+) -> list[tuple[str, float, dict[str, int]]]:
+    """Fuse ranked ID lists from several retrievers
+
+    Args:
+        rankings: Retriever name -> IDs, best first (duplicates ignored)
+        weights: Retriever name -> weight (default 1.0)
+        k: Rank damping constant
+
+    Returns:
+        (id, fused score, {retriever: 1-based rank}) best first; ties keep
+        first-seen order
+    """
+    weights = weights or {}
+    scores: dict[str, float] = {}
+    ranks: dict[str, dict[str, int]] = {}
+
+    for name, ids in rankings.items():
+        weight = weights.get(name, 1.0)
+        rank = 0
+        for item_id in ids:
+            item_ranks = ranks.setdefault(item_id, {})
+            if name in item_ranks:
+                continue
+            rank += 1
+            item_ranks[name] = rank
+            scores[item_id] = scores.get(item_id, 0.0) + weight / (k + rank)
+
+    order = {item_id: i for i, item_id in enumerate(scores)}
+    fused = sorted(scores, key=lambda item_id: (-scores[item_id], order[item_id]))
+    return [(item_id, scores[item_id], ranks[item_id]) for item_id in fused]
+
+
+def has_boolean_operators(query: str) -> bool:
+    """Whether the query uses explicit (uppercase) AND / OR / NOT"""
+    return bool(BOOLEAN_OPERATOR.search(query))
+
+
+@dataclass
+class BooleanPostFilter:
+    """must / should / must_not terms checked against result text"""
+
+    must: list[str] = field(default_factory=list)
+    should: list[str] = field(default_factory=list)
+    must_not: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_query(cls, query: str, boolean_terms: dict[str, list[str]]) -> "BooleanPostFilter":
+        """Filter for a parsed query
+
+        Without explicit (uppercase) operators the filter is inactive, whatever
+        the parser extracted.
+        """
+        if not has_boolean_operators(query):
+            return cls()
+        return cls(
+            must=list(boolean_terms.get("must", [])),
+            should=list(boolean_terms.get("should", [])),
+            must_not=list(boolean_terms.get("must_not", [])),
+        )
+
+    @property
+    def active(self) -> bool:
+        return bool(self.must or self.should or self.must_not)
+
+    def matches(self, text: str) -> bool:
+        """Apply the filter to (already lowercased or raw) text"""
+        if not self.active:
+            return True
+        text = text.lower()
+        if any(term not in text for term in self.must):
+            return False
+        if any(term in text for term in self.must_not):
+            return False
+        if self.should and not self.must and not any(term in text for term in self.should):
+            return False
+        return True
+
+
+# ==================== Cursors ====================
+
+
+def encode_cursor(search_id: str, offset: int) -> str:
+    return f"{search_id}.{offset}"
+
+
+def decode_cursor(cursor: str) -> tuple[str, int]:
+    """Split a cursor into (search_id, offset)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    search_id, _, offset = cursor.rpartition(".")
+    if not search_id or not offset.isdigit():
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return search_id, int(offset)
+
+
+class SearchResultCache:
+    """TTL + LRU cache of fused result lists keyed by random search IDs"""
+
+    def __init__(self, max_entries: int = 256, ttl: float = 600.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, value: Any) -> str:
+        """Store a result set; returns its search ID"""
+        search_id = secrets.token_urlsafe(9)
+        now = time.monotonic()
+        with self._lock:
+            self._entries[search_id] = (now, value)
+            self._evict(now)
+        return search_id
+
+    def get(self, search_id: str) -> Optional[Any]:
+        """Result set for a search ID, or None if unknown/expired"""
+        now = time.monotonic()
+        with self._lock:
+            self._evict(now)
+            entry = self._entries.get(search_id)
+            if entry is None:
+                return None
+            if now - entry[0] > self.ttl:
+                del self._entries[search_id]
+                return None
+            self._entries.move_to_end(search_id)
+            return entry[1]
+
+    def _evict(self, now: float) -> None:
+        while self._entries:
+            oldest_id, (created, _) = next(iter(self._entries.items()))
+            if len(self._entries) > self.max_entries or now - created > self.ttl:
+                del self._entries[oldest_id]
+            else:
+                break
+
+    def __len__(self) -> int:
+        return len(self._entries)
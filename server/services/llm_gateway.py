@@ -0,0 +1,276 @@
+"""
+LLM Gateway - Async OpenRouter chat completions with pooling, limits and streaming
+
+Design Decision: One async HTTP client instead of the synchronous OpenAI SDK
+Rationale: chat_enhanced and the document summary endpoints called
+`client.chat.completions.create` (blocking) inside `async def` handlers, so a
+30-second completion stalled every other request on the worker's event
+loop. The gateway talks to the OpenAI-compatible /chat/completions endpoint
+with a shared httpx.AsyncClient:
+
+- Connection pool: keep-alive connections are reused across requests
+  (no TLS handshake per completion)
+- Per-model concurrency: an asyncio.Semaphore per model caps in-flight calls
+  (`LLM_MODEL_CONCURRENCY`, default 4); callers wait at most `queue_timeout`
+  for a slot before failing fast with LLMError
+- Timeouts: connect/read timeouts on the client plus an overall deadline per
+  completion (and per stream)
+- Streaming: `stream()` yields content deltas from the server-sent events
+  response, for token-by-token delivery to the browser
+
+Configuration (environment):
+- OPENROUTER_API_KEY: required at call time
+- OPENROUTER_BASE_URL: default https://openrouter.ai/api/v1 (point at a local
+  stub server for tests or offline development)
+- LLM_MODEL_CONCURRENCY: in-flight completions per model
+
+Trade-offs:
+- Only the subset of the API this app uses (messages, max_tokens,
+  temperature); responses are plain dicts
+- Concurrency limits are per process, not per deployment
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from typing import AsyncIterator, Optional
+
+import httpx
+
+
+logger = logging.getLogger(__name__)
+
+OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+
+DEFAULT_TIMEOUT = 30.0
+CONNECT_TIMEOUT = 5.0
+QUEUE_TIMEOUT = 10.0
+DEFAULT_MODEL_CONCURRENCY = 4
+MAX_CONNECTIONS = 20
+
+
+class LLMError(Exception):
+    """Completion failed (missing key, timeout, HTTP error, bad response)"""
+
+
+class LLMGateway:
+    """
+    Shared async client for chat completions.
+
+    Usage:
+        gateway = get_llm_gateway()
+        text = await gateway.complete(model, messages, max_tokens=500)
+        async for delta in gateway.stream(model, messages):
+            ...
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        queue_timeout: float = QUEUE_TIMEOUT,
+        model_concurrency: Optional[int] = None,
+        max_connections: int = MAX_CONNECTIONS,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Args:
+            api_key: API key (default: OPENROUTER_API_KEY, read at call time)
+            base_url: API base URL (default: OPENROUTER_BASE_URL or OpenRouter)
+            timeout: Overall deadline per completion, seconds
+            queue_timeout: Maximum wait for a per-model concurrency slot
+            model_concurrency: In-flight completions per model
+            max_connections: Connection pool size
+            transport: Custom httpx transport (tests)
+        """
+        self.api_key = api_key
+        base_url = base_url or os.getenv("OPENROUTER_BASE_URL") or OPENROUTER_BASE_URL
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.queue_timeout = queue_timeout
+        self.model_concurrency = model_concurrency or int(
+            os.getenv("LLM_MODEL_CONCURRENCY", DEFAULT_MODEL_CONCURRENCY)
+        )
+        self.max_connections = max_connections
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Pooled HTTP client (created on first use)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=httpx.Timeout(self.timeout, connect=CONNECT_TIMEOUT),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                transport=self._transport,
+            )
+        return self._client
+
+    def _headers(self) -> dict[str, str]:
+        api_key = self.api_key or os.getenv("OPENROUTER_API_KEY")
+        if not api_key:
+            raise LLMError("OPENROUTER_API_KEY not set in .env.local")
+        return {"Authorization": f"Bearer {api_key}"}
+
+    def _semaphore(self, model: str) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(model)
+        if semaphore is None:
+            semaphore = self._semaphores.setdefault(
+                model, asyncio.Semaphore(self.model_concurrency)
+            )
+        return semaphore
+
+    async def _acquire(self, model: str) -> asyncio.Semaphore:
+        semaphore = self._semaphore(model)
+        try:
+            await asyncio.wait_for(semaphore.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            raise LLMError(f"Too many concurrent requests for {model}; try again shortly")
+        return semaphore
+
+    @staticmethod
+    def _payload(model: str, messages: list[dict], max_tokens: int, temperature: float) -> dict:
+        return {
+            "model": model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+
+    async def complete(
+        self,
+        model: str,
+        messages: list[dict],
+        max_tokens: int = 500,
+        temperature: float = 0.3,
+        timeout: Optional[float] = None,
+    ) -> str:
+        """
+        Run one chat completion.
+
+        Returns:
+            Stripped message content
+
+        Raises:
+            LLMError: On missing key, timeout, HTTP error or malformed response
+        """
+        headers = self._headers()
+        semaphore = await self._acquire(model)
+        try:
+            response = await asyncio.wait_for(
+                self.client.post(
+                    "/chat/completions",
+                    json=self._payload(model, messages, max_tokens, temperature),
+                    headers=headers,
+                ),
+                timeout or self.timeout,
+            )
+            response.raise_for_status()
+            return response.json()["choices"][0]["message"]["content"].strip()
+        except asyncio.TimeoutError:
+            raise LLMError(f"{model} did not respond within {timeout or self.timeout:.0f}s")
+        except httpx.HTTPStatusError as e:
+            raise LLMError(f"{model} returned HTTP {e.response.status_code}")
+        except (httpx.HTTPError, KeyError, IndexError, TypeError, ValueError) as e:
+            raise LLMError(f"{model} request failed: {e}")
+        finally:
+            semaphore.release()
+
+    async def stream(
+        self,
+        model: str,
+        messages: list[dict],
+        max_tokens: int = 500,
+        temperature: float = 0.3,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a chat completion as content deltas.
+
+        The concurrency slot is held until the stream ends or the consumer
+        stops iterating.
+
+        Raises:
+            LLMError: As complete(); also if the overall deadline passes mid-stream
+        """
+        headers = self._headers()
+        deadline = time.monotonic() + (timeout or self.timeout)
+        payload = {**self._payload(model, messages, max_tokens, temperature), "stream": True}
+
+        semaphore = await self._acquire(model)
+        try:
+            async with self.client.stream(
+                "POST", "/chat/completions", json=payload, headers=headers
+            ) as response:
+                if response.status_code >= 400:
+                    raise LLMError(f"{model} returned HTTP {response.status_code}")
+                async for line in response.aiter_lines():
+                    if time.monotonic() > deadline:
+                        raise LLMError(f"{model} stream exceeded {timeout or self.timeout:.0f}s")
+                    delta = parse_stream_line(line)
+                    if delta is None:
+                        break
+                    if delta:
+                        yield delta
+        except httpx.HTTPError as e:
+            raise LLMError(f"{model} stream failed: {e}")
+        finally:
+            semaphore.release()
+
+    async def aclose(self) -> None:
+        """Close pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+def parse_stream_line(line: str) -> Optional[str]:
+    """
+    Content delta from one server-sent events line.
+
+    Returns:
+        Delta text ("" for keep-alives, comments and non-content events), or
+        None at the end-of-stream marker
+    """
+    if not line.startswith("data:"):
+        return ""
+    data = line[5:].strip()
+    if data == "[DONE]":
+        return None
+    try:
+        choices = json.loads(data).get("choices") or [{}]
+        return choices[0].get("delta", {}).get("content") or ""
+    except (ValueError, AttributeError):
+        logger.debug(f"Skipping malformed stream line: {line[:100]}")
+        return ""
+
+
+# Singleton instance
+_llm_gateway: Optional[LLMGateway] = None
+
+
+def get_llm_gateway() -> LLMGateway:
+    """
+    Get or create the shared LLM gateway.
+
+    Returns:
+        Process-wide LLMGateway instance
+    """
+    global _llm_gateway
+    if _llm_gateway is None:
+        _llm_gateway = LLMGateway()
+    return _llm_gateway
+
+
+async def close_llm_gateway() -> None:
+    """Close the shared gateway's connections (server shutdown)"""
+    if _llm_gateway is not None:
+        await _llm_gateway.aclose()
@@ -0,0 +1,283 @@
+"""
+Network Level of Detail - Compact graph views for /api/network/lod and /api/network/expand
+
+Design Decision: Let the server choose what to draw, and send it as columns
+Rationale: /api/network returns up to 1,000 full node dicts and every edge
+among them; dense neighbourhoods (hundreds of edges around the central
+entities) stall the React force layout before anything is readable. Views are
+now cut on the resident GraphEngine:
+- overview: one super-node per community (entity_network_metrics.json),
+  super-edges summing the weights between communities
+- community: one community's members, ranked by a metric, up to max_nodes
+- expand: nodes within `hops` of seed nodes that the client does not already
+  hold (viewport / neighbourhood expansion), plus their edges to what it has
+
+Hidden nodes (generic entities, as filtered by /api/network) are neither
+returned nor traversed.
+
+Every view keeps only the top-k edges per node by weight (an edge survives if
+it is among the k strongest of either endpoint), so node degree on screen is
+bounded while every node keeps its strongest ties.
+
+Payload (compact, columnar):
+    {"nodes": {"index": [3, 17, ...], "id": [...], "name": [...],
+               "connection_count": [...], "community": [...], "score": [...]},
+     "edges": {"source": [3, ...], "target": [17, ...], "weight": [...]}}
+- node ints are GraphEngine positions, stable for one network file
+  (`graph_version`), so expansions merge into the client's existing view
+- edges reference node ints; a node's strings are sent once, in `nodes`
+
+Trade-offs:
+- Communities come from the offline metrics; without them the overview is
+  unavailable and every node is community 0
+- Edge pruning is per view: an edge dropped from one response may appear in a
+  later expansion once its endpoints' stronger ties are already on screen
+"""
+
+from typing import Iterable, Optional
+
+import numpy as np
+
+from services.graph_engine import GraphEngine
+
+
+DEFAULT_TOP_K = 5
+DEFAULT_MAX_NODES = 200
+
+
+def top_k_edge_mask(
+    sources: np.ndarray, targets: np.ndarray, weights: np.ndarray, k: Optional[int]
+) -> np.ndarray:
+    """
+    Edges among the k heaviest of either endpoint.
+
+    Ties keep input order. k=None (or 0) keeps everything.
+    """
+    if not k or len(sources) == 0:
+        return np.ones(len(sources), dtype=bool)
+
+    # Each edge appears once per endpoint; rank within an endpoint by weight
+    m = len(sources)
+    ends = np.concatenate([sources, targets])
+    edge_ids = np.concatenate([np.arange(m), np.arange(m)])
+    order = np.lexsort((edge_ids, -np.concatenate([weights, weights]), ends))
+    grouped = ends[order]
+    starts = np.flatnonzero(np.r_[True, grouped[1:] != grouped[:-1]])
+    group_start = np.repeat(starts, np.diff(np.r_[starts, len(grouped)]))
+    ranked_in = (np.arange(len(grouped)) - group_start) < k
+
+    keep = np.zeros(m, dtype=bool)
+    keep[edge_ids[order][ranked_in]] = True
+    return keep
+
+
+class NetworkLOD:
+    """
+    Level-of-detail views over one network load.
+
+    Usage:
+        lod = NetworkLOD(graph, network_data["nodes"], communities, scores, hidden)
+        lod.overview(top_k=3)
+        lod.expand([graph.index["jeffrey_epstein"]], known=set(), hops=1)
+    """
+
+    def __init__(
+        self,
+        graph: GraphEngine,
+        nodes: list[dict],
+        communities: Optional[Iterable[int]] = None,
+        scores: Optional[Iterable[float]] = None,
+        hidden: Iterable[int] = (),
+    ):
+        """
+        Args:
+            graph: GraphEngine built from the same node list
+            nodes: entity_network.json node dicts, in graph order
+            communities: Community per node int (None: all 0)
+            scores: Ranking score per node int (None: connection_count)
+            hidden: Node ints never returned (e.g. generic entities)
+        """
+        n = len(graph)
+        self.graph = graph
+        self.nodes = nodes
+        self.communities = (
+            np.asarray(list(communities), dtype=np.int64)
+            if communities is not None
+            else np.zeros(n, dtype=np.int64)
+        )
+        self.scores = (
+            np.asarray(list(scores), dtype=np.float64)
+            if scores is not None
+            else np.asarray([node.get("connection_count", 0) for node in nodes], dtype=np.float64)
+        )
+        self.visible = np.ones(n, dtype=bool)
+        self.visible[list(hidden)] = False
+
+        # Undirected edge list (one slot per edge) for vectorized filtering
+        rows = np.repeat(np.arange(n), graph.degree)
+        upper = rows < graph.indices
+        self.edge_sources = rows[upper]
+        self.edge_targets = graph.indices[upper].astype(np.int64)
+        self.edge_weights = graph.weights[upper]
+
+    # ==================== Payload ====================
+
+    def _node_columns(self, members: list[int]) -> dict:
+        return {
+            "index": members,
+            "id": [self.nodes[n]["id"] for n in members],
+            "name": [self.nodes[n].get("name", self.nodes[n]["id"]) for n in members],
+            "connection_count": [self.nodes[n].get("connection_count", 0) for n in members],
+            "community": self.communities[members].tolist(),
+            "score": self.scores[members].tolist(),
+        }
+
+    @staticmethod
+    def _edge_columns(sources, targets, weights) -> dict:
+        return {
+            "source": sources.tolist(),
+            "target": targets.tolist(),
+            "weight": weights.tolist(),
+        }
+
+    def _ranked(self, mask: np.ndarray, limit: Optional[int]) -> list[int]:
+        """Node ints selected by mask, highest score first (ties: node order)"""
+        candidates = np.flatnonzero(mask)
+        order = np.lexsort((candidates, -self.scores[candidates]))
+        return candidates[order][:limit].tolist()
+
+    def _edges(self, mask: np.ndarray, top_k: Optional[int], min_weight: float = 0) -> dict:
+        """Top-k edges among edge-list rows selected by mask"""
+        mask = mask & (self.edge_weights >= min_weight)
+        sources = self.edge_sources[mask]
+        targets = self.edge_targets[mask]
+        weights = self.edge_weights[mask]
+        keep = top_k_edge_mask(sources, targets, weights, top_k)
+        return self._edge_columns(sources[keep], targets[keep], weights[keep])
+
+    # ==================== Views ====================
+
+    def overview(self, top_k: Optional[int] = DEFAULT_TOP_K, leaders: int = 3) -> dict:
+        """
+        One super-node per community.
+
+        Returns:
+            {"communities": {"index", "size", "internal_weight", "leaders"},
+             "nodes": leader node columns, "edges": super-edges}
+            (leaders: the top-scored member ints of each community)
+        """
+        labels = self.communities
+        visible = np.flatnonzero(self.visible)
+        n_communities = int(labels.max()) + 1 if len(labels) else 0
+        sizes = np.bincount(labels[visible], minlength=n_communities)
+        present = np.flatnonzero(sizes)
+
+        edge_visible = self.visible[self.edge_sources] & self.visible[self.edge_targets]
+        a = labels[self.edge_sources][edge_visible]
+        b = labels[self.edge_targets][edge_visible]
+        weights = self.edge_weights[edge_visible]
+        internal = np.bincount(a[a == b], weights=weights[a == b], minlength=n_communities)
+
+        # Sum weights per unordered community pair
+        between = a != b
+        low = np.minimum(a, b)[between]
+        high = np.maximum(a, b)[between]
+        pairs, inverse = np.unique(low * n_communities + high, return_inverse=True)
+        pair_weights = np.bincount(inverse, weights=weights[between])
+        super_sources, super_targets = pairs // n_communities, pairs % n_communities
+        keep = top_k_edge_mask(super_sources, super_targets, pair_weights, top_k)
+
+        leader_lists = [self._ranked(self.visible & (labels == c), leaders) for c in present]
+        leader_nodes = sorted({n for members in leader_lists for n in members})
+        return {
+            "communities": {
+                "index": present.tolist(),
+                "size": sizes[present].tolist(),
+                "internal_weight": internal[present].tolist(),
+                "leaders": leader_lists,
+            },
+            "nodes": self._node_columns(leader_nodes),
+            "edges": self._edge_columns(
+                super_sources[keep], super_targets[keep], pair_weights[keep]
+            ),
+        }
+
+    def community(
+        self,
+        community: int,
+        max_nodes: Optional[int] = DEFAULT_MAX_NODES,
+        top_k: Optional[int] = DEFAULT_TOP_K,
+        min_weight: float = 0,
+    ) -> dict:
+        """Highest-scored members of one community and the top-k edges among them"""
+        members = self._ranked(self.visible & (self.communities == community), max_nodes)
+        selected = np.zeros(len(self.graph), dtype=bool)
+        selected[members] = True
+        edge_mask = selected[self.edge_sources] & selected[self.edge_targets]
+        return {
+            "nodes": self._node_columns(members),
+            "edges": self._edges(edge_mask, top_k, min_weight),
+        }
+
+    def expand(
+        self,
+        seeds: Iterable[int],
+        known: Iterable[int] = (),
+        hops: int = 1,
+        max_nodes: Optional[int] = DEFAULT_MAX_NODES,
+        top_k: Optional[int] = DEFAULT_TOP_K,
+        min_weight: float = 0,
+    ) -> dict:
+        """
+        Neighbourhood expansion around seed nodes.
+
+        Args:
+            seeds: Node ints to expand from (e.g. the clicked node or the viewport)
+            known: Node ints the client already holds (not re-sent)
+            hops: Expansion radius
+            max_nodes: New nodes returned, nearest first (seeds not in
+                `known` have hops 0), then by score
+            top_k: Edges kept per node
+            min_weight: Ignore edges lighter than this while expanding
+
+        Returns:
+            {"nodes": new node columns (with "hops"),
+             "edges": top-k edges touching a new node (other end new or known)}
+        """
+        seeds = [n for n in dict.fromkeys(seeds) if self.visible[n]]
+        on_client = np.zeros(len(self.graph), dtype=bool)
+        on_client[list(known)] = True
+
+        # Multi-source BFS over the edge arrays; hidden nodes are not traversed
+        heavy = self.edge_weights >= min_weight
+        ends = (
+            np.concatenate([self.edge_sources[heavy], self.edge_targets[heavy]]),
+            np.concatenate([self.edge_targets[heavy], self.edge_sources[heavy]]),
+        )
+        distance = np.full(len(self.graph), -1, dtype=np.int64)
+        distance[seeds] = 0
+        frontier = np.zeros(len(self.graph), dtype=bool)
+        frontier[seeds] = True
+        for hop in range(1, hops + 1):
+            reached = np.zeros(len(self.graph), dtype=bool)
+            reached[ends[1][frontier[ends[0]]]] = True
+            frontier = reached & self.visible & (distance < 0)
+            if not frontier.any():
+                break
+            distance[frontier] = hop
+
+        candidates = np.flatnonzero((distance >= 0) & self.visible & ~on_client)
+        order = np.lexsort((candidates, -self.scores[candidates], distance[candidates]))
+        new_nodes = candidates[order][:max_nodes].tolist()
+
+        new = np.zeros(len(self.graph), dtype=bool)
+        new[new_nodes] = True
+        present = new | (on_client & self.visible)
+        edge_mask = (
+            present[self.edge_sources]
+            & present[self.edge_targets]
+            & (new[self.edge_sources] | new[self.edge_targets])
+        )
+        nodes = self._node_columns(new_nodes)
+        nodes["hops"] = distance[new_nodes].tolist()
+        return {"nodes": nodes, "edges": self._edges(edge_mask, top_k, min_weight)}
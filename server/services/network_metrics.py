@@ -0,0 +1,398 @@
+"""
+Network Metrics - Offline centrality and community detection for the entity network
+
+Design Decision: Compute once offline, serve precomputed columns
+Rationale: /api/network could only rank nodes by the stored connection_count
+and the analysis scripts computed nothing beyond counts. Centrality and
+community structure are global properties (every score depends on the whole
+graph), so they are computed by scripts/analysis/compute_network_metrics.py
+and persisted next to entity_network.json; the API only looks them up.
+
+Algorithms (numpy over the GraphEngine CSR arrays; no scipy/networkx
+dependency):
+- pagerank: weighted power iteration, damping 0.85, dangling mass spread
+  uniformly
+- eigenvector_centrality: power iteration on A + dI, d = max weighted degree
+  (by Gershgorin the shifted spectrum is non-negative, so a hub-and-spoke
+  eigenvalue near -λmax cannot stall convergence), unit L2 norm
+- betweenness_centrality: Brandes over hop-count shortest paths (the paths
+  GraphEngine returns); with `samples` < n, sources are sampled and scores
+  rescaled by n / samples (unbiased estimate)
+- louvain_communities: weighted modularity optimization with graph
+  aggregation; communities numbered by size (0 = largest)
+
+Graphs (both over the entity_network.json node set):
+- flight: entity_network.json edges (flight co-occurrence counts)
+- coappearance: entities mentioned in the same document
+  (document_entity_index.json; weight = shared documents)
+
+File format (entity_network_metrics.json, columnar):
+    {"schema_version", "generated", "source_digest", "node_ids": [...],
+     "graphs": {"flight": {"edges", "modularity", "communities",
+                           "metrics": {"pagerank": [...], ...}}, ...}}
+
+Trade-offs:
+- Betweenness is unweighted (hops); edge weights count co-occurrences, which
+  are similarities, not distances
+- Louvain is order-dependent; a fixed seed makes runs reproducible
+- Scores go stale when entity_network.json changes (detected by content
+  digest and reported by the API) until the script is re-run
+"""
+
+import hashlib
+import json
+import logging
+import random
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from services.graph_engine import GraphEngine
+
+
+logger = logging.getLogger(__name__)
+
+METRICS_SCHEMA_VERSION = 1
+
+METRIC_NAMES = ("degree", "weighted_degree", "pagerank", "betweenness", "eigenvector")
+
+# Sources sampled for approximate betweenness (exact below this many nodes)
+BETWEENNESS_SAMPLES = 1000
+
+
+def _slot_rows(graph: GraphEngine) -> np.ndarray:
+    """Row (source node) of each CSR slot"""
+    return np.repeat(np.arange(len(graph)), graph.degree)
+
+
+def _spmv(graph: GraphEngine, rows: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """y = A·x for the symmetric weighted adjacency A"""
+    return np.bincount(rows, weights=graph.weights * x[graph.indices], minlength=len(graph))
+
+
+# ==================== Centrality ====================
+
+
+def pagerank(
+    graph: GraphEngine, damping: float = 0.85, tol: float = 1e-10, max_iter: int = 200
+) -> np.ndarray:
+    """Weighted PageRank (sums to 1)"""
+    n = len(graph)
+    if n == 0:
+        return np.zeros(0)
+    rows = _slot_rows(graph)
+    out_weight = graph.weighted_degree
+    dangling = out_weight == 0
+    inverse = np.divide(1.0, out_weight, out=np.zeros(n), where=~dangling)
+
+    x = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        spread = _spmv(graph, rows, x * inverse)
+        x_new = damping * (spread + x[dangling].sum() / n) + (1 - damping) / n
+        if np.abs(x_new - x).sum() < n * tol:
+            return x_new
+        x = x_new
+    logger.warning(f"PageRank did not converge in {max_iter} iterations")
+    return x
+
+
+def eigenvector_centrality(
+    graph: GraphEngine, tol: float = 1e-8, max_iter: int = 1000
+) -> np.ndarray:
+    """Eigenvector centrality (unit L2 norm; isolated nodes → ~0)"""
+    n = len(graph)
+    if n == 0 or graph.n_edges == 0:
+        return np.zeros(n)
+    rows = _slot_rows(graph)
+    shift = graph.weighted_degree.max()
+
+    x = np.full(n, 1.0 / np.sqrt(n))
+    for _ in range(max_iter):
+        x_new = _spmv(graph, rows, x) + shift * x
+        x_new /= np.linalg.norm(x_new)
+        if np.abs(x_new - x).sum() < n * tol:
+            return x_new
+        x = x_new
+    logger.warning(f"Eigenvector centrality did not converge in {max_iter} iterations")
+    return x
+
+
+def betweenness_centrality(
+    graph: GraphEngine, samples: Optional[int] = BETWEENNESS_SAMPLES, seed: int = 0
+) -> np.ndarray:
+    """
+    Normalized betweenness over hop-count shortest paths (Brandes).
+
+    Args:
+        graph: Graph to score
+        samples: Source nodes to sample (None or >= n: exact)
+        seed: Sampling seed
+
+    Returns:
+        Scores in [0, 1] (fraction of shortest paths between other pairs)
+    """
+    n = len(graph)
+    scores = np.zeros(n)
+    if n < 3:
+        return scores
+
+    if samples is None or samples >= n:
+        sources = range(n)
+        scale = 1.0
+    else:
+        sources = random.Random(seed).sample(range(n), samples)
+        scale = n / samples
+
+    indptr, indices = graph.indptr.tolist(), graph.indices.tolist()
+    for source in sources:
+        # Single-source shortest paths: BFS order, path counts, predecessors
+        order = []
+        predecessors = [[] for _ in range(n)]
+        sigma = [0] * n
+        sigma[source] = 1
+        distance = [-1] * n
+        distance[source] = 0
+        frontier = [source]
+        while frontier:
+            next_frontier = []
+            for node in frontier:
+                order.append(node)
+                for slot in range(indptr[node], indptr[node + 1]):
+                    neighbor = indices[slot]
+                    if distance[neighbor] < 0:
+                        distance[neighbor] = distance[node] + 1
+                        next_frontier.append(neighbor)
+                    if distance[neighbor] == distance[node] + 1:
+                        sigma[neighbor] += sigma[node]
+                        predecessors[neighbor].append(node)
+            frontier = next_frontier
+
+        # Dependency accumulation in reverse BFS order
+        delta = [0.0] * n
+        for node in reversed(order):
+            coefficient = (1.0 + delta[node]) / sigma[node]
+            for predecessor in predecessors[node]:
+                delta[predecessor] += sigma[predecessor] * coefficient
+            if node != source:
+                scores[node] += delta[node]
+
+    # Undirected: each pair counted from both ends; normalize by (n-1)(n-2)/2 pairs
+    return scores * scale / ((n - 1) * (n - 2))
+
+
+# ==================== Communities ====================
+
+
+def louvain_communities(
+    graph: GraphEngine, resolution: float = 1.0, seed: int = 0, max_levels: int = 20
+) -> tuple[np.ndarray, float]:
+    """
+    Louvain community detection.
+
+    Returns:
+        (community per node, numbered by size with 0 = largest; modularity)
+    """
+    n = len(graph)
+    if n == 0:
+        return np.zeros(0, dtype=np.int32), 0.0
+
+    rng = random.Random(seed)
+    indptr, indices, weights = (
+        graph.indptr.tolist(),
+        graph.indices.tolist(),
+        graph.weights.tolist(),
+    )
+    adjacency: list[dict[int, float]] = [{} for _ in range(n)]
+    for node in range(n):
+        for slot in range(indptr[node], indptr[node + 1]):
+            neighbor = indices[slot]
+            adjacency[node][neighbor] = adjacency[node].get(neighbor, 0.0) + weights[slot]
+    loops = [0.0] * n  # internal weight of aggregated nodes
+    total = float(graph.weights.sum())  # 2m
+    membership = list(range(n))  # original node → current aggregated node
+
+    if total == 0:
+        return np.arange(n, dtype=np.int32), 0.0
+
+    for _ in range(max_levels):
+        size = len(adjacency)
+        strength = [sum(adjacency[i].values()) + 2 * loops[i] for i in range(size)]
+        community = list(range(size))
+        community_total = list(strength)
+
+        # Phase 1: move nodes to the neighbouring community with the best gain
+        moved_any = False
+        improved = True
+        order = list(range(size))
+        while improved:
+            improved = False
+            rng.shuffle(order)
+            for node in order:
+                current = community[node]
+                community_total[current] -= strength[node]
+
+                links: dict[int, float] = {}
+                for neighbor, weight in adjacency[node].items():
+                    links[community[neighbor]] = links.get(community[neighbor], 0.0) + weight
+
+                factor = resolution * strength[node] / total
+                best = current
+                best_gain = links.get(current, 0.0) - community_total[current] * factor
+                for candidate, weight in links.items():
+                    gain = weight - community_total[candidate] * factor
+                    if gain > best_gain + 1e-12:
+                        best, best_gain = candidate, gain
+
+                community_total[best] += strength[node]
+                if best != current:
+                    community[node] = best
+                    improved = moved_any = True
+
+        if not moved_any:
+            break
+
+        # Phase 2: aggregate communities into nodes
+        renumber = {c: i for i, c in enumerate(dict.fromkeys(community))}
+        membership = [renumber[community[m]] for m in membership]
+        new_adjacency: list[dict[int, float]] = [{} for _ in renumber]
+        new_loops = [0.0] * len(renumber)
+        for node in range(size):
+            c = renumber[community[node]]
+            new_loops[c] += loops[node]
+            for neighbor, weight in adjacency[node].items():
+                d = renumber[community[neighbor]]
+                if c == d:
+                    new_loops[c] += weight / 2  # seen from both endpoints
+                else:
+                    new_adjacency[c][d] = new_adjacency[c].get(d, 0.0) + weight
+        adjacency, loops = new_adjacency, new_loops
+
+    labels = np.asarray(membership, dtype=np.int32)
+    sizes = np.bincount(labels)
+    rank = np.empty_like(sizes)
+    rank[np.lexsort((np.arange(len(sizes)), -sizes))] = np.arange(len(sizes))
+    labels = rank[labels].astype(np.int32)
+    return labels, modularity(graph, labels, resolution)
+
+
+def modularity(graph: GraphEngine, labels: np.ndarray, resolution: float = 1.0) -> float:
+    """Newman modularity of a partition (weighted)"""
+    total = float(graph.weights.sum())
+    if total == 0:
+        return 0.0
+    rows = _slot_rows(graph)
+    internal = graph.weights[labels[rows] == labels[graph.indices]].sum()
+    community_strength = np.bincount(labels, weights=graph.weighted_degree)
+    return float(internal / total - resolution * ((community_strength / total) ** 2).sum())
+
+
+# ==================== Offline computation ====================
+
+
+def compute_graph_metrics(
+    graph: GraphEngine, betweenness_samples: Optional[int] = BETWEENNESS_SAMPLES, seed: int = 0
+) -> dict:
+    """All metric columns for one graph (JSON-ready)"""
+    communities, graph_modularity = louvain_communities(graph, seed=seed)
+    return {
+        "edges": graph.n_edges,
+        "modularity": round(graph_modularity, 6),
+        "communities": int(communities.max()) + 1 if len(communities) else 0,
+        "metrics": {
+            "degree": graph.degree.tolist(),
+            "weighted_degree": graph.weighted_degree.tolist(),
+            "pagerank": np.round(pagerank(graph), 8).tolist(),
+            "betweenness": np.round(
+                betweenness_centrality(graph, betweenness_samples, seed), 8
+            ).tolist(),
+            "eigenvector": np.round(eigenvector_centrality(graph), 8).tolist(),
+            "community": communities.tolist(),
+        },
+    }
+
+
+def file_digest(path: Path) -> str:
+    """Content digest used to detect a metrics file computed for another network"""
+    return hashlib.sha1(Path(path).read_bytes()).hexdigest()
+
+
+# ==================== Serving ====================
+
+
+class NetworkMetrics:
+    """
+    Precomputed per-node metrics, looked up by network node ID.
+
+    Usage:
+        metrics = NetworkMetrics.load(METRICS_PATH, NETWORK_PATH)
+        metrics.node_metrics("jeffrey_epstein", "flight")["pagerank"]
+    """
+
+    def __init__(self, data: dict, stale: bool = False):
+        self.data = data
+        self.stale = stale
+        self.graphs: dict[str, dict] = data.get("graphs", {})
+        self.row = {node_id: position for position, node_id in enumerate(data["node_ids"])}
+
+    @classmethod
+    def load(
+        cls, metrics_path: Path, network_path: Optional[Path] = None
+    ) -> Optional["NetworkMetrics"]:
+        """
+        Load a metrics file (None if missing or unreadable).
+
+        Marks the metrics stale when network_path's content no longer matches
+        the network they were computed from.
+        """
+        metrics_path = Path(metrics_path)
+        if not metrics_path.exists():
+            return None
+        try:
+            with open(metrics_path) as f:
+                data = json.load(f)
+            if data.get("schema_version") != METRICS_SCHEMA_VERSION:
+                logger.warning(f"Unsupported metrics schema in {metrics_path}")
+                return None
+            stale = bool(
+                network_path
+                and Path(network_path).exists()
+                and data.get("source_digest") != file_digest(network_path)
+            )
+            if stale:
+                logger.warning(
+                    f"{metrics_path.name} was computed for a different entity network; "
+                    "re-run scripts/analysis/compute_network_metrics.py"
+                )
+            return cls(data, stale)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Could not load network metrics {metrics_path}: {e}")
+            return None
+
+    def node_metrics(self, node_id: str, graph: str = "flight") -> Optional[dict]:
+        """All metric values for a node in one graph (None if unknown)"""
+        position = self.row.get(node_id)
+        columns = self.graphs.get(graph, {}).get("metrics")
+        if position is None or columns is None:
+            return None
+        return {name: values[position] for name, values in columns.items()}
+
+    def score(self, node_id: str, metric: str, graph: str = "flight") -> float:
+        """One metric value (0 for unknown nodes)"""
+        position = self.row.get(node_id)
+        columns = self.graphs.get(graph, {}).get("metrics", {})
+        if position is None or metric not in columns:
+            return 0
+        return columns[metric][position]
+
+    def summary(self) -> dict:
+        """Metadata block for API responses"""
+        return {
+            "available": True,
+            "generated": self.data.get("generated"),
+            "stale": self.stale,
+            "graphs": {
+                name: {key: graph[key] for key in ("edges", "modularity", "communities")}
+                for name, graph in self.graphs.items()
+            },
+        }
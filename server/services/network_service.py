@@ -8,7 +8,8 @@ in one service for consistency and maintainability.
 Handles:
 - Network graph filtering (min connections, max nodes)
 - Entity deduplication in network
-- Graph traversal (shortest path, subgraphs)
+- Graph traversal (shortest path, subgraphs) on a resident CSR graph
+  (GraphEngine, built once per load instead of per request)
 - Network statistics
 """
 
@@ -26,6 +27,7 @@ from entity_filtering import EntityFilter
 # Import disambiguator
 sys.path.insert(0, str(Path(__file__).parent))
 from entity_disambiguation import get_disambiguator
+from graph_engine import GraphEngine
 
 
 class NetworkService:
@@ -46,6 +48,7 @@ class NetworkService:
 
         # Data cache
         self.network_data: dict = {}
+        self.graph = GraphEngine.from_network({})
 
         # Load data
         self.load_data()
@@ -56,6 +59,7 @@ class NetworkService:
         if network_path.exists():
             with open(network_path) as f:
                 self.network_data = json.load(f)
+        self.graph = GraphEngine.from_network(self.network_data)
 
     def get_network(
         self,
@@ -101,13 +105,13 @@ class NetworkService:
             # Find entity node
             entity_node = next((n for n in nodes if n.get("name") == entity_filter), None)
             if entity_node:
-                # Get connected node IDs
+                # Get connected node IDs (CSR row of the entity)
                 connected_ids = {entity_node["id"]}
-                for edge in edges:
-                    if edge["source"] == entity_node["id"]:
-                        connected_ids.add(edge["target"])
-                    elif edge["target"] == entity_node["id"]:
-                        connected_ids.add(edge["source"])
+                center = self.graph.index.get(entity_node["id"])
+                if center is not None:
+                    connected_ids.update(
+                        self.graph.node_ids[n] for n in self.graph.neighbors(center)
+                    )
 
                 # Filter nodes
                 nodes = [n for n in nodes if n["id"] in connected_ids]
@@ -143,29 +147,31 @@ class NetworkService:
             },
         }
 
-    def find_shortest_path(self, entity_a: str, entity_b: str) -> dict:
+    def find_shortest_path(
+        self, entity_a: str, entity_b: str, k: int = 1, max_hops: Optional[int] = None
+    ) -> dict:
         """Find shortest path between two entities
 
         Args:
             entity_a: First entity name
             entity_b: Second entity name
+            k: Number of paths to return (k > 1 adds "alternatives")
+            max_hops: Maximum path length (None: unbounded)
 
         Returns:
             {
                 "path": List of entity names in path,
                 "edges": List of edges in path,
                 "distance": Number of hops,
-                "found": Whether path exists
+                "found": Whether path exists,
+                "alternatives": Next-shortest paths (only when k > 1)
             }
         """
-        # Find entity nodes
-        nodes = self.network_data.get("nodes", [])
-        edges = self.network_data.get("edges", [])
+        graph = self.graph
+        source = graph.name_index.get(entity_a)
+        target = graph.name_index.get(entity_b)
 
-        node_a = next((n for n in nodes if n.get("name") == entity_a), None)
-        node_b = next((n for n in nodes if n.get("name") == entity_b), None)
-
-        if not node_a or not node_b:
+        if source is None or target is None:
             return {
                 "path": [],
                 "edges": [],
@@ -174,64 +180,34 @@ class NetworkService:
                 "error": "One or both entities not found in network",
             }
 
-        # Build adjacency list
-        adjacency = {}
-        edge_map = {}
-        for edge in edges:
-            source = edge["source"]
-            target = edge["target"]
-
-            if source not in adjacency:
-                adjacency[source] = []
-            if target not in adjacency:
-                adjacency[target] = []
-
-            adjacency[source].append(target)
-            adjacency[target].append(source)
-
-            edge_map[(source, target)] = edge
-            edge_map[(target, source)] = edge
-
-        # BFS to find shortest path
-        from collections import deque
-
-        queue = deque([(node_a["id"], [node_a["id"]])])
-        visited = {node_a["id"]}
-
-        while queue:
-            current_id, path = queue.popleft()
-
-            if current_id == node_b["id"]:
-                # Found path - convert to entity names
-                path_nodes = [next(n for n in nodes if n["id"] == nid) for nid in path]
-                path_names = [n["name"] for n in path_nodes]
-
-                # Get edges in path
-                path_edges = []
-                for i in range(len(path) - 1):
-                    edge = edge_map.get((path[i], path[i + 1]))
-                    if edge:
-                        path_edges.append(edge)
-
-                return {
-                    "path": path_names,
-                    "edges": path_edges,
-                    "distance": len(path) - 1,
-                    "found": True,
-                }
-
-            # Explore neighbors
-            for neighbor_id in adjacency.get(current_id, []):
-                if neighbor_id not in visited:
-                    visited.add(neighbor_id)
-                    queue.append((neighbor_id, [*path, neighbor_id]))
+        if k > 1:
+            paths = graph.k_shortest_paths(source, target, k, max_hops=max_hops)
+        else:
+            path = graph.shortest_path(source, target, max_hops=max_hops)
+            paths = [path] if path else []
+
+        if not paths:
+            return {
+                "path": [],
+                "edges": [],
+                "distance": -1,
+                "found": False,
+                "error": "No path exists between entities",
+            }
+
+        result = {**self._path_result(paths[0]), "found": True}
+        if k > 1:
+            result["alternatives"] = [self._path_result(path) for path in paths[1:]]
+        return result
 
+    def _path_result(self, path: list[int]) -> dict:
+        """Entity names, edge dicts and hop count for a path of node ints"""
+        nodes = self.network_data.get("nodes", [])
+        edges = self.network_data.get("edges", [])
         return {
-            "path": [],
-            "edges": [],
-            "distance": -1,
-            "found": False,
-            "error": "No path exists between entities",
+            "path": [nodes[n]["name"] for n in path],
+            "edges": [edges[position] for position in self.graph.path_edges(path)],
+            "distance": len(path) - 1,
         }
 
     def get_entity_subgraph(
@@ -242,7 +218,7 @@ class NetworkService:
         Args:
             entity_name: Entity name
             max_hops: Maximum degrees of separation
-            min_strength: Minimum connection strength
+            min_strength: Minimum connection strength (edge weight)
 
         Returns:
             {
@@ -251,55 +227,25 @@ class NetworkService:
                 "edges": List of edges in subgraph
             }
         """
-        # Find entity node
         nodes = self.network_data.get("nodes", [])
         edges = self.network_data.get("edges", [])
 
-        entity_node = next((n for n in nodes if n.get("name") == entity_name), None)
-
-        if not entity_node:
+        center = self.graph.name_index.get(entity_name)
+        if center is None:
             return {
                 "center": None,
                 "nodes": [],
                 "edges": [],
                 "error": "Entity not found in network",
             }
+        entity_node = nodes[center]
 
-        # BFS to find nodes within max_hops
-        from collections import deque
-
-        visited = {entity_node["id"]: 0}  # node_id -> hop distance
-        queue = deque([(entity_node["id"], 0)])
-
-        while queue:
-            current_id, distance = queue.popleft()
-
-            if distance >= max_hops:
-                continue
-
-            # Find connected edges
-            for edge in edges:
-                if edge.get("flight_count", 0) < min_strength:
-                    continue
-
-                neighbor_id = None
-                if edge["source"] == current_id:
-                    neighbor_id = edge["target"]
-                elif edge["target"] == current_id:
-                    neighbor_id = edge["source"]
-
-                if neighbor_id and neighbor_id not in visited:
-                    visited[neighbor_id] = distance + 1
-                    queue.append((neighbor_id, distance + 1))
-
-        # Get nodes and edges in subgraph
-        subgraph_nodes = [n for n in nodes if n["id"] in visited]
+        # k-hop neighbourhood over edges at least min_strength heavy
+        members = self.graph.bfs(center, max_hops=max_hops, min_weight=min_strength)
+        subgraph_nodes = [nodes[n] for n in sorted(members)]
         subgraph_edges = [
-            e
-            for e in edges
-            if e["source"] in visited
-            and e["target"] in visited
-            and e.get("flight_count", 0) >= min_strength
+            edges[position]
+            for position in self.graph.induced_edges(members, min_weight=min_strength)
         ]
 
         return {
@@ -0,0 +1,401 @@
+"""
+OCR Corpus - Packed, memory-mapped store for the House Oversight OCR text
+
+Design Decision: A few large shard files plus an offset index
+Rationale: ocr_text/ holds ~67k small files (<stem>.txt + <stem>.json per
+PDF). Every consumer (document summaries, /similar text loading, the vector
+store builder, entity linking, classifiers) paid an open()/read()/close()
+per document, and full-corpus passes were bound by syscalls and directory
+lookups rather than disk bandwidth. The packed corpus stores the same
+records back to back:
+
+    ocr_corpus/shard-<gen>-0000.bin ...  records (text, then metadata JSON)
+    ocr_corpus/index.json                {"version", "compression", "shards",
+                                          "doc_ids": [...], "columns": {"shard",
+                                          "offset", "length", "text_length",
+                                          "meta_offset", "meta_length"}}
+
+- Shards are mmapped: a lookup is a dict probe plus a slice of the mapping
+  (`get_bytes` returns a memoryview into it for uncompressed corpora - no
+  copy until the text is decoded)
+- Records are written in sorted doc-ID order, so `iter_texts` streams each
+  shard front to back (sequential I/O, MADV_SEQUENTIAL where supported)
+- Compression is per record: "none", "zlib" (stdlib) or "zstd" (optional
+  `zstandard` package); each record decompresses independently, so random
+  access stays O(1)
+
+Lookups (`read_ocr_text`, `read_ocr_metadata`) use the packed corpus when it
+exists and fall back to the loose files for documents it does not contain,
+or whose loose file is newer than index.json (re-OCRed since the last pack),
+so the corpus can be adopted (or rebuilt) without breaking readers or
+serving stale text.
+
+Each pack writes its shards under fresh names (`<gen>` is unique per
+writer) that only the new index.json references, and publishes by swapping
+index.json last. A reader loads either the old index with the old shards or
+the new index with the new shards, never a mix; old shards are unlinked
+after the swap (open mappings stay valid).
+
+Trade-offs:
+- Read-only: re-run scripts/extraction/pack_ocr_corpus.py after OCR adds or
+  changes documents (the reader reloads when index.json changes)
+- Lookups of packed documents stat() the loose file to detect re-OCR
+- The index is JSON (~2 MB for 33k documents, loaded once per process)
+
+Performance (33k documents): full-corpus pass is one sequential read of the
+shards instead of 33k open() calls; single lookups avoid the per-file open.
+"""
+
+import json
+import logging
+import mmap
+import os
+import threading
+import uuid
+import zlib
+from array import array
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+OCR_SOURCE_DIR = PROJECT_ROOT / "data" / "sources" / "house_oversight_nov2025"
+DEFAULT_TEXT_DIR = OCR_SOURCE_DIR / "ocr_text"
+DEFAULT_CORPUS_DIR = OCR_SOURCE_DIR / "ocr_corpus"
+
+CORPUS_VERSION = 1
+COMPRESSIONS = ("none", "zlib", "zstd")
+
+# Start a new shard once the current one exceeds this many bytes
+DEFAULT_SHARD_BYTES = 256 * 1024 * 1024
+
+INDEX_COLUMNS = ("shard", "offset", "length", "text_length", "meta_offset", "meta_length")
+
+
+def _compressor(compression: str):
+    if compression == "none":
+        return lambda data: data
+    if compression == "zlib":
+        return lambda data: zlib.compress(data, 6)
+    if compression == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstd compression requires the zstandard package")
+        return zstandard.ZstdCompressor(level=3).compress
+    raise ValueError(f"compression must be one of: {', '.join(COMPRESSIONS)}")
+
+
+def _decompressor(compression: str):
+    if compression == "none":
+        return None
+    if compression == "zlib":
+        return zlib.decompress
+    if compression == "zstd":
+        if zstandard is None:
+            raise RuntimeError("This corpus is zstd-compressed; install the zstandard package")
+        return zstandard.ZstdDecompressor().decompress
+    raise ValueError(f"Unknown corpus compression: {compression}")
+
+
+def write_json_atomic(path: Path, data: dict):
+    temp_path = path.with_name(path.name + ".tmp")
+    with open(temp_path, "w") as f:
+        json.dump(data, f)
+    os.replace(temp_path, path)
+
+
+class OCRCorpusWriter:
+    """
+    Builds a packed corpus directory.
+
+    Usage:
+        with OCRCorpusWriter(corpus_dir, compression="zlib") as writer:
+            writer.add("DOJ-OGR-00000001", text, metadata)
+
+    Shards are written under names unique to this writer, which no published
+    index references; closing publishes them by atomically replacing
+    index.json, then removes the previous corpus' shards. Readers see the old
+    corpus or the new one, never a partial one. On error the new shards are
+    removed and the published corpus is left untouched.
+    """
+
+    def __init__(
+        self,
+        corpus_dir: Path,
+        compression: str = "none",
+        shard_bytes: int = DEFAULT_SHARD_BYTES,
+    ):
+        self.corpus_dir = Path(corpus_dir)
+        self.compression = compression
+        self.compress = _compressor(compression)
+        self.shard_bytes = shard_bytes
+        self.generation = uuid.uuid4().hex[:12]
+
+        self.doc_ids: list[str] = []
+        self.columns = {name: array("q") for name in INDEX_COLUMNS}
+        self.shards: list[str] = []
+        self._file = None
+        self._position = 0
+        self.corpus_dir.mkdir(parents=True, exist_ok=True)
+
+    def _open_shard(self):
+        if self._file:
+            self._file.close()
+        name = f"shard-{self.generation}-{len(self.shards):04d}.bin"
+        self.shards.append(name)
+        self._file = open(self.corpus_dir / name, "wb")
+        self._position = 0
+
+    def _write(self, data: bytes) -> int:
+        offset = self._position
+        self._file.write(data)
+        self._position += len(data)
+        return offset
+
+    def add(self, doc_id: str, text: str, metadata: Optional[dict] = None):
+        """Append one document (text and optional metadata)"""
+        if self._file is None or self._position >= self.shard_bytes:
+            self._open_shard()
+
+        body = self.compress(text.encode("utf-8"))
+        meta = self.compress(json.dumps(metadata).encode("utf-8")) if metadata else b""
+
+        self.doc_ids.append(doc_id)
+        self.columns["shard"].append(len(self.shards) - 1)
+        self.columns["offset"].append(self._write(body))
+        self.columns["length"].append(len(body))
+        self.columns["text_length"].append(len(text))
+        self.columns["meta_offset"].append(self._write(meta))
+        self.columns["meta_length"].append(len(meta))
+
+    def close(self):
+        """Publish the new shards by swapping in the index, then remove the old shards"""
+        if self._file:
+            self._file.close()
+            self._file = None
+
+        write_json_atomic(
+            self.corpus_dir / "index.json",
+            {
+                "version": CORPUS_VERSION,
+                "compression": self.compression,
+                "shards": self.shards,
+                "doc_ids": self.doc_ids,
+                "columns": {name: column.tolist() for name, column in self.columns.items()},
+            },
+        )
+
+        current = set(self.shards)
+        for path in self.corpus_dir.glob("shard-*.bin"):
+            if path.name not in current:
+                path.unlink()
+
+    def __enter__(self) -> "OCRCorpusWriter":
+        return self
+
+    def abort(self):
+        """Discard this writer's shards without publishing them"""
+        if self._file:
+            self._file.close()
+            self._file = None
+        for name in self.shards:
+            (self.corpus_dir / name).unlink(missing_ok=True)
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class OCRCorpus:
+    """
+    Read-only, memory-mapped packed corpus.
+
+    Usage:
+        corpus = OCRCorpus(DEFAULT_CORPUS_DIR)
+        text = corpus.get_text("DOJ-OGR-00000001")
+        for doc_id, text in corpus.iter_texts():
+            ...
+    """
+
+    def __init__(self, corpus_dir: Path):
+        self.corpus_dir = Path(corpus_dir)
+        index_path = self.corpus_dir / "index.json"
+        with open(index_path) as f:
+            # mtime of the index actually read, even if it is swapped meanwhile
+            self.index_mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+            index = json.load(f)
+        if index.get("version") != CORPUS_VERSION:
+            raise ValueError(f"Unsupported OCR corpus version in {index_path}")
+
+        self.compression = index["compression"]
+        self.decompress = _decompressor(self.compression)
+        self.doc_ids: list[str] = index["doc_ids"]
+        self.row = {doc_id: position for position, doc_id in enumerate(self.doc_ids)}
+        self.columns = {name: array("q", index["columns"][name]) for name in INDEX_COLUMNS}
+
+        self.shards = []
+        for name in index["shards"]:
+            with open(self.corpus_dir / name, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    self.shards.append(b"")
+                    continue
+                self.shards.append(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def __len__(self) -> int:
+        return len(self.doc_ids)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self.row
+
+    def _record(self, position: int, meta: bool = False) -> Union[memoryview, bytes]:
+        prefix = "meta_" if meta else ""
+        offset = self.columns[prefix + "offset"][position]
+        length = self.columns[prefix + "length"][position]
+        shard = self.shards[self.columns["shard"][position]]
+        data = memoryview(shard)[offset : offset + length]
+        return self.decompress(data) if self.decompress else data
+
+    def get_bytes(self, doc_id: str) -> Optional[Union[memoryview, bytes]]:
+        """UTF-8 text bytes (a view into the mapping when uncompressed; None if absent)"""
+        position = self.row.get(doc_id)
+        return None if position is None else self._record(position)
+
+    def get_text(self, doc_id: str) -> Optional[str]:
+        position = self.row.get(doc_id)
+        if position is None:
+            return None
+        return str(self._record(position), "utf-8")
+
+    def get_metadata(self, doc_id: str) -> Optional[dict]:
+        position = self.row.get(doc_id)
+        if position is None or not self.columns["meta_length"][position]:
+            return None
+        return json.loads(bytes(self._record(position, meta=True)))
+
+    def text_length(self, doc_id: str) -> Optional[int]:
+        position = self.row.get(doc_id)
+        return None if position is None else self.columns["text_length"][position]
+
+    def iter_texts(self) -> Iterator[tuple[str, str]]:
+        """(doc_id, text) for every document, in storage order (sequential reads)"""
+        for shard in self.shards:
+            if isinstance(shard, mmap.mmap) and hasattr(mmap, "MADV_SEQUENTIAL"):
+                shard.madvise(mmap.MADV_SEQUENTIAL)
+        for position, doc_id in enumerate(self.doc_ids):
+            yield doc_id, str(self._record(position), "utf-8")
+
+
+def pack_directory(
+    text_dir: Path,
+    corpus_dir: Path,
+    compression: str = "none",
+    shard_bytes: int = DEFAULT_SHARD_BYTES,
+) -> int:
+    """
+    Convert an ocr_text/ directory (<stem>.txt + optional <stem>.json) into a packed corpus.
+
+    Returns:
+        Number of documents packed
+    """
+    text_dir = Path(text_dir)
+    with os.scandir(text_dir) as entries:
+        stems = sorted(entry.name[:-4] for entry in entries if entry.name.endswith(".txt"))
+
+    with OCRCorpusWriter(corpus_dir, compression, shard_bytes) as writer:
+        for stem in stems:
+            with open(text_dir / f"{stem}.txt", encoding="utf-8", errors="replace") as f:
+                text = f.read()
+            metadata = None
+            try:
+                with open(text_dir / f"{stem}.json", encoding="utf-8") as f:
+                    metadata = json.load(f)
+            except FileNotFoundError:
+                pass
+            except ValueError as e:
+                logger.warning(f"Skipping unreadable OCR metadata for {stem}: {e}")
+            writer.add(stem, text, metadata)
+    return len(stems)
+
+
+# ==================== Shared reader ====================
+
+_corpora: dict[Path, Optional[OCRCorpus]] = {}
+_corpora_lock = threading.Lock()
+
+
+def get_ocr_corpus(corpus_dir: Path = DEFAULT_CORPUS_DIR) -> Optional[OCRCorpus]:
+    """
+    Process-wide reader for a corpus directory (None if it has not been packed).
+
+    Reloads when index.json changes (one stat() per call). A load that races
+    a re-pack (old index, shards already removed) returns None until the next
+    call sees the new index.
+    """
+    corpus_dir = Path(corpus_dir).resolve()
+    try:
+        mtime_ns = (corpus_dir / "index.json").stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    with _corpora_lock:
+        corpus = _corpora.get(corpus_dir)
+        if corpus is None or corpus.index_mtime_ns != mtime_ns:
+            try:
+                corpus = OCRCorpus(corpus_dir)
+                logger.info(f"Loaded packed OCR corpus: {len(corpus)} documents")
+            except (OSError, ValueError, KeyError, RuntimeError) as e:
+                logger.warning(f"Ignoring packed OCR corpus {corpus_dir}: {e}")
+                corpus = None
+            _corpora[corpus_dir] = corpus
+    return corpus
+
+
+def _newer_than_corpus(path: Path, corpus: OCRCorpus) -> bool:
+    """Whether a loose file was written after the corpus was packed"""
+    try:
+        return path.stat().st_mtime_ns > corpus.index_mtime_ns
+    except FileNotFoundError:
+        return False
+
+
+def read_ocr_text(
+    base_name: str,
+    text_dir: Path = DEFAULT_TEXT_DIR,
+    corpus_dir: Path = DEFAULT_CORPUS_DIR,
+) -> Optional[str]:
+    """OCR text for a document (packed corpus, unless ocr_text/<base_name>.txt is newer)"""
+    corpus = get_ocr_corpus(corpus_dir)
+    path = Path(text_dir) / f"{base_name}.txt"
+    if corpus is not None and base_name in corpus and not _newer_than_corpus(path, corpus):
+        return corpus.get_text(base_name)
+    try:
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def read_ocr_metadata(
+    base_name: str,
+    text_dir: Path = DEFAULT_TEXT_DIR,
+    corpus_dir: Path = DEFAULT_CORPUS_DIR,
+) -> Optional[dict]:
+    """OCR metadata for a document (packed corpus, unless ocr_text/<base_name>.json is newer)"""
+    corpus = get_ocr_corpus(corpus_dir)
+    path = Path(text_dir) / f"{base_name}.json"
+    if corpus is not None and base_name in corpus and not _newer_than_corpus(path, corpus):
+        return corpus.get_metadata(base_name)
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
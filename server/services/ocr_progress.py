@@ -0,0 +1,362 @@
+"""
+OCR Progress Store - Per-document OCR outcomes with running counters
+
+Design Decision: SQLite rows plus a counters table instead of ocr_progress.json
+Rationale: ocr_house_oversight.py kept `completed`, `failed` and
+`email_candidates` as ever-growing lists in ocr_progress.json and rewrote the
+whole file after every batch; check_ocr_status.py re-parsed it, and
+/api/ingestion/status ran that script in a subprocess on every request and
+scraped its printed output. The OCR run now writes one small transaction per
+finished document, and readers answer status from a fixed-size counters
+table:
+
+Schema (data/sources/house_oversight_nov2025/ocr_progress.db):
+- documents(file, status, error, is_email, email_confidence, email_addresses,
+  page_count, text_length, updated_at): latest outcome per PDF
+- counters(name, value): completed / failed / emails_found / pages_ocred,
+  adjusted in the same transaction as the document row (a retried failure
+  moves from `failed` to `completed`, it is not counted twice)
+- meta(key, value): total_files, start_time, last_update
+
+Concurrency: one writer (the OCR run's main process; page workers only write
+page files), any number of readers. WAL mode keeps readers from blocking the
+writer; the API opens the database read-only.
+
+Migration: `import_legacy_progress` loads an existing ocr_progress.json once,
+so `--resume` keeps skipping documents finished under the old format. Stores
+given a `legacy_path` (the API's shared store, check_ocr_status.py) do the
+same on first access when the database does not exist yet, so status is
+served from a tree that only has ocr_progress.json. The import is built in
+a temporary file and linked into place (never replacing a database an OCR
+run created meanwhile).
+
+Performance:
+- Status read: two primary-key-table scans over 4 + 3 rows, independent of
+  corpus size (was: subprocess + full JSON parse)
+- Write: one transaction per document (was: full JSON rewrite per batch)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DEFAULT_OCR_PROGRESS_DB_PATH = (
+    PROJECT_ROOT / "data" / "sources" / "house_oversight_nov2025" / "ocr_progress.db"
+)
+DEFAULT_LEGACY_PROGRESS_PATH = DEFAULT_OCR_PROGRESS_DB_PATH.with_suffix(".json")
+
+# House Oversight Nov 2025 release size (used until a run records total_files)
+DEFAULT_TOTAL_FILES = 33572
+
+COUNTERS = ("completed", "failed", "emails_found", "pages_ocred")
+
+# Seconds without a write before a running OCR job is reported as stalled
+STALL_SECONDS = 300
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    file TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    error TEXT,
+    is_email INTEGER NOT NULL DEFAULT 0,
+    email_confidence REAL NOT NULL DEFAULT 0,
+    email_addresses TEXT NOT NULL DEFAULT '[]',
+    page_count INTEGER,
+    text_length INTEGER NOT NULL DEFAULT 0,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_documents_status ON documents(status, updated_at);
+CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+
+class OCRProgressStore:
+    """
+    SQLite-backed OCR progress.
+
+    Usage (OCR run):
+        store = OCRProgressStore(PROGRESS_DB)
+        store.start_run(total_files=len(all_pdfs))
+        done = store.completed_files()
+        store.record_document({"file": "X.pdf", "success": True, ...}, pages_ocred=12)
+
+    Usage (API):
+        get_ocr_progress_store().status()
+    """
+
+    def __init__(
+        self, db_path: Path = DEFAULT_OCR_PROGRESS_DB_PATH, legacy_path: Optional[Path] = None
+    ):
+        """
+        Args:
+            db_path: Progress database
+            legacy_path: ocr_progress.json to import on first access when
+                db_path does not exist (None: never import implicitly)
+        """
+        self.db_path = Path(db_path)
+        self.legacy_path = Path(legacy_path) if legacy_path else None
+        self._local = threading.local()
+        self._migrate_lock = threading.Lock()
+
+    @contextmanager
+    def get_connection(self):
+        """Read-write connection (WAL, so readers are not blocked)"""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path))
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        try:
+            conn.executescript(SCHEMA)
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def _reader(self) -> Optional[sqlite3.Connection]:
+        """Per-thread read-only connection (None until the OCR run creates the database)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self._import_legacy_file()
+            if not self.db_path.exists():
+                return None
+            conn = sqlite3.connect(
+                f"file:{self.db_path}?mode=ro", uri=True, check_same_thread=False
+            )
+            self._local.conn = conn
+        return conn
+
+    # ==================== Writing ====================
+
+    @staticmethod
+    def _touch(conn: sqlite3.Connection, now: str):
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('last_update', ?)", (now,))
+
+    @staticmethod
+    def _add(conn: sqlite3.Connection, name: str, delta: int):
+        if delta:
+            conn.execute(
+                "INSERT INTO counters (name, value) VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+                (name, delta),
+            )
+
+    def start_run(self, total_files: int, fresh: bool = False):
+        """Record a run start; `fresh` discards all previous progress"""
+        now = datetime.now().isoformat()
+        with self.get_connection() as conn:
+            if fresh:
+                conn.execute("DELETE FROM documents")
+                conn.execute("DELETE FROM counters")
+                conn.execute("DELETE FROM meta")
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('total_files', ?)",
+                (str(total_files),),
+            )
+            conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('start_time', ?)", (now,))
+            self._touch(conn, now)
+
+    def record_document(self, result: dict, pages_ocred: int = 0):
+        """
+        Store a document outcome and adjust the counters in one transaction.
+
+        Args:
+            result: OCR result dict ("file", "success", "error", "is_email",
+                "email_confidence", "email_addresses", "page_count", "text_length")
+            pages_ocred: Pages OCRed for this document in this run
+        """
+        self.record_documents([result], pages_ocred)
+
+    def record_documents(self, results: Iterable[dict], pages_ocred: int = 0):
+        """Batch form of record_document (pages_ocred is the batch total)"""
+        now = datetime.now().isoformat()
+        with self.get_connection() as conn:
+            for result in results:
+                status = "completed" if result.get("success") else "failed"
+                is_email = bool(result.get("is_email")) and status == "completed"
+                previous = conn.execute(
+                    "SELECT status, is_email FROM documents WHERE file = ?", (result["file"],)
+                ).fetchone()
+                if previous:
+                    self._add(conn, previous[0], -1)
+                    self._add(conn, "emails_found", -previous[1])
+                self._add(conn, status, 1)
+                self._add(conn, "emails_found", int(is_email))
+
+                conn.execute(
+                    "INSERT OR REPLACE INTO documents (file, status, error, is_email, "
+                    "email_confidence, email_addresses, page_count, text_length, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        result["file"],
+                        status,
+                        result.get("error"),
+                        int(is_email),
+                        result.get("email_confidence") or 0.0,
+                        json.dumps(result.get("email_addresses") or []),
+                        result.get("page_count"),
+                        result.get("text_length") or 0,
+                        now,
+                    ),
+                )
+            self._add(conn, "pages_ocred", pages_ocred)
+            self._touch(conn, now)
+
+    def import_legacy_progress(self, progress: dict) -> int:
+        """
+        Import an ocr_progress.json dict (completed / failed / email_candidates lists).
+
+        Returns:
+            Number of documents imported
+        """
+        emails = {candidate["file"]: candidate for candidate in progress.get("email_candidates", [])}
+        failed = {entry["file"]: entry.get("error") for entry in progress.get("failed", [])}
+        completed = set(progress.get("completed", []))
+        results = [
+            {
+                "file": name,
+                "success": True,
+                "is_email": name in emails,
+                "email_confidence": emails.get(name, {}).get("confidence", 0.0),
+                "email_addresses": emails.get(name, {}).get("email_addresses", []),
+            }
+            for name in progress.get("completed", [])
+        ]
+        results += [
+            {"file": name, "success": False, "error": error}
+            for name, error in failed.items()
+            if name not in completed
+        ]
+        self.record_documents(results)
+        # The legacy format may lack start_time (but not last_update); keep the
+        # legacy last_update so stall detection reflects the old run, not the import
+        stats = progress.get("stats", {})
+        legacy_meta = {
+            "start_time": stats.get("start_time") or stats.get("last_update"),
+            "last_update": stats.get("last_update"),
+        }
+        with self.get_connection() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [(key, value) for key, value in legacy_meta.items() if value],
+            )
+        return len(results)
+
+    def _import_legacy_file(self):
+        """Create the database from legacy_path if neither it nor an OCR run has yet"""
+        if self.legacy_path is None or self.db_path.exists() or not self.legacy_path.exists():
+            return
+        with self._migrate_lock:
+            if self.db_path.exists():
+                return
+            with open(self.legacy_path) as f:
+                progress = json.load(f)
+
+            temp_path = self.db_path.with_name(f"{self.db_path.name}.{os.getpid()}.tmp")
+            temp_path.unlink(missing_ok=True)
+            try:
+                OCRProgressStore(temp_path).import_legacy_progress(progress)
+                os.link(temp_path, self.db_path)
+            except FileExistsError:
+                pass  # an OCR run created the database meanwhile; it wins
+            finally:
+                temp_path.unlink(missing_ok=True)
+
+    # ==================== Reading ====================
+
+    def completed_files(self) -> set[str]:
+        """PDF names finished successfully (resume skips these)"""
+        conn = self._reader()
+        if conn is None:
+            return set()
+        rows = conn.execute("SELECT file FROM documents WHERE status = 'completed'")
+        return {row[0] for row in rows}
+
+    def recent_failures(self, limit: int = 5) -> list[dict]:
+        conn = self._reader()
+        if conn is None:
+            return []
+        rows = conn.execute(
+            "SELECT file, error FROM documents WHERE status = 'failed' "
+            "ORDER BY updated_at DESC LIMIT ?",
+            (limit,),
+        )
+        return [{"file": file, "error": error} for file, error in rows]
+
+    def email_candidates(self) -> list[dict]:
+        conn = self._reader()
+        if conn is None:
+            return []
+        rows = conn.execute(
+            "SELECT file, email_confidence, email_addresses FROM documents "
+            "WHERE is_email = 1 ORDER BY file"
+        )
+        return [
+            {"file": file, "confidence": confidence, "email_addresses": json.loads(addresses)}
+            for file, confidence, addresses in rows
+        ]
+
+    def status(self) -> dict:
+        """
+        Counters and run metadata (constant-time).
+
+        Returns:
+            {"started", "completed", "failed", "emails_found", "pages_ocred",
+             "total_files", "progress" (percent), "start_time", "last_update",
+             "stalled"}
+        """
+        status = {
+            "started": False,
+            **{name: 0 for name in COUNTERS},
+            "total_files": DEFAULT_TOTAL_FILES,
+            "progress": 0.0,
+            "start_time": None,
+            "last_update": None,
+            "stalled": False,
+        }
+        conn = self._reader()
+        if conn is None:
+            return status
+        try:
+            counters = dict(conn.execute("SELECT name, value FROM counters"))
+            meta = dict(conn.execute("SELECT key, value FROM meta"))
+        except sqlite3.OperationalError:  # created but not yet initialized
+            return status
+
+        status.update({name: counters.get(name, 0) for name in COUNTERS})
+        status["started"] = "start_time" in meta
+        status["total_files"] = int(meta.get("total_files") or DEFAULT_TOTAL_FILES)
+        status["start_time"] = meta.get("start_time")
+        status["last_update"] = meta.get("last_update")
+        if status["total_files"]:
+            status["progress"] = round(status["completed"] * 100 / status["total_files"], 2)
+        if status["last_update"] and status["completed"] < status["total_files"]:
+            idle = datetime.now() - datetime.fromisoformat(status["last_update"])
+            status["stalled"] = idle.total_seconds() > STALL_SECONDS
+        return status
+
+
+_store: Optional[OCRProgressStore] = None
+_store_lock = threading.Lock()
+
+
+def get_ocr_progress_store() -> OCRProgressStore:
+    """Get the process-wide progress store for the default database
+
+    Imports ocr_progress.json on first access when the database does not exist.
+    """
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = OCRProgressStore(legacy_path=DEFAULT_LEGACY_PROGRESS_PATH)
+    return _store
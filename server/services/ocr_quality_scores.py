@@ -0,0 +1,105 @@
+"""
+OCR Quality Scores - Per-document OCR quality for ranking
+
+Design Decision: Precomputed columnar scores file
+Rationale: scripts/analysis/score_ocr_quality.py scores the whole OCR corpus
+offline (scripts/core/ocr_quality.py, in parallel) and writes
+data/metadata/ocr_quality_scores.json:
+
+    {"schema_version", "generated", "lexicon", "doc_ids": [...],
+     "overall": [...], "word": [...], "corruption": [...], "line": [...]}
+
+The API loads the overall column once into a dict and down-ranks documents
+whose OCR is mostly garbage, instead of scoring text per request; the vector
+store builder copies the score into each document's metadata.
+
+Ranking: score = similarity * (1 - weight + weight * quality). A weight of 0
+keeps pure similarity; documents without a score keep their similarity.
+
+Trade-offs:
+- Scores go stale when OCR is re-run (re-run the scorer; the file is
+  reloaded when its mtime changes)
+"""
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Optional
+
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DEFAULT_SCORES_PATH = PROJECT_ROOT / "data" / "metadata" / "ocr_quality_scores.json"
+
+SCORES_SCHEMA_VERSION = 1
+SCORE_COLUMNS = ("overall", "word", "corruption", "line")
+
+# Default share of the ranking score taken by OCR quality
+DEFAULT_QUALITY_WEIGHT = 0.3
+
+
+def quality_adjusted(similarity: float, quality: Optional[float], weight: float) -> float:
+    """Similarity scaled by OCR quality (unchanged when the document has no score)"""
+    if quality is None or not weight:
+        return similarity
+    return similarity * (1.0 - weight + weight * quality)
+
+
+class OCRQualityScores:
+    """
+    Read-only per-document OCR quality.
+
+    Usage:
+        scores = get_ocr_quality_scores()
+        if scores:
+            quality = scores.get("DOJ-OGR-00000001")  # overall score or None
+    """
+
+    def __init__(self, path: Path = DEFAULT_SCORES_PATH):
+        self.path = Path(path)
+        self.mtime_ns = self.path.stat().st_mtime_ns
+        with open(self.path) as f:
+            data = json.load(f)
+        if data.get("schema_version") != SCORES_SCHEMA_VERSION:
+            raise ValueError(f"Unsupported OCR quality schema in {self.path}")
+        self.generated = data.get("generated")
+        self.lexicon = data.get("lexicon")
+        self.scores: dict[str, float] = dict(zip(data["doc_ids"], data["overall"]))
+
+    def get(self, doc_id: str) -> Optional[float]:
+        return self.scores.get(doc_id)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self.scores
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+
+_scores: Optional[OCRQualityScores] = None
+_scores_lock = threading.Lock()
+
+
+def get_ocr_quality_scores(path: Path = DEFAULT_SCORES_PATH) -> Optional[OCRQualityScores]:
+    """
+    Process-wide scores (None until score_ocr_quality.py has been run).
+
+    Reloads when the file changes (one stat() per call).
+    """
+    global _scores
+    try:
+        mtime_ns = Path(path).stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    with _scores_lock:
+        if _scores is None or _scores.path != Path(path) or _scores.mtime_ns != mtime_ns:
+            try:
+                _scores = OCRQualityScores(path)
+                logger.info(f"Loaded OCR quality scores for {len(_scores)} documents")
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Ignoring OCR quality scores {path}: {e}")
+                return None
+        return _scores
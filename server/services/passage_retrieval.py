@@ -0,0 +1,134 @@
+"""
+Passage Retrieval - Aggregate chunk-level vector hits per document
+
+Design Decision: Chunk collection + per-document aggregation
+Rationale: The document collection holds one vector per OCR file, built from
+the first ~256 word pieces only, and search returned the first 300
+characters as the excerpt. The chunk collection (built with
+`build_vector_store.py --chunks`) holds one vector per overlapping token
+window with its parent document ID and character offsets. A query retrieves
+chunks, groups them by parent document, and returns each document once with
+its best-matching passage.
+
+Aggregation modes:
+- max: document score = best chunk similarity (precision; default)
+- sum: document score = sum of matched chunk similarities (rewards documents
+  that match the query in several places)
+
+Chunk metadata (written by the builder):
+- parent_doc_id, chunk_index, char_start, char_end
+- parent document metadata (filename, source, date_extracted, entity_mentions)
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+CHUNK_COLLECTION_NAME = "epstein_document_chunks"
+
+AGGREGATION_MODES = ("max", "sum")
+
+
+@dataclass
+class PassageHit:
+    """Best-matching chunk of a document"""
+
+    chunk_id: str
+    chunk_index: int
+    char_start: int
+    char_end: int
+    similarity: float
+    text: str
+
+
+@dataclass
+class DocumentHit:
+    """Document ranked by its aggregated chunk similarity"""
+
+    doc_id: str
+    score: float
+    passage: PassageHit
+    matched_chunks: int
+    metadata: dict = field(default_factory=dict)
+
+
+def aggregate_chunk_hits(
+    ids: list[str],
+    distances: list[float],
+    documents: list[str],
+    metadatas: list[dict],
+    mode: str = "max",
+) -> list[DocumentHit]:
+    """Group chunk query results by parent document
+
+    Args:
+        ids, distances, documents, metadatas: One ChromaDB query result row
+            (chunks ordered by distance)
+        mode: "max" or "sum"
+
+    Returns:
+        Documents ordered by aggregated score (ties by doc_id)
+
+    Raises:
+        ValueError: If mode is not an aggregation mode
+    """
+    if mode not in AGGREGATION_MODES:
+        raise ValueError(f"Unknown aggregation mode: {mode}")
+
+    by_doc: dict[str, DocumentHit] = {}
+
+    for chunk_id, distance, text, metadata in zip(ids, distances, documents, metadatas):
+        metadata = metadata or {}
+        doc_id = metadata.get("parent_doc_id") or chunk_id
+        similarity = 1 - distance
+
+        passage = PassageHit(
+            chunk_id=chunk_id,
+            chunk_index=int(metadata.get("chunk_index", 0)),
+            char_start=int(metadata.get("char_start", 0)),
+            char_end=int(metadata.get("char_end", len(text or ""))),
+            similarity=float(similarity),
+            text=text or "",
+        )
+
+        hit = by_doc.get(doc_id)
+        if hit is None:
+            doc_metadata = {
+                key: value
+                for key, value in metadata.items()
+                if key not in ("parent_doc_id", "chunk_index", "char_start", "char_end")
+            }
+            by_doc[doc_id] = DocumentHit(
+                doc_id=doc_id,
+                score=float(similarity),
+                passage=passage,
+                matched_chunks=1,
+                metadata=doc_metadata,
+            )
+            continue
+
+        hit.matched_chunks += 1
+        if mode == "sum":
+            hit.score += float(similarity)
+        else:
+            hit.score = max(hit.score, float(similarity))
+        if passage.similarity > hit.passage.similarity:
+            hit.passage = passage
+
+    return sorted(by_doc.values(), key=lambda hit: (-hit.score, hit.doc_id))
+
+
+def chunk_query_size(limit: int, oversample: int = 5, cap: int = 500) -> int:
+    """Number of chunks to retrieve for `limit` documents
+
+    Several chunks of one document usually rank together, so retrieve more
+    chunks than documents wanted.
+    """
+    return min(max(limit * oversample, limit), cap)
+
+
+def filter_hits(hits: list[DocumentHit], entity_filter: Optional[str]) -> list[DocumentHit]:
+    """Keep documents whose entity_mentions contain entity_filter"""
+    if not entity_filter:
+        return hits
+    return [hit for hit in hits if entity_filter in hit.metadata.get("entity_mentions", "")]
@@ -0,0 +1,244 @@
+"""
+Search Analytics - In-memory aggregator with a background flusher
+
+Design Decision: O(1) enqueue on the search path, batched atomic writes
+Rationale: unified_search used to mutate the analytics dict, rebuild the
+100-entry recent list and `json.dump(indent=2)` the whole file on every
+request, inside the async handler. Search latency included a full file
+rewrite, and concurrent requests serialized on disk I/O.
+
+Now:
+- `record()` puts one event on a queue (no lock, no I/O)
+- A daemon thread folds queued events into the aggregate and writes the
+  file when it is dirty and either `flush_interval` seconds have passed or
+  `flush_every` events are pending
+- Writes go to a temp file then `os.replace`, so readers never see a torn
+  file and a crash leaves the previous snapshot intact
+- Readers (`snapshot()`, `popular_queries()`) fold pending events first, so
+  results are current even between flushes
+- Listeners (the autocomplete index) receive changed query counts as events
+  are folded in
+
+File format is unchanged (total_searches, popular_queries, recent_searches,
+last_updated).
+
+Trade-offs:
+- Up to `flush_interval` seconds of events can be lost on a hard crash
+  (clean shutdown flushes via `close()`)
+- Recent searches are a bounded deque (newest first)
+"""
+
+import heapq
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+
+logger = logging.getLogger(__name__)
+
+RECENT_LIMIT = 100
+
+
+class SearchAnalytics:
+    """Aggregates search events in memory and persists them in the background"""
+
+    def __init__(
+        self,
+        path: Path,
+        flush_interval: float = 5.0,
+        flush_every: int = 200,
+        start: bool = True,
+    ):
+        """Load existing analytics and start the flusher
+
+        Args:
+            path: Analytics JSON file
+            flush_interval: Seconds between writes while dirty
+            flush_every: Pending events that trigger an early write
+            start: Start the background thread (tests flush manually)
+        """
+        self.path = Path(path)
+        self.flush_interval = flush_interval
+        self.flush_every = flush_every
+
+        self._events: queue.SimpleQueue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._dirty = False
+        self._unflushed = 0
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._listeners: list[Callable[[dict[str, int]], None]] = []
+
+        self._load()
+
+        if start:
+            self._thread = threading.Thread(target=self._run, name="search-analytics", daemon=True)
+            self._thread.start()
+
+    def _load(self) -> None:
+        data: dict[str, Any] = {}
+        if self.path.exists():
+            try:
+                with open(self.path) as f:
+                    data = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Could not read search analytics ({e}); starting fresh")
+
+        self.total_searches = int(data.get("total_searches", 0))
+        self.popular: dict[str, int] = dict(data.get("popular_queries", {}))
+        self.recent: deque = deque(
+            data.get("recent_searches", [])[:RECENT_LIMIT], maxlen=RECENT_LIMIT
+        )
+        self.last_updated = data.get("last_updated", datetime.utcnow().isoformat())
+
+    # ==================== Hot Path ====================
+
+    def record(self, query: str, fields: Any = None) -> None:
+        """Enqueue one search event (O(1), never touches disk)"""
+        self._events.put((query, datetime.utcnow().isoformat(), fields))
+        if self._events.qsize() >= self.flush_every:
+            self._wakeup.set()
+
+    # ==================== Aggregation ====================
+
+    def _drain(self) -> int:
+        """Fold queued events into the aggregate (caller holds the lock)"""
+        applied = 0
+        updated: dict[str, int] = {}
+        while True:
+            try:
+                query, timestamp, fields = self._events.get_nowait()
+            except queue.Empty:
+                break
+            self.total_searches += 1
+            self.popular[query] = self.popular.get(query, 0) + 1
+            updated[query] = self.popular[query]
+            self.recent.appendleft({"query": query, "timestamp": timestamp, "fields": fields})
+            applied += 1
+
+        if applied:
+            self._dirty = True
+            self._unflushed += applied
+            self.last_updated = datetime.utcnow().isoformat()
+            self._notify(updated)
+        return applied
+
+    def _notify(self, updated: dict[str, int]) -> None:
+        for listener in self._listeners:
+            try:
+                listener(updated)
+            except Exception as e:
+                logger.error(f"Search analytics listener failed: {e}")
+
+    def add_listener(self, listener: Callable[[dict[str, int]], None]) -> None:
+        """Call listener(query -> new count) whenever popular counts change
+
+        The listener is first called with all current counts, atomically with
+        registration, so it never misses or reorders an update.
+        """
+        with self._lock:
+            self._drain()
+            listener(dict(self.popular))
+            self._listeners.append(listener)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Current analytics in the on-disk format"""
+        with self._lock:
+            self._drain()
+            return {
+                "total_searches": self.total_searches,
+                "popular_queries": dict(self.popular),
+                "recent_searches": list(self.recent),
+                "last_updated": self.last_updated,
+            }
+
+    def popular_queries(self) -> dict[str, int]:
+        """Query -> search count"""
+        with self._lock:
+            self._drain()
+            return dict(self.popular)
+
+    def top_queries(self, limit: int) -> list[tuple[str, int]]:
+        """Most searched queries, highest count first"""
+        with self._lock:
+            self._drain()
+            return heapq.nlargest(limit, self.popular.items(), key=lambda item: item[1])
+
+    def clear_recent(self) -> None:
+        """Forget recent searches (popular query counts are kept)"""
+        with self._lock:
+            self._drain()
+            self.recent.clear()
+            self.last_updated = datetime.utcnow().isoformat()
+            self._dirty = True
+        self._wakeup.set()
+
+    # ==================== Persistence ====================
+
+    def flush(self) -> bool:
+        """Write the aggregate if it changed
+
+        Returns:
+            True if the file was written
+        """
+        with self._write_lock:
+            with self._lock:
+                self._drain()
+                if not self._dirty:
+                    return False
+                data = {
+                    "total_searches": self.total_searches,
+                    "popular_queries": dict(self.popular),
+                    "recent_searches": list(self.recent),
+                    "last_updated": self.last_updated,
+                }
+                self._dirty = False
+                self._unflushed = 0
+
+            # Serialize and write outside the aggregate lock; readers don't wait on disk
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_name(f".{self.path.name}.tmp")
+                with open(tmp_path, "w") as f:
+                    json.dump(data, f, indent=2)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                logger.error(f"Failed to write search analytics: {e}")
+                with self._lock:
+                    self._dirty = True
+                return False
+            return True
+
+    def _run(self) -> None:
+        last_flush = time.monotonic()
+        while not self._stopped.is_set():
+            self._wakeup.wait(timeout=min(self.flush_interval, 1.0))
+            self._wakeup.clear()
+
+            with self._lock:
+                self._drain()
+                due = self._dirty and (
+                    self._unflushed >= self.flush_every
+                    or time.monotonic() - last_flush >= self.flush_interval
+                )
+            if due:
+                self.flush()
+                last_flush = time.monotonic()
+
+    def close(self) -> None:
+        """Stop the flusher and write pending events"""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self.flush()
@@ -0,0 +1,261 @@
+"""
+Summary Store - Persistent AI document summaries keyed by document hash and model
+
+Design Decision: SQLite table instead of fields in master_document_index.json
+Rationale: /api/documents/{document_id}/ai-summary re-read the whole master
+index to find one document and, after each new summary, rewrote the whole
+file with json.dump(indent=2) - tens of MB written per summary, with
+concurrent writers able to drop each other's summaries. Summaries now live
+in their own table (one indexed row per document and model, written in one
+small transaction); the master index is only read, through the shared
+DocumentCatalog (O(1) hash lookup, reloaded when the file changes).
+
+Single-flight: Concurrent requests for a summary that isn't cached yet
+(e.g. a document page opened by several users at once) await one shared
+extraction + LLM call instead of each paying for their own. Failures are
+not cached; the next request retries.
+
+Schema (data/metadata/document_summaries.db):
+- summaries(document_id, model, summary, generated_at, word_count,
+  text_source), primary key (document_id, model)
+
+Migration: summaries already stored in master_document_index.json are
+imported once (`import_documents`) so they keep being served from cache.
+
+Trade-offs:
+- A lookup falls back to a summary from another model if none exists for the
+  configured one (a model switch doesn't regenerate every summary)
+- Single-flight is per process; separate workers may still duplicate a call
+"""
+
+import asyncio
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Hashable, Iterable, Optional
+
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DEFAULT_SUMMARY_DB_PATH = PROJECT_ROOT / "data" / "metadata" / "document_summaries.db"
+
+# PDF pages read for a summary (the prompt uses the first 8,000 characters)
+MAX_PDF_PAGES = 50
+
+SUMMARY_COLUMNS = ("document_id", "model", "summary", "generated_at", "word_count", "text_source")
+
+
+class SummaryStore:
+    """
+    SQLite-backed summary cache.
+
+    Usage:
+        store = get_summary_store()
+        cached = store.get(document_hash, model)
+        if cached is None:
+            cached = store.put(document_hash, model, summary_text, "ocr")
+    """
+
+    def __init__(self, db_path: Path = DEFAULT_SUMMARY_DB_PATH):
+        self.db_path = Path(db_path)
+        self._local = threading.local()
+        with self.get_connection():
+            pass
+
+    @contextmanager
+    def get_connection(self):
+        """Read-write connection (WAL, so readers are not blocked)"""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path))
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        try:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS summaries (
+                    document_id TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    summary TEXT NOT NULL,
+                    generated_at TEXT NOT NULL,
+                    word_count INTEGER NOT NULL,
+                    text_source TEXT NOT NULL,
+                    PRIMARY KEY (document_id, model)
+                )
+                """
+            )
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def _reader(self) -> sqlite3.Connection:
+        """Per-thread connection for lookups"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+        return conn
+
+    def get(self, document_id: str, model: Optional[str] = None) -> Optional[dict]:
+        """
+        Cached summary for a document.
+
+        Args:
+            document_id: Document hash
+            model: Preferred model; falls back to the newest summary from any model
+
+        Returns:
+            Summary record (SUMMARY_COLUMNS) or None
+        """
+        row = self._reader().execute(
+            f"SELECT {', '.join(SUMMARY_COLUMNS)} FROM summaries WHERE document_id = ? "
+            "ORDER BY model = ? DESC, generated_at DESC LIMIT 1",
+            (document_id, model or ""),
+        ).fetchone()
+        return dict(row) if row else None
+
+    def put(
+        self,
+        document_id: str,
+        model: str,
+        summary: str,
+        text_source: str,
+        generated_at: Optional[str] = None,
+    ) -> dict:
+        """Store (or replace) a summary; returns the stored record"""
+        record = {
+            "document_id": document_id,
+            "model": model,
+            "summary": summary,
+            "generated_at": generated_at or datetime.now().isoformat(),
+            "word_count": len(summary.split()),
+            "text_source": text_source,
+        }
+        with self.get_connection() as conn:
+            conn.execute(
+                f"INSERT OR REPLACE INTO summaries ({', '.join(SUMMARY_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(SUMMARY_COLUMNS))})",
+                tuple(record[column] for column in SUMMARY_COLUMNS),
+            )
+        return record
+
+    def import_documents(self, documents: Iterable[dict]) -> int:
+        """
+        Import summaries stored inline in master_document_index.json.
+
+        Existing rows win (INSERT OR IGNORE), so re-running is harmless.
+
+        Returns:
+            Number of summaries imported
+        """
+        rows = [
+            (
+                doc["hash"],
+                doc.get("summary_model") or "unknown",
+                doc["summary"],
+                doc.get("summary_generated_at") or "unknown",
+                doc.get("summary_word_count") or len(doc["summary"].split()),
+                doc.get("summary_text_source") or "unknown",
+            )
+            for doc in documents
+            if doc.get("hash") and doc.get("summary")
+        ]
+        if not rows:
+            return 0
+        with self.get_connection() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                f"INSERT OR IGNORE INTO summaries ({', '.join(SUMMARY_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(SUMMARY_COLUMNS))})",
+                rows,
+            )
+            imported = conn.total_changes - before
+        logger.info(f"Imported {imported} summaries from the master document index")
+        return imported
+
+    def __len__(self) -> int:
+        return self._reader().execute("SELECT COUNT(*) FROM summaries").fetchone()[0]
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent async calls with the same key into one execution.
+
+    The shared call is shielded: a disconnected client cancels only its own
+    wait, not the work other callers are waiting on.
+    """
+
+    def __init__(self):
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(future)
+
+    def _finish(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if not future.cancelled():
+            future.exception()  # mark retrieved even if every waiter went away
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._inflight
+
+
+def extract_pdf_text(pdf_path: Path, max_pages: int = MAX_PDF_PAGES) -> str:
+    """
+    Extract text from the first pages of a PDF (blocking; run in a thread).
+
+    Raises:
+        ValueError: If no text could be extracted
+    """
+    from pypdf import PdfReader
+
+    reader = PdfReader(str(pdf_path))
+    parts = []
+    for page_num in range(min(len(reader.pages), max_pages)):
+        try:
+            parts.append(reader.pages[page_num].extract_text() + "\n")
+        except Exception as e:
+            logger.warning(f"Failed to extract page {page_num}: {e}")
+
+    text = "".join(parts)
+    if not text.strip():
+        raise ValueError("No text could be extracted from PDF")
+    return text
+
+
+# Store instances keyed by resolved database path
+_stores: dict[Path, SummaryStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_summary_store(db_path: Optional[Path] = None) -> SummaryStore:
+    """
+    Get shared SummaryStore for a database file.
+
+    Args:
+        db_path: Path to the summary database (default: data/metadata/document_summaries.db)
+
+    Returns:
+        Process-wide SummaryStore instance for that path
+    """
+    path = Path(db_path or DEFAULT_SUMMARY_DB_PATH).resolve()
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = SummaryStore(path)
+            _stores[path] = store
+    return store
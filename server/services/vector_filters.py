@@ -0,0 +1,322 @@
+"""
+Vector Filters - Normalized filter metadata and filter pushdown for ChromaDB
+
+Design Decision: Filter inside the vector store, not after it
+Rationale: Endpoints fetched a fixed candidate list (`n_results=limit * 2`,
+`n_results=50`) and then dropped candidates by date or entity in Python, so
+a selective filter silently returned fewer results than requested (often
+none). Dates were free-form strings ("3/14/2005", "March 14, 2005",
+"2024-11-18T09:00:00") and entities a comma-joined string, neither of which
+ChromaDB can range-filter or match exactly.
+
+Index-time metadata (written by build_vector_store.py and
+embed_news_articles.py via `filter_metadata`):
+- date:        ISO "YYYY-MM-DD" (display and exact matches)
+- date_epoch:  int seconds since 1970-01-01 UTC (range filters: $gte/$lte)
+- entity_ids:  list of normalized entity keys (exact match: $contains)
+- filter_version: FILTER_SCHEMA_VERSION
+
+Query time: `where_clauses` turns date range / entity / equality filters
+into one ChromaDB where clause, and `query_filtered` re-queries with a
+doubled candidate count while filters that cannot be pushed down (similarity
+thresholds, boolean text post-filters) leave the page under-filled.
+
+Collections built before this schema have none of these keys; a range
+filter on them would match nothing. `supports_pushdown` only enables
+pushdown once every row in the collection carries filter_version, so a
+partly migrated or resumed store (some rows re-indexed, others not) keeps
+the previous Python predicates (`legacy_*`) inside the same re-query loop
+instead of silently dropping its unmarked rows.
+
+Trade-offs:
+- Entity pushdown is an exact match on the normalized entity name
+  ("ghislaine maxwell"), not a substring match ("maxwell")
+- Documents without a parseable date are excluded by any date filter
+- Re-indexing is required to enable pushdown on an existing store
+"""
+
+import re
+import threading
+import time
+from datetime import date
+from typing import Any, Callable, Optional
+
+
+FILTER_SCHEMA_VERSION = 1
+
+# Re-query loop bounds
+OVERFETCH_FACTOR = 2
+MAX_CANDIDATES = 1000
+
+# Unsupported (legacy) collections are re-probed after this many seconds
+PUSHDOWN_RECHECK_SECONDS = 60.0
+
+MONTHS = {
+    name: number
+    for number, name in enumerate(
+        [
+            "january",
+            "february",
+            "march",
+            "april",
+            "may",
+            "june",
+            "july",
+            "august",
+            "september",
+            "october",
+            "november",
+            "december",
+        ],
+        1,
+    )
+}
+
+ISO_DATE = re.compile(r"^\s*(\d{4})-(\d{1,2})-(\d{1,2})")
+US_DATE = re.compile(r"^\s*(\d{1,2})/(\d{1,2})/(\d{2}|\d{4})\s*$")
+LONG_DATE = re.compile(r"^\s*([A-Za-z]+)\.?\s+(\d{1,2}),?\s+(\d{4})\s*$")
+
+EPOCH = date(1970, 1, 1)
+
+
+# ==================== Index-time normalization ====================
+
+
+def normalize_date(value: Any) -> Optional[str]:
+    """
+    Parse a free-form date to ISO "YYYY-MM-DD".
+
+    Accepts ISO dates/datetimes, MM/DD/YYYY (two-digit years: 00-29 -> 20xx,
+    else 19xx) and "Month D, YYYY". Returns None when unparseable.
+    """
+    if not value or not isinstance(value, str):
+        return None
+
+    match = ISO_DATE.match(value)
+    if match:
+        year, month, day = (int(part) for part in match.groups())
+    else:
+        match = US_DATE.match(value)
+        if match:
+            month, day, year = (int(part) for part in match.groups())
+            if year < 100:
+                year += 2000 if year < 30 else 1900
+        else:
+            match = LONG_DATE.match(value)
+            if not match or match.group(1).lower() not in MONTHS:
+                return None
+            month = MONTHS[match.group(1).lower()]
+            day, year = int(match.group(2)), int(match.group(3))
+
+    try:
+        return date(year, month, day).isoformat()
+    except ValueError:
+        return None
+
+
+def date_to_epoch(iso_date: str) -> int:
+    """Seconds since 1970-01-01 UTC at midnight of an ISO date"""
+    return (date.fromisoformat(iso_date) - EPOCH).days * 86400
+
+
+def date_metadata(value: Any) -> dict:
+    """date/date_epoch metadata for a raw date value ({} if unparseable)
+
+    ChromaDB rejects None metadata values, so missing dates omit the keys.
+    """
+    iso_date = normalize_date(value)
+    if iso_date is None:
+        return {}
+    return {"date": iso_date, "date_epoch": date_to_epoch(iso_date)}
+
+
+def entity_key(name: str) -> str:
+    """Normalized entity key: lowercase, single spaces"""
+    return " ".join(name.lower().split())
+
+
+def entity_metadata(names: list[str]) -> dict:
+    """entity_ids metadata for detected entity names ({} if none)"""
+    keys = sorted({entity_key(name) for name in names if name and name.strip()})
+    return {"entity_ids": keys} if keys else {}
+
+
+def filter_metadata(raw_date: Any, entity_names: list[str]) -> dict:
+    """All pushdown-filter metadata for one record"""
+    return {
+        **date_metadata(raw_date),
+        **entity_metadata(entity_names),
+        "filter_version": FILTER_SCHEMA_VERSION,
+    }
+
+
+# ==================== Query-time filters ====================
+
+
+def parse_date_bound(value: Optional[str]) -> Optional[str]:
+    """
+    Normalize a date filter parameter.
+
+    Returns:
+        ISO date, or None if no bound was given
+
+    Raises:
+        ValueError: If the value is not a recognizable date
+    """
+    if not value:
+        return None
+    iso_date = normalize_date(value)
+    if iso_date is None:
+        raise ValueError(f"Invalid date: {value!r} (expected YYYY-MM-DD)")
+    return iso_date
+
+
+def where_clauses(
+    equals: Optional[dict[str, Any]] = None,
+    date_start: Optional[str] = None,
+    date_end: Optional[str] = None,
+    entity: Optional[str] = None,
+    extra: Optional[list[dict]] = None,
+) -> Optional[dict]:
+    """
+    Build a ChromaDB where clause.
+
+    Args:
+        equals: field -> value equality filters (None values skipped)
+        date_start, date_end: Inclusive ISO date bounds (pushed to date_epoch)
+        entity: Entity name (pushed to entity_ids $contains)
+        extra: Further raw clauses, e.g. {"credibility_score": {"$gte": 0.8}}
+
+    Returns:
+        Single clause, {"$and": [...]} for several, or None for no filters
+
+    Raises:
+        ValueError: If a date bound is not a valid date
+    """
+    clauses = [{key: value} for key, value in (equals or {}).items() if value is not None]
+    clauses.extend(extra or [])
+
+    for bound, operator in ((date_start, "$gte"), (date_end, "$lte")):
+        iso_date = parse_date_bound(bound)
+        if iso_date:
+            clauses.append({"date_epoch": {operator: date_to_epoch(iso_date)}})
+
+    if entity:
+        clauses.append({"entity_ids": {"$contains": entity_key(entity)}})
+
+    if not clauses:
+        return None
+    return clauses[0] if len(clauses) == 1 else {"$and": clauses}
+
+
+def legacy_date_match(
+    metadata: dict, date_start: Optional[str], date_end: Optional[str], field: str
+) -> bool:
+    """Python date-range check for records indexed before filter_version 1
+
+    Records without a parseable date pass (previous behaviour).
+    """
+    if not date_start and not date_end:
+        return True
+    record_date = metadata.get("date") or normalize_date(metadata.get(field, ""))
+    if not record_date:
+        return True
+    if date_start and record_date < parse_date_bound(date_start):
+        return False
+    if date_end and record_date > parse_date_bound(date_end):
+        return False
+    return True
+
+
+def legacy_entity_match(metadata: dict, entity: Optional[str]) -> bool:
+    """Python entity check (case-insensitive substring of entity_mentions)"""
+    if not entity:
+        return True
+    return entity.lower() in metadata.get("entity_mentions", "").lower()
+
+
+# Collection name -> (supports pushdown, checked at)
+_pushdown_support: dict[str, tuple[bool, float]] = {}
+_pushdown_lock = threading.Lock()
+
+
+def supports_pushdown(collection) -> bool:
+    """
+    Whether every row of a collection carries filter_version metadata.
+
+    A single marked row is not enough: rows indexed before the schema lack
+    date_epoch/entity_ids and would never match a pushed-down filter. The
+    probe compares the number of marked rows (ids only) with the collection
+    count.
+
+    Cached per collection name; a negative result is re-probed every
+    PUSHDOWN_RECHECK_SECONDS so a re-index is picked up without a restart.
+    A positive result is final, since current indexers mark every row they
+    write. Blocking (ChromaDB I/O) - call via asyncio.to_thread from routes.
+    """
+    now = time.monotonic()
+    with _pushdown_lock:
+        cached = _pushdown_support.get(collection.name)
+    if cached and (cached[0] or now - cached[1] < PUSHDOWN_RECHECK_SECONDS):
+        return cached[0]
+
+    try:
+        total = collection.count()
+        marked = collection.get(
+            where={"filter_version": {"$gte": FILTER_SCHEMA_VERSION}}, include=[]
+        )
+        supported = total > 0 and len(marked["ids"]) == total
+    except Exception:
+        supported = False
+
+    with _pushdown_lock:
+        _pushdown_support[collection.name] = (supported, now)
+    return supported
+
+
+def query_filtered(
+    collection,
+    query_embedding: list[float],
+    n_results: int,
+    where: Optional[dict] = None,
+    accept: Optional[Callable[[str, float, str, dict], bool]] = None,
+    min_similarity: Optional[float] = None,
+    max_candidates: int = MAX_CANDIDATES,
+) -> list[tuple[str, float, str, dict]]:
+    """
+    Vector query that keeps fetching until n_results hits pass the filters.
+
+    Pushed-down filters go in `where`; `accept(id, similarity, text,
+    metadata)` covers the rest. The candidate count starts at
+    n_results * OVERFETCH_FACTOR and doubles while the page is under-filled,
+    stopping when the collection is exhausted, similarities fall below
+    min_similarity (results are ordered), or max_candidates is reached.
+
+    Returns:
+        (id, similarity, text, metadata) tuples, best first
+    """
+    fetch = min(max(n_results * OVERFETCH_FACTOR, 1), max_candidates)
+
+    while True:
+        results = collection.query(
+            query_embeddings=[query_embedding], n_results=fetch, where=where
+        )
+        ids = results["ids"][0]
+
+        hits = []
+        exhausted = len(ids) < fetch
+        for i, doc_id in enumerate(ids):
+            similarity = 1 - results["distances"][0][i]
+            if min_similarity is not None and similarity < min_similarity:
+                exhausted = True
+                break
+            text = results["documents"][0][i]
+            metadata = results["metadatas"][0][i]
+            if accept is None or accept(doc_id, similarity, text, metadata):
+                hits.append((doc_id, similarity, text, metadata))
+                if len(hits) >= n_results:
+                    return hits
+
+        if exhausted or fetch >= max_candidates:
+            return hits
+        fetch = min(fetch * 2, max_candidates)
@@ -0,0 +1,124 @@
+"""
+Token-Window Text Chunker
+
+Design Decision: Overlapping token windows with character offsets
+Rationale: all-MiniLM-L6-v2 reads at most 256 word pieces, so embedding a
+whole OCR file silently drops everything after the first page or so. Splitting
+into overlapping windows gives every part of a document its own vector, and
+the character offsets let search return the matched passage instead of the
+document's first 300 characters.
+
+Tokenization:
+- Default: whitespace-delimited words (no model dependency)
+- Builder: the embedding model's own tokenizer via `model_token_offsets`,
+  so windows line up with what the model actually reads
+
+Trade-offs:
+- Overlap duplicates ~20% of tokens across neighbouring chunks, so a passage
+  that straddles a boundary is still embedded whole in one chunk
+- Chunk text is sliced from the original string (offsets are exact, but
+  chunk boundaries fall on token starts/ends, not sentences)
+
+Usage:
+    for chunk in chunk_text(text, window=200, overlap=40):
+        print(chunk.index, chunk.start, chunk.end, chunk.text)
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+
+WORD_PATTERN = re.compile(r"\S+")
+
+TokenOffsets = Callable[[str], list[tuple[int, int]]]
+
+
+@dataclass
+class TextChunk:
+    """One window of a document: text[start:end]"""
+
+    index: int
+    start: int
+    end: int
+    text: str
+    token_count: int
+
+
+def word_offsets(text: str) -> list[tuple[int, int]]:
+    """Character spans of whitespace-delimited words"""
+    return [match.span() for match in WORD_PATTERN.finditer(text)]
+
+
+def model_token_offsets(tokenizer) -> TokenOffsets:
+    """Build an offsets function from a Hugging Face fast tokenizer
+
+    Special tokens are excluded; a window of N tokens therefore needs N + 2
+    positions in the model (CLS/SEP).
+    """
+
+    def offsets(text: str) -> list[tuple[int, int]]:
+        encoding = tokenizer(
+            text,
+            add_special_tokens=False,
+            return_offsets_mapping=True,
+            return_attention_mask=False,
+            truncation=False,
+            verbose=False,
+        )
+        return [(start, end) for start, end in encoding["offset_mapping"] if end > start]
+
+    return offsets
+
+
+def chunk_text(
+    text: str,
+    window: int = 200,
+    overlap: int = 40,
+    tokenize: Optional[TokenOffsets] = None,
+    min_tokens: int = 8,
+) -> list[TextChunk]:
+    """Split text into overlapping token windows
+
+    Args:
+        text: Document text
+        window: Tokens per chunk
+        overlap: Tokens shared by consecutive chunks
+        tokenize: Function returning token (start, end) character offsets
+                  (default: whitespace words)
+        min_tokens: A trailing chunk adding fewer new tokens than this is
+                    merged into the previous one (which may then exceed
+                    `window` by less than min_tokens)
+
+    Returns:
+        Chunks in document order (empty list for blank text)
+
+    Raises:
+        ValueError: If overlap is not smaller than window
+    """
+    if overlap >= window:
+        raise ValueError(f"overlap ({overlap}) must be smaller than window ({window})")
+
+    spans = (tokenize or word_offsets)(text)
+    if not spans:
+        return []
+
+    step = window - overlap
+    starts = list(range(0, max(len(spans) - overlap, 1), step))
+
+    # Fold a short tail into the previous window
+    if len(starts) > 1 and len(spans) - starts[-1] < min_tokens + overlap:
+        starts.pop()
+
+    chunks = []
+    for index, first in enumerate(starts):
+        last = len(spans) if index == len(starts) - 1 else min(first + window, len(spans))
+        start = spans[first][0]
+        end = spans[last - 1][1]
+        chunks.append(
+            TextChunk(
+                index=index, start=start, end=end, text=text[start:end], token_count=last - first
+            )
+        )
+
+    return chunks
@@ -0,0 +1,110 @@
+"""
+Unit Tests for the search autocomplete index
+
+Test Coverage:
+- Substring matching via bigram (2 chars) and trigram postings
+- Tiered ranking (exact > prefix > word prefix > substring) with popularity
+  tie-breaks and the popular-query boost
+- Typo-tolerant trigram fallback
+- Incremental entity sync and popular-query updates from search analytics
+
+Run tests:
+    pytest tests/unit/test_autocomplete_index.py -v
+"""
+
+import sys
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "server"))
+
+from services.autocomplete_index import AutocompleteIndex, set_popular_query, sync_entities
+from services.search_analytics import SearchAnalytics
+
+
+ENTITIES = [
+    {"name": "Maxwell, Ghislaine", "flights": 300, "sources": ["flight_logs"], "categories": []},
+    {"name": "Anne Maxwell", "flights": 0, "sources": ["black_book"]},
+    {"name": "Isabel Maxwell", "flights": 2, "sources": ["black_book"]},
+    {"name": "Maxwel", "flights": 0, "sources": []},
+    {
+        "name": "Alan Dershowitz",
+        "flights": 11,
+        "sources": ["black_book", "flight_logs"],
+        "aliases": ["Professor Dershowitz"],
+    },
+]
+
+
+def build() -> AutocompleteIndex:
+    index = AutocompleteIndex()
+    sync_entities(index, ENTITIES)
+    return index
+
+
+def texts(hits):
+    return [hit.text for hit in hits]
+
+
+def test_tiers_and_popularity():
+    hits = build().search("Maxwel", limit=10)
+    assert texts(hits) == ["Maxwel", "Maxwell, Ghislaine", "Isabel Maxwell", "Anne Maxwell"]
+    assert [hit.score for hit in hits] == [1.0, 0.95, 0.92, 0.92]
+    assert hits[1].type == "entity" and hits[1].metadata == {"categories": []}
+
+    assert texts(build().search("axwell", limit=1)) == ["Maxwell, Ghislaine"]
+
+
+def test_two_character_queries_and_aliases():
+    index = build()
+    assert set(texts(index.search("dE", limit=10))) == {
+        "Alan Dershowitz",
+        "Professor Dershowitz (Alan Dershowitz)",
+    }
+    alias = index.search("professor", limit=1)[0]
+    assert alias.type == "entity_alias"
+    assert alias.metadata == {"canonical_name": "Alan Dershowitz"}
+
+    assert index.search("x", limit=10) == []
+    assert index.search("zz", limit=10) == []
+
+
+def test_fuzzy_fallback():
+    index = build()
+    assert texts(index.search("dershowtz", limit=2)) == [
+        "Alan Dershowitz",
+        "Professor Dershowitz (Alan Dershowitz)",
+    ]
+    assert index.search("dershowtz", limit=1)[0].score < 0.85
+    assert index.search("qqqqqq", limit=5) == []
+
+
+def test_incremental_updates(tmp_path):
+    index = build()
+    assert len(index) == 6
+
+    changed = ENTITIES[:2] + [{"name": "Virginia Giuffre", "flights": 0, "sources": []}]
+    assert sync_entities(index, changed) == 5  # 4 removed, 1 added
+    assert texts(index.search("maxwell", limit=10)) == ["Maxwell, Ghislaine", "Anne Maxwell"]
+    assert texts(index.search("giuf", limit=10)) == ["Virginia Giuffre"]
+
+    # Entries that stay are refreshed, not only re-weighted
+    recategorized = [{**ENTITIES[0], "categories": ["associate"], "flights": 5}] + changed[1:]
+    assert sync_entities(index, recategorized) == 0
+    hit = index.search("maxwell, g", limit=1)[0]
+    assert hit.metadata == {"categories": ["associate"]}
+    assert texts(index.search("maxwell", limit=10)) == ["Maxwell, Ghislaine", "Anne Maxwell"]
+
+    analytics = SearchAnalytics(tmp_path / "analytics.json", start=False)
+    analytics.record("giuffre deposition")
+    analytics.add_listener(
+        lambda counts: [set_popular_query(index, q, c) for q, c in counts.items()]
+    )
+    hit = [hit for hit in index.search("giuf", limit=10) if hit.type == "popular_query"][0]
+    assert hit.metadata == {"search_count": 1}
+    assert hit.score == 0.76  # prefix tier x popular-query boost
+
+    analytics.record("giuffre deposition")
+    analytics.snapshot()
+    hit = [hit for hit in index.search("giuf", limit=10) if hit.type == "popular_query"][0]
+    assert hit.metadata == {"search_count": 2}
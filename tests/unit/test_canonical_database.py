@@ -0,0 +1,96 @@
+"""
+Unit Tests for CanonicalDatabase bulk writes
+
+Test Coverage:
+- Bulk inserts (documents, sources, duplicate groups, logs)
+- transaction(): one connection, commit together, rollback on error, nesting
+- In-memory lookups used by the canonicalization pipeline
+- WAL journal mode
+
+Run tests:
+    pytest tests/unit/test_canonical_database.py -v
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+from core.database import CanonicalDatabase
+
+
+def make_doc(n: int, ocr_quality: float = 0.9) -> dict:
+    return {
+        "canonical_id": f"DOC-{n:04d}",
+        "content_hash": f"content{n}",
+        "file_hash": f"file{n}",
+        "document_type": "email",
+        "to_persons": ["someone"],
+        "ocr_quality": ocr_quality,
+    }
+
+
+def make_source(n: int, source_name: str = "house_oversight") -> dict:
+    return {
+        "canonical_id": f"DOC-{n:04d}",
+        "source_name": source_name,
+        "file_path": f"/data/{n}.pdf",
+        "quality_score": 0.9,
+    }
+
+
+def test_bulk_inserts(tmp_path):
+    db = CanonicalDatabase(tmp_path / "index.db")
+    with db.get_connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    with db.transaction():
+        assert db.insert_canonical_documents(make_doc(n) for n in range(3)) == 3
+        assert db.insert_sources([make_source(0), make_source(1), make_source(0, "doj")]) == 3
+        group = {"canonical_id": "DOC-0000", "duplicate_type": "exact", "similarity_score": 1.0}
+        assert db.insert_duplicate_groups([group, group]) == 2
+        db.log_many([("canonicalize", "doj", "success", "done", {"n": 1})])
+
+    # Same rows as the single-row methods
+    db.insert_canonical_document(make_doc(3, None))
+    assert db.get_canonical_document("DOC-0001")["to_persons"] == ["someone"]
+    assert len(db.get_sources("DOC-0000")) == 2
+    assert len(db.get_duplicates("DOC-0000")) == 2
+    assert db.get_recent_logs()[0]["details"] == '{"n": 1}'
+
+    assert db.load_content_index() == {
+        "content0": ("DOC-0000", 0.9),
+        "content1": ("DOC-0001", 0.9),
+        "content2": ("DOC-0002", 0.9),
+        "content3": ("DOC-0003", None),
+    }
+    assert db.get_source_canonical_ids("house_oversight") == {"DOC-0000", "DOC-0001"}
+    assert db.get_source_canonical_ids("missing") == set()
+
+
+def test_transaction(tmp_path):
+    db = CanonicalDatabase(tmp_path / "index.db")
+
+    # Every call inside shares one connection
+    with db.transaction():
+        with db.get_connection() as first, db.get_connection() as second:
+            assert first is second
+        db.insert_canonical_document(make_doc(0))
+        with db.transaction():  # Nested: joins the outer transaction
+            db.insert_source(make_source(0))
+    assert db.get_statistics()["total_documents"] == 1
+
+    # A failure rolls back the whole batch
+    with pytest.raises(sqlite3.IntegrityError):
+        with db.transaction():
+            db.insert_canonical_documents([make_doc(1), make_doc(2)])
+            db.insert_sources([make_source(0)])  # Duplicate (canonical_id, source_name)
+    assert set(db.load_content_index()) == {"content0"}
+
+    # The connection is released afterwards
+    with db.get_connection() as first, db.get_connection() as second:
+        assert first is not second
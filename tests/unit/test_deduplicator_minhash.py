@@ -0,0 +1,183 @@
+"""
+Unit Tests for MinHash/LSH near-duplicate detection
+
+Test Coverage:
+- MinHash Jaccard estimates for OCR variants vs. unrelated text
+- LSH candidate generation
+- Deduplicator fuzzy phase (candidates verified with difflib)
+- Signatures persisted in CanonicalDatabase for incremental comparison
+- Stored candidates confirmed against their fingerprint before merging
+
+Run tests:
+    pytest tests/unit/test_deduplicator_minhash.py -v
+"""
+
+import random
+import sqlite3
+import string
+import sys
+import zlib
+from pathlib import Path
+
+import pytest
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+from core.database import CanonicalDatabase
+from core.deduplicator import Deduplicator, Document
+from core.minhash import LSHIndex, MinHasher
+
+
+def make_text(seed: int, words: int = 400) -> str:
+    rng = random.Random(seed)
+    return " ".join(
+        "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 9)))
+        for _ in range(words)
+    )
+
+
+def ocr_variant(text: str, seed: int, errors: int = 10, upper: bool = True) -> str:
+    """Simulate OCR noise: substituted characters, reflowed whitespace, casing"""
+    rng = random.Random(seed)
+    chars = list(text)
+    for _ in range(errors):
+        chars[rng.randrange(len(chars))] = rng.choice("il1|0o")
+    text = "".join(chars).replace(" ", "\n", 5)
+    return text.upper() if upper else text
+
+
+def make_doc(doc_id: str, text: str) -> Document:
+    return Document(
+        id=doc_id,
+        file_path=Path(f"{doc_id}.pdf"),
+        file_hash=f"sha256:{doc_id}",
+        content_hash=f"sha256:content-{doc_id}",
+        fuzzy_hash=None,
+        text=text,
+        document_type="other",
+    )
+
+
+def test_minhash_estimates_similarity():
+    hasher = MinHasher()
+    original = make_text(1)
+    variant = hasher.signature(ocr_variant(original, 2))
+    unrelated = hasher.signature(make_text(3))
+    signature = hasher.signature(original)
+
+    assert signature.dtype.name == "uint32" and len(signature) == 128
+    assert MinHasher.jaccard(signature, variant) > 0.8
+    assert MinHasher.jaccard(signature, unrelated) < 0.3
+    assert hasher.signature("   ") is None
+
+
+def test_lsh_candidates():
+    hasher = MinHasher()
+    original = make_text(1)
+    index = LSHIndex.from_signatures(
+        [
+            ("a", hasher.signature(original)),
+            ("b", hasher.signature(ocr_variant(original, 5))),
+            ("c", hasher.signature(make_text(9))),
+        ]
+    )
+    assert index.candidate_pairs() == {("a", "b")}
+    assert index.query(hasher.signature(original)) == {"a", "b"}
+
+    with pytest.raises(ValueError):
+        LSHIndex(num_perm=128, bands=30)
+
+
+def test_detect_fuzzy_duplicates_uses_candidates(monkeypatch):
+    # Short texts: difflib's autojunk heuristic kicks in above 200 characters
+    docs = [make_doc(f"doc{i}", make_text(100 + i, words=30)) for i in range(30)]
+    docs.append(make_doc("doc3-ocr", ocr_variant(docs[3].text, 7, errors=1, upper=False)))
+
+    dedup = Deduplicator()
+    compared = []
+    original = dedup._calculate_similarity
+
+    def counting(doc_a, doc_b):
+        compared.append((doc_a.id, doc_b.id))
+        return original(doc_a, doc_b)
+
+    monkeypatch.setattr(dedup, "_calculate_similarity", counting)
+    groups = dedup.detect_fuzzy_duplicates(docs)
+
+    assert [group.docs for group in groups] == [["doc3", "doc3-ocr"]]
+    assert groups[0].type == "fuzzy"
+    assert len(compared) < 5  # vs. 465 pairwise comparisons
+
+
+def test_stored_signatures_match_incrementally(tmp_path):
+    db = CanonicalDatabase(tmp_path / "dedup.db")
+    dedup = Deduplicator()
+
+    existing = [make_doc(f"canon{i}", make_text(200 + i)) for i in range(5)]
+    for doc in existing:
+        assert dedup.store_signature(db, doc.id, doc)
+    assert not dedup.store_signature(db, "empty", make_doc("empty", ""))
+
+    incoming = make_doc("new", ocr_variant(existing[2].text, 11))
+    matches = Deduplicator().find_stored_near_duplicates(db, incoming)
+    assert [canonical_id for canonical_id, _ in matches] == ["canon2"]
+    assert matches[0][1] >= 0.9  # Confirmed similarity, not the MinHash estimate
+
+    assert Deduplicator().find_stored_near_duplicates(db, make_doc("x", make_text(999))) == []
+
+    # Signatures built with other parameters are not comparable
+    other = Deduplicator(shingle_size=4)
+    assert other.find_stored_near_duplicates(db, incoming) == []
+
+
+def test_stored_candidates_are_confirmed(tmp_path):
+    db = CanonicalDatabase(tmp_path / "dedup.db")
+    dedup = Deduplicator()
+    original = make_doc("canon", make_text(300))
+    dedup.store_signature(db, "canon", original)
+
+    # Shares 350 of 400 words: MinHash estimate 0.80 passes, difflib ratio 0.875 does not
+    words = original.text.split()
+    distinct = make_doc("near", " ".join(words[:350] + make_text(301, words=50).split()))
+    signature = dedup.compute_signature(distinct)
+    assert MinHasher.jaccard(signature, original.minhash) >= dedup.minhash_threshold
+    assert dedup.find_stored_near_duplicates(db, distinct) == []
+
+    # Signatures stored before fingerprints existed cannot be confirmed
+    with db.get_connection() as conn:
+        conn.execute("UPDATE minhash_signatures SET text_sample = NULL")
+    assert dedup.find_stored_near_duplicates(db, make_doc("v", ocr_variant(original.text, 11))) == []
+
+
+def test_signature_table_migration(tmp_path):
+    path = tmp_path / "dedup.db"
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE minhash_signatures (
+                canonical_id TEXT PRIMARY KEY,
+                num_perm INTEGER NOT NULL,
+                shingle_size INTEGER NOT NULL,
+                seed INTEGER NOT NULL,
+                signature BLOB NOT NULL
+            )
+        """
+        )
+
+    db = CanonicalDatabase(path)
+    doc = make_doc("canon", make_text(300))
+    assert Deduplicator().store_signature(db, "canon", doc)
+    assert db.get_minhash_signatures()["canon"]["text_sample"] is not None
+
+
+def test_signature_matches_exact_arithmetic():
+    hasher = MinHasher()
+    text = make_text(4, words=50)
+    prime = (1 << 61) - 1
+    hashes = [zlib.crc32(s.encode("utf-8")) for s in hasher.shingles(text)]
+    expected = [
+        min(((int(a) * x + int(b)) % prime) & 0xFFFFFFFF for x in hashes)
+        for a, b in zip(hasher._a, hasher._b)
+    ]
+    assert hasher.signature(text).tolist() == expected
@@ -0,0 +1,158 @@
+"""
+Unit Tests for DocumentCatalog
+
+Test Coverage:
+- O(1) ID lookup and duplicate/missing ID handling
+- Secondary indexes (classification, source, entity)
+- filter_documents() parity with the original endpoint filters
+- mtime-based reloading
+- Posting lists resolved against the snapshot they came from
+- Shared instances per (index path, ID field)
+
+Run tests:
+    pytest tests/unit/test_document_catalog.py -v
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "server"))
+
+from services.document_catalog import DocumentCatalog, get_document_catalog
+
+
+DOCUMENTS = [
+    {
+        "id": "doc1",
+        "filename": "flight_log_2005.pdf",
+        "path": "data/sources/flights/flight_log_2005.pdf",
+        "type": "pdf",
+        "classification": "flight_log",
+        "source": "house_oversight_nov2025",
+        "entities_mentioned": ["Jeffrey Epstein", "Ghislaine Maxwell"],
+    },
+    {
+        "id": "doc2",
+        "filename": "email_2015.pdf",
+        "path": "data/sources/emails/email_2015.pdf",
+        "type": "email",
+        "classification": "Email",
+        "source": "documentcloud_6250471",
+        "entities_mentioned": ["Jeffrey Epstein"],
+    },
+    {
+        "id": "doc3",
+        "filename": "stats.json",
+        "path": "data/metadata/stats.json",
+        "type": "json",
+        "classification": "metadata",
+        "source": "internal",
+        "entities_mentioned": [],
+    },
+    {
+        "id": "doc4",
+        "filename": "court_filing.pdf",
+        "path": "data/sources/court/court_filing.pdf",
+        "type": "pdf",
+        "classification": "court_filing",
+        "source": "house_oversight_nov2025",
+        "entities_mentioned": ["Virginia Giuffre", "Ghislaine Maxwell"],
+        "content": "Content not available for this document.",
+    },
+    {"filename": "no_id.pdf", "path": "x/no_id.pdf"},
+]
+
+
+def write_index(path: Path, documents: list) -> Path:
+    with open(path, "w") as f:
+        json.dump({"documents": documents}, f)
+    return path
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    index_path = write_index(tmp_path / "all_documents_index.json", DOCUMENTS)
+    return DocumentCatalog(index_path, check_interval=0)
+
+
+def test_get_by_id(catalog):
+    assert catalog.get("doc2")["filename"] == "email_2015.pdf"
+    assert catalog.get("missing") is None
+    assert len(catalog) == 4  # Document without ID is skipped
+
+
+def test_missing_index_is_unavailable(tmp_path):
+    catalog = DocumentCatalog(tmp_path / "nope.json", check_interval=0)
+    assert not catalog.available
+    assert catalog.get("doc1") is None
+    assert catalog.filter_documents() == []
+
+
+def test_secondary_indexes(catalog):
+    assert [d["id"] for d in catalog.by_classification("email")] == ["doc2"]
+    assert [d["id"] for d in catalog.by_source("HOUSE_OVERSIGHT_NOV2025")] == ["doc1", "doc4"]
+    assert [d["id"] for d in catalog.by_entity("ghislaine maxwell")] == ["doc1", "doc4"]
+
+
+def test_filter_excludes_hidden_documents(catalog):
+    ids = [d["id"] for d in catalog.filter_documents() if d.get("id")]
+    assert ids == ["doc1", "doc2"]
+
+
+def test_filter_matches_original_semantics(catalog):
+    # Entity and source are substring matches, classification is exact
+    assert [d["id"] for d in catalog.filter_documents(entity="epstein")] == ["doc1", "doc2"]
+    assert [d["id"] for d in catalog.filter_documents(source="oversight")] == ["doc1"]
+    assert [d["id"] for d in catalog.filter_documents(classification="EMAIL")] == ["doc2"]
+    assert [d["id"] for d in catalog.filter_documents(doc_type="pdf")] == ["doc1"]
+    assert [d["id"] for d in catalog.filter_documents(q="FLIGHT")] == ["doc1"]
+    assert catalog.filter_documents(entity="maxwell", classification="email") == []
+
+
+def test_facets(catalog):
+    assert "flight_log" in catalog.facets["classifications"]
+    assert "house_oversight_nov2025" in catalog.facets["sources"]
+
+
+def test_reloads_when_file_changes(tmp_path):
+    index_path = write_index(tmp_path / "all_documents_index.json", DOCUMENTS[:1])
+    catalog = DocumentCatalog(index_path, check_interval=0)
+    assert catalog.get("doc2") is None
+
+    write_index(index_path, DOCUMENTS[:2])
+    stat = index_path.stat()
+    os.utime(index_path, (stat.st_atime, stat.st_mtime + 5))
+
+    assert catalog.get("doc2") is not None
+    assert catalog.reload_count == 2
+
+
+def test_forced_reload(catalog):
+    catalog.get("doc1")
+    catalog.reload()
+    catalog.get("doc1")
+    assert catalog.reload_count == 2
+
+
+def test_exact_lookup_uses_one_snapshot(catalog, tmp_path):
+    # A reload between the posting-list lookup and resolving its positions
+    # must not index the new (here: shorter) documents list
+    smaller = DocumentCatalog(write_index(tmp_path / "smaller.json", DOCUMENTS[3:4]))
+    snapshots = [catalog._ensure_fresh(), smaller._ensure_fresh()]
+    catalog._ensure_fresh = lambda: snapshots.pop(0) if len(snapshots) > 1 else snapshots[0]
+
+    assert [doc["id"] for doc in catalog.by_entity("ghislaine maxwell")] == ["doc1", "doc4"]
+
+
+def test_shared_catalog_per_id_field(tmp_path):
+    index_path = write_index(tmp_path / "master_document_index.json", [{"id": "a", "hash": "h1"}])
+    by_id = get_document_catalog(index_path)
+    by_hash = get_document_catalog(index_path, id_field="hash")
+    assert by_hash is not by_id and get_document_catalog(index_path) is by_id
+    assert by_id.get("a") is not None and by_id.get("h1") is None
+    assert by_hash.get("h1") is not None
@@ -0,0 +1,108 @@
+"""
+Unit Tests for batched document fetches and the date side-table
+
+Test Coverage:
+- Batched `collection.get` (chunking, de-duplication, request order)
+- Date projection from normalized and legacy metadata
+- Range selection (bare years, undated documents, ordering)
+- Persistence and rebuild when the collection size changes
+
+Run tests:
+    pytest tests/unit/test_document_fetch.py -v
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "server"))
+
+from services.document_fetch import (
+    DocumentDateTable,
+    fetch_documents,
+    get_document_date_table,
+)
+
+
+class FakeCollection:
+    """In-memory stand-in for a ChromaDB collection; records get() calls"""
+
+    def __init__(self, records: dict[str, dict]):
+        self.records = records
+        self.calls = []
+
+    def count(self):
+        return len(self.records)
+
+    def get(self, ids=None, include=None, limit=None, offset=None):
+        self.calls.append({"ids": ids, "include": include, "limit": limit, "offset": offset})
+        if ids is None:
+            found = list(self.records)[offset : offset + limit]
+        else:  # unordered, like ChromaDB
+            found = [doc_id for doc_id in reversed(ids) if doc_id in self.records]
+        result = {"ids": found, "documents": None, "metadatas": None}
+        if "documents" in include:
+            result["documents"] = [f"text of {doc_id}" for doc_id in found]
+        if "metadatas" in include:
+            result["metadatas"] = [self.records[doc_id] for doc_id in found]
+        return result
+
+
+RECORDS = {
+    "a": {"date": "2001-05-01", "date_epoch": 988675200},
+    "b": {"date_extracted": "March 14, 1995"},
+    "c": {"date_extracted": "unknown"},
+    "d": {"published_date": "2000-12-31T10:00:00Z"},
+    "e": {"date_extracted": "1/2/00"},
+}
+
+
+def test_fetch_documents_batches():
+    collection = FakeCollection({f"doc{i}": {"n": i} for i in range(10)})
+    ids = ["doc7", "missing", "doc1", "doc7", *[f"doc{i}" for i in range(5)]]
+    documents = fetch_documents(collection, ids, batch_size=3)
+
+    assert list(documents) == ["doc7", "doc1", "doc0", "doc2", "doc3", "doc4"]
+    assert documents["doc7"] == {"text": "text of doc7", "metadata": {"n": 7}}
+    assert [len(call["ids"]) for call in collection.calls] == [3, 3, 1]
+
+    assert fetch_documents(collection, ["doc1"], include=["metadatas"]) == {
+        "doc1": {"metadata": {"n": 1}}
+    }
+
+
+def test_date_table_select():
+    table = DocumentDateTable.build(FakeCollection(RECORDS), page_size=2)
+    assert table.dates == ["2001-05-01", "1995-03-14", "", "2000-12-31", "2000-01-02"]
+
+    candidates = ["a", "b", "c", "d", "e", "unknown"]
+    assert table.select(candidates) == [
+        ("b", "1995-03-14"),
+        ("e", "2000-01-02"),
+        ("d", "2000-12-31"),
+        ("a", "2001-05-01"),
+    ]
+    assert [doc_id for doc_id, _ in table.select(candidates, "2000", "2000")] == ["e", "d"]
+    assert [doc_id for doc_id, _ in table.select(candidates, "01/03/2000")] == ["d", "a"]
+    with pytest.raises(ValueError):
+        table.select(candidates, "last year")
+
+
+def test_side_table_persists_and_rebuilds(tmp_path):
+    path = tmp_path / "document_dates.json"
+    collection = FakeCollection(dict(RECORDS))
+    table = get_document_date_table(collection, path)
+    assert path.exists() and len(table) == 5
+
+    loaded = DocumentDateTable.load(path)
+    assert loaded.ids == table.ids and list(loaded.epochs) == list(table.epochs)
+
+    scans = len(collection.calls)
+    assert get_document_date_table(collection, path) is table
+    assert len(collection.calls) == scans
+
+    collection.records["f"] = {"date": "1990-01-01"}
+    table = get_document_date_table(collection, path)
+    assert len(table) == 6 and table.select(["f"]) == [("f", "1990-01-01")]
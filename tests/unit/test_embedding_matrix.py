@@ -0,0 +1,162 @@
+"""
+Unit Tests for the precomputed document embedding matrix
+
+Test Coverage:
+- EmbeddingMatrixWriter → EmbeddingMatrix round trip (float32 memmap, float16)
+- top_k() against a brute-force cosine ranking
+- Publishing: manifest names the matrix; mismatched or legacy pairs
+- DocumentSimilarityService vectorized path (no model required)
+
+Run tests:
+    pytest tests/unit/test_embedding_matrix.py -v
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "server"))
+
+from services import document_similarity
+from services.document_similarity import DocumentSimilarityService
+from services.embedding_matrix import EmbeddingMatrix, EmbeddingMatrixWriter
+from services.embedding_service import EmbeddingService
+
+
+def build_matrix(directory: Path, vectors: np.ndarray, dtype: str = "float32") -> list:
+    ids = [f"doc{i}" for i in range(len(vectors))]
+    writer = EmbeddingMatrixWriter(directory, count=len(vectors) + 2, dim=vectors.shape[1], dtype=dtype)
+    writer.write(0, vectors[:3])
+    writer.write(3, vectors[3:])
+    writer.close(ids)
+    return ids
+
+
+@pytest.fixture
+def vectors():
+    rng = np.random.default_rng(42)
+    return rng.normal(size=(50, 16)).astype(np.float32)
+
+
+def test_round_trip_is_memory_mapped(tmp_path, vectors):
+    ids = build_matrix(tmp_path, vectors)
+    matrix = EmbeddingMatrix.load(tmp_path)
+
+    assert matrix.ids == ids
+    assert isinstance(matrix.vectors, np.memmap)
+    assert matrix.meta["dtype"] == "float32"
+    norms = np.linalg.norm(np.asarray(matrix.vectors), axis=1)
+    assert np.allclose(norms, 1.0, atol=1e-5)
+
+
+def test_missing_matrix_returns_none(tmp_path):
+    assert EmbeddingMatrix.load(tmp_path / "missing") is None
+
+
+def test_rebuild_publishes_matrix_and_ids_together(tmp_path, vectors):
+    build_matrix(tmp_path, vectors)
+    old = EmbeddingMatrix.load(tmp_path)
+    old_name = json.loads((tmp_path / "ids.json").read_text())["embeddings"]
+
+    ids = build_matrix(tmp_path, vectors[:10][::-1].copy())
+    manifest = json.loads((tmp_path / "ids.json").read_text())
+    assert manifest["embeddings"] != old_name
+    assert sorted(path.name for path in tmp_path.glob("*.npy")) == [manifest["embeddings"]]
+    assert not list(tmp_path.glob("*.tmp"))
+
+    matrix = EmbeddingMatrix.load(tmp_path)
+    assert matrix.ids == ids and len(matrix) == 10
+    assert np.allclose(matrix.vector("doc0"), old.vector("doc9"), atol=1e-6)  # old map still valid
+
+
+def test_legacy_and_mismatched_files(tmp_path, vectors):
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    np.save(tmp_path / "embeddings.npy", normalized)
+    (tmp_path / "ids.json").write_text(json.dumps({"ids": [f"doc{i}" for i in range(50)]}))
+    assert EmbeddingMatrix.load(tmp_path).vector("doc7") is not None  # pre-manifest build
+
+    (tmp_path / "ids.json").write_text(json.dumps({"ids": ["doc0", "doc1"]}))
+    with pytest.raises(ValueError):
+        EmbeddingMatrix.load(tmp_path)
+
+    build_matrix(tmp_path, vectors)
+    assert not (tmp_path / "embeddings.npy").exists()
+
+
+def test_top_k_matches_brute_force(tmp_path, vectors):
+    build_matrix(tmp_path, vectors)
+    matrix = EmbeddingMatrix.load(tmp_path)
+
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    expected = np.argsort(-(normalized @ normalized[7]))
+    expected = [row for row in expected if row != 7][:5]
+
+    rows, scores = matrix.top_k(matrix.vector("doc7"), k=5, exclude_rows=[7])
+    assert rows.tolist() == expected
+    assert list(scores) == sorted(scores, reverse=True)
+
+
+def test_top_k_threshold_and_float16(tmp_path, vectors):
+    build_matrix(tmp_path, vectors, dtype="float16")
+    matrix = EmbeddingMatrix.load(tmp_path)
+
+    assert matrix.vectors.dtype == np.float32
+    rows, scores = matrix.top_k(matrix.vector("doc0"), k=10, min_score=0.99)
+    assert rows.tolist() == [0]
+
+
+def test_similarity_service_uses_matrix(tmp_path, vectors):
+    build_matrix(tmp_path, vectors)
+    documents = [{"id": f"doc{i}", "filename": f"doc{i}.pdf"} for i in range(len(vectors))]
+    by_id = {doc["id"]: doc for doc in documents}
+
+    service = DocumentSimilarityService(matrix_dir=tmp_path)
+    results = service.find_similar_documents(
+        "doc3",
+        documents,
+        limit=4,
+        similarity_threshold=-1.0,
+        use_cache=False,
+        get_document=by_id.get,
+    )
+
+    assert service.model is None  # No per-document encoding
+    assert len(results) == 4
+    assert "doc3" not in [r["document_id"] for r in results]
+    scores = [r["similarity_score"] for r in results]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_similarity_service_encodes_only_missing_source(tmp_path, vectors, monkeypatch):
+    build_matrix(tmp_path, vectors)
+    documents = [{"id": f"doc{i}", "filename": f"doc{i}.pdf"} for i in range(len(vectors))]
+    documents.append({"id": "new", "filename": "new.pdf", "summary": "new document"})
+    by_id = {doc["id"]: doc for doc in documents}
+
+    class Model:
+        encoded = []
+
+        def encode(self, texts, convert_to_numpy=True):
+            self.encoded.extend(texts)
+            return np.stack([vectors[5] * 2 for _ in texts])
+
+    embeddings = EmbeddingService(model_factory=lambda name: Model())
+    monkeypatch.setattr(document_similarity, "get_embedding_service", lambda: embeddings)
+
+    service = DocumentSimilarityService(matrix_dir=tmp_path)
+    results = service.find_similar_documents(
+        "new",
+        documents,
+        limit=3,
+        similarity_threshold=-1.0,
+        use_cache=False,
+        get_document=by_id.get,
+    )
+
+    assert len(Model.encoded) == 1  # Only the source, not the corpus
+    assert [r["document_id"] for r in results][0] == "doc5"
+    assert results[0]["similarity_score"] == pytest.approx(1.0, abs=1e-3)
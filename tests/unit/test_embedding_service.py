@@ -0,0 +1,146 @@
+"""
+Unit Tests for the shared embedding service
+
+Test Coverage:
+- Query cache keyed by normalized text, LRU eviction, read-only vectors
+- Micro-batching of concurrent async encodes (one model call, shared futures)
+- Encoding errors delivered to every waiter
+- Model built once
+- model.encode never runs concurrently (sync and async callers)
+
+Run tests:
+    pytest tests/unit/test_embedding_service.py -v
+"""
+
+import asyncio
+import sys
+import threading
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "server"))
+
+from services.embedding_service import EmbeddingService, normalize_query
+
+
+class FakeModel:
+    """Deterministic 4-d 'embeddings' that record each encode call"""
+
+    def __init__(self, fail: bool = False):
+        self.calls = []
+        self.threads = []
+        self.fail = fail
+
+    def encode(self, texts, convert_to_numpy=True):
+        self.calls.append(list(texts))
+        self.threads.append(threading.current_thread().name)
+        if self.fail:
+            raise RuntimeError("model exploded")
+        return np.array([[len(text), text.count(" "), ord(text[0]), 1.0] for text in texts])
+
+
+def make_service(model: FakeModel, **kwargs) -> EmbeddingService:
+    built = []
+
+    def factory(name):
+        built.append(name)
+        return model
+
+    service = EmbeddingService(model_factory=factory, **kwargs)
+    service.built = built
+    return service
+
+
+def test_query_cache_normalizes_and_evicts():
+    model = FakeModel()
+    service = make_service(model, cache_size=2)
+
+    first = service.encode_query("Flight  Logs ")
+    again = service.encode_query("flight logs")
+    assert first is again
+    assert model.calls == [["flight logs"]]
+    assert not first.flags.writeable
+    assert normalize_query("  A\tB \n") == "a b"
+
+    service.encode_query("b")
+    service.encode_query("c")  # evicts "flight logs"
+    service.encode_query("flight logs")
+    assert model.calls[-1] == ["flight logs"]
+    assert service.cache_info()["size"] == 2
+    assert service.built == ["all-MiniLM-L6-v2"]
+
+
+def test_concurrent_queries_share_one_batch():
+    model = FakeModel()
+    service = make_service(model, batch_window_ms=20)
+    queries = ["alpha", "Beta", "alpha", "gamma delta", "beta"]
+
+    async def run():
+        return await asyncio.gather(*(service.embed_query(q) for q in queries))
+
+    results = asyncio.run(run())
+
+    assert model.calls == [["alpha", "beta", "gamma delta"]]
+    assert model.threads[0].startswith("embed")
+    assert results[0] is results[2] and results[1] is results[4]
+    np.testing.assert_array_equal(results[3], service.encode_query("Gamma delta"))
+    assert service.cache_info()["batches"] == 1
+
+
+def test_full_batch_flushes_without_waiting():
+    model = FakeModel()
+    service = make_service(model, max_batch_size=2, batch_window_ms=10_000)
+
+    async def run():
+        return await asyncio.wait_for(
+            asyncio.gather(service.embed_query("one"), service.embed_query("two")), timeout=5
+        )
+
+    assert len(asyncio.run(run())) == 2
+    assert model.calls == [["one", "two"]]
+
+
+def test_encode_errors_reach_every_waiter():
+    service = make_service(FakeModel(fail=True))
+
+    async def run():
+        return await asyncio.gather(
+            service.embed_query("x"), service.embed_query("y"), return_exceptions=True
+        )
+
+    results = asyncio.run(run())
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert service.cache_info()["size"] == 0
+
+    with pytest.raises(RuntimeError):
+        service.encode_query("x")
+
+
+def test_encodes_are_serialized():
+    active = []
+    overlapped = []
+
+    class SlowModel(FakeModel):
+        def encode(self, texts, convert_to_numpy=True):
+            active.append(1)
+            overlapped.append(len(active) > 1)
+            threading.Event().wait(0.01)
+            active.pop()
+            return super().encode(texts, convert_to_numpy)
+
+    model = SlowModel()
+    service = make_service(model)
+
+    async def run():
+        sync_callers = [
+            asyncio.to_thread(service.encode, [f"document {i}"]) for i in range(4)
+        ]
+        queries = [service.embed_query(f"query {i}") for i in range(4)]
+        texts = [service.embed_texts([f"text {i}"]) for i in range(4)]
+        await asyncio.gather(*sync_callers, *queries, *texts)
+
+    asyncio.run(run())
+    assert len(model.calls) >= 6 and not any(overlapped)
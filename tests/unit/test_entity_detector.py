@@ -0,0 +1,112 @@
+"""
+Unit Tests for Aho–Corasick entity detection
+
+Test Coverage:
+- Regex-equivalent word boundaries and case-insensitivity
+- Longest-match-first overlap resolution
+- EntityDetector GUIDs, display names and mention counts
+
+Run tests:
+    pytest tests/unit/test_entity_detector.py -v
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "server"))
+
+from entity_detector import EntityDetector
+from utils.aho_corasick import AhoCorasickMatcher
+
+
+def build_matcher(*patterns: str) -> AhoCorasickMatcher:
+    matcher = AhoCorasickMatcher()
+    for pattern in patterns:
+        matcher.add(pattern, pattern)
+    matcher.build()
+    return matcher
+
+
+def test_word_boundaries():
+    matcher = build_matcher("Epstein")
+    text = "Epstein, EPSTEIN and epsteins but not xEpstein"
+    spans = [(start, end) for start, end, _ in matcher.find_all(text)]
+    assert spans == [(0, 7), (9, 16)]
+
+
+def test_longest_match_wins():
+    matcher = build_matcher("Epstein", "Jeffrey Epstein", "Mark Epstein")
+    matches = matcher.find_all("Jeffrey Epstein met Epstein")
+    assert [payloads for _, _, payloads in matches] == [["Jeffrey Epstein"], ["Epstein"]]
+
+
+def test_failure_links_find_suffix_patterns():
+    matcher = build_matcher("he", "she", "hers", "his")
+    raw = sorted((s, e) for s, e, _ in matcher.iter_raw_matches("ushers"))
+    assert raw == [(1, 4), (2, 4), (2, 6)]
+
+
+def test_duplicate_keys_share_payloads():
+    matcher = AhoCorasickMatcher()
+    matcher.add("Maxwell", "guid-1")
+    matcher.add("MAXWELL", "guid-2")
+    assert len(matcher) == 1
+    assert matcher.find_all("maxwell")[0][2] == ["guid-1", "guid-2"]
+
+
+@pytest.fixture
+def detector(tmp_path):
+    stats = {
+        "statistics": {
+            "jeffrey_epstein": {
+                "guid": "guid-je",
+                "name": "Jeffrey Epstein",
+                "name_variations": ["Epstein", "Jeffrey E. Epstein"],
+            },
+            "ghislaine_maxwell": {
+                "guid": "guid-gm",
+                "name": "Ghislaine Maxwell",
+                "name_variations": ["Maxwell"],
+            },
+            "no_guid": {"name": "Nobody"},
+        }
+    }
+    path = tmp_path / "entity_statistics.json"
+    path.write_text(json.dumps(stats))
+    return EntityDetector(str(path))
+
+
+def test_detect_entities_counts(detector):
+    text = (
+        "Jeffrey Epstein and Ghislaine Maxwell. Later, EPSTEIN called Maxwell. "
+        "Jeffrey E. Epstein signed."
+    )
+    results = detector.detect_entities(text, use_cache=False)
+    by_guid = {r.guid: r for r in results}
+
+    assert by_guid["guid-je"].mentions == 3
+    assert by_guid["guid-je"].name == "Jeffrey E. Epstein"
+    assert by_guid["guid-gm"].mentions == 2
+    assert results[0].guid == "guid-je"
+
+
+def test_detect_entities_empty(detector):
+    assert detector.detect_entities("", use_cache=False) == []
+    assert detector.detect_entities("nothing relevant here", use_cache=False) == []
+
+
+def test_get_entity_by_guid(detector):
+    assert detector.get_entity_by_guid("guid-gm")["name"] == "Ghislaine Maxwell"
+    assert detector.get_entity_by_guid("missing") is None
+
+
+def test_find_substring_payloads_matches_in_operator():
+    names = ["Maxwell", "Epstein, Jeffrey", "Wexner"]
+    matcher = build_matcher(*names)
+    text = "MAXWELLS met epstein, jeffrey at Wexnerville"
+    expected = {name for name in names if name.lower() in text.lower()}
+    assert matcher.find_substring_payloads(text) == expected
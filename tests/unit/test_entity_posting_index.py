@@ -0,0 +1,104 @@
+"""
+Unit Tests for the entity posting-list index
+
+Test Coverage:
+- Postings built from both index shapes (document → entities, entity → documents)
+- Intersection / union against set-based reference results
+- Co-occurrence and connection counts against the previous full scan
+
+Run tests:
+    pytest tests/unit/test_entity_posting_index.py -v
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "server"))
+
+from services.entity_posting_index import EntityPostingIndex
+
+
+def scan_connections(document_entities: dict, entity_name: str) -> int:
+    """Previous calculate_entity_connections implementation (full scan)"""
+    target = entity_name.lower().strip()
+    co_mentioned = set()
+    for entities in document_entities.values():
+        if target in [e.lower().strip() for e in entities]:
+            co_mentioned.update(e.lower().strip() for e in entities if e.lower().strip() != target)
+    return len(co_mentioned)
+
+
+@pytest.fixture
+def document_entities():
+    rng = random.Random(7)
+    names = [f"Entity {i}" for i in range(40)]
+    return {f"DOC-{i:04d}": rng.sample(names, rng.randint(0, 6)) for i in range(500)}
+
+
+def test_documents_and_case_insensitive_lookup():
+    index = EntityPostingIndex.from_document_entities(
+        {"d1": ["Jeffrey Epstein", "Maxwell"], "d2": ["jeffrey epstein "], "d3": ["Maxwell"]}
+    )
+    assert index.documents("JEFFREY EPSTEIN") == ["d1", "d2"]
+    assert index.documents("maxwell") == ["d1", "d3"]
+    assert index.documents("nobody") == []
+    assert "Maxwell" in index and len(index) == 2
+
+
+def test_from_entity_documents_deduplicates():
+    index = EntityPostingIndex.from_entity_documents(
+        {
+            "Clinton": {"documents": [{"doc_id": "a"}, {"doc_id": "b"}, {"doc_id": "a"}]},
+            "Epstein": {"documents": [{"doc_id": "b"}, {"doc_id": "c"}]},
+        }
+    )
+    assert index.documents("Clinton") == ["a", "b"]
+    assert index.intersect(["Clinton", "Epstein"]) == ["b"]
+    assert index.union(["Clinton", "Epstein"]) == ["a", "b", "c"]
+    assert index.pair_count("Clinton", "Epstein") == 1
+
+
+def test_set_algebra_matches_reference(document_entities):
+    index = EntityPostingIndex.from_document_entities(document_entities)
+    sets = {}
+    for doc_id, entities in document_entities.items():
+        for name in entities:
+            sets.setdefault(name, set()).add(doc_id)
+
+    for a, b, c in [("Entity 1", "Entity 2", "Entity 3"), ("Entity 5", "Entity 30", "Entity 39")]:
+        assert set(index.intersect([a, b, c])) == sets[a] & sets[b] & sets[c]
+        assert set(index.union([a, b])) == sets[a] | sets[b]
+
+    assert index.intersect(["Entity 1", "missing"]) == []
+    assert index.intersect([]) == []
+    assert len(index.intersect(["Entity 1", "Entity 2"], limit=2)) <= 2
+
+
+def test_connection_counts_match_full_scan(document_entities):
+    index = EntityPostingIndex.from_document_entities(document_entities)
+    for i in range(40):
+        name = f"Entity {i}"
+        assert index.connection_count(name) == scan_connections(document_entities, name)
+    assert index.connection_count("missing") == 0
+
+
+def test_cooccurrence_counts(document_entities):
+    index = EntityPostingIndex.from_document_entities(document_entities)
+    counts = index.cooccurrence_counts("Entity 0")
+
+    assert "entity 0" not in counts
+    assert len(counts) == index.connection_count("Entity 0")
+    for other, count in counts.items():
+        assert count == index.pair_count("Entity 0", other)
+
+
+def test_empty_index():
+    index = EntityPostingIndex.from_document_entities({})
+    assert len(index) == 0
+    assert index.connection_count("anyone") == 0
+    assert index.cooccurrence_counts("anyone") == {}
+    assert index.union(["anyone"]) == []
@@ -0,0 +1,172 @@
+"""
+Unit Tests for the FTS5 document full-text index
+
+Test Coverage:
+- User query -> FTS5 MATCH translation (phrases, boolean, prefix, punctuation)
+- Unary NOT rejected instead of silently dropped
+- Incremental sync (added / unchanged / metadata-only / updated / deleted)
+- BM25 ranking, snippets, catalog filters, filename fallback and text facets
+- Indexed text for boolean post-filters
+
+Run tests:
+    pytest tests/unit/test_fulltext_index.py -v
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "server"))
+
+from services.document_catalog import DocumentCatalog
+from services.fulltext_index import (
+    OCR_TEXT_DIR,
+    FullTextIndex,
+    FullTextQueryError,
+    search_catalog,
+    to_fts_query,
+)
+from services.hybrid_search import BooleanPostFilter
+
+
+TEXTS = {
+    "DOJ-OGR-1": "Flight logs from Palm Beach list Maxwell twice. Maxwell again.",
+    "DOJ-OGR-2": "The deposition mentions flight schedules but no logs of Maxwell.",
+    "DOJ-OGR-3": "Bank records for the Palm Beach household account.",
+}
+
+
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ("epstein maxwell", '"epstein" "maxwell"'),
+        ('"flight logs" AND palm', '"flight logs" AND "palm"'),
+        ("(epstein OR clinton) AND NOT maxwell", '( "epstein" OR "clinton" ) NOT "maxwell"'),
+        ("dersh*", '"dersh"*'),
+        ("DOJ-OGR-0001", '"DOJ-OGR-0001"'),
+        ('AND "unbalanced', '"unbalanced"'),
+        ("a ( b", '"a" ( "b" )'),
+        ("NOT", ""),
+        ("a NOT", '"a"'),
+        ("a NOT NOT", '"a"'),
+    ],
+)
+def test_to_fts_query(query, expected):
+    assert to_fts_query(query) == expected
+
+
+@pytest.mark.parametrize(
+    "query",
+    ["NOT epstein", "NOT (a)", "a OR NOT b", "AND NOT a", "a AND (NOT b)", "a NOT NOT b"],
+)
+def test_unary_not_is_rejected(query):
+    # Dropping the NOT would return exactly the documents the user excluded
+    with pytest.raises(FullTextQueryError, match="NOT"):
+        to_fts_query(query)
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    ocr_dir = tmp_path / OCR_TEXT_DIR
+    ocr_dir.mkdir(parents=True)
+    for name, text in TEXTS.items():
+        (ocr_dir / f"{name}.txt").write_text(text)
+
+    md_path = tmp_path / "data" / "md" / "notes.md"
+    md_path.parent.mkdir(parents=True)
+    md_path.write_text("Markdown notes about Maxwell and the island.")
+
+    documents = [
+        {"id": f"id{i}", "filename": f"{name}.pdf", "classification": cls, "source": "house"}
+        for i, (name, cls) in enumerate(zip(TEXTS, ["email", "court_filing", "email"]), 1)
+    ]
+    documents.append(
+        {
+            "id": "md1",
+            "filename": "notes.md",
+            "path": str(md_path),
+            "classification": "other",
+            "source": "md",
+        }
+    )
+    documents.append({"id": "pal1", "filename": "palm_beach_photo.jpg", "source": "photos"})
+    return tmp_path, documents
+
+
+def write_catalog(path: Path, documents: list[dict]) -> DocumentCatalog:
+    path.write_text(json.dumps({"documents": documents}))
+    return DocumentCatalog(path, check_interval=0)
+
+
+def test_incremental_sync(corpus):
+    root, documents = corpus
+    index = FullTextIndex(root / "fts.db")
+    assert not index.available
+
+    assert index.sync(documents, project_root=root)["added"] == 5
+    assert index.available and len(index) == 5
+    assert index.sync(documents, project_root=root)["unchanged"] == 5
+
+    documents[0]["classification"] = "correspondence"
+    text_path = root / OCR_TEXT_DIR / "DOJ-OGR-2.txt"
+    text_path.write_text("Rewritten page about helicopters.")
+    os.utime(text_path, (1, 1))
+    stats = index.sync(documents[:-1], project_root=root)
+    assert (stats["metadata_updated"], stats["updated"], stats["deleted"]) == (1, 1, 1)
+
+    assert [doc_id for doc_id, _ in index.rank("helicopters")] == ["id2"]
+    assert index.rank("schedules") == []
+
+
+def test_search_catalog(corpus):
+    root, documents = corpus
+    index = FullTextIndex(root / "fts.db")
+    index.sync(documents, project_root=root)
+    catalog = write_catalog(root / "index.json", documents)
+
+    result = search_catalog(catalog, index, "maxwell")
+    ids = [doc["id"] for doc in result["documents"]]
+    assert ids[0] == "id1" and set(ids) == {"id1", "id2", "md1"}
+    assert "<mark>Maxwell</mark>" in result["documents"][0]["snippet"]
+    assert result["text_facets"]["classifications"] == {"email": 1, "court_filing": 1, "other": 1}
+
+    phrase = search_catalog(catalog, index, '"flight logs"')
+    assert [doc["id"] for doc in phrase["documents"]] == ["id1"]
+
+    boolean = search_catalog(catalog, index, "palm NOT maxwell")
+    assert {doc["id"] for doc in boolean["documents"]} == {"id3", "pal1"}  # pal1: filename
+    with pytest.raises(FullTextQueryError):
+        search_catalog(catalog, index, "NOT maxwell")
+
+    filtered = search_catalog(catalog, index, "maxwell", classification="court_filing")
+    assert [doc["id"] for doc in filtered["documents"]] == ["id2"]
+    assert filtered["total"] == 1
+
+    # Filename-only matches (previous substring behaviour) follow text matches
+    fallback = search_catalog(catalog, index, "photo.jpg")
+    assert [doc["id"] for doc in fallback["documents"]] == ["pal1"]
+    assert fallback["documents"][0]["score"] is not None  # filename column is indexed too
+    assert search_catalog(catalog, index, "beach_ph")["documents"][0]["score"] is None
+
+    page = search_catalog(catalog, index, "maxwell", limit=1, offset=1)
+    assert page["total"] == 3 and len(page["documents"]) == 1
+
+
+def test_texts_for_post_filters(corpus):
+    root, documents = corpus
+    index = FullTextIndex(root / "fts.db")
+    index.sync(documents, project_root=root)
+
+    texts = index.texts(["id1", "md1", "missing"])
+    assert set(texts) == {"id1", "md1"}
+    assert texts["id1"] == "DOJ-OGR-1.pdf\n" + TEXTS["DOJ-OGR-1"]
+
+    # Unified search re-checks BM25 hits with the boolean post-filter
+    ranked = [doc_id for doc_id, _ in index.rank("palm")]
+    post_filter = BooleanPostFilter(must=["palm"], must_not=["maxwell"])
+    texts = index.texts(ranked)
+    assert [doc_id for doc_id in ranked if post_filter.matches(texts[doc_id])] == ["pal1", "id3"]
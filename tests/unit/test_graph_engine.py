@@ -0,0 +1,131 @@
+"""
+Unit Tests for the CSR graph engine
+
+Test Coverage:
+- CSR construction (degrees, weighted degrees, edge positions, skipped edges)
+- k-hop BFS with weight thresholds
+- Bidirectional shortest paths (bounds, banned nodes/edges)
+- k-shortest loopless paths (Yen)
+- Agreement with a plain BFS on a random graph
+
+Run tests:
+    pytest tests/unit/test_graph_engine.py -v
+"""
+
+import random
+import sys
+from collections import deque
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "server"))
+
+from services.graph_engine import GraphEngine
+
+
+#   a -5- b -1- c
+#   |           |
+#   2           3
+#   |           |
+#   d ----4---- e -1- f      g (isolated)
+NETWORK = {
+    "nodes": [{"id": n, "name": n.upper()} for n in "abcdefg"],
+    "edges": [
+        {"source": "a", "target": "b", "weight": 5},
+        {"source": "b", "target": "c", "weight": 1},
+        {"source": "a", "target": "d", "weight": 2},
+        {"source": "c", "target": "e", "weight": 3},
+        {"source": "d", "target": "e", "weight": 4},
+        {"source": "e", "target": "f", "weight": 1},
+        {"source": "a", "target": "a", "weight": 9},  # self-loop, skipped
+        {"source": "a", "target": "zzz", "weight": 9},  # unknown node, skipped
+    ],
+}
+
+
+def names(graph, path):
+    return "".join(graph.node_ids[n] for n in path)
+
+
+def test_csr_construction():
+    graph = GraphEngine.from_network(NETWORK)
+    assert len(graph) == 7 and graph.n_edges == 6
+    assert graph.degree.tolist() == [2, 2, 2, 2, 3, 1, 0]
+    assert graph.weighted_degree.tolist() == [7, 6, 4, 6, 8, 1, 0]
+    assert names(graph, graph.neighbors(graph.index["e"])) == "dcf"  # strongest first
+    assert graph.name_index["C"] == graph.index["c"]
+
+    a, b, c = (graph.index[n] for n in "abc")
+    assert graph.path_edges([a, b, c]) == [0, 1]
+    assert graph.induced_edges(range(7), min_weight=2) == [0, 2, 3, 4]
+
+
+def test_bfs_hops_and_thresholds():
+    graph = GraphEngine.from_network(NETWORK)
+    a = graph.index["a"]
+    distances = {graph.node_ids[n]: d for n, d in graph.bfs(a).items()}
+    assert distances == {"a": 0, "b": 1, "d": 1, "c": 2, "e": 2, "f": 3}
+    assert names(graph, graph.bfs(a, max_hops=1)) == "abd"
+    assert sorted(names(graph, graph.bfs(a, min_weight=2))) == list("abcde")
+    assert names(graph, graph.bfs(a, max_hops=0)) == "a"
+
+
+def test_shortest_path():
+    graph = GraphEngine.from_network(NETWORK)
+    a, c, f, g = (graph.index[n] for n in "acfg")
+    assert names(graph, graph.shortest_path(a, f)) == "adef"
+    assert names(graph, graph.shortest_path(a, c)) == "abc"
+    assert names(graph, graph.shortest_path(a, c, min_weight=2)) == "adec"
+    assert graph.shortest_path(a, f, max_hops=2) is None
+    assert graph.shortest_path(a, g) is None
+    assert graph.shortest_path(a, a) == [a]
+    no_b = frozenset({graph.index["b"]})
+    assert names(graph, graph.shortest_path(a, c, banned_nodes=no_b)) == "adec"
+    banned = frozenset({(graph.index["a"], graph.index["b"])})
+    assert names(graph, graph.shortest_path(a, c, banned_edges=banned)) == "adec"
+
+
+def test_k_shortest_paths():
+    graph = GraphEngine.from_network(NETWORK)
+    a, e, f = (graph.index[n] for n in "aef")
+    assert [names(graph, p) for p in graph.k_shortest_paths(a, e, 3)] == ["ade", "abce"]
+    assert [names(graph, p) for p in graph.k_shortest_paths(a, f, 1)] == ["adef"]
+    assert graph.k_shortest_paths(a, f, 3, max_hops=3) == [graph.shortest_path(a, f)]
+
+
+def test_matches_plain_bfs_on_random_graph():
+    rng = random.Random(7)
+    n_nodes = 200
+    edges = {tuple(sorted(rng.sample(range(n_nodes), 2))) for _ in range(400)}
+    network = {
+        "nodes": [{"id": str(n)} for n in range(n_nodes)],
+        "edges": [{"source": str(s), "target": str(t), "weight": 1} for s, t in edges],
+    }
+    graph = GraphEngine.from_network(network)
+
+    adjacency = {n: [] for n in range(n_nodes)}
+    for s, t in edges:
+        adjacency[s].append(t)
+        adjacency[t].append(s)
+
+    def plain_distances(source):
+        distances = {source: 0}
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            for neighbor in adjacency[node]:
+                if neighbor not in distances:
+                    distances[neighbor] = distances[node] + 1
+                    queue.append(neighbor)
+        return distances
+
+    for source in rng.sample(range(n_nodes), 10):
+        expected = plain_distances(source)
+        assert graph.bfs(source) == expected
+        for target in rng.sample(range(n_nodes), 20):
+            path = graph.shortest_path(source, target)
+            if target not in expected:
+                assert path is None
+                continue
+            assert len(path) - 1 == expected[target]
+            assert all(b in adjacency[a] for a, b in zip(path, path[1:]))
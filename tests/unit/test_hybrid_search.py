@@ -0,0 +1,93 @@
+"""
+Unit Tests for hybrid search helpers
+
+Test Coverage:
+- Reciprocal rank fusion (agreement between retrievers, weights, duplicates)
+- Boolean post-filters (explicit operators only, must / should / must_not)
+- Cursor encoding and the TTL result cache used for stable pagination
+
+Run tests:
+    pytest tests/unit/test_hybrid_search.py -v
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "server"))
+
+from services.hybrid_search import (
+    BooleanPostFilter,
+    SearchResultCache,
+    decode_cursor,
+    encode_cursor,
+    reciprocal_rank_fusion,
+)
+
+
+def test_reciprocal_rank_fusion():
+    fused = reciprocal_rank_fusion(
+        {"bm25": ["a", "b", "c"], "dense": ["c", "d", "c"]},
+        k=60,
+    )
+    ids = [item_id for item_id, _, _ in fused]
+    assert ids == ["c", "a", "b", "d"]  # found by both -> first; ties keep first-seen order
+    assert fused[0][1] == pytest.approx(1 / 63 + 1 / 61)
+    assert fused[0][2] == {"bm25": 3, "dense": 1}
+    assert fused[1][2] == {"bm25": 1}
+
+    weighted = reciprocal_rank_fusion({"bm25": ["a"], "dense": ["b"]}, weights={"dense": 2.0})
+    assert [item_id for item_id, _, _ in weighted] == ["b", "a"]
+    assert reciprocal_rank_fusion({}) == []
+
+
+def test_boolean_post_filter():
+    terms = {"must": ["maxwell"], "should": [], "must_not": ["clinton"]}
+
+    explicit = BooleanPostFilter.from_query("maxwell NOT clinton", terms)
+    assert explicit.matches("Ghislaine MAXWELL at the island")
+    assert not explicit.matches("Maxwell and Clinton")
+    assert not explicit.matches("the island")
+
+    # Plain queries are not filtered: dense hits need not contain the words
+    plain = BooleanPostFilter.from_query("maxwell", {"must": ["maxwell"], "should": [], "must_not": []})
+    assert not plain.active and plain.matches("the island")
+
+    either = BooleanPostFilter.from_query(
+        "palm OR island", {"must": [], "should": ["palm", "island"], "must_not": []}
+    )
+    assert either.matches("Little St. James island") and not either.matches("New York")
+
+    # Lowercase "not" is an ordinary word, not an operator
+    prose = BooleanPostFilter.from_query(
+        "flights that did not include clinton",
+        {"must": ["flights", "that", "did", "clinton"], "should": [], "must_not": ["include"]},
+    )
+    assert not prose.active and prose.matches("passengers include clinton")
+
+
+def test_cursors():
+    assert decode_cursor(encode_cursor("abc-_1", 40)) == ("abc-_1", 40)
+    for bad in ("", "abc", "abc.", ".20", "abc.-1", "abc.x"):
+        with pytest.raises(ValueError):
+            decode_cursor(bad)
+
+
+def test_result_cache_ttl_and_capacity(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("services.hybrid_search.time.monotonic", lambda: now[0])
+
+    cache = SearchResultCache(max_entries=2, ttl=60)
+    first = cache.put(["r1"])
+    second = cache.put(["r2"])
+    assert first != second and cache.get(first) == ["r1"]  # now most recently used
+
+    third = cache.put(["r3"])
+    assert cache.get(second) is None and len(cache) == 2  # least recently used evicted
+    assert cache.get(first) == ["r1"]
+
+    now[0] += 61
+    assert cache.get(first) is None and cache.get(third) is None
+    assert len(cache) == 0
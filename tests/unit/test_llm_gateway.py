@@ -0,0 +1,159 @@
+"""
+Unit Tests for the async LLM gateway
+
+Runs against a local stub of the OpenAI-compatible /chat/completions API
+(ThreadingHTTPServer on 127.0.0.1), so no network access or API key is needed.
+
+Test Coverage:
+- Completions over the pooled client (auth header, payload)
+- Token streaming from server-sent events
+- Per-model concurrency limits
+- Timeouts and HTTP errors surfaced as LLMError
+
+Run tests:
+    pytest tests/unit/test_llm_gateway.py -v
+"""
+
+import asyncio
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "server"))
+
+from services.llm_gateway import LLMError, LLMGateway, parse_stream_line
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Echoes the last user message; behaviour selected by the model name"""
+
+    active: dict[str, int] = {}
+    max_active: dict[str, int] = {}
+    lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        model = body["model"]
+        text = body["messages"][-1]["content"]
+
+        if self.headers.get("Authorization") != "Bearer test-key":
+            self.send_error(401)
+            return
+        if model == "broken":
+            self.send_error(500)
+            return
+
+        # Requests in progress per model, counted while "thinking"
+        with StubHandler.lock:
+            StubHandler.active[model] = StubHandler.active.get(model, 0) + 1
+            StubHandler.max_active[model] = max(
+                StubHandler.max_active.get(model, 0), StubHandler.active[model]
+            )
+        if model.startswith("slow"):
+            time.sleep(0.2)
+        with StubHandler.lock:
+            StubHandler.active[model] -= 1
+
+        if body.get("stream"):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.end_headers()
+            self.wfile.write(b": keep-alive\n\n")
+            for word in text.split():
+                chunk = {"choices": [{"delta": {"content": word + " "}}]}
+                self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+                self.wfile.flush()
+            self.wfile.write(b"data: [DONE]\n\n")
+        else:
+            payload = json.dumps(
+                {"choices": [{"message": {"content": f"  echo: {text}  "}}]}
+            ).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+
+@pytest.fixture(scope="module")
+def stub_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v1"
+    server.shutdown()
+
+
+def user(text):
+    return [{"role": "user", "content": text}]
+
+
+def test_complete_and_stream(stub_url):
+    async def scenario():
+        gateway = LLMGateway(api_key="test-key", base_url=stub_url)
+        assert await gateway.complete("m", user("hello")) == "echo: hello"
+        deltas = [delta async for delta in gateway.stream("m", user("one two three"))]
+        assert deltas == ["one ", "two ", "three "]
+        await gateway.aclose()
+
+    asyncio.run(scenario())
+
+
+def test_errors(stub_url, monkeypatch):
+    async def scenario():
+        gateway = LLMGateway(api_key="test-key", base_url=stub_url, timeout=0.05)
+        with pytest.raises(LLMError, match="HTTP 500"):
+            await gateway.complete("broken", user("x"))
+        with pytest.raises(LLMError, match="did not respond"):
+            await gateway.complete("slow", user("x"))
+        with pytest.raises(LLMError, match="HTTP 500"):
+            async for _ in gateway.stream("broken", user("x")):
+                pass
+        await gateway.aclose()
+
+        monkeypatch.delenv("OPENROUTER_API_KEY", raising=False)
+        with pytest.raises(LLMError, match="OPENROUTER_API_KEY"):
+            await LLMGateway(base_url=stub_url).complete("m", user("x"))
+
+    asyncio.run(scenario())
+
+
+def test_per_model_concurrency(stub_url):
+    async def scenario():
+        gateway = LLMGateway(api_key="test-key", base_url=stub_url, model_concurrency=2)
+        results = await asyncio.gather(
+            *(gateway.complete("slow-a", user(str(i))) for i in range(5))
+        )
+        assert results == [f"echo: {i}" for i in range(5)]
+        assert StubHandler.max_active["slow-a"] == 2
+
+        busy = LLMGateway(
+            api_key="test-key", base_url=stub_url, model_concurrency=1, queue_timeout=0.05
+        )
+        outcomes = await asyncio.gather(
+            busy.complete("slow-b", user("a")),
+            busy.complete("slow-b", user("b")),
+            return_exceptions=True,
+        )
+        assert outcomes[0] == "echo: a" and isinstance(outcomes[1], LLMError)
+        await gateway.aclose()
+        await busy.aclose()
+
+    asyncio.run(scenario())
+
+
+def test_parse_stream_line():
+    assert parse_stream_line('data: {"choices": [{"delta": {"content": "hi"}}]}') == "hi"
+    assert parse_stream_line('data: {"choices": [{"delta": {"role": "assistant"}}]}') == ""
+    assert parse_stream_line(": OPENROUTER PROCESSING") == ""
+    assert parse_stream_line("data: not json") == ""
+    assert parse_stream_line("data: [DONE]") is None
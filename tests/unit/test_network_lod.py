@@ -0,0 +1,135 @@
+"""
+Unit Tests for network level-of-detail views
+
+Test Coverage:
+- Top-k edge pruning (per endpoint, against a brute-force reference)
+- Community overview (super-node sizes, internal and super-edge weights)
+- Community view ranking and limits
+- Neighbourhood expansion (hops, known nodes, hidden nodes)
+
+Run tests:
+    pytest tests/unit/test_network_lod.py -v
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "server"))
+
+from services.graph_engine import GraphEngine
+from services.network_lod import NetworkLOD, top_k_edge_mask
+
+
+#   community 0: a b c (triangle)    community 1: d e     f (community 2)
+#   a -5- b, b -4- c, a -1- c, c -2- d, d -6- e, e -3- f, b -1- e
+NETWORK = {
+    "nodes": [
+        {"id": n, "name": n.upper(), "connection_count": count}
+        for n, count in zip("abcdef", (2, 3, 3, 2, 3, 1))
+    ],
+    "edges": [
+        {"source": s, "target": t, "weight": w}
+        for s, t, w in [
+            ("a", "b", 5),
+            ("b", "c", 4),
+            ("a", "c", 1),
+            ("c", "d", 2),
+            ("d", "e", 6),
+            ("e", "f", 3),
+            ("b", "e", 1),
+        ]
+    ],
+}
+COMMUNITIES = [0, 0, 0, 1, 1, 2]
+
+
+def make_lod(**kwargs):
+    graph = GraphEngine.from_network(NETWORK)
+    return graph, NetworkLOD(graph, NETWORK["nodes"], COMMUNITIES, **kwargs)
+
+
+def edge_set(payload, graph):
+    edges = payload["edges"]
+    return {
+        graph.node_ids[s] + graph.node_ids[t]
+        for s, t in zip(edges["source"], edges["target"])
+    }
+
+
+def test_top_k_edge_mask_matches_brute_force():
+    rng = random.Random(5)
+    pairs = sorted({tuple(sorted(rng.sample(range(30), 2))) for _ in range(120)})
+    sources = np.array([a for a, _ in pairs])
+    targets = np.array([b for _, b in pairs])
+    weights = np.array([float(rng.randint(1, 10)) for _ in pairs])
+
+    for k in (1, 3):
+        expected = set()
+        for node in range(30):
+            incident = [i for i, (a, b) in enumerate(pairs) if node in (a, b)]
+            incident.sort(key=lambda i: (-weights[i], i))
+            expected.update(incident[:k])
+        mask = top_k_edge_mask(sources, targets, weights, k)
+        assert set(np.flatnonzero(mask)) == expected
+
+    assert top_k_edge_mask(sources, targets, weights, 0).all()
+
+
+def test_overview():
+    graph, lod = make_lod()
+    view = lod.overview(top_k=None, leaders=1)
+    communities = view["communities"]
+    assert communities["index"] == [0, 1, 2]
+    assert communities["size"] == [3, 2, 1]
+    assert communities["internal_weight"] == [10, 6, 0]
+    # Leaders by connection_count (ties: node order)
+    assert communities["leaders"] == [[1], [4], [5]]
+    assert view["nodes"]["id"] == ["b", "e", "f"]
+
+    super_edges = dict(
+        zip(zip(view["edges"]["source"], view["edges"]["target"]), view["edges"]["weight"])
+    )
+    assert super_edges == {(0, 1): 3, (1, 2): 3}
+
+
+def test_community_view():
+    graph, lod = make_lod()
+    view = lod.community(0, max_nodes=2, top_k=None)
+    assert view["nodes"]["id"] == ["b", "c"]
+    assert edge_set(view, graph) == {"bc"}
+
+    view = lod.community(0, top_k=1)
+    assert edge_set(view, graph) == {"ab", "bc"}
+    assert view["nodes"]["community"] == [0, 0, 0]
+
+
+def test_expand():
+    graph, lod = make_lod()
+    a, c = graph.index["a"], graph.index["c"]
+
+    view = lod.expand([a], hops=1, top_k=None)
+    assert view["nodes"]["id"] == ["a", "b", "c"]
+    assert view["nodes"]["hops"] == [0, 1, 1]
+    assert edge_set(view, graph) == {"ab", "bc", "ac"}
+
+    # Known nodes are not re-sent; edges to them are
+    view = lod.expand([c], known=[a, graph.index["b"], c], hops=1, top_k=None)
+    assert view["nodes"]["id"] == ["d"]
+    assert edge_set(view, graph) == {"cd"}
+
+    view = lod.expand([a], hops=2, max_nodes=4, top_k=None)
+    assert view["nodes"]["id"] == ["a", "b", "c", "e"]
+
+
+def test_hidden_nodes():
+    graph, lod = make_lod(hidden=[4])  # e
+    view = lod.expand([graph.index["d"]], hops=2, top_k=None)
+    # e is neither returned nor traversed (f is only reachable through e)
+    assert view["nodes"]["id"] == ["d", "c", "b", "a"]
+    assert lod.overview()["communities"]["size"] == [3, 1, 1]
+    assert lod.expand([graph.index["e"]])["nodes"]["index"] == []
+
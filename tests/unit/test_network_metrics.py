@@ -0,0 +1,165 @@
+"""
+Unit Tests for offline network metrics
+
+Test Coverage:
+- PageRank (sums to 1, uniform on regular graphs, hubs rank first)
+- Betweenness (exact path/star values, sampled estimate)
+- Eigenvector centrality against a dense eigendecomposition
+- Louvain communities and modularity
+- NetworkMetrics loading, staleness and lookups
+
+Run tests:
+    pytest tests/unit/test_network_metrics.py -v
+"""
+
+import json
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "server"))
+
+from services.graph_engine import GraphEngine
+from services.network_metrics import (
+    METRICS_SCHEMA_VERSION,
+    NetworkMetrics,
+    betweenness_centrality,
+    compute_graph_metrics,
+    eigenvector_centrality,
+    file_digest,
+    louvain_communities,
+    pagerank,
+)
+
+
+def graph_from_pairs(n, pairs, weights=None):
+    return GraphEngine(
+        [f"n{i}" for i in range(n)],
+        [a for a, _ in pairs],
+        [b for _, b in pairs],
+        weights or [1] * len(pairs),
+    )
+
+
+def dense(graph):
+    matrix = np.zeros((len(graph), len(graph)))
+    rows = np.repeat(np.arange(len(graph)), graph.degree)
+    np.add.at(matrix, (rows, graph.indices), graph.weights)
+    return matrix
+
+
+def random_graph(n=60, edges=200, seed=3):
+    rng = random.Random(seed)
+    pairs = set()
+    while len(pairs) < edges:
+        a, b = rng.sample(range(n), 2)
+        pairs.add((min(a, b), max(a, b)))
+    pairs = sorted(pairs)
+    return graph_from_pairs(n, pairs, [rng.randint(1, 30) for _ in pairs])
+
+
+def two_cliques():
+    """Two 5-cliques joined by one bridge (4-5)"""
+    pairs = [(a, b) for a in range(5) for b in range(a + 1, 5)]
+    pairs += [(a, b) for a in range(5, 10) for b in range(a + 1, 10)]
+    return graph_from_pairs(10, pairs + [(4, 5)])
+
+
+def test_pagerank():
+    ring = graph_from_pairs(6, [(i, (i + 1) % 6) for i in range(6)])
+    assert np.allclose(pagerank(ring), 1 / 6)
+
+    star = graph_from_pairs(5, [(0, i) for i in range(1, 5)])
+    scores = pagerank(star)
+    assert abs(scores.sum() - 1) < 1e-9
+    assert scores.argmax() == 0
+
+    # Isolated (dangling) nodes keep the total at 1
+    scores = pagerank(graph_from_pairs(4, [(0, 1)]))
+    assert abs(scores.sum() - 1) < 1e-9
+
+
+def test_betweenness_exact():
+    path = graph_from_pairs(3, [(0, 1), (1, 2)])
+    assert np.allclose(betweenness_centrality(path, None), [0, 1, 0])
+
+    star = graph_from_pairs(5, [(0, i) for i in range(1, 5)])
+    assert np.allclose(betweenness_centrality(star, None), [1, 0, 0, 0, 0])
+
+    # Square: two equal shortest paths between opposite corners
+    square = graph_from_pairs(4, [(0, 1), (1, 2), (2, 3), (3, 0)])
+    assert np.allclose(betweenness_centrality(square, None), 1 / 6)
+
+
+def test_betweenness_sampled():
+    graph = random_graph()
+    exact = betweenness_centrality(graph, None)
+    sampled = betweenness_centrality(graph, 40, seed=1)
+    assert np.array_equal(betweenness_centrality(graph, 40, seed=1), sampled)
+    assert np.abs(sampled - exact).max() < 0.05
+    assert exact.argmax() in np.argsort(-sampled)[:3]
+
+
+def test_eigenvector_matches_dense():
+    for graph in (random_graph(), two_cliques()):
+        _, vectors = np.linalg.eigh(dense(graph))
+        expected = np.abs(vectors[:, -1])
+        assert np.abs(eigenvector_centrality(graph) - expected).max() < 1e-5
+
+    assert not eigenvector_centrality(graph_from_pairs(3, [])).any()
+
+
+def test_louvain_two_cliques():
+    labels, quality = louvain_communities(two_cliques())
+    assert set(labels[:5]) == {labels[0]} and set(labels[5:]) == {labels[5]}
+    assert labels[0] != labels[5]
+    assert quality > 0.4
+
+    # Communities are numbered by size (0 = largest)
+    pairs = [(a, b) for a in range(6) for b in range(a + 1, 6)] + [(6, 7), (7, 8), (6, 8)]
+    labels, _ = louvain_communities(graph_from_pairs(9, pairs + [(5, 6)]))
+    assert labels[0] == 0 and labels[8] == 1
+
+
+def test_network_metrics_load(tmp_path):
+    network = {
+        "nodes": [{"id": f"n{i}", "name": f"N{i}"} for i in range(10)],
+        "edges": [
+            {"source": f"n{a}", "target": f"n{b}", "weight": 1}
+            for a in range(10)
+            for b in range(a + 1, 10)
+            if (a < 5) == (b < 5) or (a, b) == (4, 5)
+        ],
+    }
+    network_path = tmp_path / "entity_network.json"
+    network_path.write_text(json.dumps(network))
+    graph = GraphEngine.from_network(network)
+
+    metrics_path = tmp_path / "entity_network_metrics.json"
+    metrics_path.write_text(
+        json.dumps(
+            {
+                "schema_version": METRICS_SCHEMA_VERSION,
+                "generated": "2025-01-01T00:00:00",
+                "source_digest": file_digest(network_path),
+                "node_ids": graph.node_ids,
+                "graphs": {"flight": compute_graph_metrics(graph)},
+            }
+        )
+    )
+
+    metrics = NetworkMetrics.load(metrics_path, network_path)
+    assert not metrics.stale
+    values = metrics.node_metrics("n4")
+    assert values["degree"] == 5 and values["community"] in (0, 1)
+    assert metrics.score("n4", "betweenness") > metrics.score("n0", "betweenness")
+    assert metrics.node_metrics("missing") is None
+    assert metrics.node_metrics("n4", "coappearance") is None
+    assert metrics.summary()["graphs"]["flight"]["communities"] == 2
+
+    network_path.write_text(json.dumps({**network, "edges": network["edges"][:3]}))
+    assert NetworkMetrics.load(metrics_path, network_path).stale
+    assert NetworkMetrics.load(tmp_path / "missing.json") is None
@@ -0,0 +1,158 @@
+"""
+Unit Tests for the packed OCR corpus
+
+Test Coverage:
+- Round trip of text and metadata (uncompressed, zlib, zstd when installed)
+- Sharding and storage-order iteration
+- Conversion of an ocr_text/ directory
+- Loose-file fallback and reload after re-packing
+- Versioned shards: re-packing never changes files an open index references
+- Loose files newer than the index win over packed records
+
+Run tests:
+    pytest tests/unit/test_ocr_corpus.py -v
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "server"))
+
+from services import ocr_corpus
+from services.ocr_corpus import (
+    OCRCorpus,
+    OCRCorpusWriter,
+    get_ocr_corpus,
+    pack_directory,
+    read_ocr_metadata,
+    read_ocr_text,
+)
+
+
+DOCS = {
+    "DOJ-OGR-00000001": ("From: someone\nTo: someone else\fpage two", {"page_count": 2}),
+    "DOJ-OGR-00000002": ("", None),
+    "DOJ-OGR-00000003": ("Ünïcödé text " * 50, {"is_email": False}),
+}
+
+
+def write_corpus(path, compression="none", shard_bytes=1 << 20):
+    with OCRCorpusWriter(path, compression, shard_bytes) as writer:
+        for doc_id, (text, metadata) in DOCS.items():
+            writer.add(doc_id, text, metadata)
+    return OCRCorpus(path)
+
+
+@pytest.mark.parametrize(
+    "compression",
+    [
+        "none",
+        "zlib",
+        pytest.param(
+            "zstd",
+            marks=pytest.mark.skipif(
+                ocr_corpus.zstandard is None, reason="zstandard not installed"
+            ),
+        ),
+    ],
+)
+def test_round_trip(tmp_path, compression):
+    corpus = write_corpus(tmp_path / "corpus", compression)
+    assert len(corpus) == 3 and "DOJ-OGR-00000002" in corpus and "MISSING" not in corpus
+
+    for doc_id, (text, metadata) in DOCS.items():
+        assert corpus.get_text(doc_id) == text
+        assert bytes(corpus.get_bytes(doc_id)) == text.encode("utf-8")
+        assert corpus.get_metadata(doc_id) == metadata
+        assert corpus.text_length(doc_id) == len(text)
+    assert corpus.get_text("MISSING") is None and corpus.get_metadata("MISSING") is None
+
+
+def test_sharding_and_iteration(tmp_path):
+    # A shard is closed once it passes shard_bytes: the empty document shares the last one
+    corpus = write_corpus(tmp_path / "corpus", shard_bytes=16)
+    assert list(corpus.columns["shard"]) == [0, 1, 1]
+    assert len(list((tmp_path / "corpus").glob("shard-*.bin"))) == 2
+    assert list(corpus.iter_texts()) == [(doc_id, text) for doc_id, (text, _) in DOCS.items()]
+    assert not list((tmp_path / "corpus").glob("*.tmp"))
+
+    # Re-packing into fewer shards removes the stale ones
+    corpus = write_corpus(tmp_path / "corpus")
+    assert len(list((tmp_path / "corpus").glob("shard-*.bin"))) == 1
+    assert corpus.get_text("DOJ-OGR-00000003") == DOCS["DOJ-OGR-00000003"][0]
+
+
+def test_repack_never_touches_published_shards(tmp_path):
+    corpus_dir = tmp_path / "corpus"
+    old = write_corpus(corpus_dir)
+    index = json.loads((corpus_dir / "index.json").read_text())
+
+    # A failed re-pack leaves the published corpus and no new shards behind
+    with pytest.raises(RuntimeError):
+        with OCRCorpusWriter(corpus_dir) as writer:
+            writer.add("DOJ-OGR-00000009", "partial")
+            raise RuntimeError("OCR run interrupted")
+    assert json.loads((corpus_dir / "index.json").read_text()) == index
+    assert sorted(path.name for path in corpus_dir.glob("shard-*.bin")) == index["shards"]
+
+    # A successful one writes new shard names, so the old index never pairs with new data
+    with OCRCorpusWriter(corpus_dir) as writer:
+        writer.add("DOJ-OGR-00000009", "repacked")
+    shards = json.loads((corpus_dir / "index.json").read_text())["shards"]
+    assert not set(shards) & set(index["shards"])
+    assert sorted(path.name for path in corpus_dir.glob("shard-*.bin")) == shards
+    assert old.get_text("DOJ-OGR-00000001") == DOCS["DOJ-OGR-00000001"][0]  # mapping survives
+    assert OCRCorpus(corpus_dir).get_text("DOJ-OGR-00000009") == "repacked"
+
+
+def test_pack_directory_and_fallback(tmp_path):
+    text_dir = tmp_path / "ocr_text"
+    text_dir.mkdir()
+    for doc_id, (text, metadata) in DOCS.items():
+        (text_dir / f"{doc_id}.txt").write_text(text, encoding="utf-8")
+        if metadata:
+            (text_dir / f"{doc_id}.json").write_text(json.dumps(metadata))
+
+    corpus_dir = tmp_path / "ocr_corpus"
+    assert get_ocr_corpus(corpus_dir) is None
+    assert read_ocr_text("DOJ-OGR-00000001", text_dir, corpus_dir) == DOCS["DOJ-OGR-00000001"][0]
+
+    assert pack_directory(text_dir, corpus_dir) == 3
+    corpus = get_ocr_corpus(corpus_dir)
+    assert corpus.doc_ids == sorted(DOCS)
+    assert get_ocr_corpus(corpus_dir) is corpus
+
+    # Packed documents no longer touch the loose files
+    (text_dir / "DOJ-OGR-00000001.txt").unlink()
+    (text_dir / "DOJ-OGR-00000001.json").unlink()
+    assert read_ocr_text("DOJ-OGR-00000001", text_dir, corpus_dir) == DOCS["DOJ-OGR-00000001"][0]
+    assert read_ocr_metadata("DOJ-OGR-00000001", text_dir, corpus_dir) == {"page_count": 2}
+
+    # Documents re-OCRed after packing are read from the newer loose files
+    newer_ns = corpus.index_mtime_ns + 1_000_000_000
+    (text_dir / "DOJ-OGR-00000003.txt").write_text("re-OCRed text")
+    (text_dir / "DOJ-OGR-00000003.json").write_text(json.dumps({"is_email": True}))
+    for suffix in (".txt", ".json"):
+        os.utime(text_dir / f"DOJ-OGR-00000003{suffix}", ns=(newer_ns, newer_ns))
+    assert read_ocr_text("DOJ-OGR-00000003", text_dir, corpus_dir) == "re-OCRed text"
+    assert read_ocr_metadata("DOJ-OGR-00000003", text_dir, corpus_dir) == {"is_email": True}
+    older_ns = corpus.index_mtime_ns - 1_000_000_000
+    os.utime(text_dir / "DOJ-OGR-00000003.txt", ns=(older_ns, older_ns))
+    assert read_ocr_text("DOJ-OGR-00000003", text_dir, corpus_dir) == DOCS["DOJ-OGR-00000003"][0]
+
+    # Documents OCRed after packing are read from the loose files
+    (text_dir / "DOJ-OGR-00000004.txt").write_text("new document")
+    assert read_ocr_text("DOJ-OGR-00000004", text_dir, corpus_dir) == "new document"
+    assert read_ocr_text("MISSING", text_dir, corpus_dir) is None
+    assert read_ocr_metadata("MISSING", text_dir, corpus_dir) is None
+
+    # Re-packing is picked up by the shared reader
+    with OCRCorpusWriter(corpus_dir) as writer:
+        writer.add("DOJ-OGR-00000004", "new document")
+    ocr_corpus._corpora[corpus_dir.resolve()].index_mtime_ns -= 1
+    assert get_ocr_corpus(corpus_dir).doc_ids == ["DOJ-OGR-00000004"]
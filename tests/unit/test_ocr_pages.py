@@ -0,0 +1,72 @@
+"""
+Unit Tests for the page-granular OCR store
+
+Test Coverage:
+- Page manifests (page counts, re-planning)
+- Per-page checkpoints and pending pages (resume)
+- Document reassembly in page order
+- Atomic writes (no temp files left behind)
+
+Run tests:
+    pytest tests/unit/test_ocr_pages.py -v
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts" / "extraction"))
+
+from ocr_pages import PAGE_SEPARATOR, PageStore
+
+
+def test_manifest(tmp_path):
+    store = PageStore(tmp_path)
+    assert store.load_manifest("DOC_1") is None
+    assert store.pending_pages("DOC_1") == []
+
+    manifest = store.record_page_count("DOC_1", "DOC_1.pdf", 3)
+    assert manifest == {"source_pdf": "DOC_1.pdf", "page_count": 3, "assembled": False}
+    assert store.pending_pages("DOC_1") == [1, 2, 3]
+
+    store.mark_assembled("DOC_1")
+    assert store.record_page_count("DOC_1", "DOC_1.pdf", 3)["assembled"]
+    # A different page count re-plans the document
+    assert not store.record_page_count("DOC_1", "DOC_1.pdf", 4)["assembled"]
+
+
+def test_checkpoints_and_resume(tmp_path):
+    store = PageStore(tmp_path)
+    store.record_page_count("DOC_1", "DOC_1.pdf", 3)
+    record = store.save_page("DOC_1", 2, "second page\f", {"ocr_time": 1.5})
+    assert record["page"] == 2 and record["text_length"] == 12 and record["ocr_time"] == 1.5
+
+    # A page text without its metadata checkpoint (crash mid-page) is pending
+    store.page_text_path("DOC_1", 3).write_text("partial")
+    assert store.pending_pages("DOC_1") == [1, 3]
+    assert not store.is_complete("DOC_1")
+
+    # A fresh store (new process) sees the same state
+    resumed = PageStore(tmp_path)
+    assert resumed.done_pages("DOC_1") == {2}
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_assemble(tmp_path):
+    store = PageStore(tmp_path)
+    store.record_page_count("DOC_1", "DOC_1.pdf", 3)
+    for page in (3, 1):
+        store.save_page("DOC_1", page, f"page {page}\f", {})
+
+    with pytest.raises(ValueError):
+        store.assemble("DOC_1")
+    with pytest.raises(ValueError):
+        store.assemble("MISSING")
+
+    store.save_page("DOC_1", 2, "page 2", {})
+    assert store.is_complete("DOC_1")
+    text, pages = store.assemble("DOC_1")
+    assert text.split(PAGE_SEPARATOR) == ["page 1", "page 2", "page 3"]
+    assert [page["page"] for page in pages] == [1, 2, 3]
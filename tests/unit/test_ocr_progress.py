@@ -0,0 +1,137 @@
+"""
+Unit Tests for the OCR progress store
+
+Test Coverage:
+- Status before a run exists (no database created by readers)
+- Counters kept in step with document rows (retries, emails, pages)
+- Fresh runs vs. resumed runs
+- Import of the legacy ocr_progress.json format
+- Status served from a tree that only has ocr_progress.json
+- Stall detection
+
+Run tests:
+    pytest tests/unit/test_ocr_progress.py -v
+"""
+
+import json
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "server"))
+
+from services.ocr_progress import DEFAULT_TOTAL_FILES, OCRProgressStore
+
+
+def done(name, **fields):
+    return {"file": name, "success": True, "text_length": 100, **fields}
+
+
+def test_status_before_start(tmp_path):
+    store = OCRProgressStore(tmp_path / "ocr_progress.db")
+    status = store.status()
+    assert not status["started"]
+    assert status["completed"] == 0 and status["total_files"] == DEFAULT_TOTAL_FILES
+    assert store.completed_files() == set()
+    assert not (tmp_path / "ocr_progress.db").exists()
+
+
+def test_counters_follow_documents(tmp_path):
+    store = OCRProgressStore(tmp_path / "ocr_progress.db")
+    store.start_run(total_files=4)
+    store.record_document(done("a.pdf"), pages_ocred=3)
+    store.record_document(
+        done("b.pdf", is_email=True, email_confidence=0.9, email_addresses=["x@y.com"]),
+        pages_ocred=1,
+    )
+    store.record_document({"file": "c.pdf", "success": False, "error": "page 2: boom"}, 1)
+
+    status = store.status()
+    assert (status["completed"], status["failed"], status["emails_found"]) == (2, 1, 1)
+    assert status["pages_ocred"] == 5
+    assert status["progress"] == 50.0
+    assert store.recent_failures() == [{"file": "c.pdf", "error": "page 2: boom"}]
+    assert store.email_candidates() == [
+        {"file": "b.pdf", "confidence": 0.9, "email_addresses": ["x@y.com"]}
+    ]
+
+    # A retried failure moves between counters instead of being counted twice
+    store.record_document(done("c.pdf"), pages_ocred=1)
+    store.record_document(done("b.pdf"))  # re-run: no longer an email
+    status = store.status()
+    assert (status["completed"], status["failed"], status["emails_found"]) == (3, 0, 0)
+    assert store.completed_files() == {"a.pdf", "b.pdf", "c.pdf"}
+
+
+def test_resume_and_fresh_runs(tmp_path):
+    store = OCRProgressStore(tmp_path / "ocr_progress.db")
+    store.start_run(total_files=2)
+    store.record_document(done("a.pdf"))
+    start_time = store.status()["start_time"]
+
+    store.start_run(total_files=3)
+    status = store.status()
+    assert status["completed"] == 1 and status["total_files"] == 3
+    assert status["start_time"] == start_time
+
+    store.start_run(total_files=3, fresh=True)
+    assert store.status()["completed"] == 0
+    assert store.completed_files() == set()
+
+
+def test_import_legacy_progress(tmp_path):
+    store = OCRProgressStore(tmp_path / "ocr_progress.db")
+    store.start_run(total_files=10)
+    imported = store.import_legacy_progress(
+        {
+            "completed": ["a.pdf", "b.pdf"],
+            "failed": [{"file": "b.pdf", "error": "old"}, {"file": "c.pdf", "error": "bad"}],
+            "email_candidates": [
+                {"file": "a.pdf", "confidence": 0.7, "email_addresses": ["p@q.org"]}
+            ],
+            "stats": {"start_time": "2025-11-20T10:00:00"},
+        }
+    )
+    assert imported == 3
+    status = store.status()
+    assert (status["completed"], status["failed"], status["emails_found"]) == (2, 1, 1)
+    assert status["start_time"] == "2025-11-20T10:00:00"
+
+
+def test_stalled(tmp_path):
+    store = OCRProgressStore(tmp_path / "ocr_progress.db")
+    store.start_run(total_files=2)
+    assert not store.status()["stalled"]
+
+    old = (datetime.now() - timedelta(hours=1)).isoformat()
+    with store.get_connection() as conn:
+        conn.execute("UPDATE meta SET value = ? WHERE key = 'last_update'", (old,))
+    assert store.status()["stalled"]
+
+
+def test_status_from_legacy_json_alone(tmp_path):
+    legacy_path = tmp_path / "ocr_progress.json"
+    legacy_path.write_text(
+        json.dumps(
+            {
+                "completed": ["a.pdf", "b.pdf"],
+                "failed": [],
+                "email_candidates": [{"file": "b.pdf", "confidence": 0.9}],
+                "stats": {"start_time": None, "last_update": "2025-11-16T22:15:45"},
+            }
+        )
+    )
+    store = OCRProgressStore(tmp_path / "ocr_progress.db", legacy_path=legacy_path)
+    status = store.status()
+    assert status["started"] and (status["completed"], status["emails_found"]) == (2, 1)
+    assert status["last_update"] == "2025-11-16T22:15:45"
+    assert store.completed_files() == {"a.pdf", "b.pdf"}
+    assert not list(tmp_path.glob("*.tmp*"))
+
+    # An existing database (e.g. a new OCR run) is never replaced by the import
+    other = tmp_path / "other"
+    other.mkdir()
+    OCRProgressStore(other / "ocr_progress.db").start_run(total_files=5, fresh=True)
+    status = OCRProgressStore(other / "ocr_progress.db", legacy_path=legacy_path).status()
+    assert status["completed"] == 0 and status["total_files"] == 5
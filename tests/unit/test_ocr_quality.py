@@ -0,0 +1,118 @@
+"""
+Unit Tests for OCR quality scoring
+
+Test Coverage:
+- Compiled Bloom-filter lexicon (membership, false-positive rate, persistence)
+- Word/corruption metrics (control, replacement and unassigned characters)
+- Batch scoring matches per-text scoring
+- Precomputed scores file and quality-adjusted ranking
+
+Run tests:
+    pytest tests/unit/test_ocr_quality.py -v
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "server"))
+
+from core.ocr_quality import BloomLexicon, OCRQualityAssessor, load_lexicon
+from services.ocr_quality_scores import (
+    SCORES_SCHEMA_VERSION,
+    get_ocr_quality_scores,
+    quality_adjusted,
+)
+
+
+WORDS = [f"word{chr(97 + i % 26)}{i}" for i in range(5000)]
+
+
+def test_bloom_lexicon(tmp_path):
+    lexicon = BloomLexicon.from_words(WORDS + ["  Court ", ""])
+    assert len(lexicon) == 5001
+    assert lexicon.contains_many(WORDS).all()
+    assert "court" in lexicon and "zzqx" not in lexicon
+
+    # 0.1% target false-positive rate
+    unknown = [f"other{i}" for i in range(20000)]
+    assert lexicon.contains_many(unknown).mean() < 0.005
+
+    path = tmp_path / "lexicon.npz"
+    lexicon.save(path)
+    loaded = BloomLexicon.load(path)
+    assert loaded.contains_many(WORDS).all()
+    assert (loaded.contains_many(unknown) == lexicon.contains_many(unknown)).all()
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_dictionary_sources(tmp_path):
+    word_list = tmp_path / "words.txt"
+    word_list.write_text("Alpha\nbeta\n\n")
+    compiled = tmp_path / "words.npz"
+    BloomLexicon.from_words(["alpha", "beta"]).save(compiled)
+
+    for path in (word_list, compiled):
+        assessor = OCRQualityAssessor(path)
+        assert assessor.assess("alpha beta gamma delta")["word_score"] == 0.5
+    # Loaded once per process
+    assert OCRQualityAssessor(word_list).dictionary is load_lexicon(str(word_list))
+    assert OCRQualityAssessor(tmp_path / "missing.txt").assess("the court")["word_score"] == 1.0
+
+
+def test_metrics():
+    assessor = OCRQualityAssessor()
+    # 2+ letter runs only: "a", digits and letter/digit mixes are not words
+    assert assessor._extract_words("The COURT a x1 12 e-mail") == ["the", "court", "mail"]
+    assert assessor.assess("")["overall_score"] == 0.0
+
+    clean = "the court order\n" * 10
+    assert assessor._assess_corruption(clean) == 1.0
+    # Control character: 3, replacement character: 5, unassigned code point: 3 + 2
+    assert assessor._assess_corruption("x" * 99 + "\x07") == pytest.approx(1 - 0.3)
+    assert assessor._assess_corruption("x" * 99 + "�") == pytest.approx(1 - 0.5)
+    assert assessor._assess_corruption("x" * 99 + "\U000e0000") == pytest.approx(1 - 0.5)
+    assert assessor._assess_corruption("café\n\t\r" * 10) == 1.0
+
+
+def test_batch_matches_single():
+    assessor = OCRQualityAssessor()
+    texts = [
+        "Dear counsel,\nPlease find the motion attached.\n",
+        "Th1s i5 a p00r1y\n0CR'd d0cum3nt\x0c�",
+        "",
+        "epstein maxwell EPSTEIN zzqq",
+    ]
+    assert assessor.assess_batch(texts) == [assessor.assess(text) for text in texts]
+    assert assessor.assess_batch([]) == []
+
+
+def test_scores_file_and_ranking(tmp_path):
+    path = tmp_path / "ocr_quality_scores.json"
+    assert get_ocr_quality_scores(path) is None
+
+    path.write_text(
+        json.dumps(
+            {
+                "schema_version": SCORES_SCHEMA_VERSION,
+                "doc_ids": ["A", "B"],
+                "overall": [0.95, 0.2],
+                "word": [0.9, 0.1],
+                "corruption": [1.0, 0.5],
+                "line": [0.9, 0.1],
+            }
+        )
+    )
+    scores = get_ocr_quality_scores(path)
+    assert scores.get("A") == 0.95 and scores.get("C") is None and len(scores) == 2
+    assert get_ocr_quality_scores(path) is scores
+
+    assert quality_adjusted(0.8, None, 0.3) == 0.8
+    assert quality_adjusted(0.8, 0.2, 0.0) == 0.8
+    # A slightly better match with garbage OCR ranks below a clean one
+    garbage = quality_adjusted(0.8, scores.get("B"), 0.3)
+    assert garbage < quality_adjusted(0.75, scores.get("A"), 0.3)
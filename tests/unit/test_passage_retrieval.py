@@ -0,0 +1,106 @@
+"""
+Unit Tests for chunking and passage retrieval
+
+Test Coverage:
+- Token windows: overlap, exact character offsets, tail merging
+- Chunk hit aggregation per document (max / sum) with best passage
+
+Run tests:
+    pytest tests/unit/test_passage_retrieval.py -v
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "server"))
+
+from services.passage_retrieval import aggregate_chunk_hits, chunk_query_size, filter_hits
+from utils.text_chunker import chunk_text, model_token_offsets
+
+
+def make_text(words: int) -> str:
+    return "  ".join(f"w{i}" for i in range(words))
+
+
+def test_windows_overlap_and_offsets():
+    text = make_text(500)
+    chunks = chunk_text(text, window=200, overlap=40)
+
+    assert [c.token_count for c in chunks] == [200, 200, 180]
+    for chunk in chunks:
+        assert text[chunk.start : chunk.end] == chunk.text
+    assert chunks[0].text.split()[-40:] == chunks[1].text.split()[:40]
+    assert chunks[-1].end == len(text)
+
+
+def test_short_tail_is_merged_and_blank_text():
+    chunks = chunk_text(make_text(205), window=200, overlap=40, min_tokens=8)
+    assert len(chunks) == 1 and chunks[0].token_count == 205
+
+    assert chunk_text("   \n ", window=10, overlap=2) == []
+    assert len(chunk_text("one two", window=10, overlap=2)) == 1
+
+    with pytest.raises(ValueError):
+        chunk_text("text", window=10, overlap=10)
+
+
+def test_model_token_offsets_drop_special_tokens():
+    def fake_tokenizer(text, **kwargs):
+        assert kwargs["return_offsets_mapping"] and not kwargs["add_special_tokens"]
+        return {"offset_mapping": [(0, 0), (0, 3), (4, 7), (0, 0)]}
+
+    chunks = chunk_text("abc def", window=4, overlap=1, tokenize=model_token_offsets(fake_tokenizer))
+    assert [(c.start, c.end, c.token_count) for c in chunks] == [(0, 7, 2)]
+
+
+def chunk_row(doc_id: str, index: int, distance: float, entities: str = ""):
+    metadata = {
+        "parent_doc_id": doc_id,
+        "chunk_index": index,
+        "char_start": index * 100,
+        "char_end": index * 100 + 120,
+        "filename": f"{doc_id}.txt",
+        "entity_mentions": entities,
+    }
+    return f"{doc_id}#c{index}", distance, f"passage {doc_id}/{index}", metadata
+
+
+def aggregate(rows, mode):
+    ids, distances, documents, metadatas = (list(column) for column in zip(*rows))
+    return aggregate_chunk_hits(ids, distances, documents, metadatas, mode=mode)
+
+
+def test_aggregate_max_and_sum():
+    rows = [
+        chunk_row("A", 3, 0.10, "Maxwell"),
+        chunk_row("B", 0, 0.20),
+        chunk_row("B", 1, 0.25),
+        chunk_row("B", 7, 0.30),
+        chunk_row("A", 4, 0.50, "Maxwell"),
+    ]
+
+    by_max = aggregate(rows, "max")
+    assert [hit.doc_id for hit in by_max] == ["A", "B"]
+    assert by_max[0].passage.chunk_index == 3
+    assert (by_max[0].passage.char_start, by_max[0].passage.char_end) == (300, 420)
+    assert by_max[0].passage.text == "passage A/3"
+    assert by_max[0].matched_chunks == 2
+    assert "parent_doc_id" not in by_max[0].metadata
+
+    by_sum = aggregate(rows, "sum")
+    assert [hit.doc_id for hit in by_sum] == ["B", "A"]
+    assert by_sum[0].score == pytest.approx(0.8 + 0.75 + 0.7)
+    assert by_sum[0].passage.chunk_index == 0
+
+    assert [hit.doc_id for hit in filter_hits(by_max, "Maxwell")] == ["A"]
+
+    with pytest.raises(ValueError):
+        aggregate(rows, "mean")
+
+
+def test_chunk_query_size():
+    assert chunk_query_size(10) == 50
+    assert chunk_query_size(1000) == 500
@@ -0,0 +1,86 @@
+"""
+Unit Tests for the background search analytics writer
+
+Test Coverage:
+- record() only enqueues; readers see pending events
+- Atomic flush in the existing on-disk format, reload from disk
+- Recent searches bounded, newest first; clear keeps popular counts
+- Size-triggered flush from the background thread
+
+Run tests:
+    pytest tests/unit/test_search_analytics.py -v
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "server"))
+
+from services.search_analytics import RECENT_LIMIT, SearchAnalytics
+
+
+def test_record_is_deferred_until_flush(tmp_path):
+    path = tmp_path / "metadata" / "search_analytics.json"
+    analytics = SearchAnalytics(path, start=False)
+
+    for query in ["maxwell", "flight logs", "maxwell"]:
+        analytics.record(query, ["all"])
+    assert not path.exists()
+
+    snapshot = analytics.snapshot()
+    assert snapshot["total_searches"] == 3
+    assert snapshot["popular_queries"] == {"maxwell": 2, "flight logs": 1}
+    assert [item["query"] for item in snapshot["recent_searches"]] == [
+        "maxwell",
+        "flight logs",
+        "maxwell",
+    ]
+    assert analytics.top_queries(1) == [("maxwell", 2)]
+
+    assert analytics.flush()
+    assert not analytics.flush()  # nothing new
+    on_disk = json.loads(path.read_text())
+    assert set(on_disk) == {"total_searches", "popular_queries", "recent_searches", "last_updated"}
+    assert on_disk["popular_queries"] == {"maxwell": 2, "flight logs": 1}
+    assert not list(path.parent.glob(".*.tmp"))
+
+    reloaded = SearchAnalytics(path, start=False)
+    reloaded.record("palm beach")
+    assert reloaded.snapshot()["total_searches"] == 4
+
+
+def test_recent_is_bounded_and_clear_keeps_counts(tmp_path):
+    analytics = SearchAnalytics(tmp_path / "a.json", start=False)
+    for i in range(RECENT_LIMIT + 20):
+        analytics.record(f"q{i}")
+
+    recent = analytics.snapshot()["recent_searches"]
+    assert len(recent) == RECENT_LIMIT
+    assert recent[0]["query"] == f"q{RECENT_LIMIT + 19}"
+
+    analytics.clear_recent()
+    snapshot = analytics.snapshot()
+    assert snapshot["recent_searches"] == []
+    assert len(snapshot["popular_queries"]) == RECENT_LIMIT + 20
+    assert analytics.flush()
+
+
+def test_background_flush_on_size(tmp_path):
+    path = tmp_path / "a.json"
+    analytics = SearchAnalytics(path, flush_interval=60, flush_every=5)
+    try:
+        for i in range(5):
+            analytics.record(f"q{i}")
+
+        deadline = time.monotonic() + 5
+        while not path.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert json.loads(path.read_text())["total_searches"] == 5
+    finally:
+        analytics.record("last")
+        analytics.close()
+
+    assert json.loads(path.read_text())["total_searches"] == 6
@@ -0,0 +1,106 @@
+"""
+Unit Tests for the chatbot site snapshot
+
+Test Coverage:
+- Capabilities computed from the source files (missing files tolerated)
+- Indexed entity detection matches the linear substring scan
+- Rebuild on source change (mtime/size) and on file watcher invalidation
+- Per-message overhead
+
+Run tests:
+    pytest tests/unit/test_site_snapshot.py -v
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "server"))
+
+from services.site_snapshot import SiteSnapshotProvider
+
+
+STATISTICS = {
+    "Ghislaine Maxwell": {"total_documents": 40, "connection_count": 12, "is_billionaire": False},
+    "Maxwell": {"total_documents": 3, "in_black_book": True},
+    "Bill Gates": {"total_documents": 5, "is_billionaire": True, "biography": "..."},
+    "Al": {"total_documents": 1},
+}
+
+
+@pytest.fixture
+def sources(tmp_path):
+    paths = {
+        "entity_statistics": tmp_path / "entity_statistics.json",
+        "entity_network": tmp_path / "entity_network.json",
+        "classifications": tmp_path / "document_classifications.json",
+        "documents": tmp_path / "all_documents_index.json",
+        "flights": tmp_path / "flight_logs_by_flight.json",
+    }
+    paths["entity_statistics"].write_text(json.dumps({"statistics": STATISTICS}))
+    paths["entity_network"].write_text(json.dumps({"nodes": [1, 2], "edges": [[1, 2]]}))
+    paths["classifications"].write_text(json.dumps({"results": {"a": {}, "b": {}}}))
+    paths["flights"].write_text(json.dumps({"flights": [{}, {}, {}]}))
+    return paths
+
+
+def test_capabilities(sources):
+    capabilities = SiteSnapshotProvider(sources).get().capabilities
+    assert capabilities["entities"] == {
+        "total": 4,
+        "with_bios": 1,
+        "billionaires": 1,
+        "in_black_book": 1,
+    }
+    assert capabilities["flights"] == {"total": 3, "searchable": True}
+    assert capabilities["documents"]["total"] == 2  # no unified index: classification count
+    assert capabilities["network"] == {"nodes": 2, "edges": 1, "available": True}
+
+
+def test_detect_entities_matches_linear_scan(sources):
+    snapshot = SiteSnapshotProvider(sources).get()
+    for query in ["Who flew with GHISLAINE MAXWELL and bill gates?", "Tell me about Alan", "hi"]:
+        expected = [name for name in STATISTICS if name.lower() in query.lower()]
+        assert [entity["name"] for entity in snapshot.detect_entities(query)] == expected
+
+    (entity,) = snapshot.detect_entities("bill gates")
+    assert entity == {
+        "name": "Bill Gates",
+        "documents": 5,
+        "connections": 0,
+        "flights": 0,
+        "is_billionaire": True,
+    }
+
+
+def test_rebuild_on_change_and_invalidate(sources):
+    provider = SiteSnapshotProvider(sources, check_interval=0)
+    first = provider.get()
+    assert provider.get() is first
+
+    sources["flights"].write_text(json.dumps({"flights": [{}] * 10}))
+    os.utime(sources["flights"], ns=(0, time.time_ns() + 10**9))
+    second = provider.get()
+    assert second is not first and second.version != first.version
+    assert second.capabilities["flights"]["total"] == 10
+
+    provider.invalidate("timeline_updated", "timeline_events.json")  # not a source
+    assert provider.get() is second
+    provider.invalidate("flights_updated", "flight_logs_by_flight.json")
+    assert provider.get() is not second
+    assert provider.rebuild_count == 3
+
+
+def test_per_message_overhead(sources):
+    provider = SiteSnapshotProvider(sources)
+    provider.get()
+    start = time.perf_counter()
+    for _ in range(100):
+        snapshot = provider.get()
+        snapshot.detect_entities("Tell me about Ghislaine Maxwell's flights")
+    assert (time.perf_counter() - start) / 100 < 0.005
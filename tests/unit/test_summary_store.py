@@ -0,0 +1,96 @@
+"""
+Unit Tests for the AI summary store
+
+Test Coverage:
+- Summary lookup by document hash and model (with cross-model fallback)
+- One-time import of summaries cached in master_document_index.json
+- Single-flight coalescing of concurrent summary generation
+- Master index lookups by hash through DocumentCatalog(id_field="hash")
+
+Run tests:
+    pytest tests/unit/test_summary_store.py -v
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "server"))
+
+from services.document_catalog import DocumentCatalog
+from services.summary_store import SingleFlight, SummaryStore
+
+
+def test_get_put_and_model_fallback(tmp_path):
+    store = SummaryStore(tmp_path / "summaries.db")
+    assert store.get("abc", "model-a") is None
+
+    store.put("abc", "model-a", "First summary text", "ocr", generated_at="2025-01-01T00:00:00")
+    store.put("abc", "model-b", "Second one", "pdf_extraction", generated_at="2025-02-01T00:00:00")
+
+    record = store.get("abc", "model-a")
+    assert record["summary"] == "First summary text" and record["word_count"] == 3
+    assert store.get("abc", "model-c")["model"] == "model-b"  # newest other model
+    assert store.get("abc")["model"] == "model-b"
+
+    store.put("abc", "model-a", "Replaced", "ocr")
+    assert store.get("abc", "model-a")["summary"] == "Replaced"
+    assert len(store) == 2
+
+
+def test_import_documents(tmp_path):
+    store = SummaryStore(tmp_path / "summaries.db")
+    documents = [
+        {"hash": "h1", "summary": "Cached inline", "summary_model": "m", "summary_word_count": 2},
+        {"hash": "h2"},
+        {"summary": "no hash"},
+    ]
+    assert store.import_documents(documents) == 1
+    assert store.import_documents(documents) == 0
+    record = store.get("h1", "m")
+    assert record["summary"] == "Cached inline" and record["text_source"] == "unknown"
+
+
+def test_single_flight():
+    async def scenario():
+        flight = SingleFlight()
+        calls = []
+
+        async def generate():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return len(calls)
+
+        results = await asyncio.gather(*(flight.do("doc", generate) for _ in range(5)))
+        assert results == [1] * 5 and len(calls) == 1
+        assert "doc" not in flight
+
+        async def fail():
+            calls.append(1)
+            raise RuntimeError("upstream down")
+
+        for _ in range(2):  # failures are not cached
+            with pytest.raises(RuntimeError):
+                await flight.do("doc", fail)
+        assert len(calls) == 3
+
+        # A cancelled waiter doesn't cancel the shared call
+        waiter = asyncio.ensure_future(flight.do("slow", generate))
+        other = asyncio.ensure_future(flight.do("slow", generate))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        assert await other == 4
+
+    asyncio.run(scenario())
+
+
+def test_catalog_keyed_by_hash(tmp_path):
+    path = tmp_path / "master_document_index.json"
+    path.write_text(json.dumps({"documents": [{"hash": "h1", "canonical_path": "a.pdf"}]}))
+    catalog = DocumentCatalog(path, check_interval=0, id_field="hash")
+    assert catalog.get("h1")["canonical_path"] == "a.pdf"
+    assert catalog.get("a.pdf") is None
@@ -0,0 +1,157 @@
+"""
+Unit Tests for vector-store filter metadata and pushdown
+
+Test Coverage:
+- Free-form date normalization (ISO, MM/DD/YYYY, "Month D, YYYY") and epochs
+- Index-time filter metadata (date, date_epoch, entity_ids)
+- ChromaDB where clauses for equality, date ranges and entities
+- Adaptive re-query loop when post-filters under-fill the page
+- Pushdown only once every row carries filter metadata
+
+Run tests:
+    pytest tests/unit/test_vector_filters.py -v
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "server"))
+
+import services.vector_filters as vector_filters
+from services.vector_filters import (
+    FILTER_SCHEMA_VERSION,
+    filter_metadata,
+    legacy_date_match,
+    normalize_date,
+    query_filtered,
+    supports_pushdown,
+    where_clauses,
+)
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("2024-11-18T09:30:00Z", "2024-11-18"),
+        ("2005-3-4", "2005-03-04"),
+        ("03/14/2005", "2005-03-14"),
+        ("3/14/05", "2005-03-14"),
+        ("7/4/99", "1999-07-04"),
+        ("March 14, 2005", "2005-03-14"),
+        ("Sept 14 2005", None),
+        ("02/30/2005", None),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_normalize_date(value, expected):
+    assert normalize_date(value) == expected
+
+
+def test_filter_metadata():
+    metadata = filter_metadata("January 2, 1970", ["Ghislaine  Maxwell", "ghislaine maxwell", " "])
+    assert metadata == {
+        "date": "1970-01-02",
+        "date_epoch": 86400,
+        "entity_ids": ["ghislaine maxwell"],
+        "filter_version": FILTER_SCHEMA_VERSION,
+    }
+    assert filter_metadata("unknown", []) == {"filter_version": FILTER_SCHEMA_VERSION}
+
+
+def test_where_clauses():
+    assert where_clauses() is None
+    assert where_clauses({"doc_type": "news_article", "source": None}) == {"doc_type": "news_article"}
+    assert where_clauses(
+        {"doc_type": "news_article"},
+        date_start="1970-01-02",
+        date_end="01/03/1970",
+        entity="Ghislaine Maxwell",
+    ) == {
+        "$and": [
+            {"doc_type": "news_article"},
+            {"date_epoch": {"$gte": 86400}},
+            {"date_epoch": {"$lte": 172800}},
+            {"entity_ids": {"$contains": "ghislaine maxwell"}},
+        ]
+    }
+    with pytest.raises(ValueError):
+        where_clauses(date_start="last week")
+
+
+def test_legacy_date_match():
+    assert legacy_date_match({"published_date": "2024-11-18T09:00"}, "2024-11-01", None, "published_date")
+    assert not legacy_date_match({"date_extracted": "3/14/2005"}, "2006-01-01", None, "date_extracted")
+    assert legacy_date_match({}, "2006-01-01", "2006-12-31", "date_extracted")  # undated passes
+
+
+class FakeCollection:
+    """Returns the first n of a fixed ranking and records n_results"""
+
+    name = "fake"
+
+    def __init__(self, size: int):
+        self.ids = [f"doc{i}" for i in range(size)]
+        self.requests = []
+
+    def query(self, query_embeddings, n_results, where=None):
+        self.requests.append(n_results)
+        ids = self.ids[:n_results]
+        return {
+            "ids": [ids],
+            "distances": [[i / 1000 for i in range(len(ids))]],
+            "documents": [[f"text {doc_id}" for doc_id in ids]],
+            "metadatas": [[{"n": int(doc_id[3:])} for doc_id in ids]],
+        }
+
+
+def test_query_filtered_requeries_until_filled():
+    collection = FakeCollection(500)
+    hits = query_filtered(
+        collection, [0.0], 10, accept=lambda _id, _sim, _text, metadata: metadata["n"] % 9 == 0
+    )
+    assert [hit[0] for hit in hits] == [f"doc{i}" for i in range(0, 90, 9)]
+    assert collection.requests == [20, 40, 80, 160]
+
+
+def test_query_filtered_stops_when_exhausted_or_below_threshold():
+    collection = FakeCollection(25)
+    hits = query_filtered(collection, [0.0], 10, accept=lambda *_: False)
+    assert hits == [] and collection.requests == [20, 40]
+
+    collection = FakeCollection(500)
+    hits = query_filtered(collection, [0.0], 10, min_similarity=0.995, accept=lambda *_: False)
+    assert hits == [] and collection.requests == [20]  # similarity 0.994 at rank 7 ends it
+
+
+class MigrationCollection:
+    """Collection whose rows carry filter_version only from index `marked` on"""
+
+    def __init__(self, name: str, size: int, marked: int):
+        self.name = name
+        self.size = size
+        self.marked = marked
+
+    def count(self):
+        return self.size
+
+    def get(self, where=None, include=None, limit=None):
+        ids = [f"doc{i}" for i in range(self.marked, self.size)]
+        return {"ids": ids[:limit] if limit else ids}
+
+
+def test_supports_pushdown_requires_every_row_marked(monkeypatch):
+    monkeypatch.setattr(vector_filters, "_pushdown_support", {})
+
+    partial = MigrationCollection("partial", 10, marked=3)  # resumed re-index
+    assert not supports_pushdown(partial)
+    partial.marked = 0  # re-index finished; negative result still cached
+    assert not supports_pushdown(partial)
+    monkeypatch.setattr(vector_filters, "PUSHDOWN_RECHECK_SECONDS", 0.0)
+    assert supports_pushdown(partial)
+
+    assert not supports_pushdown(MigrationCollection("empty", 0, marked=0))
+    assert supports_pushdown(MigrationCollection("migrated", 10, marked=0))
@@ -79,7 +79,7 @@ def main():
     service = DocumentService(data_path)
 
     print(f"Dataset size: {len(service.documents):,} documents")
-    print(f"Index size: {len(service._document_index):,} entries")
+    print(f"Index size: {len(service.catalog):,} entries")
     print()
 
     # Run benchmarks
@@ -99,8 +99,8 @@ def main():
 
     # Memory overhead
     import sys
-    index_memory = sys.getsizeof(service._document_index)
-    for doc in service._document_index.values():
+    index_memory = sys.getsizeof(service.documents)
+    for doc in service.documents:
         index_memory += sys.getsizeof(doc)
 
     print(f"Memory overhead:      {index_memory / 1_000_000:>10.2f} MB (index only)")
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Benchmark Entity Detection: Aho–Corasick vs. per-pattern regex
+
+Compares the single-pass automaton in EntityDetector against the previous
+implementation (one compiled `\\b{name}\\b` regex per name variation) on real
+OCR files, and reports where the two disagree.
+
+Expected differences:
+- The regex version counts overlapping sub-names twice ("Epstein" inside
+  "Jeffrey Epstein"); the automaton resolves matches longest first, so
+  mention counts can be lower and sub-name-only GUIDs can disappear.
+
+Usage:
+    python3 tests/verification/benchmark_entity_detection.py
+    python3 tests/verification/benchmark_entity_detection.py --files 500
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+
+# Add server to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "server"))
+
+from entity_detector import EntityDetector
+
+
+OCR_TEXT_DIR = Path("data/sources/house_oversight_nov2025/ocr_text")
+
+
+class RegexEntityDetector:
+    """Previous implementation: one regex per name variation"""
+
+    def __init__(self, detector: EntityDetector):
+        self.patterns = [
+            (guid, name, re.compile(rf"\b{re.escape(name)}\b", re.IGNORECASE))
+            for guid, name in detector.entity_patterns
+        ]
+
+    def detect_entities(self, text: str) -> dict[str, int]:
+        mentions: dict[str, int] = {}
+        for guid, _name, pattern in self.patterns:
+            count = len(pattern.findall(text))
+            if count:
+                mentions[guid] = mentions.get(guid, 0) + count
+        return mentions
+
+
+def load_texts(limit: int) -> list[str]:
+    """Load up to `limit` OCR text files"""
+    texts = []
+    for path in sorted(OCR_TEXT_DIR.glob("*.txt"))[:limit]:
+        try:
+            texts.append(path.read_text(encoding="utf-8", errors="replace"))
+        except OSError:
+            continue
+    return texts
+
+
+def main():
+    """Run benchmark and display results"""
+    parser = argparse.ArgumentParser(description="Benchmark entity detection")
+    parser.add_argument("--files", type=int, default=200, help="Number of OCR files")
+    args = parser.parse_args()
+
+    print("Entity Detection Performance Benchmark")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    detector = EntityDetector()
+    automaton_load = time.perf_counter() - start
+
+    start = time.perf_counter()
+    legacy = RegexEntityDetector(detector)
+    regex_load = time.perf_counter() - start
+
+    texts = load_texts(args.files)
+    total_chars = sum(len(t) for t in texts)
+    print(f"Name patterns:  {len(detector.entity_patterns):,}")
+    print(f"OCR files:      {len(texts):,} ({total_chars / 1_000_000:.2f}M chars)")
+    print(f"Load time:      automaton {automaton_load * 1000:.0f}ms, regex {regex_load * 1000:.0f}ms")
+    print()
+
+    if not texts:
+        print(f"✗ No OCR files found in {OCR_TEXT_DIR}")
+        return
+
+    # Automaton
+    start = time.perf_counter()
+    automaton_results = [
+        {m.guid: m.mentions for m in detector.detect_entities(t, max_results=10_000, use_cache=False)}
+        for t in texts
+    ]
+    automaton_time = time.perf_counter() - start
+
+    # Regex
+    start = time.perf_counter()
+    regex_results = [legacy.detect_entities(t) for t in texts]
+    regex_time = time.perf_counter() - start
+
+    print("Results:")
+    print("-" * 60)
+    print(f"Aho–Corasick:   {automaton_time / len(texts) * 1000:>10.2f} ms per document")
+    print(f"Regex per name: {regex_time / len(texts) * 1000:>10.2f} ms per document")
+    print(f"Speedup:        {regex_time / max(automaton_time, 1e-9):>10.1f}× faster")
+    print()
+
+    # Agreement
+    same_guids = sum(1 for a, r in zip(automaton_results, regex_results) if a.keys() == r.keys())
+    same_counts = sum(1 for a, r in zip(automaton_results, regex_results) if a == r)
+    only_regex = sum(len(r.keys() - a.keys()) for a, r in zip(automaton_results, regex_results))
+    only_automaton = sum(len(a.keys() - r.keys()) for a, r in zip(automaton_results, regex_results))
+
+    print("Agreement:")
+    print("-" * 60)
+    print(f"Identical GUID sets:    {same_guids:,}/{len(texts):,} documents")
+    print(f"Identical counts:       {same_counts:,}/{len(texts):,} documents")
+    print(f"GUIDs only in regex:    {only_regex:,} (overlapping sub-name matches)")
+    print(f"GUIDs only in automaton: {only_automaton:,} (should be 0)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Benchmark Network Queries: CSR GraphEngine vs. per-request edge scans
+
+Compares the resident GraphEngine against the previous NetworkService
+implementations on entity_network.json (or a synthetic graph):
+- shortest path: adjacency dict rebuilt from all edges per call, then BFS
+- k-hop subgraph: full edge scan for every dequeued node
+
+Both versions use edge "weight" as the subgraph strength here so results can
+be compared (the previous code read a "flight_count" key that network edges
+do not have).
+
+Usage:
+    python3 tests/verification/benchmark_graph_engine.py
+    python3 tests/verification/benchmark_graph_engine.py --synthetic 5000 --degree 8
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from collections import deque
+from pathlib import Path
+
+
+# Add server to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "server"))
+
+from services.graph_engine import GraphEngine
+
+
+NETWORK_PATH = Path("data/metadata/entity_network.json")
+
+
+def legacy_shortest_path(network: dict, source_id: str, target_id: str):
+    """Previous find_shortest_path: adjacency rebuilt per call"""
+    adjacency = {}
+    for edge in network["edges"]:
+        adjacency.setdefault(edge["source"], []).append(edge["target"])
+        adjacency.setdefault(edge["target"], []).append(edge["source"])
+
+    queue = deque([(source_id, [source_id])])
+    visited = {source_id}
+    while queue:
+        current, path = queue.popleft()
+        if current == target_id:
+            return [next(n for n in network["nodes"] if n["id"] == nid)["id"] for nid in path]
+        for neighbor in adjacency.get(current, []):
+            if neighbor not in visited:
+                visited.add(neighbor)
+                queue.append((neighbor, [*path, neighbor]))
+    return None
+
+
+def legacy_subgraph(network: dict, center_id: str, max_hops: int, min_strength: int) -> set:
+    """Previous get_entity_subgraph: edge scan per dequeued node"""
+    visited = {center_id: 0}
+    queue = deque([(center_id, 0)])
+    while queue:
+        current, distance = queue.popleft()
+        if distance >= max_hops:
+            continue
+        for edge in network["edges"]:
+            if edge.get("weight", 0) < min_strength:
+                continue
+            neighbor = None
+            if edge["source"] == current:
+                neighbor = edge["target"]
+            elif edge["target"] == current:
+                neighbor = edge["source"]
+            if neighbor and neighbor not in visited:
+                visited[neighbor] = distance + 1
+                queue.append((neighbor, distance + 1))
+    return set(visited)
+
+
+def synthetic_network(n_nodes: int, degree: int, seed: int = 42) -> dict:
+    """Random graph with a few hubs (preferential attachment)"""
+    rng = random.Random(seed)
+    targets = [0]
+    edges = set()
+    for node in range(1, n_nodes):
+        for other in {rng.choice(targets) for _ in range(max(1, degree // 2))}:
+            edges.add((other, node))
+            targets.extend([other, node])
+    return {
+        "nodes": [{"id": f"n{i}", "name": f"Node {i}"} for i in range(n_nodes)],
+        "edges": [
+            {"source": f"n{s}", "target": f"n{t}", "weight": rng.randint(1, 20)} for s, t in edges
+        ],
+    }
+
+
+def timed(fn, repeat: int) -> float:
+    """Mean seconds per call"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    """Run benchmark and display results"""
+    parser = argparse.ArgumentParser(description="Benchmark network graph queries")
+    parser.add_argument("--synthetic", type=int, help="Use a synthetic graph with N nodes")
+    parser.add_argument("--degree", type=int, default=6, help="Average degree (synthetic)")
+    parser.add_argument("--queries", type=int, default=50, help="Queries per operation")
+    args = parser.parse_args()
+
+    if args.synthetic:
+        network = synthetic_network(args.synthetic, args.degree)
+    elif NETWORK_PATH.exists():
+        with open(NETWORK_PATH) as f:
+            network = json.load(f)
+    else:
+        print(f"✗ {NETWORK_PATH} not found (run from the project root or use --synthetic)")
+        return
+
+    print("Network Query Performance Benchmark")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    graph = GraphEngine.from_network(network)
+    build_time = time.perf_counter() - start
+    print(f"Graph:          {len(graph):,} nodes, {graph.n_edges:,} edges")
+    print(f"CSR build:      {build_time * 1000:.1f} ms (once per load)")
+    print()
+
+    rng = random.Random(0)
+    ids = graph.node_ids
+    pairs = [(rng.randrange(len(ids)), rng.randrange(len(ids))) for _ in range(args.queries)]
+    centers = sorted(range(len(ids)), key=lambda n: -graph.degree[n])[: args.queries]
+
+    # Agreement
+    path_mismatches = 0
+    for a, b in pairs:
+        legacy = legacy_shortest_path(network, ids[a], ids[b])
+        engine = graph.shortest_path(a, b)
+        if (legacy is None) != (engine is None) or (legacy and len(legacy) != len(engine)):
+            path_mismatches += 1
+    subgraph_mismatches = sum(
+        1
+        for c in centers[:10]
+        if legacy_subgraph(network, ids[c], 2, 1) != {ids[n] for n in graph.bfs(c, 2, 1)}
+    )
+
+    results = [
+        (
+            "Shortest path",
+            timed(lambda: [legacy_shortest_path(network, ids[a], ids[b]) for a, b in pairs], 1),
+            timed(lambda: [graph.shortest_path(a, b) for a, b in pairs], 5),
+            len(pairs),
+        ),
+        (
+            "2-hop subgraph",
+            timed(lambda: [legacy_subgraph(network, ids[c], 2, 1) for c in centers[:10]], 1),
+            timed(lambda: [graph.bfs(c, 2, 1) for c in centers[:10]], 5),
+            min(10, len(centers)),
+        ),
+        (
+            "5 shortest paths",
+            None,
+            timed(lambda: [graph.k_shortest_paths(a, b, 5) for a, b in pairs[:10]], 1),
+            min(10, len(pairs)),
+        ),
+    ]
+
+    print("Results (ms per query):")
+    print("-" * 60)
+    print(f"{'Operation':<18}{'Previous':>12}{'GraphEngine':>14}{'Speedup':>12}")
+    for name, legacy_time, engine_time, count in results:
+        engine_ms = engine_time / count * 1000
+        if legacy_time is None:
+            print(f"{name:<18}{'-':>12}{engine_ms:>14.3f}{'-':>12}")
+            continue
+        legacy_ms = legacy_time / count * 1000
+        print(f"{name:<18}{legacy_ms:>12.3f}{engine_ms:>14.3f}{legacy_ms / engine_ms:>11.0f}×")
+    print()
+    print("Agreement:")
+    print("-" * 60)
+    print(f"Path length mismatches:  {path_mismatches}/{len(pairs)} (should be 0)")
+    print(f"Subgraph mismatches:     {subgraph_mismatches}/{min(10, len(centers))} (should be 0)")
+
+
+if __name__ == "__main__":
+    main()